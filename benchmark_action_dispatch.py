@@ -0,0 +1,162 @@
+"""
+Dispatch des actions : coût par frame de la table compilée (tables de saut par mode)
+face à l'ancienne recherche par tuple de chaînes, remplacement à chaud de la table et
+rechargement du fichier de liaisons pendant un flux de frames à 30 fps.
+"""
+import os
+import random
+import tempfile
+import threading
+import time
+
+from src.action_dispatcher import ActionDispatcher, ActionType, GestureTiming
+from src.context_mode import ContextModeDetector
+from src.control.actions.bindings import BindingsWatcher
+
+GESTURES = ["POINTING", "PINCH", "PALM", "FIST", "TWO_FINGERS", "UNKNOWN"]
+MODES = ["cursor", "window", "media", "shortcut"]
+INFO_ACTIONS = [ActionType.MOVE_CURSOR, ActionType.CLICK_LEFT, ActionType.NONE, ActionType.MUTE]
+
+
+class LegacyDispatcher(ActionDispatcher):
+    """Ancien chemin : clé (mode.lower(), gesture.upper(), timing.value) dans un dict de chaînes"""
+
+    def __init__(self):
+        super().__init__()
+        self._action_table = self._build_action_table()
+
+    def get_action(self, mode, gesture, gesture_start_time=None, timestamp=None):
+        timing = self._get_timing(gesture, gesture_start_time, timestamp)
+        return self._action_table.get((mode.lower(), gesture.upper(), timing.value), ActionType.NONE)
+
+    def get_action_info(self, action):
+        action_info = {
+            ActionType.MOVE_CURSOR: {"name": "Déplacer curseur", "emoji": "🖱️"},
+            ActionType.CLICK_LEFT: {"name": "Clic gauche", "emoji": "👆"},
+            ActionType.CLICK_RIGHT: {"name": "Clic droit", "emoji": "👉"},
+            ActionType.DRAG_START: {"name": "Glisser", "emoji": "✊"},
+            ActionType.SCROLL_UP: {"name": "Défiler", "emoji": "📜"},
+            ActionType.SNAP_LEFT: {"name": "Snap gauche", "emoji": "⬅️"},
+            ActionType.SNAP_RIGHT: {"name": "Snap droite", "emoji": "➡️"},
+            ActionType.MAXIMIZE: {"name": "Maximiser", "emoji": "🔲"},
+            ActionType.MINIMIZE: {"name": "Minimiser", "emoji": "➖"},
+            ActionType.PLAY_PAUSE: {"name": "Play/Pause", "emoji": "⏯️"},
+            ActionType.NEXT_TRACK: {"name": "Piste suivante", "emoji": "⏭️"},
+            ActionType.VOLUME_UP: {"name": "Volume +", "emoji": "🔊"},
+            ActionType.COPY: {"name": "Copier", "emoji": "📋"},
+            ActionType.PASTE: {"name": "Coller", "emoji": "📥"},
+            ActionType.NONE: {"name": "Aucune", "emoji": "⏸️"},
+        }
+        return action_info.get(action, {"name": str(action), "emoji": "❓"})
+
+
+def session(frames=200_000, seed=0):
+    """Gestes tenus 5-40 frames, mode changeant de temps en temps (30 fps)"""
+    rng = random.Random(seed)
+    events, mode, gesture = [], "cursor", "POINTING"
+    while len(events) < frames:
+        if rng.random() < 0.2:
+            mode = rng.choice(MODES)
+        gesture = rng.choice(GESTURES)
+        events.extend((mode, gesture) for _ in range(rng.randint(5, 40)))
+    return [(mode, gesture, i / 30) for i, (mode, gesture) in enumerate(events[:frames])]
+
+
+def dispatch_cost(dispatcher, events):
+    get_action = dispatcher.get_action
+    start = time.perf_counter()
+    actions = [get_action(mode, gesture, timestamp=t) for mode, gesture, t in events]
+    return actions, (time.perf_counter() - start) / len(events) * 1e9
+
+
+def info_cost(dispatcher, calls=200_000):
+    get_info = dispatcher.get_action_info
+    start = time.perf_counter()
+    for i in range(calls):
+        info = get_info(INFO_ACTIONS[i & 3])
+        info = get_info(INFO_ACTIONS[i & 3])  # Le rendu l'appelait deux fois par frame
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def hot_swap(dispatcher, events, swaps=2_000):
+    """Lecteur en continu pendant que des tables alternatives sont compilées et installées"""
+    default = dispatcher.table.bindings
+    swapped = dict(default)
+    swapped[("cursor", "FIST", GestureTiming.QUICK.value)] = ActionType.NONE
+    expected = {ActionType.CLICK_RIGHT, ActionType.NONE}
+    bad, running = [], True
+
+    def reader():
+        while running:
+            for mode, gesture, t in events[:1000]:
+                if (mode, gesture) == ("cursor", "FIST"):
+                    action = dispatcher.table.lookup(mode, gesture, 0)
+                    if action not in expected:
+                        bad.append(action)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    start = time.perf_counter()
+    for i in range(swaps):
+        dispatcher.set_bindings(swapped if i % 2 == 0 else default)
+    compile_us = (time.perf_counter() - start) / swaps * 1e6
+    running = False
+    thread.join()
+    return compile_us, len(bad)
+
+
+def reload_under_load(events, reloads=50):
+    """Fichier réécrit pendant qu'un thread traite des frames à 30 fps : durée des rechargements, retard des frames"""
+    dispatcher, detector = ActionDispatcher(), ContextModeDetector()
+    path = os.path.join(tempfile.mkdtemp(), "bindings.yaml")
+    watcher = BindingsWatcher(dispatcher, detector, path=path)
+    late, running = [], True
+
+    def frames():
+        next_frame = time.perf_counter()
+        for mode, gesture, t in events:
+            if not running:
+                break
+            dispatcher.get_action(mode, gesture, timestamp=t)
+            detector.detect_mode((0.5, 0.5), timestamp=t)
+            late.append(time.perf_counter() - next_frame)
+            next_frame += 1 / 30
+            time.sleep(max(0.0, next_frame - time.perf_counter()))
+
+    thread = threading.Thread(target=frames)
+    thread.start()
+    for i in range(reloads):
+        action = "copy" if i % 2 else "paste"
+        with open(path, "w") as f:
+            f.write(f"bindings:\n  cursor:\n    FIST: {action}\n  media:\n    PALM: {{quick: mute}}\n"
+                    f"zones:\n  media_zone_top: {0.2 + 0.01 * (i % 5)}\n")
+        os.utime(path, ns=(i + 1, i + 1))
+        watcher.check()
+        time.sleep(0.02)
+    running = False
+    thread.join()
+    return watcher.get_stats(), list(watcher.reload_ms), max(late) * 1000, len(late)
+
+
+if __name__ == "__main__":
+    print("=== Action Dispatch Benchmark (string-tuple dict vs compiled per-mode table) ===\n")
+    events = session()
+    legacy, compiled = LegacyDispatcher(), ActionDispatcher()
+    legacy_actions, legacy_ns = dispatch_cost(legacy, events)
+    compiled_actions, compiled_ns = dispatch_cost(compiled, events)
+    same = sum(a == b for a, b in zip(legacy_actions, compiled_actions))
+    print(f"get_action       : legacy {legacy_ns:6.0f} ns, compiled {compiled_ns:6.0f} ns "
+          f"({legacy_ns / compiled_ns:.2f}x), same action {same}/{len(events)}")
+
+    legacy_info, cached_info = info_cost(legacy), info_cost(compiled)
+    print(f"get_action_info  : legacy {legacy_info:6.0f} ns, cached   {cached_info:6.0f} ns "
+          f"per frame (2 calls, {legacy_info / cached_info:.1f}x)")
+
+    compile_us, bad = hot_swap(ActionDispatcher(), events)
+    print(f"hot swap         : {compile_us:6.1f} us to compile + install {len(compiled.table)} bindings, "
+          f"{bad} inconsistent reads during swaps")
+
+    stats, times, max_late_ms, frames = reload_under_load(events)
+    print(f"bindings reload  : {stats['reloads']} reloads, avg {sum(times) / len(times):.2f} ms, "
+          f"max {stats['max_ms']:.2f} ms (parse + validate + compile + swap); "
+          f"{frames} frames processed meanwhile, max lateness {max_late_ms:.1f} ms")
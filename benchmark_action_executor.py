@@ -0,0 +1,92 @@
+"""
+Exécution des actions système : file simple (une exécution par soumission) face à la
+coalescence des actions identiques, avec un backend lent (processus xdotool simulé) et
+le périphérique uinput factice. Latence = attente en file + exécution, par action.
+"""
+import time
+
+from src.action_dispatcher import ActionDispatcher, ActionType
+from src.control.actions.executor import ActionExecutor
+from src.control.actions.system import SystemActions, UInputKeys
+from src.control.input import devices as E
+from src.control.input.devices import FakeUInput
+
+FPS = 30
+
+
+class SlowKeys(UInputKeys):
+    """Backend à coût fixe par appel (lancement d'un processus xdotool : 5-20 ms selon la charge)"""
+
+    name = "slow"
+
+    def __init__(self, cost_s=0.02):
+        super().__init__(FakeUInput())
+        self.cost_s = cost_s
+        self.calls = 0
+
+    def press(self, combo, count=1):
+        self.calls += 1
+        time.sleep(self.cost_s)
+        super().press(combo, count)
+
+
+class FakeMouse:
+    def __init__(self):
+        self.steps = 0
+        self.calls = 0
+
+    def scroll(self, dx, dy):
+        self.calls += 1
+        time.sleep(0.0005)
+        self.steps += abs(dy)
+
+
+def session(seconds=4):
+    """Rafales : volume tenu (roue du cercle), scroll continu, touches ponctuelles"""
+    frames = []
+    for i in range(seconds * FPS):
+        phase = (i // FPS) % 4
+        if phase == 0:
+            frames.append([ActionType.VOLUME_UP] * 2)  # Cercles rapides : deux pas par frame
+        elif phase == 1:
+            frames.append([ActionType.SCROLL_UP])
+        elif phase == 2:
+            frames.append([ActionType.NEXT_TRACK] if i % 10 == 0 else [])
+        else:
+            frames.append([ActionType.VOLUME_DOWN, ActionType.SCROLL_DOWN])
+    return frames
+
+
+def run(frames, coalesce):
+    keys, mouse = SlowKeys(), FakeMouse()
+    dispatcher = ActionDispatcher()
+    dispatcher.system_actions = SystemActions(mouse, keys)
+    executor = ActionExecutor()
+    executor.start()
+    submit = executor.submit_coalesced if coalesce else executor.submit
+    start = time.perf_counter()
+    for i, actions in enumerate(frames):
+        for action in actions:
+            submit(action.value, dispatcher.execute_action, action)
+        time.sleep(max(0.0, start + (i + 1) / FPS - time.perf_counter()))
+    while executor.pending:
+        time.sleep(0.005)
+    time.sleep(0.05)
+    executor.stop()
+    steps = sum(keys.device.events.count((E.EV_KEY, code, 1)) for code in (E.KEY_VOLUMEUP, E.KEY_VOLUMEDOWN)) + mouse.steps
+    return executor.get_stats(), keys.calls + mouse.calls, steps
+
+
+if __name__ == "__main__":
+    print("=== Action Executor Benchmark (plain queue vs coalesced, 20 ms key backend) ===\n")
+    frames = session()
+    submitted = sum(len(actions) for actions in frames)
+    for label, coalesce in (("plain", False), ("coalesced", True)):
+        stats, calls, steps = run(frames, coalesce)
+        print(f"{label:9}: {submitted} submitted, {calls} backend calls, {steps} volume/scroll steps delivered, "
+              f"{stats['dropped']} dropped, {stats['coalesced']} coalesced")
+        for name in ("volume_up", "volume_down", "scroll_up", "next_track"):
+            entry = stats.get(name)
+            if entry:
+                print(f"    {name:11}: exec {entry['avg_ms']:5.2f} ms, wait avg {entry['wait_avg_ms']:6.2f} ms "
+                      f"max {entry['wait_max_ms']:6.2f} ms")
@@ -0,0 +1,81 @@
+import cv2
+import numpy as np
+import time
+
+from src.vision.camera.decoder import FrameDecoder
+
+FRAME_SIZE = (640, 480)
+INFERENCE_SIZE = (320, 240)
+
+
+def make_test_frame(width, height):
+    """Synthetic BGR frame with gradients + noise (JPEG-realistic content)"""
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    frame[..., 0] = np.add.outer(y * 0.5, x * 0.5).astype(np.uint8)
+    frame[..., 1] = np.add.outer(y, np.zeros_like(x)).astype(np.uint8)
+    frame[..., 2] = np.add.outer(np.zeros_like(y), x).astype(np.uint8)
+    noise = np.random.default_rng(0).integers(0, 24, frame.shape, dtype=np.uint8)
+    return cv2.add(frame, noise)
+
+
+def pack_yuyv(bgr):
+    """BGR -> buffer YUYV 4:2:2 packé, tel que livré par une webcam V4L2"""
+    h, w = bgr.shape[:2]
+    yuv = cv2.cvtColor(bgr, cv2.COLOR_BGR2YUV)
+    packed = np.empty((h, w // 2, 4), dtype=np.uint8)
+    packed[..., 0] = yuv[:, 0::2, 0]
+    packed[..., 1] = yuv[:, 0::2, 1]
+    packed[..., 2] = yuv[:, 1::2, 0]
+    packed[..., 3] = yuv[:, 0::2, 2]
+    return packed.reshape(-1)
+
+
+def legacy_chain(bgr):
+    """Chaîne historique de _run_loop : flip + resize + cvtColor en pleine résolution"""
+    img = cv2.flip(bgr, 1)
+    img_inference = cv2.resize(img, INFERENCE_SIZE)
+    return cv2.cvtColor(img_inference, cv2.COLOR_BGR2RGB)
+
+
+def benchmark(fn, iterations):
+    # Warmup
+    for _ in range(10):
+        fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+if __name__ == "__main__":
+    print("=== Capture-to-tensor Benchmark (640x480 -> 320x240 RGB) ===\n")
+    iterations = 300
+
+    frame = make_test_frame(*FRAME_SIZE)
+    jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85])[1].reshape(-1)
+    yuyv = pack_yuyv(frame)
+
+    mjpg_decoder = FrameDecoder("MJPG", FRAME_SIZE, INFERENCE_SIZE)
+    yuyv_decoder = FrameDecoder("YUYV", FRAME_SIZE, INFERENCE_SIZE)
+
+    cases = [
+        ("MJPG legacy (decode+flip+resize+cvt)",
+         lambda: legacy_chain(cv2.imdecode(jpeg, cv2.IMREAD_COLOR))),
+        ("MJPG fast (display frame)",
+         lambda: mjpg_decoder.decode(jpeg, need_display=True)),
+        ("MJPG fast (reduced DCT decode)",
+         lambda: mjpg_decoder.decode(jpeg, need_display=False)),
+        ("YUYV legacy (cvt+flip+resize+cvt)",
+         lambda: legacy_chain(cv2.cvtColor(yuyv.reshape(480, 640, 2), cv2.COLOR_YUV2BGR_YUYV))),
+        ("YUYV fast (display frame)",
+         lambda: yuyv_decoder.decode(yuyv, need_display=True)),
+        ("YUYV fast (half-row convert -> RGB)",
+         lambda: yuyv_decoder.decode(yuyv, need_display=False)),
+    ]
+
+    print(f"JPEG buffer: {jpeg.size / 1024:.1f} KB | YUYV buffer: {yuyv.size / 1024:.1f} KB\n")
+    for name, fn in cases:
+        ms = benchmark(fn, iterations)
+        print(f"{name:40} {ms:6.3f} ms/frame")
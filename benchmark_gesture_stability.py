@@ -0,0 +1,161 @@
+"""
+Gestes statiques stabilisés : déclenchements intempestifs, gestes manqués et latence.
+
+Sessions : synthétiques par défaut, ou enregistrées (fichiers .npz passés en argument) avec
+    frames  (T, 21, 3) landmarks normalisés (miroir appliqué)
+    labels  (T,) str : geste attendu à chaque frame ("UNKNOWN" : transition / aucun)
+
+Déclenchement = passage à un nouveau geste (hors UNKNOWN). Dans chaque segment de geste
+attendu, le premier déclenchement correct compte ; tous les autres sont intempestifs
+(mauvais geste, ou même geste re-déclenché après un clignotement).
+"""
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from benchmark_pose_knn import POSES, hand_pose, rotation
+from src.gesture_classifier import StaticGestureClassifier
+from src.processing.gestures.stability import GestureStabilizer
+
+
+class NoNoise:
+    """Remplace le générateur aléatoire de hand_pose : pose exacte"""
+
+    def normal(self, loc, scale, size=None):
+        return np.full(size, float(loc)) if size is not None else float(loc)
+
+
+def synthetic_session(seed=0, segments=120, glitch_rate=0.04):
+    """
+    Suite de gestes tenus 0.5-2 s, transitions interpolées, frames aberrantes ponctuelles.
+    Geste attendu : verdict des règles sur la pose exacte (on mesure la stabilité, pas
+    l'exactitude du classificateur).
+    """
+    rng = np.random.default_rng(seed)
+    classifier = StaticGestureClassifier()
+    names = list(POSES)
+    frames, labels = [], []
+    roll, scale, cx, cy = 0.0, 0.15, 0.5, 0.6
+
+    def to_image(points):
+        points = points @ rotation(roll, 0.0, 0.0).T
+        image = np.empty_like(points)
+        image[:, 0] = cx + points[:, 0] * scale
+        image[:, 1] = cy - points[:, 1] * scale
+        image[:, 2] = -points[:, 2] * scale
+        return image.astype(np.float32)
+
+    def emit(points, label):
+        nonlocal roll
+        roll = float(np.clip(roll + rng.normal(0, 0.02), -0.5, 0.5))
+        frames.append(to_image(points))
+        labels.append(label)
+
+    previous = "PALM"
+    for _ in range(segments):
+        label = names[rng.integers(len(names))]
+        # Transition : flexions interpolées entre les deux poses (geste indéfini)
+        for t in np.linspace(0, 1, 6)[1:-1]:
+            curls = [a + (b - a) * t for a, b in zip(POSES[previous], POSES[label])]
+            emit(hand_pose(curls, rng), "UNKNOWN")
+        expected = classifier.classify(to_landmarks(to_image(hand_pose(POSES[label], NoNoise()))))
+        for _ in range(int(rng.integers(15, 60))):
+            curls = POSES[label]
+            if rng.random() < glitch_rate:
+                # Frame aberrante : un doigt mal estimé par le modèle
+                curls = list(curls)
+                finger = int(rng.integers(5))
+                curls[finger] = 1.0 - curls[finger]
+            emit(hand_pose(curls, rng, noise=0.05), expected)
+        previous = label
+    return np.stack(frames), np.array(labels)
+
+
+def to_landmarks(frame):
+    return [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in frame]
+
+
+def score_triggers(outputs, labels):
+    """(intempestifs, manqués, latence moyenne en frames, segments)"""
+    # Segments : gestes attendus consécutifs, transition précédente incluse
+    segments, start = [], 0
+    for i in range(1, len(labels) + 1):
+        if i == len(labels) or (labels[i] != labels[i - 1] and labels[i] != "UNKNOWN"):
+            expected = next((l for l in labels[start:i] if l != "UNKNOWN"), "UNKNOWN")
+            onset = next((j for j in range(start, i) if labels[j] != "UNKNOWN"), start)
+            segments.append((start, i, expected, onset))
+            start = i
+
+    false_triggers = missed = 0
+    delays = []
+    for start, end, expected, onset in segments:
+        # Geste déjà actif à l'entrée du segment (même geste que le précédent) : rien à déclencher
+        wanted = not (start and outputs[start - 1] == expected)
+        for j in range(start, end):
+            previous = outputs[j - 1] if j else "UNKNOWN"
+            if outputs[j] != previous and outputs[j] != "UNKNOWN":
+                if outputs[j] == expected and wanted:
+                    wanted = False
+                else:
+                    false_triggers += 1
+        if expected != "UNKNOWN":
+            hit = next((j for j in range(onset, end) if outputs[j] == expected), None)
+            if hit is None:
+                missed += 1
+            else:
+                delays.append(hit - onset)
+    return false_triggers, missed, (float(np.mean(delays)) if delays else 0.0), len(segments)
+
+
+def run(frames, labels):
+    classifier = StaticGestureClassifier()
+    stabilizer = GestureStabilizer()
+    raw, stable = [], []
+    raw_time = stable_time = 0.0
+    for frame in frames:
+        landmarks = to_landmarks(frame)
+        start = time.perf_counter()
+        raw.append(classifier.classify(landmarks))
+        raw_time += time.perf_counter() - start
+        start = time.perf_counter()
+        stable.append(stabilizer.update("Right", classifier.scores(landmarks)).label)
+        stable_time += time.perf_counter() - start
+    n = len(frames)
+    return raw, stable, raw_time / n * 1e6, stable_time / n * 1e6
+
+
+if __name__ == "__main__":
+    print("=== Gesture Stability Benchmark (raw classify vs hysteresis + dwell) ===\n")
+    if len(sys.argv) > 1:
+        sessions = []
+        for path in sys.argv[1:]:
+            data = np.load(path)
+            sessions.append((path, data["frames"], [str(l) for l in data["labels"]]))
+    else:
+        sessions = [(f"synthetic #{seed}", *synthetic_session(seed)) for seed in range(3)]
+
+    totals = {"raw": [0, 0, 0.0], "stable": [0, 0, 0.0]}
+    n_segments = n_frames = 0
+    for name, frames, labels in sessions:
+        labels = list(labels)
+        raw, stable, raw_us, stable_us = run(frames, labels)
+        print(f"{name}: {len(frames)} frames")
+        for key, outputs, us in (("raw", raw, raw_us), ("stable", stable, stable_us)):
+            false_triggers, missed, delay, segments = score_triggers(outputs, labels)
+            clicks = sum(1 for i in range(1, len(outputs))
+                         if outputs[i] == "PINCH" != outputs[i - 1] and labels[i] != "PINCH")
+            print(f"  {key:6}: {false_triggers:4} false triggers, {missed:3} missed / {segments} gestures, "
+                  f"delay {delay:4.1f} frames, stray PINCH (click) {clicks:3}, {us:5.1f} us/frame")
+            totals[key][0] += false_triggers
+            totals[key][1] += missed
+            totals[key][2] += delay * segments
+        n_segments += segments
+        n_frames += len(frames)
+
+    minutes = n_frames / 30 / 60
+    print()
+    for key, (false_triggers, missed, delay) in totals.items():
+        print(f"{key:6}: {false_triggers / minutes:6.1f} false triggers / min at 30 fps, "
+              f"{missed / n_segments:5.1%} missed, mean delay {delay / n_segments / 30 * 1000:4.0f} ms")
@@ -0,0 +1,73 @@
+import math
+import time
+
+import numpy as np
+
+from src.processing.gestures.templates import DTWMatcher, TemplateLibrary, dtw_distance, normalize_trajectory
+
+
+def shape_family(rng):
+    """Forme de base aléatoire : polyligne de 3 à 6 sommets ou arc/spirale"""
+    if rng.random() < 0.5:
+        return rng.uniform(0, 0.3, (rng.integers(3, 7), 2))
+    turns = rng.uniform(0.5, 2.0) * 2 * math.pi
+    t = np.linspace(0, turns, 40)
+    radius = 0.1 + rng.uniform(-0.05, 0.05) * t / turns
+    return np.stack((radius * np.cos(t), radius * np.sin(t) * rng.choice([-1, 1])), axis=1)
+
+
+def perturbed(shape, rng, frames=30, noise=0.006):
+    """Exécution d'une forme : vitesse variable, position / taille différentes, bruit"""
+    seg = np.hypot(*np.diff(shape, axis=0).T)
+    dist = np.concatenate(([0.0], np.cumsum(seg)))
+    warp = np.sort(rng.uniform(0, 1, frames))
+    warp = (warp - warp[0]) / (warp[-1] - warp[0]) * dist[-1]
+    points = np.stack((np.interp(warp, dist, shape[:, 0]), np.interp(warp, dist, shape[:, 1])), axis=1)
+    points = points * rng.uniform(0.7, 1.3) + rng.uniform(0.2, 0.6, 2)
+    return points + rng.normal(0, noise, points.shape)
+
+
+def naive_nearest(library, trajectory):
+    """Référence : DTW complet contre chaque modèle"""
+    compiled = library.compiled("Right")
+    query = normalize_trajectory(trajectory, library.n_samples)
+    rows = [(float(x), float(y)) for x, y in query]
+    dists = [dtw_distance(rows, t, library.radius) for t in compiled.rows]
+    k = int(np.argmin(dists))
+    return compiled.names[k], dists[k]
+
+
+if __name__ == "__main__":
+    print("=== Gesture Template Matching Benchmark (DTW, 1 core) ===\n")
+    rng = np.random.default_rng(0)
+    families = [shape_family(rng) for _ in range(50)]
+
+    for count in (10, 50, 100, 250, 500, 1000):
+        # Requêtes : nouvelles exécutions des gestes présents dans la bibliothèque
+        queries = []
+        for _ in range(100):
+            family = int(rng.integers(min(count, len(families))))
+            queries.append((f"g{family}", perturbed(families[family], rng)))
+        library = TemplateLibrary(path="/dev/null")
+        for i in range(count):
+            family = i % len(families)
+            library.add(f"g{family}", perturbed(families[family], rng))
+        matcher = DTWMatcher(library, threshold=math.inf)
+        library.compiled("Right")
+
+        start = time.perf_counter()
+        fast = [matcher.match("Right", q) for _, q in queries]
+        fast_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+        start = time.perf_counter()
+        naive = [naive_nearest(library, q) for _, q in queries]
+        naive_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+        same = sum(f.name == n[0] for f, n in zip(fast, naive))
+        correct = sum(f.name == label for f, (label, _) in zip(fast, queries))
+        full = matcher.dtw_computed / len(queries)
+        abandoned = matcher.dtw_abandoned / len(queries)
+        print(f"{count:5} templates: pruned {fast_ms:6.2f} ms/match (DTW {full:5.1f} full + {abandoned:5.1f} abandoned), "
+              f"naive {naive_ms:7.2f} ms ({naive_ms / fast_ms:4.1f}x), same result {same}/{len(queries)}, "
+              f"correct {correct}/{len(queries)}")
+    print("\nFrame budget at 30 fps: 33.3 ms")
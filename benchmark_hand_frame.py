@@ -0,0 +1,57 @@
+import math
+import time
+
+import numpy as np
+
+from src.processing.geometry import hand_frame
+from src.processing.geometry.hand_frame import NUMBA_AVAILABLE, _normalize_numpy, normalize_hands
+
+
+def python_normalize(hand):
+    """Référence naïve : une main à la fois, Python pur (repère identique)"""
+    w = hand[0]
+    y = [hand[9][i] - w[i] for i in range(3)]
+    scale = max(math.sqrt(sum(c * c for c in y)), 1e-6)
+    y = [c / scale for c in y]
+    a = [hand[5][i] - hand[17][i] for i in range(3)]
+    d = sum(a[i] * y[i] for i in range(3))
+    a = [a[i] - d * y[i] for i in range(3)]
+    norm = max(math.sqrt(sum(c * c for c in a)), 1e-6)
+    x = [c / norm for c in a]
+    z = [x[1] * y[2] - x[2] * y[1], x[2] * y[0] - x[0] * y[2], x[0] * y[1] - x[1] * y[0]]
+    out = []
+    for p in hand:
+        o = [p[i] - w[i] for i in range(3)]
+        out.append([sum(o[i] * axis[i] for i in range(3)) / scale for axis in (x, y, z)])
+    return out
+
+
+def throughput(fn, batch, min_time=0.3):
+    """Mains par seconde (répétitions jusqu'à min_time)"""
+    fn(batch)  # Compilation JIT / chauffe
+    runs, start = 0, time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        fn(batch)
+        runs += 1
+    return runs * len(batch) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print("=== Hand Frame Normalization Benchmark ===\n")
+    print(f"Numba: {'available' if NUMBA_AVAILABLE else 'not installed (numpy fallback)'}\n")
+    rng = np.random.default_rng(0)
+
+    check = rng.random((100, 21, 3)).astype(np.float32)
+    reference = np.array([python_normalize(h.tolist()) for h in check], dtype=np.float32)
+    print(f"max |normalize_hands - python reference| = {np.abs(normalize_hands(check) - reference).max():.2e}\n")
+
+    backends = [("python loop", lambda b: [python_normalize(h) for h in b.tolist()]),
+                ("numpy", _normalize_numpy)]
+    if NUMBA_AVAILABLE:
+        backends.append(("numba", lambda b: hand_frame.normalize_hands_batch(b, np.empty_like(b))))
+
+    print(f"{'batch':>7}" + "".join(f"{name:>16}" for name, _ in backends) + "   (hands/s)")
+    for size in (1, 2, 64, 1024, 16384):
+        batch = rng.random((size, 21, 3)).astype(np.float32)
+        rates = [throughput(fn, batch) for _, fn in backends]
+        print(f"{size:>7}" + "".join(f"{rate:16,.0f}" for rate in rates))
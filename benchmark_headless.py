@@ -0,0 +1,61 @@
+import cv2
+import numpy as np
+import time
+
+from src.core.frame_sinks import FrameSinks
+from src.core.pipeline import FramePacket
+from src.core.stages import PreprocessStage, RenderStage
+from src.feedback_overlay import FeedbackOverlay
+from src.vision.camera.decoder import FrameDecoder
+
+FRAME_SIZE = (640, 480)
+INFERENCE_SIZE = (320, 240)
+
+
+def make_jpeg():
+    rng = np.random.default_rng(0)
+    frame = cv2.GaussianBlur(rng.integers(0, 255, (FRAME_SIZE[1], FRAME_SIZE[0], 3), dtype=np.uint8), (9, 9), 0)
+    return cv2.imencode(".jpg", frame)[1]
+
+
+def overlay_render(overlay, sinks):
+    """Rendu headless de HandEngine : zones, halo, panneau, FPS, publication"""
+    def render(packet):
+        img = overlay.draw_zone_indicators(packet.frame, "cursor")
+        img = overlay.draw_hand_halo(img, (320, 240), "cursor")
+        img = overlay.draw(img, "cursor", "POINTING", "-> Déplacer", 1.0)
+        cv2.putText(img, "60 FPS", (560, 470), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+        sinks.publish(img)
+    return render
+
+
+def cpu_per_frame(preprocess, render, raw, decoder, iterations):
+    """Temps CPU (process_time) par frame pour prétraitement + rendu"""
+    for _ in range(10):
+        render.process(preprocess.process(FramePacket(raw=raw, decoder=decoder)))
+    start = time.process_time()
+    for _ in range(iterations):
+        render.process(preprocess.process(FramePacket(raw=raw, decoder=decoder)))
+    return (time.process_time() - start) * 1000 / iterations
+
+
+if __name__ == "__main__":
+    print("=== Headless CPU per Frame (MJPG 640x480, preprocess + render) ===\n")
+    iterations = 300
+    raw = make_jpeg()
+    decoder = FrameDecoder("MJPG", FRAME_SIZE, INFERENCE_SIZE, display_buffers=4)
+    overlay = FeedbackOverlay(position="top_left")
+
+    sinks = FrameSinks()
+    render = RenderStage(overlay_render(overlay, sinks))
+
+    # Ancien headless : frame d'affichage décodée et annotée à chaque frame, sans spectateur
+    legacy = cpu_per_frame(PreprocessStage(need_display=True, mirror_landmarks=True), render, raw, decoder, iterations)
+    preprocess = PreprocessStage(need_display=False, mirror_landmarks=True, sinks=sinks)
+    idle = cpu_per_frame(preprocess, render, raw, decoder, iterations)
+    sinks.attach("bench", lambda frame: frame.copy())
+    viewer = cpu_per_frame(preprocess, render, raw, decoder, iterations)
+
+    print(f"legacy headless (always render) : {legacy:6.3f} ms CPU/frame")
+    print(f"zero-render, no viewer          : {idle:6.3f} ms CPU/frame (x{legacy / idle:.1f})")
+    print(f"viewer attached (on demand)     : {viewer:6.3f} ms CPU/frame")
@@ -0,0 +1,69 @@
+import cv2
+import numpy as np
+import time
+
+from src.virtual_keyboard import VirtualKeyboard
+
+
+def legacy_draw(keyboard):
+    """Ancien rendu : canvas alloué, copie + addWeighted, toutes les touches redessinées"""
+    frame = np.zeros((480, 960, 3), dtype=np.uint8)
+    overlay = frame.copy()
+    cv2.rectangle(overlay, (20, 70), (950, 450), (50, 50, 50), -1)
+    frame = cv2.addWeighted(overlay, 0.3, frame, 0.7, 0)
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    for btn in keyboard.buttons:
+        x, y = btn.pos
+        w, h = btn.size
+        if btn.hovered:
+            color, thickness = (0, 255, 0), 3
+            progress_w = int(w * min(1.0, btn.dwell_time / btn.dwell_threshold))
+            cv2.rectangle(frame, (x, y + h - 5), (x + progress_w, y + h), (0, 200, 0), -1)
+        else:
+            color, thickness = (200, 200, 200), 2
+        cv2.rectangle(frame, (x, y), (x + w, y + h), color, thickness)
+        text_size = cv2.getTextSize(btn.text, font, 0.8, 2)[0]
+        cv2.putText(frame, btn.text, (x + (w - text_size[0]) // 2, y + (h + text_size[1]) // 2),
+                    font, 0.8, (0, 0, 0), 2)
+    mode_text = f"Mode: {'SURVOL' if keyboard.mode == 'dwell' else 'PINCH'}"
+    cv2.putText(frame, mode_text, (50, 50), font, 0.7, (255, 255, 255), 2)
+    return frame
+
+
+def fingertip_path(keyboard, frames):
+    """Index qui s'attarde sur une touche puis glisse vers la suivante"""
+    path = []
+    for i in range(frames):
+        btn = keyboard.buttons[(i // 20) % len(keyboard.buttons)]
+        x, y = btn.pos
+        path.append((x + btn.size[0] // 2, y + btn.size[1] // 2))
+    return path
+
+
+if __name__ == "__main__":
+    print("=== Virtual Keyboard Rendering Benchmark ===\n")
+    frames = 600
+    keyboard = VirtualKeyboard(layout="azerty", mode="dwell")
+    keyboard._press = lambda key: None  # Ni frappe OS ni changement de page pendant la mesure
+    path = fingertip_path(keyboard, frames)
+
+    legacy_ms, cached_ms, mismatches = 0.0, 0.0, 0
+    for i, pos in enumerate(path):
+        keyboard.check_input(pos, timestamp=i / 30)  # Horloge de frame : 30 fps simulés
+
+        start = time.perf_counter()
+        expected = legacy_draw(keyboard)
+        legacy_ms += (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        canvas = keyboard.render()
+        cached_ms += (time.perf_counter() - start) * 1000
+
+        mismatches += not np.array_equal(expected, canvas)
+
+    stats = keyboard.get_draw_stats()
+    print(f"legacy full redraw : {legacy_ms / frames:6.3f} ms/frame")
+    print(f"cached incremental : {cached_ms / frames:6.3f} ms/frame "
+          f"(avg {stats['avg_ms']:.3f} ms, max {stats['max_ms']:.3f} ms, "
+          f"{stats['keys_redrawn'] / frames:.2f} keys redrawn/frame)")
+    print(f"identical frames   : {frames - mismatches}/{frames}")
@@ -0,0 +1,64 @@
+import random
+import time
+
+from src.virtual_keyboard import (
+    LETTER_ROWS, LETTER_WIDE_KEYS, NUMERIC_ROWS, NUMERIC_WIDE_KEYS, SYMBOL_ROWS, SYMBOL_WIDE_KEYS,
+    KeyboardLayout, VirtualKeyboard,
+)
+
+
+def build_large_layout():
+    """Trois claviers affichés ensemble : lettres, chiffres et symboles (102 touches)"""
+    letters = KeyboardLayout.from_rows("letters", LETTER_ROWS["azerty"], LETTER_WIDE_KEYS, origin=(50, 100))
+    numeric = KeyboardLayout.from_rows("numeric", NUMERIC_ROWS, NUMERIC_WIDE_KEYS, origin=(1010, 100))
+    symbols = KeyboardLayout.from_rows("symbols", SYMBOL_ROWS, SYMBOL_WIDE_KEYS, origin=(1010, 500))
+    return KeyboardLayout.merge("full", [letters, numeric, symbols])
+
+
+def linear_hit(buttons, point):
+    """Ancien test : parcours de toutes les touches avec contains()"""
+    for btn in buttons:
+        if btn.contains(point):
+            return btn
+    return None
+
+
+def benchmark(fn, points, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for point in points:
+            fn(point)
+        best = min(best, time.perf_counter() - start)
+    return best / len(points) * 1e6
+
+
+if __name__ == "__main__":
+    print("=== Virtual Keyboard Hit-Test Benchmark ===\n")
+    layout = build_large_layout()
+    width, height = layout.size
+    rng = random.Random(0)
+    points = [(rng.randrange(width + 50), rng.randrange(height + 50)) for _ in range(20000)]
+
+    start = time.perf_counter()
+    KeyboardLayout.merge("rebuild", [layout])
+    build_ms = (time.perf_counter() - start) * 1000
+
+    mismatches = sum(linear_hit(layout.buttons, p) is not layout.grid.hit(p) for p in points)
+    linear_us = benchmark(lambda p: linear_hit(layout.buttons, p), points)
+    grid_us = benchmark(layout.grid.hit, points)
+
+    print(f"keys               : {len(layout.buttons)} ({width}x{height} px, cell {layout.grid.cell} px)")
+    print(f"index build        : {build_ms:.2f} ms (once per layout)")
+    print(f"linear contains()  : {linear_us:.2f} us/lookup")
+    print(f"grid index         : {grid_us:.2f} us/lookup ({linear_us / grid_us:.1f}x)")
+    print(f"mismatches         : {mismatches}/{len(points)}")
+
+    # Changement de page : les pages sont construites une fois puis réactivées
+    keyboard = VirtualKeyboard(layout="azerty", mode="dwell")
+    keyboard.add_layout(layout)
+    start = time.perf_counter()
+    for i in range(1000):
+        keyboard.set_layout(("azerty", "numeric", "symbols", "full")[i % 4])
+    switch_us = (time.perf_counter() - start) * 1000
+    print(f"layout switch      : {switch_us:.2f} us/switch ({len(keyboard.layouts)} pages cached)")
@@ -0,0 +1,140 @@
+"""
+Sortie uinput de MouseDriver : un appel système par événement (ABS_X, ABS_Y, SYN...) face
+aux événements d'une frame empaquetés en un seul write (EventBatch), positions inchangées
+ignorées et molette cumulée. Périphérique factice : un vrai tube (un write = un appel système).
+"""
+import math
+import random
+import time
+
+from src.control.input import devices as E
+from src.control.input.devices import FakeUInput
+from src.mouse_driver import MouseDriver
+
+FPS = 30
+CANVAS = (640, 480)
+
+
+class LegacyMouseDriver(MouseDriver):
+    """Ancien chemin : device.write par événement, syn() après chaque action"""
+
+    def move(self, x, y, frame_w, frame_h, timestamp=None):
+        if timestamp < self.frozen_until:
+            return
+        target_x, target_y = self.mapper.map(x / frame_w, y / frame_h)
+        screen_x, screen_y = self.filter(target_x, target_y, timestamp)
+        screen_x = int(max(0, min(self.sw - 1, screen_x)))
+        screen_y = int(max(0, min(self.sh - 1, screen_y)))
+        self.device.write(E.EV_ABS, E.ABS_X, screen_x)
+        self.device.write(E.EV_ABS, E.ABS_Y, screen_y)
+        self.device.syn()
+
+    def click(self, timestamp=None):
+        self.frozen_until = timestamp + self.CLICK_FREEZE
+        self.device.write(E.EV_KEY, E.BTN_LEFT, 1)
+        self.device.syn()
+        self.device.write(E.EV_KEY, E.BTN_LEFT, 0)
+        self.device.syn()
+
+    def scroll(self, dx, dy):
+        self.device.write(E.EV_REL, E.REL_WHEEL, int(dy * 5))
+        self.device.syn()
+
+
+def session(frames=20_000, seed=0):
+    """Par frame : position de l'index (pixels canvas), pas de molette, clic"""
+    rng = random.Random(seed)
+    out, x, y, t = [], 320.0, 240.0, 0
+    while len(out) < frames:
+        kind = rng.choice(["move", "move", "still", "scroll"])
+        for _ in range(rng.randint(10, 60)):
+            if kind == "move":
+                x += 6 * math.cos(t / 9) + rng.gauss(0, 0.5)
+                y += 4 * math.sin(t / 7) + rng.gauss(0, 0.5)
+            elif kind == "still":
+                x += rng.gauss(0, 0.05)  # Main posée : bruit sous le pixel écran
+                y += rng.gauss(0, 0.05)
+            x, y = min(max(x, 0), CANVAS[0]), min(max(y, 0), CANVAS[1])
+            scrolls = 2 if kind == "scroll" else 0  # Plusieurs pas de molette par frame
+            out.append((x, y, scrolls, rng.random() < 0.01))
+            t += 1
+    return out[:frames]
+
+
+def run(driver, device, frames, batched):
+    driver.deferred = batched
+    busy = 0.0
+    for i, (x, y, scrolls, click) in enumerate(frames):
+        now = i / FPS
+        start = time.perf_counter()
+        driver.move(x, y, *CANVAS, timestamp=now)
+        for _ in range(scrolls):
+            driver.scroll(0, 1)
+        if click:
+            driver.click(timestamp=now)
+        if batched:
+            driver.flush()
+        busy += time.perf_counter() - start
+        if i % 100 == 99:
+            device.drain()  # Hors mesure : vide le tube
+    syscalls = device.writes + (driver.batch.writes if batched else 0)
+    events = len(device.events)
+    device.close()
+    return syscalls, events, busy / len(frames) * 1e6
+
+
+def output_only(frames, batched, repeat=5):
+    """Coût de l'écriture seule : positions écran déjà calculées (sans filtre ni mapping)"""
+    positions = [(int(x * 3), int(y * 2.25), scrolls, click) for x, y, scrolls, click in frames]
+    best = float("inf")
+    for _ in range(repeat):
+        device = FakeUInput()
+        driver = MouseDriver(device=device)
+        batch = driver.batch
+        start = time.perf_counter()
+        for i, (x, y, scrolls, click) in enumerate(positions):
+            if batched:
+                batch.move(x, y)
+                for _ in range(scrolls):
+                    batch.scroll(5)
+                if click:
+                    batch.button(E.BTN_LEFT, True)
+                    batch.button(E.BTN_LEFT, False)
+                batch.flush()
+            else:
+                device.write(E.EV_ABS, E.ABS_X, x)
+                device.write(E.EV_ABS, E.ABS_Y, y)
+                device.syn()
+                for _ in range(scrolls):
+                    device.write(E.EV_REL, E.REL_WHEEL, 5)
+                    device.syn()
+                if click:
+                    for value in (1, 0):
+                        device.write(E.EV_KEY, E.BTN_LEFT, value)
+                        device.syn()
+            if i % 100 == 99:
+                device.drain()  # Inclus dans les deux mesures
+        best = min(best, (time.perf_counter() - start) / len(positions) * 1e6)
+        device.close()
+    return best
+
+
+if __name__ == "__main__":
+    print("=== Mouse Event Benchmark (write per event vs one packed write per frame) ===\n")
+    frames = session()
+    results = {}
+    for label, cls, batched in (("per-event", LegacyMouseDriver, False), ("batched", MouseDriver, True)):
+        device = FakeUInput()
+        driver = cls(device=device)
+        results[label] = run(driver, device, frames, batched)
+        syscalls, events, us = results[label]
+        print(f"{label:9}: {syscalls / len(frames):5.2f} syscalls/frame, {events / len(frames):5.2f} events/frame, "
+              f"{us:6.1f} us/frame")
+        if batched:
+            stats = driver.batch.get_stats()
+            print(f"           {stats['dropped_moves']} unchanged moves dropped, "
+                  f"{stats['coalesced_scrolls']} scroll steps merged")
+    legacy, batched = results["per-event"], results["batched"]
+    print(f"\nsyscalls: {legacy[0] / batched[0]:.1f}x fewer, time per frame: {legacy[2] / batched[2]:.2f}x")
+    print(f"output only (no filter): per-event {output_only(frames, False):5.2f} us/frame, "
+          f"batched {output_only(frames, True):5.2f} us/frame (pipe write; /dev/uinput costs more per syscall)")
@@ -0,0 +1,90 @@
+import cv2
+import numpy as np
+import time
+
+from src.feedback_overlay import FeedbackOverlay
+
+FRAME_SIZE = (640, 480)
+
+
+def legacy_overlay(frame, mode, gesture, action, hand_pos, confidence=1.0):
+    """Overlay historique : copie pleine frame + addWeighted plein écran par couche"""
+    h, w = frame.shape[:2]
+    mode_color = FeedbackOverlay.MODE_COLORS.get(mode, (200, 200, 200))
+
+    # draw_zone_indicators
+    overlay = frame.copy()
+    media_h = int(h * 0.20)
+    if mode == "media":
+        cv2.rectangle(overlay, (0, 0), (w, media_h), (0, 255, 0), -1)
+        cv2.addWeighted(overlay, 0.1, frame, 0.9, 0, frame)
+        cv2.putText(frame, "MEDIA ZONE", (w//2 - 50, 25), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+    edge_w = int(w * 0.10)
+    if mode == "window":
+        cv2.rectangle(overlay, (0, media_h), (edge_w, h), (255, 0, 255), -1)
+        cv2.rectangle(overlay, (w - edge_w, media_h), (w, h), (255, 0, 255), -1)
+        cv2.addWeighted(overlay, 0.1, frame, 0.9, 0, frame)
+
+    # draw_hand_halo
+    overlay = frame.copy()
+    cv2.circle(overlay, hand_pos, 40, mode_color, 3)
+    cv2.addWeighted(overlay, 0.5, frame, 0.5, 0, frame)
+    cv2.circle(frame, hand_pos, 5, mode_color, -1)
+
+    # draw
+    x, y = 10, 10
+    overlay = frame.copy()
+    cv2.rectangle(overlay, (x, y), (x + 220, y + 100), (30, 30, 35), -1)
+    cv2.rectangle(overlay, (x, y), (x + 220, y + 100), mode_color, 2)
+    frame = cv2.addWeighted(overlay, 0.85, frame, 0.15, 0)
+    mode_name = FeedbackOverlay.MODE_NAMES.get(mode, mode.upper())
+    cv2.putText(frame, f"Mode: {mode_name}", (x + 10, y + 25),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, mode_color, 1, cv2.LINE_AA)
+    icon = FeedbackOverlay.GESTURE_ICONS.get(gesture.upper(), "[?]")
+    cv2.putText(frame, f"Geste: {icon} {gesture} ({gesture})", (x + 10, y + 50),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
+    cv2.putText(frame, f"Action: {action}", (x + 10, y + 75),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.4, (180, 180, 180), 1, cv2.LINE_AA)
+    conf_bar_y = y + 100 - 15
+    cv2.rectangle(frame, (x + 10, conf_bar_y), (x + 210, conf_bar_y + 8), (50, 50, 50), -1)
+    cv2.rectangle(frame, (x + 10, conf_bar_y), (x + 10 + int(200 * confidence), conf_bar_y + 8), mode_color, -1)
+    return frame
+
+
+def cached_overlay(overlay, frame, mode, gesture, action, hand_pos, confidence=1.0):
+    """Même séquence que _render_frame avec le compositeur en place"""
+    overlay.debug_raw_gesture = gesture
+    frame = overlay.draw_zone_indicators(frame, mode)
+    frame = overlay.draw_hand_halo(frame, hand_pos, mode)
+    return overlay.draw(frame, mode, gesture, action, confidence)
+
+
+def benchmark(fn, source, iterations):
+    # Warmup (remplit les caches)
+    for _ in range(10):
+        fn(source.copy())
+    frames = [source.copy() for _ in range(iterations)]
+    start = time.perf_counter()
+    for frame in frames:
+        fn(frame)
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+if __name__ == "__main__":
+    print("=== Feedback Overlay Benchmark (640x480) ===\n")
+    iterations = 300
+
+    rng = np.random.default_rng(0)
+    source = rng.integers(0, 255, (FRAME_SIZE[1], FRAME_SIZE[0], 3), dtype=np.uint8)
+    overlay = FeedbackOverlay(position="top_left")
+    hand_pos = (320, 260)
+
+    for mode in ("cursor", "media", "window"):
+        args = (mode, "POINTING", "-> Déplacer", hand_pos)
+        legacy_ms = benchmark(lambda f: legacy_overlay(f, *args), source, iterations)
+        cached_ms = benchmark(lambda f: cached_overlay(overlay, f, *args), source, iterations)
+
+        diff = cv2.absdiff(legacy_overlay(source.copy(), *args), cached_overlay(overlay, source.copy(), *args))
+        print(f"{mode:8} legacy {legacy_ms:6.3f} ms | cached {cached_ms:6.3f} ms "
+              f"| x{legacy_ms / cached_ms:4.1f} | max pixel diff {int(diff.max())} "
+              f"(text AA), {np.count_nonzero(diff.max(axis=2) > 2)} px > 2")
@@ -0,0 +1,172 @@
+"""
+Précision de pointage sur un écran 4K : curseur absolu (position de la main → point de
+l'écran) face au mode relatif (trackpad : REL_X/REL_Y accélérés, embrayage, sous-pixel).
+
+Rejeu identique pour les deux modes, à 30 fps. Main tenue en l'air : tremblement
+physiologique (oscillation de 8 à 12 Hz, ~1.5 px caméra crête à crête à 1 m, plus une dérive
+lente de la posture) et bruit de suivi des landmarks de 0.5 px caméra :
+- main immobile : tremblement du curseur (écart RMS, px écran)
+- acquisition de cibles : utilisateur simulé en boucle fermée (il voit l'erreur et déplace la
+  main, bruit moteur proportionnel au geste) ; réussite si le curseur reste 10 frames dans
+  la cible avant 5 s. En relatif, la main est levée (embrayage) quand elle sort du champ.
+
+Chaîne rejouée : celle d'ActStage (HybridMouseFilter puis MouseDriver en absolu ; position
+sous-pixel directement au pointeur en relatif), sortie sur un FakeUInput.
+"""
+import math
+import random
+
+from src.advanced_filter import HybridMouseFilter
+from src.control.input import devices as E
+from src.control.input.devices import FakeUInput
+from src.models.config import MouseConfig
+from src.mouse_driver import MouseDriver
+from src.optimized_utils import AdaptiveSensitivityMapper
+
+FPS = 30
+SCREEN = (3840, 2160)
+CANVAS = (640, 480)
+TRACKING_NOISE = 0.5  # px caméra
+TREMOR_AMPLITUDE = 0.75  # px caméra (crête)
+TREMOR_HZ = (8.0, 12.0)
+DRIFT_AMPLITUDE = 1.5  # px caméra : balancement lent de l'avant-bras
+DRIFT_HZ = 0.3
+DWELL_FRAMES = 10
+TIMEOUT_S = 5.0
+
+
+class Cursor:
+    """MouseDriver sur périphérique factice + position du curseur reconstruite depuis les événements"""
+
+    def __init__(self, pointer):
+        self.device = FakeUInput()
+        self.mouse = MouseDriver(device=self.device, config=MouseConfig(pointer=pointer))
+        self.mouse.sw, self.mouse.sh = SCREEN
+        self.mouse.mapper = AdaptiveSensitivityMapper(*SCREEN, gamma=1.3)
+        self.filter = HybridMouseFilter(use_rust=False)  # Chemin Python (le module rust_core peut manquer)
+        self.relative = pointer == "relative"
+        self.x, self.y = SCREEN[0] / 2, SCREEN[1] / 2
+        self.t = 0.0
+
+    def feed(self, hand_x, hand_y):
+        """Une frame : main en px caméra (None : main levée)"""
+        self.t += 1 / FPS
+        if hand_x is not None:
+            w, h = CANVAS
+            if self.relative:
+                self.mouse.move(hand_x, hand_y, w, h, timestamp=self.t)
+            else:
+                smooth_x, smooth_y = self.filter.process(int(hand_x), int(hand_y), self.t)
+                self.mouse.move(smooth_x, smooth_y, w, h, timestamp=self.t)
+        for etype, code, value in self.device.events:
+            if etype == E.EV_ABS:
+                if code == E.ABS_X:
+                    self.x = value
+                else:
+                    self.y = value
+            elif etype == E.EV_REL and code in (E.REL_X, E.REL_Y):
+                if code == E.REL_X:
+                    self.x = min(max(self.x + value, 0), SCREEN[0] - 1)
+                else:
+                    self.y = min(max(self.y + value, 0), SCREEN[1] - 1)
+        self.device.events.clear()
+        return self.x, self.y
+
+
+class Hand:
+    """Bruit d'une main tenue en l'air : tremblement de fréquence variable, dérive, suivi"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.phase = [rng.uniform(0, 2 * math.pi) for _ in range(4)]
+        self.hz = [rng.uniform(*TREMOR_HZ) for _ in range(2)]
+        self.t = 0.0
+
+    def noise(self):
+        """(dx, dy) en px caméra pour la frame suivante"""
+        rng = self.rng
+        self.t += 1 / FPS
+        offset = []
+        for axis in range(2):
+            # Fréquence du tremblement en marche aléatoire dans la bande physiologique
+            self.hz[axis] = min(max(self.hz[axis] + rng.gauss(0, 0.2), TREMOR_HZ[0]), TREMOR_HZ[1])
+            self.phase[axis] += 2 * math.pi * self.hz[axis] / FPS
+            drift = DRIFT_AMPLITUDE * math.sin(2 * math.pi * DRIFT_HZ * self.t + self.phase[axis + 2])
+            offset.append(TREMOR_AMPLITUDE * math.sin(self.phase[axis]) + drift
+                          + rng.gauss(0, TRACKING_NOISE))
+        return offset
+
+
+def jitter(pointer, seconds=4, seed=0):
+    """Main posée au milieu de l'image : écart RMS du curseur après 1 s de stabilisation"""
+    hand = Hand(random.Random(seed))
+    cursor = Cursor(pointer)
+    points = []
+    for i in range(seconds * FPS):
+        dx, dy = hand.noise()
+        x, y = cursor.feed(330 + dx, 250 + dy)
+        if i >= FPS:
+            points.append((x, y))
+    mx = sum(p[0] for p in points) / len(points)
+    my = sum(p[1] for p in points) / len(points)
+    return math.sqrt(sum((x - mx) ** 2 + (y - my) ** 2 for x, y in points) / len(points))
+
+
+def acquire(pointer, radius, targets=30, seed=1):
+    """(réussites, temps moyen des réussites en s) ; l'utilisateur apprend le gain en ligne"""
+    rng = random.Random(seed)
+    tremor = Hand(random.Random(seed + 1))
+    cursor = Cursor(pointer)
+    hand = [320.0, 240.0]
+    gain = 6.0  # Estimation utilisateur : px écran par px caméra
+    cursor.feed(*hand)
+    cursor.feed(*hand)
+    successes, times = 0, []
+    for _ in range(targets):
+        tx, ty = rng.uniform(200, SCREEN[0] - 200), rng.uniform(200, SCREEN[1] - 200)
+        inside = 0
+        for frame in range(int(TIMEOUT_S * FPS)):
+            cx, cy = cursor.x, cursor.y
+            ex, ey = tx - cx, ty - cy
+            if math.hypot(ex, ey) <= radius:
+                inside += 1
+                if inside >= DWELL_FRAMES:
+                    successes += 1
+                    times.append(frame / FPS)
+                    break
+            else:
+                inside = 0
+            # Geste voulu : une fraction de l'erreur, bornée ; bruit moteur proportionnel
+            step_x = max(-25.0, min(25.0, 0.4 * ex / gain))
+            step_y = max(-25.0, min(25.0, 0.4 * ey / gain))
+            motor = 0.05 * math.hypot(step_x, step_y)
+            hand[0] += step_x + rng.gauss(0, motor)
+            hand[1] += step_y + rng.gauss(0, motor)
+            if cursor.relative and not (40 < hand[0] < CANVAS[0] - 40 and 40 < hand[1] < CANVAS[1] - 40):
+                for _ in range(6):
+                    cursor.feed(None, None)  # Main levée, replacée au centre
+                hand = [320.0, 240.0]
+            hand[0] = min(max(hand[0], 0.0), CANVAS[0])
+            hand[1] = min(max(hand[1], 0.0), CANVAS[1])
+            dx, dy = tremor.noise()
+            nx, ny = cursor.feed(hand[0] + dx, hand[1] + dy)
+            moved, intended = math.hypot(nx - cx, ny - cy), math.hypot(step_x, step_y)
+            if intended > 0.5 and moved > 0:
+                gain = 0.8 * gain + 0.2 * max(0.2, min(20.0, moved / intended))
+    cursor.device.close()
+    return successes, (sum(times) / len(times) if times else float("nan"))
+
+
+if __name__ == "__main__":
+    print(f"=== Pointer Mode Benchmark (absolute vs relative, {SCREEN[0]}x{SCREEN[1]} screen, "
+          f"{CANVAS[0]}x{CANVAS[1]} camera) ===\n")
+    for pointer in ("absolute", "relative"):
+        print(f"{pointer:8}: still-hand jitter {jitter(pointer):5.2f} px RMS")
+    print()
+    targets = 30
+    for radius in (24, 12, 6, 3):
+        line = f"target radius {radius:2} px:"
+        for pointer in ("absolute", "relative"):
+            hits, avg_s = acquire(pointer, radius, targets)
+            line += f"  {pointer} {hits:2}/{targets} hit, {avg_s:4.2f} s"
+        print(line)
@@ -0,0 +1,169 @@
+import math
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.gesture_classifier import StaticGestureClassifier
+from src.processing.geometry.hand_frame import normalize_hands
+from src.processing.gestures.pose_knn import KDTree, KNNPoseClassifier, PoseDataset, pose_features
+
+# Main schématique dans son repère (x vers l'index, y vers les doigts, unité ≈ paume)
+FINGER_BASES = [(0.25, 0.25), (0.22, 0.95), (0.0, 1.0), (-0.2, 0.93), (-0.38, 0.8)]
+FINGER_LENGTHS = [(0.4, 0.32, 0.27), (0.45, 0.27, 0.22), (0.5, 0.3, 0.24), (0.46, 0.28, 0.22), (0.36, 0.22, 0.2)]
+FLEXION = (math.radians(80), math.radians(100), math.radians(70))
+
+# Flexion par doigt [pouce, index, majeur, annulaire, auriculaire] (0 tendu, 1 replié)
+POSES = {
+    "PALM": [0, 0, 0, 0, 0],
+    "FIST": [1, 1, 1, 1, 1],
+    "POINTING": [1, 0, 1, 1, 1],
+    "TWO_FINGERS": [1, 0, 0, 1, 1],
+    "THUMBS_UP": [0, 1, 1, 1, 1],
+    "PINCH": [0.45, 0.5, 0, 0, 0],
+}
+
+
+def hand_pose(curls, rng, noise=0.03):
+    """(21, 3) dans le repère de la main : chaque doigt fléchi vers la paume (z > 0)"""
+    points = np.zeros((21, 3))
+    for finger, ((bx, by), lengths) in enumerate(zip(FINGER_BASES, FINGER_LENGTHS)):
+        curl = float(np.clip(curls[finger] + rng.normal(0, 0.1), 0, 1.1))
+        base = 1 + 4 * finger
+        pos = np.array([bx, by, 0.0])
+        points[base] = pos
+        if finger == 0:
+            heading, angle = math.radians(45), 0.0  # Le pouce se replie vers l'auriculaire
+            for j, length in enumerate(lengths):
+                heading += curl * math.radians(45 + 20 * j)
+                pos = pos + length * np.array([math.cos(heading), math.sin(heading), 0.3 * curl])
+                points[base + 1 + j] = pos
+        else:
+            angle = 0.0
+            for j, length in enumerate(lengths):
+                angle += curl * FLEXION[j]
+                pos = pos + length * np.array([0.0, math.cos(angle), math.sin(angle)])
+                points[base + 1 + j] = pos
+    if curls == POSES["PINCH"]:
+        points[4] = points[8] + rng.normal(0, 0.02, 3)  # Pouce contre l'index
+        points[3] = (points[2] + points[4]) / 2
+    return points + rng.normal(0, noise, points.shape)
+
+
+def rotation(roll, yaw, pitch):
+    cr, sr, cy, sy, cp, sp = (math.cos(roll), math.sin(roll), math.cos(yaw), math.sin(yaw),
+                              math.cos(pitch), math.sin(pitch))
+    rz = np.array([[cr, -sr, 0], [sr, cr, 0], [0, 0, 1]])
+    ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+    rx = np.array([[1, 0, 0], [0, cp, -sp], [0, sp, cp]])
+    return rz @ ry @ rx
+
+
+def to_image(points, rng, max_roll):
+    """Repère main → coordonnées image MediaPipe (y vers le bas), rotation / miroir aléatoires"""
+    roll = rng.uniform(-max_roll, max_roll)
+    r = rotation(roll, rng.uniform(-0.4, 0.4), rng.uniform(-0.3, 0.3))
+    points = points @ r.T
+    if rng.random() < 0.5:
+        points[:, 0] *= -1  # Main gauche
+    scale = rng.uniform(0.1, 0.2)
+    image = np.empty_like(points)
+    image[:, 0] = 0.5 + points[:, 0] * scale + rng.uniform(-0.2, 0.2)
+    image[:, 1] = 0.7 - points[:, 1] * scale + rng.uniform(-0.1, 0.1)
+    image[:, 2] = -points[:, 2] * scale
+    return image.astype(np.float32), roll
+
+
+def sample(label, count, rng, max_roll):
+    hands, rolls = [], []
+    for _ in range(count):
+        image, roll = to_image(hand_pose(POSES[label], rng), rng, max_roll)
+        hands.append(image)
+        rolls.append(roll)
+    return np.stack(hands), np.array(rolls)
+
+
+def as_landmarks(points):
+    return [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in points]
+
+
+def evaluate(classifier, hands, labels):
+    start = time.perf_counter()
+    predictions = [classifier.classify(as_landmarks(h)) for h in hands]
+    latency_us = (time.perf_counter() - start) / len(hands) * 1e6
+    return np.array(predictions) == np.array(labels), latency_us
+
+
+def pipeline_cost(classifier, hands, repeat=5):
+    """scores() comme InterpretStage l'appelle : repère de la main déjà calculé pour la frame (us)"""
+    landmarks = [as_landmarks(h) for h in hands]
+    frames = [normalize_hands(h) for h in hands]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for hand, frame in zip(landmarks, frames):
+            classifier.scores(hand, frame)
+        best = min(best, (time.perf_counter() - start) / len(hands) * 1e6)
+    return best
+
+
+if __name__ == "__main__":
+    print("=== Pose Classifier Benchmark (rules vs k-NN, synthetic hands) ===\n")
+    rng = np.random.default_rng(0)
+
+    dataset = PoseDataset(path="/dev/null")
+    for label in POSES:
+        hands, _ = sample(label, 300, rng, max_roll=math.radians(80))
+        dataset.add_batch(label, hands)
+
+    test_hands, test_labels, test_rolls = [], [], []
+    for label in POSES:
+        hands, rolls = sample(label, 200, rng, max_roll=math.radians(80))
+        test_hands.extend(hands)
+        test_labels.extend([label] * len(hands))
+        test_rolls.extend(rolls)
+    test_rolls = np.abs(np.degrees(test_rolls))
+    # Pouce levé : la vérité dépend de l'orientation dans l'image
+    test_labels = [("THUMBS_UP" if h[4, 1] < h[0, 1] else "THUMBS_DOWN") if label == "THUMBS_UP" else label
+                   for h, label in zip(test_hands, test_labels)]
+
+    rules = StaticGestureClassifier()
+    knn = KNNPoseClassifier(dataset)
+    rules_ok, rules_us = evaluate(rules, test_hands, test_labels)
+    knn_ok, knn_us = evaluate(knn, test_hands, test_labels)
+
+    print(f"Dataset: {len(dataset)} examples x {dataset.features.shape[1]} float32, "
+          f"test: {len(test_labels)} hands\n")
+    print(f"{'|roll|':>12} {'rules':>8} {'k-NN':>8}")
+    for low, high in ((0, 20), (20, 45), (45, 80)):
+        sel = (test_rolls >= low) & (test_rolls < high)
+        print(f"{low:>5}-{high:<3} deg {rules_ok[sel].mean():8.1%} {knn_ok[sel].mean():8.1%}")
+    print(f"{'all':>12} {rules_ok.mean():8.1%} {knn_ok.mean():8.1%}")
+    print(f"\nclassify() latency (incl. landmark conversion): rules {rules_us:.1f} us, k-NN {knn_us:.1f} us")
+    rules_frame_us, knn_frame_us = pipeline_cost(rules, test_hands), pipeline_cost(knn, test_hands)
+    print(f"per hand in the pipeline (hand frame precomputed): rules {rules_frame_us:.1f} us, "
+          f"k-NN {knn_frame_us:.1f} us (k-NN {knn_frame_us / rules_frame_us:.1f}x slower)")
+
+    # Coût de la recherche seule selon la taille du jeu de données : KD-tree vs balayage complet
+    # (KNNPoseClassifier choisit le balayage jusqu'à BRUTE_FORCE_MAX exemples)
+    print("\nNeighbour search (k=5), features precomputed:")
+    for size in (2_000, 8_000, 20_000, 50_000):
+        data = PoseDataset(path="/dev/null")
+        per_label = size // len(POSES)
+        for label in POSES:
+            data.add_batch(label, sample(label, per_label, rng, max_roll=math.radians(80))[0])
+        tree = KDTree(data.features)
+        queries = pose_features(np.stack(test_hands[::6]))
+
+        start = time.perf_counter()
+        tree_ids = [tree.query(q, 5)[1] for q in queries]
+        tree_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+        flat = KDTree(data.features, leaf_size=len(data))  # Une seule feuille : balayage complet
+        start = time.perf_counter()
+        brute_ids = [flat.query(q, 5)[1] for q in queries]
+        brute_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+        same = sum(set(a) == set(b) for a, b in zip(tree_ids, brute_ids))
+        print(f"{len(data):6} examples: KD-tree {tree_us:7.1f} us, full scan {brute_us:7.1f} us, "
+              f"same neighbours {same}/{len(queries)}")
@@ -0,0 +1,72 @@
+import os
+import random
+import tempfile
+import time
+
+from src.processing.text.word_trie import PredictiveText, WordTrie, build_trie
+
+
+def synthetic_lexicon(n_words, seed=0):
+    """Mots pseudo-français (syllabes) avec fréquences de Zipf"""
+    rng = random.Random(seed)
+    syllables = ["ba", "bon", "ca", "cha", "de", "é", "fa", "gre", "in", "je", "la", "le", "ma",
+                 "men", "ne", "on", "pa", "pré", "que", "ra", "re", "sa", "son", "ta", "ter",
+                 "tion", "u", "va", "vi", "ment", "eau", "oi", "ou", "er", "es", "ti"]
+    words = set()
+    while len(words) < n_words:
+        words.add("".join(rng.choice(syllables) for _ in range(rng.randint(1, 5))))
+    ranked = sorted(words)
+    rng.shuffle(ranked)
+    return [(word, int(10_000_000 / (rank + 1))) for rank, word in enumerate(ranked)]
+
+
+def naive_complete(lexicon, prefix, k):
+    """Référence : parcours complet de la liste"""
+    matches = [(freq, word) for word, freq in lexicon if word.startswith(prefix)]
+    matches.sort(key=lambda item: (-item[0], item[1]))
+    return [word for _, word in matches[:k]]
+
+
+def benchmark(predictor, typed_words):
+    """Temps par frappe (feed + suggestions), mots tapés lettre par lettre"""
+    keystrokes = 0
+    start = time.perf_counter()
+    for word in typed_words:
+        for char in word:
+            predictor.feed(char)
+            keystrokes += 1
+        predictor.reset()
+    return (time.perf_counter() - start) / keystrokes * 1e6, keystrokes
+
+
+if __name__ == "__main__":
+    print("=== Predictive Text Benchmark ===\n")
+    for n_words in (10_000, 100_000, 250_000):
+        lexicon = synthetic_lexicon(n_words)
+        path = os.path.join(tempfile.mkdtemp(), "words.trie")
+
+        start = time.perf_counter()
+        build_trie(lexicon, path, k=5)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        trie = WordTrie(path)
+        open_ms = (time.perf_counter() - start) * 1000
+
+        rng = random.Random(1)
+        typed = [rng.choice(lexicon[:5000])[0] for _ in range(2000)]
+        us_per_key, keystrokes = benchmark(PredictiveText(trie, max_suggestions=3), typed)
+
+        prefixes = [word[:rng.randint(1, len(word))] for word in typed[:50]]
+        mismatches = sum(trie.complete(p, 3) != naive_complete(lexicon, p, 3) for p in prefixes)
+        start = time.perf_counter()
+        for p in prefixes:
+            naive_complete(lexicon, p, 3)
+        naive_us = (time.perf_counter() - start) / len(prefixes) * 1e6
+
+        print(f"{n_words:>7} words : build {build_s:.2f} s, file {os.path.getsize(path) / 1e6:.1f} MB, "
+              f"open {open_ms:.2f} ms, {trie.n_nodes} nodes")
+        print(f"          incremental : {us_per_key:.2f} us/keystroke ({keystrokes} keystrokes)")
+        print(f"          full scan   : {naive_us:.0f} us/lookup, mismatches {mismatches}/{len(prefixes)}")
+        trie.close()
+        os.remove(path)
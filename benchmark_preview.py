@@ -0,0 +1,73 @@
+import cv2
+import numpy as np
+import time
+from types import SimpleNamespace
+
+from src.core.pipeline import FramePacket
+from src.core.stages import RenderStage
+from src.ui.rendering.preview_composer import PreviewComposer
+from src.ui.rendering.skeleton_renderer import SkeletonRenderer
+
+CAPTURE_FPS = 60
+DURATION = 3.0
+
+
+def make_result(rng, with_hand):
+    if not with_hand:
+        return SimpleNamespace(hand_landmarks=[], hand_world_landmarks=[])
+    hand = [SimpleNamespace(x=x, y=y, z=z) for x, y, z in rng.uniform(0.2, 0.8, (21, 3))]
+    world = [SimpleNamespace(x=x, y=y, z=z) for x, y, z in rng.normal(0, 0.04, (21, 3))]
+    return SimpleNamespace(hand_landmarks=[hand], hand_world_landmarks=[world])
+
+
+def panel(renderer, result):
+    hands = list(zip(result.hand_landmarks, result.hand_world_landmarks))
+    return renderer.render_hands(hands)
+
+
+def run(render, display_fps, frames, results):
+    """Flux temps réel à CAPTURE_FPS ; retourne le temps de rendu cumulé (ms)"""
+    stage = RenderStage(render, max_fps=display_fps)
+    for i, frame in enumerate(frames):
+        deadline = time.perf_counter() + 1.0 / CAPTURE_FPS
+        stage.process(FramePacket(frame=frame, timestamp_ms=i, result=results[i]))
+        time.sleep(max(0.0, deadline - time.perf_counter()))
+    stats = stage.get_stats()
+    return stats, stats["rendered"] * stats["render_avg_ms"]
+
+
+if __name__ == "__main__":
+    print(f"=== Preview Render Benchmark ({CAPTURE_FPS} fps capture, {DURATION:.0f} s) ===\n")
+    rng = np.random.default_rng(0)
+    count = int(CAPTURE_FPS * DURATION)
+    frames = [rng.integers(0, 255, (480, 640, 3), dtype=np.uint8) for _ in range(8)]
+    frames = [frames[i % len(frames)] for i in range(count)]
+    # Main présente la première moitié, absente la seconde (panneau WAITING inchangé)
+    results = [make_result(rng, i < count // 2) for i in range(count)]
+    renderer = SkeletonRenderer.engine_4view()
+
+    def legacy(packet):
+        skel = panel(renderer, packet.result).copy()
+        np.hstack([cv2.resize(packet.frame, (533, 400)), skel])
+
+    composer = PreviewComposer()
+    seq = {"value": 0, "had_hand": False}
+
+    def composed(packet):
+        # Même règle que InterpretStage : la séquence n'avance que si les landmarks changent
+        has_hand = bool(packet.result.hand_landmarks)
+        if has_hand or seq["had_hand"]:
+            seq["value"] += 1
+        seq["had_hand"] = has_hand
+        composer.compose(packet.frame, seq["value"], lambda: panel(renderer, packet.result))
+
+    legacy_stats, legacy_ms = run(legacy, None, frames, results)
+    new_stats, new_ms = run(composed, 30, frames, results)
+    panel_stats = composer.get_stats()
+
+    print(f"legacy   : {legacy_stats['rendered']:4d} renders x {legacy_stats['render_avg_ms']:.3f} ms = {legacy_ms:7.1f} ms")
+    print(f"decimated: {new_stats['rendered']:4d} renders x {new_stats['render_avg_ms']:.3f} ms = {new_ms:7.1f} ms "
+          f"({new_stats['decimated']} frames decimated, ~{new_stats['saved_ms']:.1f} ms saved)")
+    print(f"panel    : {panel_stats['panel_rendered']} rebuilt, {panel_stats['panel_reused']} reused "
+          f"(~{panel_stats['panel_saved_ms']:.1f} ms saved)")
+    print(f"render time per second: {legacy_ms / DURATION:.1f} -> {new_ms / DURATION:.1f} ms")
@@ -0,0 +1,49 @@
+import random
+import time
+
+from src.core.pipeline import FramePacket, Pipeline, Stage
+from src.core.stages import RenderStage
+
+RESULT_FPS = 60
+DURATION = 3.0
+
+
+class TrackStage(Stage):
+    """Interprétation simulée (~1 ms)"""
+
+    name = "interpret"
+
+    def process(self, packet):
+        time.sleep(0.001)
+        return packet
+
+
+def slow_display(rng):
+    """Rendu + imshow avec des à-coups du serveur d'affichage (40 ms, 1 fois sur 8)"""
+    def render(packet):
+        time.sleep(0.040 if rng.random() < 0.125 else 0.004)
+    return render
+
+
+def run(render_threaded):
+    rng = random.Random(0)
+    render_stage = RenderStage(slow_display(rng), max_fps=None)
+    pipeline = Pipeline(name="bench")
+    pipeline.add_stage(TrackStage(), threaded=True, mailbox=True)
+    pipeline.add_stage(render_stage, threaded=render_threaded, mailbox=True)
+    pipeline.start()
+    end = time.perf_counter() + DURATION
+    while time.perf_counter() < end:
+        deadline = time.perf_counter() + 1.0 / RESULT_FPS
+        pipeline.submit(FramePacket(frame=object()))
+        time.sleep(max(0.0, deadline - time.perf_counter()))
+    pipeline.stop()
+    stats = pipeline.get_stats()
+    return stats["interpret"]["count"] / DURATION, render_stage.get_stats()["rendered"] / DURATION
+
+
+if __name__ == "__main__":
+    print(f"=== Render Thread Benchmark ({RESULT_FPS} results/s, display stalls) ===\n")
+    for label, threaded in (("inline render ", False), ("render thread ", True)):
+        tracking_fps, render_fps = run(threaded)
+        print(f"{label}: tracking {tracking_fps:5.1f} fps | render {render_fps:5.1f} fps")
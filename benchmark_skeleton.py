@@ -0,0 +1,134 @@
+import cv2
+import numpy as np
+import time
+from types import SimpleNamespace
+
+from src.ui.rendering.skeleton_renderer import (
+    HAND_CONNECTIONS, SkeletonRenderer, draw_hand, landmarks_to_array
+)
+
+
+def make_hand(rng, world=False):
+    """Main synthétique : 21 landmarks (normalisés ou en mètres)"""
+    if world:
+        coords = rng.normal(0.0, 0.04, (21, 3))
+    else:
+        coords = np.column_stack((rng.uniform(0.2, 0.8, 21), rng.uniform(0.2, 0.8, 21), rng.normal(0, 0.05, 21)))
+    return [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in coords]
+
+
+def legacy_4view(result):
+    """Ancien HandEngine._draw_skeleton_4view : fond redessiné, une ligne par os"""
+    img = np.zeros((400, 600, 3), dtype=np.uint8)
+    cv2.line(img, (300, 0), (300, 400), (50, 50, 50), 2)
+    cv2.line(img, (0, 200), (600, 200), (50, 50, 50), 2)
+    cv2.putText(img, 'Main View', (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (100, 100, 255), 1)
+    cv2.putText(img, 'Top View', (310, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (100, 100, 255), 1)
+    cv2.putText(img, 'Left View', (10, 220), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (100, 100, 255), 1)
+    cv2.putText(img, 'Right View', (310, 220), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (100, 100, 255), 1)
+
+    def draw(pts, offset_x, offset_y, scale, color):
+        for start, end in HAND_CONNECTIONS:
+            pt1 = (int(pts[start][0] * scale + offset_x), int(pts[start][1] * scale + offset_y))
+            pt2 = (int(pts[end][0] * scale + offset_x), int(pts[end][1] * scale + offset_y))
+            cv2.line(img, pt1, pt2, (180, 180, 180), 2)
+        for p in pts:
+            cv2.circle(img, (int(p[0] * scale + offset_x), int(p[1] * scale + offset_y)), 3, color, -1)
+
+    for i, hand_landmarks in enumerate(result.hand_landmarks):
+        color = (0, 255, 255) if i == 0 else (255, 0, 255)
+        draw(np.array([(lm.x * 300, lm.y * 200) for lm in hand_landmarks]), 0, 0, 1.0, color)
+        w_pts = np.array([(lm.x, lm.y, lm.z) for lm in result.hand_world_landmarks[i]])
+        draw(np.column_stack((w_pts[:, 0], -w_pts[:, 2])), 450, 100, 600, color)
+        draw(np.column_stack((-w_pts[:, 2], w_pts[:, 1])), 150, 300, 600, color)
+        draw(np.column_stack((w_pts[:, 2], w_pts[:, 1])), 450, 300, 600, color)
+    return img
+
+
+def legacy_render_4view(landmarks, world_landmarks):
+    """Ancien SkeletonRenderer.render_4view (AppCoordinator)"""
+    canvas = np.zeros((400, 600, 3), dtype=np.uint8)
+    cv2.line(canvas, (300, 0), (300, 400), (50, 50, 50), 2)
+    cv2.line(canvas, (0, 200), (600, 200), (50, 50, 50), 2)
+
+    def draw(points):
+        for start_idx, end_idx in HAND_CONNECTIONS:
+            cv2.line(canvas, points[start_idx], points[end_idx], (0, 255, 0), 2)
+        for pt in points:
+            cv2.circle(canvas, pt, 3, (255, 255, 255), -1)
+
+    draw([(int(150 + (lm.x - 0.5) * 150), int(100 + (lm.y - 0.5) * 150)) for lm in landmarks])
+    draw([(int(450 + lm.x * 500), int(100 - lm.z * 500)) for lm in world_landmarks])
+    draw([(int(150 - lm.z * 500), int(300 + lm.y * 500)) for lm in world_landmarks])
+    draw([(int(450 + lm.z * 500), int(300 + lm.y * 500)) for lm in world_landmarks])
+    return canvas
+
+
+def legacy_video_skeleton(img, hands):
+    """Ancien squelette sur la vidéo (_render_frame) : points puis lignes"""
+    h, w = img.shape[:2]
+    for hand_landmarks in hands:
+        lm_list = []
+        for lm in hand_landmarks:
+            px, py = int(lm.x * w), int(lm.y * h)
+            lm_list.append((px, py))
+            cv2.circle(img, (px, py), 2, (100, 100, 100), cv2.FILLED)
+        for start_idx, end_idx in HAND_CONNECTIONS:
+            cv2.line(img, lm_list[start_idx], lm_list[end_idx], (50, 50, 50), 1)
+    return img
+
+
+def vectorized_video_skeleton(img, hands):
+    h, w = img.shape[:2]
+    scale = np.array([w, h], dtype=np.float64)
+    for hand_landmarks in hands:
+        points = (landmarks_to_array(hand_landmarks)[:, :2] * scale).astype(np.int32)
+        draw_hand(img, points, (50, 50, 50), (100, 100, 100), thickness=1, joint_radius=2, joints_first=True)
+    return img
+
+
+def benchmark(fn, iterations, repeat=7):
+    """Meilleur temps moyen (ms) sur repeat séries : le bruit de l'ordonnanceur ne compte pas"""
+    for _ in range(10):
+        fn()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        best = min(best, (time.perf_counter() - start) * 1000 / iterations)
+    return best
+
+
+if __name__ == "__main__":
+    print("=== Skeleton Rendering Benchmark ===\n")
+    iterations = 500
+    rng = np.random.default_rng(0)
+
+    hands = [make_hand(rng) for _ in range(2)]
+    worlds = [make_hand(rng, world=True) for _ in range(2)]
+    result = SimpleNamespace(hand_landmarks=hands, hand_world_landmarks=worlds)
+    hand_pairs = list(zip(hands, worlds))
+
+    engine_renderer = SkeletonRenderer.engine_4view()
+    default_renderer = SkeletonRenderer()
+    video = np.zeros((480, 640, 3), dtype=np.uint8)
+
+    cases = [
+        ("engine 4-view (2 hands)",
+         lambda: legacy_4view(result),
+         lambda: engine_renderer.render_hands(hand_pairs)),
+        ("coordinator 4-view (1 hand)",
+         lambda: legacy_render_4view(hands[0], worlds[0]),
+         lambda: default_renderer.render_4view(hands[0], worlds[0])),
+        ("video skeleton (2 hands)",
+         lambda: legacy_video_skeleton(video.copy(), hands),
+         lambda: vectorized_video_skeleton(video.copy(), hands)),
+    ]
+
+    for name, legacy, vectorized in cases:
+        identical = np.array_equal(legacy(), vectorized())
+        legacy_ms = benchmark(legacy, iterations)
+        vectorized_ms = benchmark(vectorized, iterations)
+        print(f"{name:28} legacy {legacy_ms:6.3f} ms | vectorized {vectorized_ms:6.3f} ms "
+              f"| x{legacy_ms / vectorized_ms:4.1f} | identical: {identical}")
@@ -0,0 +1,73 @@
+import random
+import time
+
+import numpy as np
+
+from src.processing.text.swipe_decoder import SwipeDecoder, base_letters, key_centers, resample
+from src.virtual_keyboard import LETTER_ROWS, LETTER_WIDE_KEYS, KeyboardLayout
+
+
+def synthetic_lexicon(n_words, seed=0):
+    """Mots pseudo-français (syllabes) avec fréquences de Zipf"""
+    rng = random.Random(seed)
+    syllables = ["ba", "bon", "ca", "cha", "de", "é", "fa", "gre", "in", "je", "la", "le", "ma",
+                 "men", "ne", "on", "pa", "pré", "que", "ra", "re", "sa", "son", "ta", "ter",
+                 "tion", "u", "va", "vi", "ment", "eau", "oi", "ou", "er", "es", "ti", "x", "wo", "ky"]
+    words = set()
+    while len(words) < n_words:
+        words.add("".join(rng.choice(syllables) for _ in range(rng.randint(1, 4))))
+    ranked = sorted(words)
+    rng.shuffle(ranked)
+    return [(word, int(10_000_000 / (rank + 1))) for rank, word in enumerate(ranked)]
+
+
+def synthetic_path(word, centers, rng, noise=0.2, key_size=85, step=12):
+    """Tracé d'un doigt : centres des touches décalés, interpolés tous les ~step px, bruités"""
+    keys = [centers[c] for c in base_letters(word)]
+    anchors = [(x + rng.gauss(0, noise * key_size), y + rng.gauss(0, noise * key_size)) for x, y in keys]
+    points = [anchors[0]]
+    for (x0, y0), (x1, y1) in zip(anchors, anchors[1:]):
+        n = max(1, int(np.hypot(x1 - x0, y1 - y0) / step))
+        points.extend((x0 + (x1 - x0) * t / n + rng.gauss(0, 3), y0 + (y1 - y0) * t / n + rng.gauss(0, 3))
+                      for t in range(1, n + 1))
+    return points
+
+
+def full_scan(decoder, path):
+    """Sans élagage : tous les gabarits comparés"""
+    diff = decoder.templates - resample(path, decoder.n_samples)
+    cost = np.sqrt((diff * diff).sum(axis=2)).mean(axis=1) / decoder.key_size + decoder._prior
+    return decoder.words[int(cost.argmin())]
+
+
+def benchmark(decoder, paths, k=3):
+    start = time.perf_counter()
+    results = [decoder.decode(path, k) for path in paths]
+    return results, (time.perf_counter() - start) / len(paths) * 1000
+
+
+if __name__ == "__main__":
+    print("=== Swipe Decoder Benchmark ===\n")
+    centers = key_centers(KeyboardLayout.from_rows("azerty", LETTER_ROWS["azerty"], LETTER_WIDE_KEYS).buttons)
+    rng = random.Random(1)
+    for n_words in (10_000, 50_000):
+        lexicon = synthetic_lexicon(n_words)
+        start = time.perf_counter()
+        decoder = SwipeDecoder(centers, lexicon)
+        build_s = time.perf_counter() - start
+
+        # Mots tirés selon la fréquence (les 2000 plus fréquents) et au hasard dans tout le lexique
+        for label, pool in (("frequent", lexicon[:2000]), ("uniform", lexicon)):
+            words = [rng.choice(pool)[0] for _ in range(300)]
+            paths = [synthetic_path(word, centers, rng) for word in words]
+            results, ms = benchmark(decoder, paths)
+            top1 = sum(r[:1] == [w] for w, r in zip(words, results)) / len(words)
+            top3 = sum(w in r for w, r in zip(words, results)) / len(words)
+            candidates = np.mean([len(decoder.candidates(p[0], p[-1])) for p in paths])
+            print(f"{n_words:>6} words ({label:8}): {ms:6.2f} ms/decode, {candidates:6.0f} candidates, "
+                  f"top-1 {top1:.0%}, top-3 {top3:.0%} (templates built in {build_s:.2f} s)")
+
+        start = time.perf_counter()
+        scan_top1 = sum(full_scan(decoder, p) == w for w, p in zip(words, paths)) / len(words)
+        scan_ms = (time.perf_counter() - start) / len(paths) * 1000
+        print(f"{'':>6} without pruning   : {scan_ms:6.2f} ms/decode, {len(decoder):6} candidates, top-1 {scan_top1:.0%}")
@@ -0,0 +1,187 @@
+"""
+Reconnaissance des gestes dynamiques : précision par geste et coût par frame.
+
+Sessions : synthétiques par défaut, ou enregistrées (fichiers .npz passés en argument) avec
+    frames      (T, 21, 3) landmarks normalisés (miroir appliqué)
+    timestamps  (T,) secondes
+    pinch       (T,) bool, optionnel : geste statique PINCH
+    segments    (S, 3) str : début (s), fin (s), geste attendu ("" : aucun geste)
+"""
+import math
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.processing.gestures.temporal import LandmarkWindow, MotionGesture, TemporalGestureRecognizer
+
+FPS = 30
+# Main ouverte de référence (offsets autour du poignet, taille poignet → majeur ≈ 0.1)
+HAND = np.array([(0, 0), (-.04, -.03), (-.07, -.06), (-.09, -.09), (-.11, -.11), (-.03, -.1), (-.035, -.15),
+                 (-.04, -.18), (-.045, -.21), (0, -.1), (0, -.16), (0, -.19), (0, -.22), (.025, -.095),
+                 (.03, -.145), (.035, -.175), (.04, -.2), (.05, -.08), (.06, -.12), (.065, -.145), (.07, -.165)],
+                dtype=np.float32)
+
+
+def hand_frame(cx, cy, scale=1.0, pinch=False, rng=None, noise=0.003):
+    points = HAND * scale + (cx, cy + 0.1 * scale)
+    if pinch:
+        points[4] = points[8]
+    if rng is not None:
+        points = points + rng.normal(0, noise, points.shape)
+    frame = np.zeros((21, 3), dtype=np.float32)
+    frame[:, :2] = points
+    return frame
+
+
+def synthetic_session(seed=0, repeats=6):
+    """Alternance de gestes et de mouvements parasites (repos, déplacement lent du curseur)"""
+    rng = np.random.default_rng(seed)
+    frames, times, pinch, segments = [], [], [], []
+    t = 0.0
+
+    def emit(positions, label, pinches=None):
+        nonlocal t
+        start = t
+        for i, (cx, cy, scale) in enumerate(positions):
+            p = bool(pinches[i]) if pinches is not None else False
+            frames.append(hand_frame(cx, cy, scale, p, rng))
+            times.append(t)
+            pinch.append(p)
+            t += 1.0 / FPS
+        segments.append((start, t, label))
+
+    def line(x0, y0, x1, y1, seconds, scale=1.0):
+        n = int(seconds * FPS)
+        return [(x0 + (x1 - x0) * i / n, y0 + (y1 - y0) * i / n, scale) for i in range(n)]
+
+    def still(seconds, x=0.5, y=0.5):
+        return [(x, y, 1.0)] * int(seconds * FPS)
+
+    plan = []
+    for _ in range(repeats):
+        plan += [
+            ("SWIPE_RIGHT", lambda: line(0.3, 0.5, 0.7, 0.5, 0.3)),
+            ("SWIPE_LEFT", lambda: line(0.7, 0.5, 0.3, 0.5, 0.3)),
+            ("SWIPE_UP", lambda: line(0.5, 0.7, 0.5, 0.35, 0.3)),
+            ("SWIPE_DOWN", lambda: line(0.5, 0.35, 0.5, 0.7, 0.3)),
+            ("CIRCLE_CW", lambda: [(0.5 + 0.12 * math.cos(a), 0.5 + 0.12 * math.sin(a), 1.0)
+                                   for a in np.linspace(0, 2.2 * math.pi, int(0.9 * FPS))]),
+            ("CIRCLE_CCW", lambda: [(0.5 + 0.12 * math.cos(a), 0.5 - 0.12 * math.sin(a), 1.0)
+                                    for a in np.linspace(0, 2.2 * math.pi, int(0.9 * FPS))]),
+            ("PUSH", lambda: [(0.5, 0.5 - 0.05 * i / 12, 1.0 + 0.6 * i / 12) for i in range(12)]),
+            ("", lambda: line(0.3, 0.4, 0.6, 0.6, 1.5)),   # Curseur lent
+            ("", lambda: still(1.0)),                      # Main au repos
+        ]
+    rng_plan = random.Random(seed)
+    rng_plan.shuffle(plan)
+    # Trajectoire continue : la main rejoint lentement le début du geste, s'y arrête, puis revient
+    position = (0.5, 0.5)
+    for label, motion in plan:
+        positions = motion()
+        x0, y0, _ = positions[0]
+        emit(line(position[0], position[1], x0, y0, 0.8), "")
+        emit(still(0.4, x0, y0), "")
+        emit(positions, label)
+        position = positions[-1][:2]
+        emit(still(0.3, *position), "")
+    emit(line(position[0], position[1], 0.5, 0.5, 0.8), "")
+    for _ in range(repeats):
+        emit(still(0.4), "")
+        emit(still(0.9), "DOUBLE_PINCH", pinches=[0, 0, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1] + [0] * 15)
+    segments = np.array([(f"{a:.4f}", f"{b:.4f}", label) for a, b, label in segments])
+    return np.array(frames), np.array(times), np.array(pinch), segments
+
+
+def to_landmarks(frame):
+    return [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in frame]
+
+
+def evaluate(frames, times, pinch, segments):
+    """Par geste attendu : détecté dans son segment ; ailleurs : faux positif"""
+    recognizer = TemporalGestureRecognizer()
+    detections = []
+    cost = 0.0
+    landmarks = [to_landmarks(f) for f in frames]
+    for lms, t, p in zip(landmarks, times, pinch):
+        start = time.perf_counter()
+        gesture = recognizer.update("Right", lms, float(t), "PINCH" if p else "UNKNOWN")
+        cost += time.perf_counter() - start
+        if gesture is not None:
+            detections.append((float(t), gesture.value))
+
+    per_label = {}
+    false_positives = 0
+    for t, label in detections:
+        # Détection attendue : pendant le segment du geste ou jusqu'à 0.2 s après sa fin
+        if not any(float(start) <= t < float(end) + 0.2 and g == label for start, end, g in segments):
+            false_positives += 1
+    for start, end, label in segments:
+        if not label:
+            continue
+        hit = any(float(start) <= t < float(end) + 0.2 and g == label for t, g in detections)
+        total, found = per_label.get(label, (0, 0))
+        per_label[label] = (total + 1, found + hit)
+    return per_label, false_positives, cost / len(frames) * 1e6
+
+
+def full_window_cost(frames, times, capacity):
+    """Référence : caractéristiques recalculées sur toute la fenêtre à chaque frame"""
+    window = LandmarkWindow(capacity, max_age=60.0)
+    landmarks = [to_landmarks(f) for f in frames]
+    start = time.perf_counter()
+    for lms, t in zip(landmarks, times):
+        window.push(lms, float(t))
+        pts = window.ordered_frames()[:, PALM, :2].mean(axis=1)
+        seg = np.diff(pts, axis=0)
+        path = np.hypot(seg[:, 0], seg[:, 1]).sum()
+        angles = np.arctan2(seg[1:, 0] * seg[:-1, 1] - seg[1:, 1] * seg[:-1, 0],
+                            (seg[1:] * seg[:-1]).sum(axis=1)).sum() if len(seg) > 1 else 0.0
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+PALM = [0, 5, 9, 13, 17]
+
+
+if __name__ == "__main__":
+    print("=== Temporal Gesture Benchmark ===\n")
+    if len(sys.argv) > 1:
+        sessions = []
+        for path in sys.argv[1:]:
+            data = np.load(path)
+            pinch = data["pinch"] if "pinch" in data else np.zeros(len(data["timestamps"]), bool)
+            sessions.append((path, (data["frames"], data["timestamps"], pinch, data["segments"])))
+    else:
+        sessions = [(f"synthetic #{seed}", synthetic_session(seed)) for seed in range(3)]
+
+    totals = {}
+    false_positives = frames_count = 0
+    for name, session in sessions:
+        per_label, fp, us = evaluate(*session)
+        n_frames = len(session[0])
+        print(f"{name:14}: {n_frames} frames, {us:.1f} us/frame (incremental), {fp} false positives")
+        for label, (total, found) in per_label.items():
+            t, f = totals.get(label, (0, 0))
+            totals[label] = (t + total, f + found)
+        false_positives += fp
+        frames_count += n_frames
+
+    print()
+    for label in MotionGesture:
+        if label.value in totals:
+            total, found = totals[label.value]
+            print(f"  {label.value:13}: {found}/{total} recognized ({found / total:.0%})")
+    print(f"  false positives: {false_positives} ({false_positives / (frames_count / FPS / 60):.2f}/min)\n")
+
+    frames, times = sessions[0][1][0], sessions[0][1][1]
+    for capacity in (16, 32, 64, 128):
+        window = LandmarkWindow(capacity, max_age=60.0)
+        landmarks = [to_landmarks(f) for f in frames]
+        start = time.perf_counter()
+        for lms, t in zip(landmarks, times):
+            window.push(lms, float(t))
+        incremental = (time.perf_counter() - start) / len(frames) * 1e6
+        print(f"window {capacity:3} frames: incremental {incremental:5.1f} us/frame, "
+              f"full recompute {full_window_cost(frames, times, capacity):6.1f} us/frame")
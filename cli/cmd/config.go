@@ -48,6 +48,17 @@ var configSetCmd = &cobra.Command{
 			} else {
 				fmt.Fprintf(os.Stderr, "❌ %s\n", resp.Message)
 			}
+		case "pause":
+			resp, err := ipc.SetPauseMode(value)
+			if err != nil {
+				fmt.Fprintf(os.Stderr, "❌ Erreur: %v\n", err)
+				os.Exit(1)
+			}
+			if resp.Status == "ok" {
+				fmt.Printf("✅ Pause mode: %s\n", value)
+			} else {
+				fmt.Fprintf(os.Stderr, "❌ %s\n", resp.Message)
+			}
 		default:
 			fmt.Fprintf(os.Stderr, "❌ Clé inconnue: %s\n", key)
 			os.Exit(1)
@@ -80,6 +91,8 @@ var configGetCmd = &cobra.Command{
 			fmt.Printf("Processing: %v\n", resp.Data["is_processing"])
 		case "camera":
 			fmt.Printf("Camera: %v\n", resp.Data["camera_index"])
+		case "pause":
+			fmt.Printf("Pause mode: %v (dernière reprise: %v ms)\n", resp.Data["pause_mode"], resp.Data["last_resume_ms"])
 		default:
 			fmt.Fprintf(os.Stderr, "❌ Clé inconnue: %s\n", key)
 			os.Exit(1)
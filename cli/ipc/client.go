@@ -76,3 +76,13 @@ func SetASL(enabled bool) (*Response, error) {
 func SetCamera(index int) (*Response, error) {
 	return SendCommand(Command{Command: "set_camera", Value: index})
 }
+
+// SetPauseMode définit la politique de pause (cold, warm, hot)
+func SetPauseMode(mode string) (*Response, error) {
+	return SendCommand(Command{Command: "set_pause_mode", Value: mode})
+}
+
+// GetResumeStats récupère les temps de reprise mesurés par mode
+func GetResumeStats() (*Response, error) {
+	return SendCommand(Command{Command: "get_resume_stats"})
+}
@@ -2,12 +2,18 @@
 Module de dispatch des actions.
 
 Traduit les combinaisons (Geste + Mode + Timing) en actions système.
+
+Les liaisons (mode, geste, timing) → action sont compilées une fois en tables de saut
+par mode (ActionTable) : à chaque frame, deux accès dict sur les chaînes déjà canoniques
+(valeurs de ContextMode et étiquettes de gestes) puis un index de tuple par timing.
 """
 
 from enum import Enum
-from typing import Callable, Optional, Dict, Tuple
+from typing import Callable, Optional, Dict, Tuple, Union
 import time
 
+from src.context_mode import ContextMode
+
 
 class ActionType(Enum):
     """Types d'actions système."""
@@ -51,6 +57,87 @@ class GestureTiming(Enum):
     QUICK = "quick"       # < 300ms
     HOLD = "hold"         # 300ms - 1s
     LONG = "long"         # > 1s
+    MOTION = "motion"     # Geste dynamique terminé (swipe, cercle...)
+
+
+# Case de chaque timing dans les lignes des tables compilées
+TIMINGS = tuple(GestureTiming)
+QUICK_SLOT, HOLD_SLOT, LONG_SLOT, MOTION_SLOT = (TIMINGS.index(t) for t in (
+    GestureTiming.QUICK, GestureTiming.HOLD, GestureTiming.LONG, GestureTiming.MOTION))
+MODES = frozenset(mode.value for mode in ContextMode)
+
+_NO_ACTIONS = (ActionType.NONE,) * len(TIMINGS)
+_NO_GESTURES: Dict[str, Tuple[ActionType, ...]] = {}
+
+# Informations d'affichage : table statique, une entrée par action (aucune allocation par appel)
+_ACTION_NAMES = {
+    ActionType.MOVE_CURSOR: {"name": "Déplacer curseur", "emoji": "🖱️"},
+    ActionType.CLICK_LEFT: {"name": "Clic gauche", "emoji": "👆"},
+    ActionType.CLICK_RIGHT: {"name": "Clic droit", "emoji": "👉"},
+    ActionType.DRAG_START: {"name": "Glisser", "emoji": "✊"},
+    ActionType.SCROLL_UP: {"name": "Défiler", "emoji": "📜"},
+    ActionType.SNAP_LEFT: {"name": "Snap gauche", "emoji": "⬅️"},
+    ActionType.SNAP_RIGHT: {"name": "Snap droite", "emoji": "➡️"},
+    ActionType.MAXIMIZE: {"name": "Maximiser", "emoji": "🔲"},
+    ActionType.MINIMIZE: {"name": "Minimiser", "emoji": "➖"},
+    ActionType.PLAY_PAUSE: {"name": "Play/Pause", "emoji": "⏯️"},
+    ActionType.NEXT_TRACK: {"name": "Piste suivante", "emoji": "⏭️"},
+    ActionType.VOLUME_UP: {"name": "Volume +", "emoji": "🔊"},
+    ActionType.COPY: {"name": "Copier", "emoji": "📋"},
+    ActionType.PASTE: {"name": "Coller", "emoji": "📥"},
+    ActionType.NONE: {"name": "Aucune", "emoji": "⏸️"},
+}
+ACTION_INFO: Dict[ActionType, dict] = {
+    action: _ACTION_NAMES.get(action, {"name": str(action), "emoji": "❓"}) for action in ActionType
+}
+
+Bindings = Dict[Tuple[str, str, str], Union[ActionType, str]]
+
+
+class ActionTable:
+    """
+    Liaisons compilées : mode → geste → tuple d'actions indexé par case de timing.
+    Immuable : remplacer la table est une affectation de référence, atomique pour les
+    threads qui la lisent (aucune frame ne voit une table à moitié construite).
+    """
+
+    __slots__ = ("modes", "bindings")
+
+    def __init__(self, bindings: Bindings):
+        """
+        Args:
+            bindings: {(mode, geste, timing): action} ; action en ActionType ou sa valeur
+                ("click_left"). ValueError si le mode, le timing ou l'action est inconnu.
+        """
+        rows: Dict[str, Dict[str, list]] = {}
+        canonical = {}
+        for (mode, gesture, timing), action in bindings.items():
+            mode, gesture, timing = mode.lower(), gesture.upper(), timing.lower()
+            if mode not in MODES:
+                raise ValueError(f"Unknown mode '{mode}' for {gesture}/{timing}")
+            slot = TIMINGS.index(GestureTiming(timing))
+            if not isinstance(action, ActionType):
+                action = ActionType(str(action).lower())
+            row = rows.setdefault(mode, {}).setdefault(gesture, list(_NO_ACTIONS))
+            row[slot] = action
+            canonical[(mode, gesture, timing)] = action
+        self.modes: Dict[str, Dict[str, Tuple[ActionType, ...]]] = {
+            mode: {gesture: tuple(row) for gesture, row in gestures.items()}
+            for mode, gestures in rows.items()
+        }
+        self.bindings = canonical  # Forme source (sérialisable, comparable)
+
+    def __len__(self) -> int:
+        return len(self.bindings)
+
+    def lookup(self, mode: str, gesture: str, slot: int) -> ActionType:
+        gestures = self.modes.get(mode)
+        if gestures is None:
+            gestures = self.modes.get(mode.lower(), _NO_GESTURES)
+        row = gestures.get(gesture)
+        if row is None:
+            row = gestures.get(gesture.upper(), _NO_ACTIONS)
+        return row[slot]
 
 
 class ActionDispatcher:
@@ -60,16 +147,35 @@ class ActionDispatcher:
     QUICK_THRESHOLD = 0.3
     HOLD_THRESHOLD = 1.0
     
-    def __init__(self):
+    def __init__(self, bindings: Optional[Bindings] = None):
+        """
+        Args:
+            bindings: liaisons (mode, geste, timing) → action ; None : liaisons par défaut
+        """
         self._gesture_start_time: Dict[str, float] = {}
         self._last_gesture: Optional[str] = None
         self._is_dragging = False
+        self.system_actions = None  # SystemActions : exécution réelle (execute_action)
         
-        # Table de mapping: (Mode, Geste, Timing) -> Action
-        self._action_table = self._build_action_table()
+        # Table de mapping compilée: Mode → Geste → [Timing] → Action
+        self._table = ActionTable(bindings if bindings is not None else self._build_action_table())
+    
+    @property
+    def table(self) -> ActionTable:
+        return self._table
+    
+    def set_bindings(self, bindings: Bindings) -> ActionTable:
+        """Compile de nouvelles liaisons puis remplace la table d'un coup (ValueError si invalides)"""
+        table = ActionTable(bindings)  # Compilée hors de la table active
+        self.set_table(table)
+        return table
+    
+    def set_table(self, table: ActionTable):
+        """Installe une table déjà compilée (une seule affectation)"""
+        self._table = table
         
     def _build_action_table(self) -> Dict[Tuple, ActionType]:
-        """Construit la table de mapping Geste+Mode+Timing → Action."""
+        """Liaisons par défaut (Mode, Geste, Timing) → Action."""
         return {
             # ==================== MODE CURSOR ====================
             ("cursor", "POINTING", "quick"): ActionType.MOVE_CURSOR,
@@ -116,13 +222,32 @@ class ActionDispatcher:
             ("shortcut", "PALM", "quick"): ActionType.PASTE,
             ("shortcut", "TWO_FINGERS", "quick"): ActionType.CUT,
             ("shortcut", "POINTING", "quick"): ActionType.UNDO,
+            
+            # ==================== GESTES DYNAMIQUES ====================
+            # Timing "motion" : geste terminé (TemporalGestureRecognizer), pas de durée.
+            # Pas de swipe en mode cursor : la main y déplace le curseur.
+            ("window", "SWIPE_LEFT", "motion"): ActionType.SNAP_LEFT,
+            ("window", "SWIPE_RIGHT", "motion"): ActionType.SNAP_RIGHT,
+            ("window", "SWIPE_UP", "motion"): ActionType.MAXIMIZE,
+            ("window", "SWIPE_DOWN", "motion"): ActionType.MINIMIZE,
+            ("window", "CIRCLE_CW", "motion"): ActionType.SWITCH_WINDOW,
+            
+            ("media", "SWIPE_RIGHT", "motion"): ActionType.NEXT_TRACK,
+            ("media", "SWIPE_LEFT", "motion"): ActionType.PREV_TRACK,
+            ("media", "CIRCLE_CW", "motion"): ActionType.VOLUME_UP,
+            ("media", "CIRCLE_CCW", "motion"): ActionType.VOLUME_DOWN,
+            ("media", "PUSH", "motion"): ActionType.PLAY_PAUSE,
+            ("media", "DOUBLE_PINCH", "motion"): ActionType.MUTE,
+            
+            ("shortcut", "SWIPE_LEFT", "motion"): ActionType.UNDO,
         }
     
     def get_action(
         self, 
         mode: str, 
         gesture: str, 
-        gesture_start_time: Optional[float] = None
+        gesture_start_time: Optional[float] = None,
+        timestamp: Optional[float] = None
     ) -> ActionType:
         """
         Détermine l'action à effectuer.
@@ -131,83 +256,69 @@ class ActionDispatcher:
             mode: Mode contextuel actif ('cursor', 'window', 'media', 'shortcut')
             gesture: Geste détecté ('POINTING', 'PINCH', 'PALM', 'FIST', 'TWO_FINGERS')
             gesture_start_time: Timestamp du début du geste (optionnel)
+            timestamp: Instant de capture de la frame (s, monotone) ; à défaut, l'horloge
+                monotone du système
             
         Returns:
             ActionType: L'action à exécuter
         """
         # Déterminer le timing
-        timing = self._get_timing(gesture, gesture_start_time)
+        now = timestamp if timestamp is not None else time.monotonic()
+        slot = self._timing_slot(gesture, gesture_start_time, now)
         
-        # Lookup dans la table
-        key = (mode.lower(), gesture.upper(), timing.value)
-        action = self._action_table.get(key, ActionType.NONE)
-        
-        return action
+        # Lookup dans la table compilée (lue une fois : un remplacement concurrent est sans effet ici)
+        return self._table.lookup(mode, gesture, slot)
+    
+    def get_motion_action(self, mode: str, motion: str) -> ActionType:
+        """Action d'un geste dynamique terminé (SWIPE_LEFT, CIRCLE_CW, PUSH...)"""
+        return self._table.lookup(mode, motion, MOTION_SLOT)
     
     def _get_timing(
         self, 
         gesture: str, 
-        gesture_start_time: Optional[float]
+        gesture_start_time: Optional[float],
+        now: float
     ) -> GestureTiming:
-        """Calcule le timing du geste."""
-        now = time.time()
-        
+        """Calcule le timing du geste (durées mesurées sur l'horloge de frame)."""
+        return TIMINGS[self._timing_slot(gesture, gesture_start_time, now)]
+    
+    def _timing_slot(self, gesture: str, gesture_start_time: Optional[float], now: float) -> int:
+        """Case de timing (index dans les lignes de la table compilée)"""
         # Nouveau geste ou pas de timestamp
         if gesture != self._last_gesture:
             self._gesture_start_time[gesture] = now
             self._last_gesture = gesture
-            return GestureTiming.QUICK
+            return QUICK_SLOT
         
         # Utiliser le timestamp fourni ou celui stocké
-        start = gesture_start_time or self._gesture_start_time.get(gesture, now)
+        start = gesture_start_time if gesture_start_time is not None else self._gesture_start_time.get(gesture, now)
         duration = now - start
         
         if duration < self.QUICK_THRESHOLD:
-            return GestureTiming.QUICK
+            return QUICK_SLOT
         elif duration < self.HOLD_THRESHOLD:
-            return GestureTiming.HOLD
+            return HOLD_SLOT
         else:
-            return GestureTiming.LONG
+            return LONG_SLOT
     
     def execute_action(self, action: ActionType, **kwargs) -> bool:
         """
-        Exécute l'action système.
+        Exécute l'action système (appel bloquant : à passer par l'ActionExecutor).
         
         Args:
             action: L'action à exécuter
-            **kwargs: Paramètres additionnels (position, direction, etc.)
+            **kwargs: Paramètres de SystemActions.perform (count, timestamp)
             
         Returns:
             bool: True si l'action a été exécutée avec succès
         """
-        # Pour l'instant, on log simplement l'action
-        # L'implémentation réelle sera connectée au MouseDriver et aux API système
-        
         if action == ActionType.NONE:
             return True
-        
-        # TODO: Implémenter les actions réelles
-        # Cette méthode sera appelée par le moteur principal
-        
-        return True
+        if self.system_actions is None:
+            return False
+        return self.system_actions.perform(action, **kwargs)
     
     def get_action_info(self, action: ActionType) -> dict:
-        """Retourne les informations sur une action."""
-        action_info = {
-            ActionType.MOVE_CURSOR: {"name": "Déplacer curseur", "emoji": "🖱️"},
-            ActionType.CLICK_LEFT: {"name": "Clic gauche", "emoji": "👆"},
-            ActionType.CLICK_RIGHT: {"name": "Clic droit", "emoji": "👉"},
-            ActionType.DRAG_START: {"name": "Glisser", "emoji": "✊"},
-            ActionType.SCROLL_UP: {"name": "Défiler", "emoji": "📜"},
-            ActionType.SNAP_LEFT: {"name": "Snap gauche", "emoji": "⬅️"},
-            ActionType.SNAP_RIGHT: {"name": "Snap droite", "emoji": "➡️"},
-            ActionType.MAXIMIZE: {"name": "Maximiser", "emoji": "🔲"},
-            ActionType.MINIMIZE: {"name": "Minimiser", "emoji": "➖"},
-            ActionType.PLAY_PAUSE: {"name": "Play/Pause", "emoji": "⏯️"},
-            ActionType.NEXT_TRACK: {"name": "Piste suivante", "emoji": "⏭️"},
-            ActionType.VOLUME_UP: {"name": "Volume +", "emoji": "🔊"},
-            ActionType.COPY: {"name": "Copier", "emoji": "📋"},
-            ActionType.PASTE: {"name": "Coller", "emoji": "📥"},
-            ActionType.NONE: {"name": "Aucune", "emoji": "⏸️"},
-        }
-        return action_info.get(action, {"name": str(action), "emoji": "❓"})
+        """Retourne les informations sur une action (table statique partagée : ne pas modifier)."""
+        info = ACTION_INFO.get(action)
+        return info if info is not None else {"name": str(action), "emoji": "❓"}
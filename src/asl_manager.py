@@ -1,12 +1,19 @@
+import os
+
 from src.sign_recognizer import SignLanguageInterpreter
+from src.processing.gestures.pose_knn import DEFAULT_ASL_DATASET, KNNPoseClassifier
 
 class ASLManager:
     """
     Gère la logique métier de la reconnaissance ASL.
     Encapsule l'interpréteur, l'état d'activation et le formatage des résultats.
     """
-    def __init__(self):
-        self.interpreter = SignLanguageInterpreter()
+    def __init__(self, backend: str = "rules", dataset_path: str = DEFAULT_ASL_DATASET):
+        # "knn" : lettres apprises sur exemples (même interface predict), si le jeu de données existe
+        if backend == "knn" and os.path.exists(dataset_path):
+            self.interpreter = KNNPoseClassifier.load(dataset_path, unknown="Unknown")
+        else:
+            self.interpreter = SignLanguageInterpreter()
         self.enabled = False
         self.last_prediction = "Attente..."
         self.last_confidence = 0.0
@@ -17,9 +24,10 @@ class ASLManager:
         if not enabled:
             self.last_prediction = "Désactivé"
 
-    def process(self, landmarks):
+    def process(self, landmarks, normalized=None):
         """
         Traite les landmarks si activé et met à jour la prédiction.
+        normalized : main dans son repère (hand_frame) si déjà calculée par le pipeline.
         Retourne True si une mise à jour a eu lieu.
         """
         if not self.enabled:
@@ -30,7 +38,7 @@ class ASLManager:
             self.last_confidence = 0.0
             return True
 
-        label, conf = self.interpreter.predict(None, landmarks)
+        label, conf = self.interpreter.predict(None, landmarks, normalized)
         self.last_prediction = label
         self.last_confidence = conf
         return True
@@ -5,6 +5,7 @@ Le système devine automatiquement ce que l'utilisateur veut faire
 selon la position de sa main et le contexte.
 """
 
+from dataclasses import dataclass
 from enum import Enum
 from typing import Tuple, Optional
 import time
@@ -19,6 +20,15 @@ class ContextMode(Enum):
     KEYBOARD = "keyboard"  # Zone basse - Clavier virtuel
 
 
+@dataclass(frozen=True)
+class ContextZones:
+    """Géométrie des zones et seuils du mode SHORTCUT (remplacée d'un bloc au rechargement)"""
+    media_zone_top: float = 0.20
+    window_edge_margin: float = 0.10
+    shortcut_hold_time: float = 0.8
+    shortcut_move_threshold: float = 0.03
+
+
 class ContextModeDetector:
     """Détecteur de mode contextuel basé sur la position de la main."""
     
@@ -32,14 +42,21 @@ class ContextModeDetector:
     
     def __init__(self):
         self._left_hand_history = []  # Historique positions main gauche
-        self._left_hand_gesture_time = 0  # Timestamp début geste main gauche
+        self._left_hand_gesture_time = None  # Timestamp début geste main gauche (horloge de frame)
         self._current_mode = ContextMode.CURSOR
+        self.zones = ContextZones(self.MEDIA_ZONE_TOP, self.WINDOW_EDGE_MARGIN,
+                                  self.SHORTCUT_HOLD_TIME, self.SHORTCUT_MOVE_THRESHOLD)
+    
+    def set_zones(self, zones: ContextZones):
+        """Nouvelle géométrie : une seule affectation, une frame voit l'ancienne ou la nouvelle"""
+        self.zones = zones
         
     def detect_mode(
         self, 
         hand_pos: Tuple[float, float],  # Position normalisée (0-1)
         left_hand_gesture: Optional[str] = None,
-        left_hand_pos: Optional[Tuple[float, float]] = None
+        left_hand_pos: Optional[Tuple[float, float]] = None,
+        timestamp: Optional[float] = None
     ) -> ContextMode:
         """
         Détecte le mode contextuel basé sur la position de la main.
@@ -48,30 +65,34 @@ class ContextModeDetector:
             hand_pos: Position (x, y) normalisée de la main dominante (0-1)
             left_hand_gesture: Geste détecté sur la main secondaire (gauche)
             left_hand_pos: Position de la main secondaire
+            timestamp: Instant de capture de la frame (s, monotone) ; à défaut, l'horloge
+                monotone du système (comportement dépendant de la cadence de traitement)
             
         Returns:
             ContextMode: Le mode contextuel approprié
         """
         x, y = hand_pos
+        zones = self.zones
         
         # 1. SHORTCUT: Main gauche en FIST maintenu
-        if self._check_shortcut_mode(left_hand_gesture, left_hand_pos):
+        now = timestamp if timestamp is not None else time.monotonic()
+        if self._check_shortcut_mode(left_hand_gesture, left_hand_pos, now, zones):
             self._current_mode = ContextMode.SHORTCUT
             return ContextMode.SHORTCUT
         
         # Reset shortcut timer si conditions non remplies
         if left_hand_gesture != "FIST":
-            self._left_hand_gesture_time = 0
+            self._left_hand_gesture_time = None
         
         # 2. MEDIA: Main dans la zone supérieure
-        if y < self.MEDIA_ZONE_TOP:
+        if y < zones.media_zone_top:
             self._current_mode = ContextMode.MEDIA
             return ContextMode.MEDIA
         
         # 3. WINDOW: Main près des bords de l'écran
-        near_left = x < self.WINDOW_EDGE_MARGIN
-        near_right = x > (1 - self.WINDOW_EDGE_MARGIN)
-        near_bottom = y > (1 - self.WINDOW_EDGE_MARGIN)
+        near_left = x < zones.window_edge_margin
+        near_right = x > (1 - zones.window_edge_margin)
+        near_bottom = y > (1 - zones.window_edge_margin)
         
         if near_left or near_right or near_bottom:
             self._current_mode = ContextMode.WINDOW
@@ -84,17 +105,17 @@ class ContextModeDetector:
     def _check_shortcut_mode(
         self, 
         left_hand_gesture: Optional[str],
-        left_hand_pos: Optional[Tuple[float, float]]
+        left_hand_pos: Optional[Tuple[float, float]],
+        now: float,
+        zones: ContextZones
     ) -> bool:
         """Vérifie si les conditions du mode SHORTCUT sont remplies."""
         
         if left_hand_gesture != "FIST" or left_hand_pos is None:
             return False
         
-        now = time.time()
-        
         # Première détection du geste
-        if self._left_hand_gesture_time == 0:
+        if self._left_hand_gesture_time is None:
             self._left_hand_gesture_time = now
             self._left_hand_history = [left_hand_pos]
             return False
@@ -116,13 +137,13 @@ class ContextModeDetector:
             avg_movement = total_movement / (len(self._left_hand_history) - 1)
             
             # Main pas assez stable
-            if avg_movement > self.SHORTCUT_MOVE_THRESHOLD:
+            if avg_movement > zones.shortcut_move_threshold:
                 self._left_hand_gesture_time = now
                 return False
         
         # Vérifier le temps de maintien
         hold_duration = now - self._left_hand_gesture_time
-        return hold_duration >= self.SHORTCUT_HOLD_TIME
+        return hold_duration >= zones.shortcut_hold_time
     
     def get_mode_info(self) -> dict:
         """Retourne les informations sur le mode actuel."""
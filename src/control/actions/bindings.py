@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""
+Bindings - Liaisons geste → action et zones de mode, éditables par l'utilisateur
+Responsabilité unique : Lire, valider et appliquer à chaud le fichier de liaisons
+(src/config/bindings.yaml), sans arrêter le moteur ni recharger le modèle.
+
+Format (YAML, ou JSON si l'extension est .json) :
+
+    inherit_defaults: true        # Partir des liaisons par défaut (false : table vide)
+    bindings:
+      cursor:
+        PINCH: {quick: click_left, hold: drag_start, long: drag_start}
+        PALM: move_cursor         # Raccourci : quick, hold et long
+        FIST: none                # Retire la liaison par défaut
+      window:
+        SWIPE_LEFT: {motion: snap_left}
+    zones:
+      media_zone_top: 0.2
+      window_edge_margin: 0.1
+      shortcut_hold_time: 0.8
+      shortcut_move_threshold: 0.03
+
+Une entrée (mode, geste) remplace toutes les liaisons par défaut de ce geste dans ce mode.
+Le fichier est surveillé par BindingsWatcher (date de modification, sondage) : à chaque
+changement, il est relu et compilé sur le thread du watcher, puis la table de dispatch et
+les zones sont remplacées chacune par une seule affectation. Un fichier invalide est
+signalé et l'ancienne configuration reste active.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from src.action_dispatcher import ActionDispatcher, ActionTable, ActionType, GestureTiming, MODES
+from src.context_mode import ContextModeDetector, ContextZones
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "config")
+DEFAULT_BINDINGS_PATH = os.path.join(CONFIG_DIR, "bindings.yaml")
+
+STATIC_TIMINGS = (GestureTiming.QUICK.value, GestureTiming.HOLD.value, GestureTiming.LONG.value)
+TOP_LEVEL_KEYS = ("inherit_defaults", "bindings", "zones")
+# Bornes des zones (fractions de l'image, secondes)
+ZONE_LIMITS = {
+    "media_zone_top": (0.0, 1.0),
+    "window_edge_margin": (0.0, 0.5),
+    "shortcut_hold_time": (0.0, 10.0),
+    "shortcut_move_threshold": (0.0, 1.0),
+}
+
+
+class BindingsError(ValueError):
+    """Fichier de liaisons invalide : toutes les erreurs trouvées (errors)"""
+
+    def __init__(self, path: str, errors: List[str]):
+        self.path = path
+        self.errors = errors
+        super().__init__(f"{path}: " + "; ".join(errors))
+
+
+@dataclass
+class BindingsConfig:
+    """Configuration validée et compilée, prête à être installée"""
+    table: ActionTable
+    zones: ContextZones
+
+
+def parse_bindings(data, defaults: Dict, path: str = "<bindings>") -> BindingsConfig:
+    """Dict lu du fichier → BindingsConfig ; BindingsError avec toutes les erreurs"""
+    errors = []
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        raise BindingsError(path, ["top level must be a mapping"])
+    for key in data:
+        if key not in TOP_LEVEL_KEYS:
+            errors.append(f"unknown key '{key}' (expected {', '.join(TOP_LEVEL_KEYS)})")
+
+    inherit = data.get("inherit_defaults", True)
+    if not isinstance(inherit, bool):
+        errors.append("inherit_defaults must be true or false")
+        inherit = True
+    bindings = dict(defaults) if inherit else {}
+
+    modes = data.get("bindings") or {}
+    if not isinstance(modes, dict):
+        errors.append("bindings must map modes to gestures")
+        modes = {}
+    for mode, gestures in modes.items():
+        mode_key = str(mode).lower()
+        if mode_key not in MODES:
+            errors.append(f"unknown mode '{mode}' (expected {', '.join(sorted(MODES))})")
+            continue
+        if not isinstance(gestures, dict):
+            errors.append(f"bindings.{mode} must map gestures to actions")
+            continue
+        for gesture, actions in gestures.items():
+            gesture_key = str(gesture).upper()
+            where = f"bindings.{mode}.{gesture}"
+            if isinstance(actions, str):
+                actions = {timing: actions for timing in STATIC_TIMINGS}
+            elif not isinstance(actions, dict):
+                errors.append(f"{where} must be an action or a timing → action mapping")
+                continue
+            row = {}
+            for timing, action in actions.items():
+                try:
+                    timing_key = GestureTiming(str(timing).lower()).value
+                except ValueError:
+                    errors.append(f"{where}: unknown timing '{timing}'")
+                    continue
+                try:
+                    row[timing_key] = ActionType(str(action).lower())
+                except ValueError:
+                    errors.append(f"{where}.{timing}: unknown action '{action}'")
+            # Le geste est redéfini dans ce mode : ses liaisons précédentes disparaissent
+            for key in [k for k in bindings if k[0] == mode_key and k[1] == gesture_key]:
+                del bindings[key]
+            for timing_key, action in row.items():
+                if action != ActionType.NONE:
+                    bindings[(mode_key, gesture_key, timing_key)] = action
+
+    zone_values = {}
+    zones = data.get("zones") or {}
+    if not isinstance(zones, dict):
+        errors.append("zones must be a mapping")
+        zones = {}
+    for name, value in zones.items():
+        if name not in ZONE_LIMITS:
+            errors.append(f"unknown zone setting '{name}' (expected {', '.join(ZONE_LIMITS)})")
+            continue
+        low, high = ZONE_LIMITS[name]
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not low <= value <= high:
+            errors.append(f"zones.{name} must be a number in [{low}, {high}], got {value!r}")
+            continue
+        zone_values[name] = float(value)
+
+    if errors:
+        raise BindingsError(path, errors)
+    return BindingsConfig(ActionTable(bindings), ContextZones(**zone_values))
+
+
+def load_bindings(path: str = DEFAULT_BINDINGS_PATH, defaults: Optional[Dict] = None) -> BindingsConfig:
+    """Lit et valide un fichier de liaisons (YAML, ou JSON si .json)"""
+    if defaults is None:
+        defaults = ActionDispatcher().table.bindings
+    try:
+        with open(path, encoding="utf-8") as f:
+            if path.endswith(".json"):
+                data = json.load(f)
+            else:
+                import yaml
+                data = yaml.safe_load(f)
+    except Exception as e:  # Lecture, syntaxe JSON / YAML, PyYAML absent
+        raise BindingsError(path, [" ".join(str(e).split())]) from e
+    return parse_bindings(data, defaults, path)
+
+
+class BindingsWatcher:
+    """
+    Surveille le fichier de liaisons et applique chaque version valide à chaud.
+
+    Cibles : ActionDispatcher (table), ContextModeDetector (zones) et, si fourni,
+    l'overlay qui dessine les zones. Le thread du watcher fait tout le travail (lecture,
+    validation, compilation) ; les étages du pipeline ne voient que des remplacements
+    de références.
+    """
+
+    def __init__(self, dispatcher: ActionDispatcher, mode_detector: ContextModeDetector,
+                 overlay=None, path: str = DEFAULT_BINDINGS_PATH, interval: float = 0.5):
+        self.dispatcher = dispatcher
+        self.mode_detector = mode_detector
+        self.overlay = overlay
+        self.path = path
+        self.interval = interval
+        self._defaults = dispatcher.table.bindings  # Liaisons du code, base de chaque fichier
+        self._stamp = None
+        self.reloads = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self.reload_ms = deque(maxlen=20)  # Lecture + validation + compilation + installation
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, name="bindings-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def check(self) -> bool:
+        """Recharge si le fichier a changé (ou disparu). True si une configuration a été installée."""
+        try:
+            st = os.stat(self.path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        if stamp == self._stamp:
+            return False
+        self._stamp = stamp
+
+        start = time.perf_counter()
+        if stamp is None:
+            # Fichier supprimé : retour aux liaisons du code
+            config = parse_bindings({}, self._defaults, self.path)
+        else:
+            try:
+                config = load_bindings(self.path, self._defaults)
+            except BindingsError as e:
+                self.failures += 1
+                self.last_error = str(e)
+                print(f"⚠️ Bindings not applied, keeping current ones: {e}")
+                return False
+        self._install(config)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.reloads += 1
+        self.last_error = None
+        self.reload_ms.append(elapsed_ms)
+        print(f"🔁 Bindings loaded in {elapsed_ms:.1f} ms ({len(config.table)} bindings)")
+        return True
+
+    def get_stats(self) -> dict:
+        times = list(self.reload_ms)
+        return {
+            "path": self.path,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "last_ms": times[-1] if times else 0.0,
+            "max_ms": max(times) if times else 0.0,
+        }
+
+    def _install(self, config: BindingsConfig):
+        self.dispatcher.set_table(config.table)
+        self.mode_detector.set_zones(config.zones)
+        if self.overlay is not None:
+            self.overlay.set_zones(config.zones.media_zone_top, config.zones.window_edge_margin)
+
+    def _worker(self):
+        while self._running:
+            try:
+                self.check()
+            except Exception as e:
+                print(f"⚠️ Bindings watcher error: {e}")
+            time.sleep(self.interval)
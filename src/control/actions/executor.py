@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+ActionExecutor - Exécution des entrées OS hors du thread d'interprétation
+Responsabilité unique : Sérialiser les appels bloquants (uinput, pynput, pyautogui) sur un
+thread dédié, derrière une file bornée, en mesurant attente et durée par type d'action
+
+Les actions répétables (pas de volume, scroll...) soumises par submit_coalesced fusionnent
+avec la dernière action en file si elle est identique et pas encore démarrée : une seule
+exécution avec count=n au lieu de n passages dans la file.
+
+Les fonctions enregistrées par on_idle (écriture groupée des événements uinput) sont
+appelées chaque fois que la file se vide : les entrées d'une rafale partent ensemble.
+
+Les relâchements (RELEASE_ACTIONS) ne sont jamais abandonnés, même file pleine : perdre un
+drag_end laisserait le bouton appuyé côté OS.
+"""
+import threading
+import time
+import traceback
+from typing import Callable, Optional
+
+from src.core.pipeline import DropPolicy, StageQueue, StageStats
+
+
+class ActionExecutor:
+    """File d'actions OS consommée par un thread unique (ordre de soumission préservé)"""
+
+    # Actions qui relâchent un bouton ou une touche maintenus
+    RELEASE_ACTIONS = frozenset({"drag_end"})
+
+    def __init__(self, max_pending: int = 64):
+        # Plein : la plus ancienne action (hors relâchements) est abandonnée plutôt que de
+        # bloquer l'interprétation
+        self._queue = StageQueue(max_pending, DropPolicy.DROP_OLDEST)
+        self._exec_stats = {}
+        self._wait_stats = {}
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        # Dernière action soumise en mode coalescé : (clé, entrée), None après une autre soumission
+        self._lock = threading.Lock()
+        self._tail = None
+        self.coalesced = 0
+        self._idle_hooks = []
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, name="action-executor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, name: str, fn: Callable, *args, **kwargs) -> bool:
+        """Met une action en file. name regroupe les métriques (move, click, key...)."""
+        with self._lock:
+            self._tail = None
+            return self._queue.put((name, fn, args, kwargs, time.perf_counter()),
+                                   droppable=name not in self.RELEASE_ACTIONS)
+
+    def submit_coalesced(self, name: str, fn: Callable, *args, **kwargs) -> bool:
+        """
+        Comme submit, mais fusionne avec la dernière action en file si même nom, même fonction
+        et mêmes arguments positionnels (l'ordre des actions est préservé). fn reçoit count=n
+        et les kwargs de la soumission la plus récente.
+        """
+        key = (name, fn, args)
+        with self._lock:
+            tail = self._tail
+            if tail is not None and tail[0] == key and not tail[1]["started"]:
+                tail[1]["count"] += 1
+                tail[1]["kwargs"] = kwargs
+                self.coalesced += 1
+                return True
+            entry = {"count": 1, "kwargs": kwargs, "started": False}
+            self._tail = (key, entry)
+            return self._queue.put((name, self._run_coalesced, (fn, args, entry), {}, time.perf_counter()),
+                                   droppable=name not in self.RELEASE_ACTIONS)
+
+    def on_idle(self, fn: Callable):
+        """fn() sur le thread de l'executor dès que la file est vide (après au moins une action)"""
+        self._idle_hooks.append(fn)
+
+    def clear(self):
+        """Abandonne les actions en attente (pause)"""
+        with self._lock:
+            self._tail = None
+            self._queue.clear()
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def get_stats(self) -> dict:
+        """Par type d'action : durée d'exécution et attente en file (ms)"""
+        stats = {}
+        for name, exec_stats in list(self._exec_stats.items()):
+            entry = exec_stats.to_dict()
+            wait = self._wait_stats[name].to_dict()
+            entry["wait_avg_ms"] = wait["avg_ms"]
+            entry["wait_max_ms"] = wait["max_ms"]
+            stats[name] = entry
+        stats["dropped"] = self._queue.dropped
+        stats["coalesced"] = self.coalesced
+        return stats
+
+    def _run_coalesced(self, fn: Callable, args: tuple, entry: dict):
+        with self._lock:
+            entry["started"] = True  # Plus de fusion : le compteur est figé
+            count, kwargs = entry["count"], entry["kwargs"]
+        fn(*args, count=count, **kwargs)
+
+    def _worker(self):
+        while self._running:
+            item = self._queue.get(timeout=0.1)
+            if item is None:
+                continue
+            name, fn, args, kwargs, submitted_at = item
+            start = time.perf_counter()
+            try:
+                fn(*args, **kwargs)
+            except Exception:
+                print(f"Error executing action '{name}' (Recovering...):")
+                traceback.print_exc()
+            end = time.perf_counter()
+            if name not in self._exec_stats:
+                self._exec_stats[name] = StageStats()
+                self._wait_stats[name] = StageStats()
+            self._exec_stats[name].record((end - start) * 1000)
+            self._wait_stats[name].record((start - submitted_at) * 1000)
+            if not len(self._queue):
+                self._run_idle_hooks()
+        self._run_idle_hooks()
+
+    def _run_idle_hooks(self):
+        for fn in self._idle_hooks:
+            try:
+                fn()
+            except Exception:
+                print("Error flushing actions (Recovering...):")
+                traceback.print_exc()
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+SystemActions - Exécution réelle des ActionType (fenêtres, multimédia, raccourcis, souris)
+Responsabilité unique : Traduire une action en entrées OS. Souris via MouseDriver ; touches
+via le premier backend clavier disponible : uinput (noyau, X11 et Wayland), xdotool (X11),
+pynput.
+
+Appelé depuis le thread de l'ActionExecutor (ActionDispatcher.execute_action) : les appels
+bloquants (écriture uinput, processus xdotool) ne touchent pas au thread d'interprétation.
+"""
+import os
+import platform
+import shutil
+import subprocess
+from typing import Dict, Optional, Sequence
+
+from src.action_dispatcher import ActionType
+from src.control.input import devices as E
+
+try:
+    from evdev import UInput
+    UINPUT_AVAILABLE = True
+except Exception:
+    UINPUT_AVAILABLE = False
+
+try:
+    from pynput.keyboard import Controller, Key
+    PYNPUT_AVAILABLE = True
+except ImportError:
+    PYNPUT_AVAILABLE = False
+
+# Combinaisons de touches (noms génériques, traduits par chaque backend)
+KEY_COMBOS: Dict[ActionType, tuple] = {
+    ActionType.SNAP_LEFT: ("super", "left"),
+    ActionType.SNAP_RIGHT: ("super", "right"),
+    ActionType.MAXIMIZE: ("super", "up"),
+    ActionType.MINIMIZE: ("super", "h"),
+    ActionType.MOVE_WINDOW: ("alt", "f7"),  # Déplacement clavier (GNOME, KDE, Xfce)
+    ActionType.SWITCH_WINDOW: ("alt", "tab"),
+    ActionType.PLAY_PAUSE: ("play_pause",),
+    ActionType.NEXT_TRACK: ("next_track",),
+    ActionType.PREV_TRACK: ("prev_track",),
+    ActionType.VOLUME_UP: ("volume_up",),
+    ActionType.VOLUME_DOWN: ("volume_down",),
+    ActionType.MUTE: ("mute",),
+    ActionType.COPY: ("ctrl", "c"),
+    ActionType.PASTE: ("ctrl", "v"),
+    ActionType.CUT: ("ctrl", "x"),
+    ActionType.UNDO: ("ctrl", "z"),
+}
+
+UINPUT_KEYS = {
+    "ctrl": E.KEY_LEFTCTRL, "alt": E.KEY_LEFTALT, "super": E.KEY_LEFTMETA, "tab": E.KEY_TAB,
+    "left": E.KEY_LEFT, "right": E.KEY_RIGHT, "up": E.KEY_UP, "down": E.KEY_DOWN, "f7": E.KEY_F7,
+    "c": E.KEY_C, "v": E.KEY_V, "x": E.KEY_X, "z": E.KEY_Z, "h": E.KEY_H,
+    "play_pause": E.KEY_PLAYPAUSE, "next_track": E.KEY_NEXTSONG, "prev_track": E.KEY_PREVIOUSSONG,
+    "volume_up": E.KEY_VOLUMEUP, "volume_down": E.KEY_VOLUMEDOWN, "mute": E.KEY_MUTE,
+}
+
+XDOTOOL_KEYS = {
+    "ctrl": "ctrl", "alt": "alt", "super": "super", "tab": "Tab",
+    "left": "Left", "right": "Right", "up": "Up", "down": "Down", "f7": "F7",
+    "play_pause": "XF86AudioPlay", "next_track": "XF86AudioNext", "prev_track": "XF86AudioPrev",
+    "volume_up": "XF86AudioRaiseVolume", "volume_down": "XF86AudioLowerVolume", "mute": "XF86AudioMute",
+}
+
+
+class UInputKeys:
+    """Clavier virtuel uinput : une touche pressée puis relâchée par SYN_REPORT"""
+
+    name = "uinput"
+
+    def __init__(self, device=None):
+        if device is None:
+            device = UInput({E.EV_KEY: sorted(UINPUT_KEYS.values())}, name="Hand Mouse Keys")
+        self.device = device
+
+    def press(self, combo: Sequence[str], count: int = 1):
+        codes = [UINPUT_KEYS[key] for key in combo]
+        write = self.device.write
+        for _ in range(count):
+            for code in codes:
+                write(E.EV_KEY, code, 1)
+            self.device.syn()
+            for code in reversed(codes):
+                write(E.EV_KEY, code, 0)
+            self.device.syn()
+
+    def close(self):
+        self.device.close()
+
+
+class XdotoolKeys:
+    """Touches via xdotool (X11) : un processus par action, répétitions comprises"""
+
+    name = "xdotool"
+
+    def __init__(self, executable: str = "xdotool"):
+        self.executable = executable
+
+    @staticmethod
+    def available() -> bool:
+        return (shutil.which("xdotool") is not None and bool(os.environ.get("DISPLAY"))
+                and os.environ.get("XDG_SESSION_TYPE") != "wayland")
+
+    def command(self, combo: Sequence[str], count: int = 1) -> list:
+        keys = "+".join(XDOTOOL_KEYS.get(key, key) for key in combo)
+        return [self.executable, "key", "--repeat", str(count), keys]
+
+    def press(self, combo: Sequence[str], count: int = 1):
+        subprocess.run(self.command(combo, count), check=False, timeout=2,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def close(self):
+        pass
+
+
+class PynputKeys:
+    """Touches via pynput (X11, macOS, Windows)"""
+
+    name = "pynput"
+
+    def __init__(self):
+        self.controller = Controller()
+        self.keys = {
+            "ctrl": Key.ctrl, "alt": Key.alt, "super": Key.cmd, "tab": Key.tab,
+            "left": Key.left, "right": Key.right, "up": Key.up, "down": Key.down, "f7": Key.f7,
+            "play_pause": Key.media_play_pause, "next_track": Key.media_next,
+            "prev_track": Key.media_previous, "volume_up": Key.media_volume_up,
+            "volume_down": Key.media_volume_down, "mute": Key.media_volume_mute,
+        }
+
+    def press(self, combo: Sequence[str], count: int = 1):
+        keys = [self.keys.get(key, key) for key in combo]
+        for _ in range(count):
+            for key in keys:
+                self.controller.press(key)
+            for key in reversed(keys):
+                self.controller.release(key)
+
+    def close(self):
+        pass
+
+
+def create_keyboard():
+    """Premier backend clavier utilisable (uinput, xdotool, pynput), None si aucun"""
+    if platform.system() == "Linux" and UINPUT_AVAILABLE:
+        try:
+            keyboard = UInputKeys()
+            print("SystemActions: Using EVDEV-UINPUT keys")
+            return keyboard
+        except Exception as err:
+            print(f"SystemActions: UInput keys failed ({err}). Trying xdotool...")
+    if XdotoolKeys.available():
+        print("SystemActions: Using xdotool keys")
+        return XdotoolKeys()
+    if PYNPUT_AVAILABLE:
+        try:
+            keyboard = PynputKeys()
+            print("SystemActions: Using Pynput keys")
+            return keyboard
+        except Exception as err:
+            print(f"SystemActions: Pynput keys failed ({err})")
+    print("SystemActions: No keyboard backend, window/media/shortcut actions disabled")
+    return None
+
+
+class SystemActions:
+    """Exécute une ActionType : touches pour fenêtres/multimédia/raccourcis, MouseDriver pour la souris"""
+
+    def __init__(self, mouse=None, keyboard=None):
+        self.mouse = mouse
+        self.keyboard = keyboard
+        self.dragging = False
+
+    @property
+    def backend(self) -> Optional[str]:
+        return self.keyboard.name if self.keyboard is not None else None
+
+    def perform(self, action: ActionType, count: int = 1, timestamp: Optional[float] = None) -> bool:
+        """
+        Args:
+            count: répétitions (actions identiques coalescées par l'executor)
+            timestamp: instant de capture de la frame (gel du curseur après un clic)
+
+        Returns:
+            bool: False si aucun backend ne peut exécuter l'action
+        """
+        if action == ActionType.NONE:
+            return True
+        combo = KEY_COMBOS.get(action)
+        if combo is not None:
+            if self.keyboard is None:
+                return False
+            self.keyboard.press(combo, count)
+            return True
+
+        mouse = self.mouse
+        if mouse is None or action == ActionType.MOVE_CURSOR:
+            return False  # Déplacement continu : piloté par ActStage (mouse.move)
+        if action == ActionType.CLICK_LEFT:
+            for _ in range(count):
+                mouse.click(timestamp=timestamp)
+        elif action == ActionType.CLICK_RIGHT:
+            for _ in range(count):
+                mouse.right_click(timestamp=timestamp)
+        elif action == ActionType.SCROLL_UP:
+            mouse.scroll(0, count)
+        elif action == ActionType.SCROLL_DOWN:
+            mouse.scroll(0, -count)
+        elif action == ActionType.DRAG_START:
+            if not self.dragging:
+                mouse.drag_start()
+                self.dragging = True
+        elif action == ActionType.DRAG_END:
+            if self.dragging:
+                mouse.drag_end()
+                self.dragging = False
+        else:
+            return False
+        return True
+
+    def release_held(self):
+        """Relâche un glisser en cours (pause, main perdue)"""
+        self.perform(ActionType.DRAG_END)
+
+    def close(self):
+        self.release_held()
+        if self.keyboard is not None:
+            self.keyboard.close()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Devices - Codes d'événements Linux et périphérique uinput factice
+Responsabilité unique : Fournir les codes (linux/input-event-codes.h, ABI stable) sans
+dépendre d'evdev, et un faux périphérique pour tester les sorties sans /dev/uinput
+"""
+import os
+import struct
+from typing import List, Tuple
+
+# struct input_event : timeval (tv_sec, tv_usec), type, code, value. Horodatage à 0 : le
+# noyau le renseigne à l'écriture sur /dev/uinput
+INPUT_EVENT = struct.Struct("llHHi")
+
+# Types d'événements
+EV_SYN, EV_KEY, EV_REL, EV_ABS = 0x00, 0x01, 0x02, 0x03
+SYN_REPORT = 0
+
+# Axes
+REL_X, REL_Y, REL_WHEEL = 0x00, 0x01, 0x08
+ABS_X, ABS_Y = 0x00, 0x01
+
+# Boutons souris
+BTN_LEFT, BTN_RIGHT = 0x110, 0x111
+
+# Touches (sous-ensemble utilisé par les actions système)
+KEY_TAB, KEY_LEFTCTRL, KEY_LEFTALT, KEY_LEFTMETA = 15, 29, 56, 125
+KEY_Z, KEY_X, KEY_C, KEY_V, KEY_H = 44, 45, 46, 47, 35
+KEY_F7 = 65
+KEY_UP, KEY_LEFT, KEY_RIGHT, KEY_DOWN = 103, 105, 106, 108
+KEY_MUTE, KEY_VOLUMEDOWN, KEY_VOLUMEUP = 113, 114, 115
+KEY_NEXTSONG, KEY_PLAYPAUSE, KEY_PREVIOUSSONG = 163, 164, 165
+
+
+class FakeUInput:
+    """
+    Remplaçant d'evdev.UInput (write, syn, close, fd) qui enregistre les événements.
+    Les écritures passent par un vrai tube (un appel système write par appel, comme
+    /dev/uinput) : fd accepte aussi des input_event empaquetés en un seul os.write.
+    writes compte les appels à write() (chemin événement par événement).
+    """
+
+    def __init__(self, events=None, name: str = "fake-uinput", **kwargs):
+        self.capabilities = events or {}
+        self.name = name
+        self.writes = 0
+        self.closed = False
+        self._read_fd, self.fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        self._events: List[Tuple[int, int, int]] = []
+        self._partial = b""
+
+    def write(self, etype: int, code: int, value: int):
+        os.write(self.fd, INPUT_EVENT.pack(0, 0, etype, code, value))
+        self.writes += 1
+
+    def syn(self):
+        self.write(EV_SYN, SYN_REPORT, 0)
+
+    def close(self):
+        if not self.closed:
+            self.drain()
+            os.close(self.fd)
+            os.close(self._read_fd)
+            self.closed = True
+
+    def drain(self):
+        """Lit le tube (à appeler assez souvent : il bloque l'écrivain au-delà de 64 Ko)"""
+        if self.closed:
+            return
+        data = self._partial
+        while True:
+            try:
+                chunk = os.read(self._read_fd, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            data += chunk
+        size = INPUT_EVENT.size
+        end = len(data) - len(data) % size
+        self._events.extend((etype, code, value) for _, _, etype, code, value in INPUT_EVENT.iter_unpack(data[:end]))
+        self._partial = data[end:]
+
+    @property
+    def events(self) -> List[Tuple[int, int, int]]:
+        """(type, code, value) reçus, dans l'ordre"""
+        self.drain()
+        return self._events
+
+    def reports(self) -> List[List[Tuple[int, int, int]]]:
+        """Événements regroupés par SYN_REPORT (ce que le noyau livre d'un bloc)"""
+        reports, current = [], []
+        for event in self.events:
+            if event[0] == EV_SYN:
+                reports.append(current)
+                current = []
+            else:
+                current.append(event)
+        return reports
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+EventBatch - Écriture groupée des événements uinput
+Responsabilité unique : Accumuler les événements d'une frame (position, molette, boutons)
+et les émettre en un seul appel système write() de structs input_event empaquetées
+
+Un write sur /dev/uinput accepte plusieurs input_event : le noyau les traite dans l'ordre,
+SYN_REPORT compris. Dans un rapport (entre deux SYN), seuls les axes dont la valeur change
+sont écrits ; la dernière position l'emporte, les déplacements relatifs (REL_X / REL_Y)
+et les pas de molette s'additionnent. Un
+bouton ferme le rapport en cours : le clic arrive à la position déjà émise.
+"""
+import os
+import threading
+from typing import Callable, Optional
+
+from src.control.input.devices import (ABS_X, ABS_Y, EV_ABS, EV_KEY, EV_REL, EV_SYN, INPUT_EVENT,
+                                       REL_WHEEL, REL_X, REL_Y, SYN_REPORT)
+
+_pack = INPUT_EVENT.pack
+_SYN = _pack(0, 0, EV_SYN, SYN_REPORT, 0)
+
+
+class EventBatch:
+    """Événements en attente pour un périphérique uinput, écrits par flush()"""
+
+    def __init__(self, device, writer: Optional[Callable[[bytes], int]] = None):
+        """
+        Args:
+            device: périphérique ouvert (evdev.UInput, FakeUInput) exposant fd
+            writer: écriture des octets ; défaut : os.write sur device.fd
+        """
+        self.device = device
+        self._write = writer if writer is not None else (lambda data: os.write(device.fd, data))
+        self._lock = threading.Lock()
+        self._buffer = bytearray()  # input_event déjà empaquetées
+        self._x: Optional[int] = None  # Position du rapport ouvert
+        self._y: Optional[int] = None
+        self._wheel = 0
+        self._rel_x = 0  # Déplacement relatif du rapport ouvert
+        self._rel_y = 0
+        self._emitted_x: Optional[int] = None  # Dernière position écrite (ou mise en file)
+        self._emitted_y: Optional[int] = None
+        # Statistiques
+        self.writes = 0
+        self.events = 0
+        self.dropped_moves = 0
+        self.coalesced_scrolls = 0
+
+    def move(self, x: int, y: int):
+        with self._lock:
+            if self._x is None and x == self._emitted_x and y == self._emitted_y:
+                self.dropped_moves += 1  # Position inchangée
+                return
+            if self._x is not None:
+                self.dropped_moves += 1  # Remplacée par la plus récente
+            self._x, self._y = x, y
+
+    def move_relative(self, dx: int, dy: int):
+        with self._lock:
+            if not (dx or dy):
+                self.dropped_moves += 1
+                return
+            self._rel_x += dx
+            self._rel_y += dy
+
+    def scroll(self, steps: int):
+        with self._lock:
+            if self._wheel:
+                self.coalesced_scrolls += 1
+            self._wheel += steps
+
+    def button(self, code: int, pressed: bool):
+        with self._lock:
+            self._close_report()
+            self._buffer += _pack(0, 0, EV_KEY, code, 1 if pressed else 0)
+            self._buffer += _SYN
+
+    def flush(self) -> int:
+        """Écrit tout en un seul appel système. Retourne le nombre d'événements écrits."""
+        with self._lock:
+            if self._x is not None or self._wheel or self._rel_x or self._rel_y:
+                self._close_report()
+            buffer = self._buffer
+            if not buffer:
+                return 0
+            self._write(buffer)
+            count = len(buffer) // INPUT_EVENT.size
+            self._buffer = bytearray()
+            self.writes += 1
+            self.events += count
+            return count
+
+    def get_stats(self) -> dict:
+        return {
+            "writes": self.writes,
+            "events": self.events,
+            "dropped_moves": self.dropped_moves,
+            "coalesced_scrolls": self.coalesced_scrolls,
+        }
+
+    def _close_report(self):
+        """Émet la position et la molette en attente, suivies d'un SYN_REPORT"""
+        buffer = self._buffer
+        size = len(buffer)
+        if self._x is not None:
+            if self._x != self._emitted_x:
+                buffer += _pack(0, 0, EV_ABS, ABS_X, self._x)
+                self._emitted_x = self._x
+            if self._y != self._emitted_y:
+                buffer += _pack(0, 0, EV_ABS, ABS_Y, self._y)
+                self._emitted_y = self._y
+            self._x = self._y = None
+        if self._rel_x:
+            buffer += _pack(0, 0, EV_REL, REL_X, self._rel_x)
+            self._rel_x = 0
+        if self._rel_y:
+            buffer += _pack(0, 0, EV_REL, REL_Y, self._rel_y)
+            self._rel_y = 0
+        if self._wheel:
+            buffer += _pack(0, 0, EV_REL, REL_WHEEL, self._wheel)
+            self._wheel = 0
+        if len(buffer) > size:
+            buffer += _SYN
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+RelativePointer - Curseur en mode trackpad (déplacements relatifs)
+Responsabilité unique : Transformer la position de la main en déplacements REL_X / REL_Y
+accélérés, avec embrayage et accumulation sous-pixel
+
+En mode absolu, un pixel caméra couvre plusieurs pixels d'un écran 4K : la précision est
+bornée par la résolution de la caméra. Ici, seul le déplacement de la main compte et son
+gain dépend de la vitesse : lent → moins d'un pixel écran par pixel caméra (précision),
+rapide → l'écran se traverse d'un geste. Les fractions de pixel sont reportées sur les
+frames suivantes au lieu d'être perdues par l'arrondi.
+
+Embrayage : main ouverte (clutch() immédiat), ou sans mise à jour pendant CLUTCH_GAP (main
+levée, autre action, gel après un clic) ; la reprise repart de la nouvelle position de la main
+sans déplacer le curseur, comme un doigt qu'on lève d'un trackpad.
+"""
+import math
+from typing import Optional, Tuple
+
+from src.optimized_utils import OneEuroFilter
+
+# Gestes qui embrayent en mode curseur : leur MOVE_CURSOR est ignoré, une autre action liée
+# reste exécutée. Main ouverte : doublon de POINTING en absolu, aucun clic perdu (FIST garde
+# le clic droit)
+CLUTCH_GESTURES = frozenset({"PALM"})
+
+
+class RelativePointer:
+    """Position de la main (largeurs d'image) → déplacement entier du curseur (pixels)"""
+
+    GAIN = 1600.0       # Pixels écran par largeur d'image parcourue, facteur 1
+    MIN_FACTOR = 0.35   # Mouvements lents (précision)
+    MAX_FACTOR = 2.5    # Mouvements rapides (traversée de l'écran)
+    LOW_SPEED = 0.05    # Largeurs d'image / s : facteur minimal en dessous
+    HIGH_SPEED = 1.2    # Facteur maximal au-delà
+    CLUTCH_GAP = 0.1    # Secondes sans mise à jour avant embrayage
+
+    # Lissage de la position (unités : largeurs d'image) ; réinitialisé à chaque embrayage
+    MIN_CUTOFF = 1.5
+    BETA = 8.0
+
+    def __init__(self, gain: Optional[float] = None, min_factor: Optional[float] = None,
+                 max_factor: Optional[float] = None):
+        self.gain = self.GAIN if gain is None else gain
+        self.min_factor = self.MIN_FACTOR if min_factor is None else min_factor
+        self.max_factor = self.MAX_FACTOR if max_factor is None else max_factor
+        self.engagements = 0  # Prises de contrôle (première comprise)
+        self.clutch()
+
+    def clutch(self):
+        """Débraye : la prochaine mise à jour ne déplace pas le curseur"""
+        self._last_t: Optional[float] = None
+
+    def factor(self, speed: float) -> float:
+        """Courbe d'accélération : facteur de gain selon la vitesse de la main (largeurs / s)"""
+        t = (speed - self.LOW_SPEED) / (self.HIGH_SPEED - self.LOW_SPEED)
+        t = min(1.0, max(0.0, t))
+        return self.min_factor + (self.max_factor - self.min_factor) * t * t * (3 - 2 * t)
+
+    def update(self, x: float, y: float, timestamp: float) -> Tuple[int, int]:
+        """
+        Args:
+            x, y: position de la main, toutes deux en largeurs d'image (axes isotropes)
+            timestamp: instant de capture (s)
+
+        Returns:
+            (dx, dy): déplacement en pixels entiers ; le reste est accumulé
+        """
+        last_t = self._last_t
+        if last_t is None or timestamp - last_t > self.CLUTCH_GAP:
+            self._engage(x, y, timestamp)
+            return 0, 0
+        dt = timestamp - last_t
+        if dt <= 0:
+            return 0, 0
+        fx, fy = self._filter_x(x, timestamp), self._filter_y(y, timestamp)
+        du, dv = fx - self._x, fy - self._y
+        self._x, self._y, self._last_t = fx, fy, timestamp
+
+        scale = self.gain * self.factor(math.hypot(du, dv) / dt)
+        self._rest_x += du * scale
+        self._rest_y += dv * scale
+        dx, dy = int(self._rest_x), int(self._rest_y)  # Vers zéro : le reste garde son signe
+        self._rest_x -= dx
+        self._rest_y -= dy
+        return dx, dy
+
+    def _engage(self, x: float, y: float, timestamp: float):
+        self.engagements += 1
+        self._filter_x = OneEuroFilter(min_cutoff=self.MIN_CUTOFF, beta=self.BETA)
+        self._filter_y = OneEuroFilter(min_cutoff=self.MIN_CUTOFF, beta=self.BETA)
+        self._x, self._y = self._filter_x(x, timestamp), self._filter_y(y, timestamp)
+        self._rest_x = self._rest_y = 0.0
+        self._last_t = timestamp
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+FrameSinks - Consommateurs des frames rendues (client MJPEG, mémoire partagée, aperçu)
+Responsabilité unique : Savoir si quelqu'un regarde. Sans consommateur, le mode headless
+ne décode pas la frame d'affichage et ne dessine rien ; le rendu reprend dès le premier
+attach().
+"""
+import threading
+import traceback
+from typing import Callable, Dict, List
+
+import numpy as np
+
+
+class FrameSinks:
+    """Registre thread-safe de callbacks sink(frame_bgr) appelés par l'étage de rendu"""
+
+    def __init__(self):
+        self._sinks: Dict[str, Callable[[np.ndarray], None]] = {}
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def attach(self, name: str, sink: Callable[[np.ndarray], None]):
+        """
+        Ajoute (ou remplace) un consommateur. La frame reçue vit dans un buffer réutilisé :
+        le consommateur la copie s'il la garde au-delà de l'appel.
+        """
+        with self._lock:
+            first = not self._sinks
+            self._sinks[name] = sink
+        if first:
+            print(f"👁️ Frame consumer attached ({name}): rendering on")
+
+    def detach(self, name: str):
+        with self._lock:
+            removed = self._sinks.pop(name, None) is not None
+            last = removed and not self._sinks
+        if last:
+            print(f"🙈 Last frame consumer detached ({name}): rendering off")
+
+    @property
+    def active(self) -> bool:
+        """Lecture sans verrou (dict non vide) : appelée à chaque frame"""
+        return bool(self._sinks)
+
+    @property
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._sinks)
+
+    def publish(self, frame: np.ndarray):
+        """Transmet la frame rendue à chaque consommateur (thread de rendu)"""
+        with self._lock:
+            sinks = list(self._sinks.items())
+        for name, sink in sinks:
+            try:
+                sink(frame)
+            except Exception:
+                print(f"Error in frame consumer '{name}' (Recovering...):")
+                traceback.print_exc()
+        if sinks:
+            self.published += 1
@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+"""
+HandHost - Socle commun des hôtes du pipeline (HandEngine, AppCoordinator)
+Responsabilité unique : Composants partagés, politique de pause, statistiques et rendu de
+l'aperçu ; chaque hôte ne fournit que l'accès à sa caméra et à son modèle
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from src.action_dispatcher import ActionDispatcher, ActionType
+from src.advanced_filter import HybridMouseFilter
+from src.asl_manager import ASLManager
+from src.context_mode import ContextMode, ContextModeDetector
+from src.control.actions.bindings import BindingsWatcher
+from src.control.actions.executor import ActionExecutor
+from src.control.actions.system import SystemActions, create_keyboard
+from src.core.frame_sinks import FrameSinks
+from src.core.pipeline import FramePacket
+from src.core.stages import DEFAULT_THREADED_STAGES, InterpretStage, build_hand_pipeline
+from src.core.state_manager import PauseMode
+from src.feedback_overlay import FeedbackOverlay
+from src.models.config import AppConfig
+from src.mouse_driver import MouseDriver
+from src.optimized_utils import PerformanceProfiler
+from src.processing.gestures.pose_knn import create_gesture_classifier
+from src.processing.gestures.stability import GestureStabilizer
+from src.processing.gestures.temporal import TemporalGestureRecognizer
+from src.processing.gestures.templates import DTWMatcher, TemplateLibrary
+from src.ui.rendering.preview_composer import PreviewComposer
+from src.ui.rendering.skeleton_renderer import draw_hand, landmarks_to_array
+from src.virtual_keyboard import VirtualKeyboard
+
+
+class HandHost(ABC):
+    """
+    Base des hôtes : les sous-classes appellent _init_host() puis _start_pipeline() et
+    implémentent l'accès aux ressources libérées en pause (_camera_opened, _grab_frame,
+    _release_camera, _landmarker_ready, _close_landmarker).
+    """
+
+    WINDOW_NAME = "Hand Mouse AI - Unified View"
+    KEYBOARD_WINDOW = "Virtual Keyboard"
+
+    def _init_host(
+        self,
+        headless: bool,
+        skeleton_renderer,
+        pause_mode: str = "cold",
+        gesture_backend: str = "rules",
+        pointer_mode: Optional[str] = None
+    ):
+        """Crée les composants partagés (pointer_mode None : valeur de src/config/default.yaml)"""
+        config = AppConfig.load()
+        self.config = config
+        self.headless = headless
+
+        # PAUSE POLICY: cold (tout libérer), warm (garder le landmarker), hot (tout garder)
+        self.pause_mode = PauseMode(pause_mode)
+        self._resume_event = threading.Event()
+        self._resume_requested_at: Optional[float] = None
+        self._resume_kind: Optional[PauseMode] = None
+        self.last_resume_ms: Optional[float] = None
+        self.resume_times = {mode.value: deque(maxlen=20) for mode in PauseMode}
+
+        # Gestes : rules (géométrie) ou knn (exemples appris)
+        self.gesture_classifier = create_gesture_classifier(gesture_backend)
+        self.gesture_stability = GestureStabilizer()  # Hystérésis + durée minimale par main
+        self.gesture_templates = TemplateLibrary.load()  # Gestes personnalisés (vue Gestes)
+        self.temporal_gestures = TemporalGestureRecognizer(matcher=DTWMatcher(self.gesture_templates))
+        self.mode_detector = ContextModeDetector()
+
+        # Pointeur absolu ou relatif (trackpad) : mouse.pointer de la config, sauf si imposé
+        mouse_config = config.mouse
+        if pointer_mode is not None:
+            mouse_config.pointer = pointer_mode
+        self.mouse = MouseDriver(config=mouse_config)
+        self.filter = HybridMouseFilter()
+        self.action_dispatcher = ActionDispatcher()
+        # Entrées OS (uinput / pynput) exécutées hors du thread d'interprétation
+        self.action_executor = ActionExecutor()
+        # Fenêtres, multimédia, raccourcis, clics : ActionDispatcher.execute_action sur l'executor
+        self.system_actions = SystemActions(self.mouse, create_keyboard())
+        self.action_dispatcher.system_actions = self.system_actions
+        # uinput : événements souris d'une rafale écrits en un seul appel système quand la file se vide
+        self.mouse.deferred = True
+        self.action_executor.on_idle(self.mouse.flush)
+
+        # UI
+        self.feedback_overlay = FeedbackOverlay(position="top_left")
+        self.skeleton_renderer = skeleton_renderer
+        self.preview_composer = PreviewComposer()
+        # Headless : rien n'est décodé pour l'affichage ni dessiné tant qu'aucun consommateur
+        # n'est attaché (client MJPEG, mémoire partagée, aperçu)
+        self.frame_sinks = FrameSinks()
+        self.virtual_keyboard = VirtualKeyboard(layout="azerty", mode="dwell")
+        self.virtual_keyboard.executor = self.action_executor
+        self.asl_manager = ASLManager(backend=gesture_backend)
+        self.profiler = PerformanceProfiler()
+
+        # État publié par les étages d'interprétation et d'action
+        self.lock = threading.Lock()
+        self.latest_result = None
+        self.landmarks_seq = 0  # Incrémenté quand les landmarks changent (dirty-check du panneau squelette)
+        self.latest_landmarks = None
+        self.latest_world_landmarks = None
+        self.current_gestures = []
+        self.current_mode = ContextMode.CURSOR
+        self.current_action = ActionType.NONE
+        self.active_hand_pos = (0, 0)  # Halo de l'overlay
+
+    def _start_pipeline(self, get_camera, threaded_stages=DEFAULT_THREADED_STAGES,
+                        display_fps: Optional[float] = None, **stage_options):
+        """
+        Capture → prétraitement → inférence → interprétation → action → stream → rendu,
+        puis executor et liaisons rechargées à chaud (src/config/bindings.yaml)
+        """
+        self.pipeline = build_hand_pipeline(
+            self,
+            get_camera=get_camera,
+            detect=self._detect,
+            render=self._render_packet,
+            headless=self.headless,
+            window_name=self.WINDOW_NAME,
+            on_key=self._on_key,
+            threaded_stages=threaded_stages,
+            display_fps=display_fps,
+            frame_sinks=self.frame_sinks,
+            **stage_options
+        )
+        self.infer_stage = self.pipeline.stage("infer")
+        self.render_stage = self.pipeline.stage("render")
+        self.pipeline.start()
+        self.action_executor.start()
+
+        self.bindings_watcher = BindingsWatcher(self.action_dispatcher, self.mode_detector, self.feedback_overlay)
+        self.bindings_watcher.check()
+        self.bindings_watcher.start()
+
+    # --- Ressources de l'hôte ---
+
+    @abstractmethod
+    def _camera_opened(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _grab_frame(self):
+        """Pause hot : vide le buffer caméra"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _release_camera(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _landmarker_ready(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _close_landmarker(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _detect(self, img_rgb, timestamp_ms: int):
+        """Étage d'inférence : envoi asynchrone au modèle (résultat dans result_callback)"""
+        raise NotImplementedError
+
+    # --- API publique ---
+
+    @property
+    def asl_enabled(self) -> bool:
+        return self.asl_manager.enabled
+
+    @asl_enabled.setter
+    def asl_enabled(self, value: bool):
+        self.asl_manager.set_enabled(value)
+
+    def start(self):
+        print("▶️ STARTING ENGINE PROCESSING")
+        # Le type de reprise dépend des ressources réellement conservées pendant la pause
+        if self._camera_opened() and self._landmarker_ready():
+            self._resume_kind = PauseMode.HOT
+        elif self._landmarker_ready():
+            self._resume_kind = PauseMode.WARM
+        else:
+            self._resume_kind = PauseMode.COLD
+        self._resume_requested_at = time.perf_counter()
+        self.is_processing = True
+        self._resume_event.set()
+
+    def stop(self):
+        print("⏹️ STOPPING ENGINE PROCESSING")
+        self.is_processing = False
+        self._resume_event.clear()
+        # Les frames en attente sont périmées à la reprise
+        self.pipeline.flush()
+        self.action_executor.clear()
+        self.action_executor.submit("drag_end", self.system_actions.release_held)  # Pas de bouton resté appuyé
+
+    def _close_actions(self):
+        """
+        Arrêt définitif des entrées OS. L'executor arrêté ne vide plus le lot uinput : le
+        relâchement d'un glisser en cours est écrit directement (sinon bouton resté appuyé).
+        """
+        self.action_executor.stop()
+        self.mouse.deferred = False
+        self.system_actions.close()
+        self.mouse.flush()
+
+    def set_pause_mode(self, mode: str) -> str:
+        """Change la politique de pause ('cold', 'warm' ou 'hot')"""
+        self.pause_mode = PauseMode(mode)
+        print(f"⏸️ Pause mode: {self.pause_mode.value}")
+        return self.pause_mode.value
+
+    def get_resume_stats(self) -> dict:
+        """Temps de reprise (ms) par mode : dernier, moyenne et nombre de mesures"""
+        return {
+            mode: {
+                "last_ms": times[-1] if times else None,
+                "avg_ms": sum(times) / len(times) if times else None,
+                "count": len(times),
+            }
+            for mode, times in self.resume_times.items()
+        }
+
+    def get_pipeline_stats(self) -> dict:
+        """Temps par étage du pipeline, rejets des files et latence d'inférence"""
+        stats = self.pipeline.get_stats()
+        stats["inference_latency"] = self.infer_stage.latency.to_dict()
+        stats["actions"] = self.action_executor.get_stats()
+        if self.mouse.batch is not None:
+            stats["mouse_events"] = self.mouse.batch.get_stats()
+        stats["display"] = {**self.render_stage.get_stats(), **self.preview_composer.get_stats()}
+        stats["display"]["tracking_fps"] = stats["interpret"]["fps"]
+        stats["display"]["consumers"] = self.frame_sinks.names
+        stats["keyboard"] = self.virtual_keyboard.get_draw_stats()
+        stats["bindings"] = self.bindings_watcher.get_stats()
+        return stats
+
+    def set_smoothing(self, value):
+        self.mouse.set_smoothing(value)
+
+    # --- Pause / reprise ---
+
+    def _handle_pause(self):
+        """Applique la politique de pause aux ressources (caméra, landmarker, fenêtres)"""
+        if self.pause_mode == PauseMode.HOT:
+            # Garde tout : on vide le buffer caméra pour reprendre sur une frame fraîche
+            self._grab_frame()
+            self._resume_event.wait(0.05)
+            return
+
+        if self._camera_opened():
+            print(f"DEBUG: Pausing Engine ({self.pause_mode.value}: releasing camera)...")
+            self._release_camera()
+            # Les fenêtres appartiennent au thread de rendu
+            self.render_stage.request_close()
+        if self.pause_mode == PauseMode.COLD and self._landmarker_ready():
+            print("DEBUG: Closing landmarker...")
+            self._close_landmarker()
+        # Réveil immédiat sur start() au lieu d'un polling fixe
+        self._resume_event.wait(0.5)
+
+    def _record_resume(self):
+        """Enregistre le temps écoulé entre start() et la première frame envoyée à l'inférence"""
+        elapsed_ms = (time.perf_counter() - self._resume_requested_at) * 1000
+        self._resume_requested_at = None
+        self.last_resume_ms = elapsed_ms
+        self.resume_times[self._resume_kind.value].append(elapsed_ms)
+        print(f"⏱️ Resume ({self._resume_kind.value}): {elapsed_ms:.1f} ms")
+
+    # --- Pipeline ---
+
+    def _submit_frame(self):
+        """Fait entrer une frame dans le pipeline (la capture cadence la boucle de l'hôte)"""
+        self.profiler.mark('start')
+        packet = FramePacket()
+        self.pipeline.submit(packet)
+        if not packet.timestamp_ms:
+            return  # Aucune frame envoyée à l'inférence (caméra muette ou buffer invalide)
+        self.profiler.mark('end')
+        self.profiler.measure('total', 'start', 'end')
+
+    def result_callback(self, result, output_image, timestamp_ms: int):
+        """Callback du modèle : dépose le packet dans la mailbox du thread d'interprétation"""
+        # Only process if we are actually "processing" (avoid backlog callbacks)
+        if not self.is_processing:
+            return
+        packet = self.infer_stage.complete(result, timestamp_ms)
+        latency = packet.timings.get("inference")
+        if latency is not None:
+            self.profiler.metrics['inference'].append(latency)
+        self.pipeline.submit(packet, stage=InterpretStage.name)
+
+    # --- Rendu ---
+
+    def _on_key(self, key: int):
+        if key == ord('q'):
+            self.stop()
+
+    def _render_packet(self, packet: FramePacket):
+        """Étage de rendu : overlay, consommateurs attachés puis fenêtres natives"""
+        frame = self._render_frame(packet.frame, packet)
+        # Attached consumers (MJPEG, shared memory...) get the annotated frame
+        self.frame_sinks.publish(frame)
+        if not self.headless:
+            self._display_windows(frame, packet)
+
+    def _render_frame(self, img, packet: FramePacket) -> np.ndarray:
+        """Dessine zones, halo, squelette et infos (instantané porté par le packet, sans verrou)"""
+        h, w = img.shape[:2]
+        mode = packet.mode or ContextMode.CURSOR
+        action = packet.action or ActionType.NONE
+        result = packet.result
+
+        display_gesture = packet.gestures[0] if packet.gestures else "UNKNOWN"
+        display_confidence = packet.confidences[0] if packet.confidences else 0.0
+        # Hack: Pass raw gesture to overlay for debug
+        self.feedback_overlay.debug_raw_gesture = display_gesture
+
+        overlay_mode = mode.value
+        if self.asl_enabled:
+            overlay_mode = "asl"
+            display_action = f"SIGNE: {self.asl_manager.get_display_text()}"
+            display_gesture = self.asl_manager.last_prediction  # Show sign in gesture line too
+            display_confidence = self.asl_manager.last_confidence
+        else:
+            action_info = self.action_dispatcher.get_action_info(action)
+            display_action = f"{action_info['emoji']} {action_info['name']}"
+
+        # Zones (fond), halo de la main
+        img = self.feedback_overlay.draw_zone_indicators(img, overlay_mode)
+        if packet.hand_pos and packet.hand_pos != (0, 0):
+            img = self.feedback_overlay.draw_hand_halo(img, packet.hand_pos, overlay_mode)
+
+        # Squelette sur la vidéo (points + segments)
+        if result and result.hand_landmarks:
+            scale = np.array([w, h], dtype=np.float64)
+            for hand_landmarks in result.hand_landmarks:
+                points = (landmarks_to_array(hand_landmarks)[:, :2] * scale).astype(np.int32)
+                draw_hand(img, points, (50, 50, 50), (100, 100, 100),
+                          thickness=1, joint_radius=2, joints_first=True)
+
+        # Infos (premier plan)
+        img = self.feedback_overlay.draw(
+            frame=img,
+            mode=overlay_mode,
+            gesture=display_gesture,
+            action=display_action,
+            confidence=display_confidence
+        )
+
+        fps = self.profiler.get_fps()
+        cv2.putText(img, f"{int(fps)} FPS", (w - 80, h - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+        return img
+
+    def _display_windows(self, frame, packet: FramePacket):
+        """Fenêtre unifiée (vidéo + squelette 4 vues) et clavier virtuel"""
+        if self.keyboard_enabled:
+            # Canvas du clavier en cache, seules les touches modifiées sont redessinées
+            keyboard_canvas = self.virtual_keyboard.render()
+            cv2.namedWindow(self.KEYBOARD_WINDOW, cv2.WINDOW_GUI_NORMAL)
+            cv2.imshow(self.KEYBOARD_WINDOW, keyboard_canvas)
+        else:
+            try:
+                cv2.destroyWindow(self.KEYBOARD_WINDOW)
+            except:
+                pass
+
+        # [Video 533x400] + [Skeleton 600x400] = 1133x400 dans un buffer préalloué ;
+        # panneau squelette reconstruit seulement quand un nouveau résultat est arrivé
+        combined = self.preview_composer.compose(
+            frame, packet.landmarks_seq, lambda: self._render_skeleton(packet.result)
+        )
+        cv2.imshow(self.WINDOW_NAME, combined)
+
+    def _render_skeleton(self, result) -> np.ndarray:
+        """Panneau squelette 4 vues de toutes les mains détectées"""
+        hands = []
+        if result and result.hand_landmarks:
+            world = result.hand_world_landmarks or []
+            for i, hand_landmarks in enumerate(result.hand_landmarks):
+                hands.append((hand_landmarks, world[i] if i < len(world) else None))
+        return self.skeleton_renderer.render_hands(hands)
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+Pipeline - Moteur de traitement par étages
+Responsabilité unique : Enchaîner des étages (capture → prétraitement → inférence →
+interprétation → action → stream → rendu) reliés par des files bornées, chacun pouvant
+tourner sur son propre thread, avec mesure du temps passé dans chaque étage.
+"""
+import threading
+import time
+import traceback
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class DropPolicy(Enum):
+    """Comportement d'une file pleine"""
+    BLOCK = "block"              # Le producteur attend une place (aucune perte)
+    DROP_OLDEST = "drop_oldest"  # L'élément le plus ancien est remplacé (temps réel)
+    DROP_NEWEST = "drop_newest"  # L'élément entrant est rejeté
+
+
+@dataclass
+class FramePacket:
+    """Données d'une frame à travers les étages du pipeline"""
+    created_at: float = field(default_factory=time.perf_counter)
+    # Horloge de frame : instant de capture (s, time.monotonic). Toute logique temporelle
+    # (durées de gestes, dwell, gel du curseur) s'y réfère, pas à l'heure du traitement :
+    # même comportement en charge, en rejeu ou en benchmark accéléré
+    captured_at: float = 0.0
+    # Capture / prétraitement
+    raw: Any = None                 # Buffer brut caméra (JPEG, YUYV ou BGR)
+    decoder: Any = None             # FrameDecoder de la caméra qui a produit le buffer
+    frame: Any = None               # Frame BGR d'affichage (None sans affichage)
+    inference_rgb: Any = None       # Image RGB réduite envoyée au modèle
+    mirrored_landmarks: bool = False  # Miroir à appliquer aux landmarks (pas aux pixels)
+    # Inférence
+    timestamp_ms: int = 0
+    inference_sent_at: float = 0.0
+    result: Any = None              # HandLandmarkerResult
+    # Interprétation
+    gestures: List[str] = field(default_factory=list)
+    confidences: List[float] = field(default_factory=list)  # Confiance de chaque geste (0-1)
+    hand_frames: Any = None         # (N, 21, 3) chaque main dans son repère (hand_frame), un lot
+    primary_landmarks: Any = None
+    primary_frame: Any = None       # (21, 3) main primaire dans son repère
+    primary_gesture: str = "UNKNOWN"
+    motion_gesture: Optional[str] = None  # Geste dynamique terminé à cette frame (main primaire)
+    secondary_landmarks: Any = None
+    secondary_gesture: str = "UNKNOWN"
+    mode: Any = None
+    action: Any = None
+    landmarks_seq: int = 0          # Séquence des landmarks publiés (dirty-check du rendu)
+    hand_pos: Any = None            # Position du halo (pixels du canvas de référence)
+    # Temps passé dans chaque étage (ms)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+class StageQueue:
+    """File bornée thread-safe avec politique de rejet"""
+
+    def __init__(self, maxsize: int = 1, policy: DropPolicy = DropPolicy.DROP_OLDEST):
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+        self.dropped = 0
+        self._items = deque()
+        self._cond = threading.Condition()
+
+    def put(self, item, timeout: Optional[float] = None, droppable: bool = True) -> bool:
+        """
+        Ajoute un élément. Retourne False si l'élément entrant est rejeté.
+        droppable=False : jamais rejeté ni évincé, quitte à dépasser maxsize (relâchements)
+        """
+        with self._cond:
+            if len(self._items) >= self.maxsize:
+                if not droppable:
+                    if self.policy == DropPolicy.DROP_OLDEST:
+                        self._evict_oldest()
+                elif self.policy == DropPolicy.DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                elif self.policy == DropPolicy.DROP_OLDEST:
+                    if not self._evict_oldest():
+                        self.dropped += 1
+                        return False
+                elif not self._cond.wait_for(lambda: len(self._items) < self.maxsize, timeout):
+                    self.dropped += 1
+                    return False
+            self._items.append((item, droppable))
+            self._cond.notify_all()
+            return True
+
+    def get(self, timeout: Optional[float] = None):
+        """Retire l'élément le plus ancien, None si la file reste vide pendant timeout"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._items, timeout):
+                return None
+            item, _ = self._items.popleft()
+            self._cond.notify_all()
+            return item
+
+    def clear(self):
+        """Vide la file (pause : les frames en attente sont périmées)"""
+        with self._cond:
+            self._items.clear()
+            self._cond.notify_all()
+
+    def _evict_oldest(self) -> bool:
+        """Retire le plus ancien élément abandonnable (appelant sous verrou)"""
+        for i, (_, droppable) in enumerate(self._items):
+            if droppable:
+                del self._items[i]
+                self.dropped += 1
+                return True
+        return False
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._items)
+
+
+class Mailbox:
+    """
+    Boîte aux lettres à une place, sans verrou sur les données : le producteur (callback
+    du modèle) ne fait qu'un append sur un deque(maxlen=1), atomique en CPython, qui
+    remplace la valeur non lue. L'Event ne sert qu'à réveiller le consommateur.
+    Même interface que StageQueue.
+    """
+
+    def __init__(self):
+        self.dropped = 0
+        self._slot = deque(maxlen=1)
+        self._ready = threading.Event()
+
+    def put(self, item, timeout: Optional[float] = None) -> bool:
+        if self._slot:
+            self.dropped += 1  # Indicatif : la valeur précédente n'a pas été lue
+        self._slot.append(item)
+        self._ready.set()
+        return True
+
+    def get(self, timeout: Optional[float] = None):
+        try:
+            return self._slot.popleft()
+        except IndexError:
+            pass
+        if not self._ready.wait(timeout):
+            return None
+        self._ready.clear()
+        try:
+            return self._slot.popleft()
+        except IndexError:
+            return None
+
+    def clear(self):
+        self._slot.clear()
+
+    def __len__(self) -> int:
+        return len(self._slot)
+
+
+class StageStats:
+    """Temps de traitement et cadence d'un étage (fenêtre glissante)"""
+
+    def __init__(self, window: int = 120):
+        self.count = 0
+        self.last_ms = 0.0
+        self.times = deque(maxlen=window)
+        self.stamps = deque(maxlen=window)
+
+    def record(self, elapsed_ms: float):
+        self.count += 1
+        self.last_ms = elapsed_ms
+        self.times.append(elapsed_ms)
+        self.stamps.append(time.perf_counter())
+
+    @property
+    def fps(self) -> float:
+        """Exécutions par seconde sur la fenêtre"""
+        stamps = list(self.stamps)
+        if len(stamps) < 2 or stamps[-1] <= stamps[0]:
+            return 0.0
+        return (len(stamps) - 1) / (stamps[-1] - stamps[0])
+
+    def to_dict(self) -> dict:
+        times = list(self.times)
+        return {
+            "count": self.count,
+            "last_ms": self.last_ms,
+            "avg_ms": sum(times) / len(times) if times else 0.0,
+            "max_ms": max(times) if times else 0.0,
+            "fps": self.fps,
+        }
+
+
+class Stage(ABC):
+    """
+    Étage de pipeline. Les sous-classes implémentent process().
+
+    process() reçoit un FramePacket et retourne le packet (éventuellement modifié) pour
+    l'étage suivant, ou None pour arrêter le packet ici (frame rejetée, ou reprise plus
+    tard via Pipeline.submit(packet, stage=...) comme pour l'inférence asynchrone).
+    """
+
+    name = "stage"
+
+    @abstractmethod
+    def process(self, packet: FramePacket) -> Optional[FramePacket]:
+        raise NotImplementedError
+
+    def reset(self):
+        """Réinitialise l'état interne (appelé quand le pipeline est vidé)"""
+        pass
+
+    def idle(self):
+        """Appelé par le thread d'un étage threadé quand sa file reste vide"""
+        pass
+
+
+class _StageSlot:
+    """Étage + sa file d'entrée, son thread et ses statistiques"""
+
+    def __init__(self, stage: Stage, threaded: bool, queue_size: int, drop_policy: DropPolicy, mailbox: bool):
+        self.stage = stage
+        self.threaded = threaded
+        self.queue = Mailbox() if mailbox else StageQueue(queue_size, drop_policy)
+        self.stats = StageStats()
+        self.thread: Optional[threading.Thread] = None
+
+
+class Pipeline:
+    """
+    Chaîne d'étages. Un étage inline s'exécute dans le thread qui lui passe le packet ;
+    un étage threadé reçoit le packet dans sa file bornée et le traite sur son thread.
+    """
+
+    def __init__(self, name: str = "pipeline"):
+        self.name = name
+        self._slots: List[_StageSlot] = []
+        self._index: Dict[str, int] = {}
+        self._running = False
+        self._latency = StageStats()
+
+    def add_stage(
+        self,
+        stage: Stage,
+        threaded: bool = False,
+        queue_size: int = 1,
+        drop_policy: DropPolicy = DropPolicy.DROP_OLDEST,
+        mailbox: bool = False
+    ) -> "Pipeline":
+        """
+        Ajoute un étage en fin de chaîne.
+
+        mailbox=True remplace la file bornée par une Mailbox (seul le dernier packet compte,
+        le producteur ne prend aucun verrou).
+        """
+        if stage.name in self._index:
+            raise ValueError(f"Duplicate stage name: {stage.name}")
+        self._index[stage.name] = len(self._slots)
+        self._slots.append(_StageSlot(stage, threaded, queue_size, drop_policy, mailbox))
+        return self
+
+    def stage(self, name: str) -> Stage:
+        return self._slots[self._index[name]].stage
+
+    @property
+    def stage_names(self) -> List[str]:
+        return [slot.stage.name for slot in self._slots]
+
+    def start(self):
+        """Démarre les threads des étages threadés"""
+        if self._running:
+            return
+        self._running = True
+        for i, slot in enumerate(self._slots):
+            if slot.threaded:
+                slot.thread = threading.Thread(
+                    target=self._worker, args=(i,), name=f"{self.name}-{slot.stage.name}", daemon=True
+                )
+                slot.thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """Arrête les threads des étages (les packets en file sont abandonnés)"""
+        self._running = False
+        for slot in self._slots:
+            if slot.thread is not None:
+                slot.thread.join(timeout)
+                slot.thread = None
+
+    def flush(self):
+        """Vide les files et réinitialise les étages"""
+        for slot in self._slots:
+            slot.queue.clear()
+            slot.stage.reset()
+
+    def submit(self, packet: FramePacket, stage: Optional[str] = None) -> bool:
+        """
+        Fait entrer un packet dans la chaîne (au premier étage ou à l'étage nommé).
+
+        Returns:
+            False si le packet a été arrêté ou rejeté par une file pleine
+        """
+        start = self._index[stage] if stage is not None else 0
+        return self._advance(start, packet)
+
+    def get_stats(self) -> dict:
+        """Temps par étage, rejets par file et latence de bout en bout"""
+        stats = {}
+        for slot in self._slots:
+            entry = slot.stats.to_dict()
+            entry["threaded"] = slot.threaded
+            entry["queued"] = len(slot.queue)
+            entry["dropped"] = slot.queue.dropped
+            stats[slot.stage.name] = entry
+        stats["end_to_end"] = self._latency.to_dict()
+        return stats
+
+    def _advance(self, index: int, packet: FramePacket) -> bool:
+        """Exécute les étages inline à partir d'index jusqu'au prochain étage threadé"""
+        while index < len(self._slots):
+            slot = self._slots[index]
+            if slot.threaded:
+                return slot.queue.put(packet)
+            packet = self._execute(slot, packet)
+            if packet is None:
+                return False
+            index += 1
+        self._latency.record((time.perf_counter() - packet.created_at) * 1000)
+        return True
+
+    def _execute(self, slot: _StageSlot, packet: FramePacket) -> Optional[FramePacket]:
+        """Exécute un étage en mesurant son temps de traitement"""
+        start = time.perf_counter()
+        result = slot.stage.process(packet)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        slot.stats.record(elapsed_ms)
+        packet.timings[slot.stage.name] = elapsed_ms
+        return result
+
+    def _worker(self, index: int):
+        """Boucle d'un étage threadé : file d'entrée → process → étages suivants"""
+        slot = self._slots[index]
+        while self._running:
+            packet = slot.queue.get(timeout=0.05)
+            try:
+                if packet is None:
+                    slot.stage.idle()
+                    continue
+                packet = self._execute(slot, packet)
+                if packet is not None:
+                    self._advance(index + 1, packet)
+            except Exception:
+                print(f"Error in pipeline stage '{slot.stage.name}' (Recovering...):")
+                traceback.print_exc()
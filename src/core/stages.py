@@ -0,0 +1,528 @@
+# -*- coding: utf-8 -*-
+"""
+Stages - Étages concrets du pipeline de traitement des mains
+Responsabilité unique : Une étape du traitement par classe (capture, prétraitement,
+inférence, interprétation, action, stream, rendu), partagée par HandEngine et AppCoordinator
+"""
+import json
+import time
+from typing import Callable, Dict, Optional
+
+import cv2
+
+from src.action_dispatcher import ActionType
+from src.context_mode import ContextMode
+from src.control.input.relative_pointer import CLUTCH_GESTURES
+from src.core.frame_sinks import FrameSinks
+from src.core.pipeline import DropPolicy, FramePacket, Pipeline, Stage, StageStats
+from src.processing.geometry.hand_frame import hands_to_array, normalize_hands
+from src.vision.preprocessing.frame_preprocessor import mirror_result
+
+
+# Interprétation (+ action) et rendu sur leurs propres threads : le callback du modèle ne
+# fait que déposer le résultat, l'affichage ne retarde ni la capture ni les actions
+DEFAULT_THREADED_STAGES = ("interpret", "render")
+
+# Étages alimentés par une Mailbox : seul le packet le plus récent compte et le producteur
+# ne prend aucun verrou (callback du modèle → interprétation, interprétation → rendu)
+MAILBOX_STAGES = ("interpret", "render")
+
+
+class CaptureStage(Stage):
+    """Lit le buffer brut de la caméra courante (sans le décoder)"""
+
+    name = "capture"
+
+    def __init__(self, get_camera: Callable[[], Optional[object]], retry_delay: float = 0.1):
+        self.get_camera = get_camera  # Caméra ouverte (CameraManager) ou None
+        self.retry_delay = retry_delay
+
+    def process(self, packet: FramePacket) -> Optional[FramePacket]:
+        camera = self.get_camera()
+        raw = camera.read_raw() if camera is not None else None
+        if raw is None:
+            # Évite de boucler à vide si la caméra ne livre plus de frame
+            time.sleep(self.retry_delay)
+            return None
+        packet.raw = raw
+        packet.decoder = camera.decoder
+        if not packet.captured_at:  # Déjà daté (rejeu) : horloge conservée
+            packet.captured_at = time.monotonic()
+        return packet
+
+
+class PreprocessStage(Stage):
+    """
+    Décode le buffer brut en frame d'affichage + image d'inférence RGB réduite.
+    Sans fenêtre (need_display=False), la frame d'affichage n'est produite que si un
+    consommateur est attaché à sinks : sinon les étages de rendu n'ont rien à dessiner.
+    """
+
+    name = "preprocess"
+
+    def __init__(
+        self,
+        need_display: bool = True,
+        mirror_landmarks: bool = False,
+        copy_outputs: bool = False,
+        sinks: Optional[FrameSinks] = None
+    ):
+        self.need_display = need_display
+        self.sinks = sinks
+        self.mirror_landmarks = mirror_landmarks
+        # L'image d'inférence vit dans un buffer réutilisé : à copier si l'inférence
+        # tourne sur un autre thread que le prétraitement
+        self.copy_outputs = copy_outputs
+
+    def process(self, packet: FramePacket) -> Optional[FramePacket]:
+        need_display = self.need_display or (self.sinks is not None and self.sinks.active)
+        frame, rgb = packet.decoder.decode(
+            packet.raw, need_display=need_display, mirror_landmarks=self.mirror_landmarks
+        )
+        packet.raw = None
+        if rgb is None:
+            return None
+        packet.frame = frame
+        packet.inference_rgb = rgb.copy() if self.copy_outputs else rgb
+        packet.mirrored_landmarks = self.mirror_landmarks
+        return packet
+
+
+class InferStage(Stage):
+    """
+    Envoie l'image au modèle (detect_async). Le packet reste en attente jusqu'au
+    callback du modèle, qui le récupère via complete() et le réinjecte à l'étage suivant.
+
+    Les packets en vol sont dans un dict manipulé uniquement par opérations atomiques
+    (insertion, pop, copie des clés) : complete() ne prend aucun verrou.
+    """
+
+    name = "infer"
+
+    def __init__(self, detect: Callable[[object, int], None], max_in_flight: int = 100):
+        self.detect = detect  # detect(image_rgb, timestamp_ms)
+        self.max_in_flight = max_in_flight
+        self.latency = StageStats()  # Envoi → callback du modèle
+        self._in_flight: Dict[int, FramePacket] = {}
+        self.reset_clock()
+
+    def reset_clock(self):
+        """Timestamps monotones par instance de landmarker (à appeler à sa création)"""
+        self.start_time = None  # Horloge de frame de la première frame envoyée
+        self.last_timestamp_ms = 0
+
+    def reset(self):
+        self._in_flight.clear()
+
+    def process(self, packet: FramePacket) -> Optional[FramePacket]:
+        # Timestamp du modèle dérivé de l'instant de capture (et non de l'envoi)
+        if not packet.captured_at:
+            packet.captured_at = time.monotonic()
+        if self.start_time is None:
+            self.start_time = packet.captured_at
+        timestamp_ms = int((packet.captured_at - self.start_time) * 1000)
+        if timestamp_ms <= self.last_timestamp_ms:
+            timestamp_ms = self.last_timestamp_ms + 1
+        self.last_timestamp_ms = timestamp_ms
+        packet.timestamp_ms = timestamp_ms
+
+        self._in_flight[timestamp_ms] = packet
+        # Frames ignorées par le modèle (occupé) : jamais de callback, on purge
+        if len(self._in_flight) > self.max_in_flight:
+            cutoff = timestamp_ms - 2000
+            for ts in list(self._in_flight.keys()):
+                if ts < cutoff:
+                    self._in_flight.pop(ts, None)
+
+        packet.inference_sent_at = time.perf_counter()
+        self.detect(packet.inference_rgb, timestamp_ms)
+        packet.inference_rgb = None
+        return None  # Reprise dans complete()
+
+    def complete(self, result, timestamp_ms: int) -> FramePacket:
+        """Associe le résultat du modèle à son packet. Retourne le packet à réinjecter."""
+        packet = self._in_flight.pop(timestamp_ms, None)
+        if packet is None:
+            packet = FramePacket(timestamp_ms=timestamp_ms,
+                                 captured_at=(self.start_time or 0.0) + timestamp_ms / 1000.0)
+        packet.result = result
+        if packet.inference_sent_at:
+            latency_ms = (time.perf_counter() - packet.inference_sent_at) * 1000
+            packet.timings["inference"] = latency_ms
+            self.latency.record(latency_ms)
+        return packet
+
+
+class InterpretStage(Stage):
+    """
+    Classification des gestes, choix main primaire/secondaire, mode et action.
+    Le packet sortant porte un instantané complet pour le rendu (résultat, gestes, mode,
+    action, landmarks_seq) : le thread de rendu ne lit pas l'état de l'hôte.
+
+    Hôte (HandEngine / AppCoordinator) : gesture_classifier, gesture_stability, temporal_gestures,
+    mode_detector, action_dispatcher, mouse (pointeur relatif), lock, mouse_frozen ; publie latest_result, landmarks_seq (incrémenté
+    quand les landmarks à afficher changent), latest_landmarks, latest_world_landmarks,
+    current_gestures, current_mode, current_action.
+    """
+
+    name = "interpret"
+
+    def __init__(self, host):
+        self.host = host
+
+    def process(self, packet: FramePacket) -> Optional[FramePacket]:
+        host = self.host
+        result = packet.result
+        if result is None:
+            return None
+        if packet.mirrored_landmarks:
+            mirror_result(result)
+
+        with host.lock:
+            # Deux résultats sans main de suite : rien de nouveau à dessiner
+            if result.hand_landmarks or host.latest_landmarks is not None:
+                host.landmarks_seq += 1
+            host.latest_result = result
+            packet.landmarks_seq = host.landmarks_seq
+            if not result.hand_landmarks:
+                # Sans main : l'affichage garde le dernier mode / action / gestes
+                packet.gestures = host.current_gestures
+                packet.mode = host.current_mode
+                packet.action = host.current_action
+            if result.hand_landmarks:
+                # Première main pour l'affichage 3D principal
+                host.latest_landmarks = result.hand_landmarks[0]
+                host.latest_world_landmarks = (
+                    result.hand_world_landmarks[0] if result.hand_world_landmarks else None
+                )
+            else:
+                host.latest_landmarks = None
+
+        temporal = host.temporal_gestures
+        if not result.hand_landmarks:
+            temporal.lost_all()
+            host.gesture_stability.reset()
+            return packet
+
+        # Classification de toutes les mains + répartition Primaire (droite) / Secondaire
+        timestamp = packet.captured_at
+        # Toutes les mains dans leur repère en un seul appel (invariance rotation / miroir)
+        packet.hand_frames = normalize_hands(hands_to_array(result.hand_landmarks))
+        motions = []
+        hands = []
+        for i, hand_landmarks in enumerate(result.hand_landmarks):
+            is_right_hand = True
+            if result.handedness and i < len(result.handedness):
+                is_right_hand = (result.handedness[i][0].category_name == "Right")
+            hand = "Right" if is_right_hand else "Left"
+            if hand in hands:
+                hand = f"{hand}{i}"
+            hands.append(hand)
+
+            # Geste stable : scores continus → hystérésis + durée minimale (par main)
+            scores = host.gesture_classifier.scores(hand_landmarks, packet.hand_frames[i])
+            stable = host.gesture_stability.update(hand, scores)
+            gesture_label = stable.label
+            packet.gestures.append(gesture_label)
+            packet.confidences.append(stable.confidence)
+
+            # Fenêtre temporelle par main (mise à jour incrémentale, O(1) par frame)
+            motions.append(temporal.update(hand, hand_landmarks, timestamp, gesture_label))
+
+            if is_right_hand:
+                packet.primary_landmarks = hand_landmarks
+                packet.primary_frame = packet.hand_frames[i]
+                packet.primary_gesture = gesture_label
+                packet.motion_gesture = motions[i].value if motions[i] else None
+            else:
+                packet.secondary_landmarks = hand_landmarks
+                packet.secondary_gesture = gesture_label
+        temporal.keep_only(hands)
+        host.gesture_stability.keep_only(hands)
+
+        # Pas de main droite : la première main devient primaire
+        if not packet.primary_landmarks:
+            packet.primary_landmarks = result.hand_landmarks[0]
+            packet.primary_frame = packet.hand_frames[0]
+            packet.primary_gesture = packet.gestures[0]
+            packet.motion_gesture = motions[0].value if motions[0] else None
+            if packet.secondary_landmarks is packet.primary_landmarks:
+                packet.secondary_landmarks = None
+                packet.secondary_gesture = "UNKNOWN"
+
+        wrist = packet.primary_landmarks[0]
+        secondary_wrist = packet.secondary_landmarks[0] if packet.secondary_landmarks else None
+        packet.mode = host.mode_detector.detect_mode(
+            hand_pos=(wrist.x, wrist.y),
+            left_hand_gesture=packet.secondary_gesture,
+            left_hand_pos=(secondary_wrist.x, secondary_wrist.y) if secondary_wrist else None,
+            timestamp=timestamp
+        )
+        packet.action = host.action_dispatcher.get_action(
+            mode=packet.mode.value,
+            gesture=packet.primary_gesture,
+            timestamp=timestamp
+        )
+        if packet.motion_gesture is not None:
+            # Geste dynamique terminé : prioritaire s'il a une action dans ce mode
+            motion_action = host.action_dispatcher.get_motion_action(packet.mode.value, packet.motion_gesture)
+            if motion_action != ActionType.NONE:
+                packet.action = motion_action
+        if (packet.action == ActionType.MOVE_CURSOR and packet.primary_gesture in CLUTCH_GESTURES
+                and packet.mode == ContextMode.CURSOR and host.mouse.pointer is not None):
+            # Mode relatif : la main ouverte ne déplace pas le curseur (embrayage dans ActStage)
+            packet.action = ActionType.NONE
+
+        # Gel / dégel de la souris par pouce levé / baissé
+        if packet.primary_gesture == "THUMBS_UP" and host.mouse_frozen:
+            host.mouse_frozen = False
+            print("👍 Souris: DÉGELÉE ✅")
+        elif packet.primary_gesture == "THUMBS_DOWN" and not host.mouse_frozen:
+            host.mouse_frozen = True
+            print("👎 Souris: GELÉE ❄️")
+
+        with host.lock:
+            host.current_mode = packet.mode
+            host.current_action = packet.action
+            host.current_gestures = packet.gestures
+        return packet
+
+
+class ActStage(Stage):
+    """
+    Exécute l'action décidée : curseur filtré, actions système, clavier virtuel, ASL.
+    Les appels OS bloquants partent dans l'ActionExecutor de l'hôte : déplacements vers
+    host.mouse, le reste via ActionDispatcher.execute_action (SystemActions), coalescé.
+
+    Une action discrète (clic, snap, touche multimédia...) part une fois quand elle devient
+    l'action courante (le glisser reste appuyé jusqu'au changement) ; le scroll est répété à
+    chaque frame tant qu'il dure.
+
+    Hôte : mouse, filter, action_executor, action_dispatcher, virtual_keyboard, asl_manager,
+    keyboard_enabled, mouse_frozen ; publie active_hand_pos (copiée dans packet.hand_pos).
+    """
+
+    name = "act"
+
+    # Taille du canvas de référence pour les coordonnées pixel
+    CANVAS_SIZE = (640, 480)
+    # Actions répétées à chaque frame (les autres ne partent qu'au changement d'action)
+    CONTINUOUS_ACTIONS = frozenset({ActionType.SCROLL_UP, ActionType.SCROLL_DOWN})
+
+    def __init__(self, host):
+        self.host = host
+        self._last_action = ActionType.NONE
+
+    def reset(self):
+        self._last_action = ActionType.NONE
+
+    def process(self, packet: FramePacket) -> Optional[FramePacket]:
+        host = self.host
+        landmarks = packet.primary_landmarks
+        now = packet.captured_at  # Horloge de frame
+        if landmarks is None:
+            self._dispatch(ActionType.NONE, now)  # Main perdue : glisser relâché
+            packet.hand_pos = host.active_hand_pos
+            return packet
+
+        w, h = self.CANVAS_SIZE
+        action = packet.action
+        executor = host.action_executor
+
+        if (packet.primary_gesture in CLUTCH_GESTURES and packet.mode == ContextMode.CURSOR
+                and host.mouse.pointer is not None):
+            # Embrayage immédiat, ordonné avec les déplacements : une main ouverte plus brève
+            # que CLUTCH_GAP ne fait pas sauter le curseur à la reprise
+            executor.submit("clutch", host.mouse.pointer.clutch)
+
+        if action in (ActionType.MOVE_CURSOR, ActionType.DRAG_START) and not host.mouse_frozen:
+            # POINTING → bout de l'index (8) pour la précision, sinon MCP index (5) pour la stabilité
+            track_pt = landmarks[8 if packet.primary_gesture == "POINTING" else 5]
+            raw_x, raw_y = int(track_pt.x * w), int(track_pt.y * h)
+            host.active_hand_pos = (raw_x, raw_y)
+
+            if host.mouse.pointer is not None:
+                # Mode relatif : position sous-pixel, lissage propre au pointeur (remis à zéro à l'embrayage)
+                executor.submit("move", host.mouse.move, track_pt.x * w, track_pt.y * h, w, h, timestamp=now)
+            else:
+                smooth_x, smooth_y = host.filter.process(raw_x, raw_y, now)
+                executor.submit("move", host.mouse.move, smooth_x, smooth_y, w, h, timestamp=now)
+        self._dispatch(action, now)
+
+        if host.keyboard_enabled:
+            host.virtual_keyboard.process(landmarks, packet.primary_gesture, (h, w, 3), now)
+
+        host.asl_manager.process(landmarks, packet.primary_frame)
+        packet.hand_pos = host.active_hand_pos
+        return packet
+
+    def _dispatch(self, action: ActionType, now: float):
+        """Actions système : fronts de changement, ou chaque frame pour les actions continues"""
+        previous, self._last_action = self._last_action, action
+        execute = self.host.action_dispatcher.execute_action
+        submit = self.host.action_executor.submit_coalesced
+        if previous == ActionType.DRAG_START and action != ActionType.DRAG_START:
+            submit(ActionType.DRAG_END.value, execute, ActionType.DRAG_END, timestamp=now)
+        if action in (ActionType.NONE, ActionType.MOVE_CURSOR):
+            return
+        if action != previous or action in self.CONTINUOUS_ACTIONS:
+            submit(action.value, execute, action, timestamp=now)
+
+
+class StreamStage(Stage):
+    """Diffuse les landmarks de la main principale au HUD (UDP, JSON)"""
+
+    name = "stream"
+
+    def __init__(self, sock, address):
+        self.sock = sock
+        self.address = address
+
+    def process(self, packet: FramePacket) -> Optional[FramePacket]:
+        result = packet.result
+        if result is not None and result.hand_landmarks:
+            data = {
+                "landmarks": [{"x": lm.x, "y": lm.y, "z": lm.z} for lm in result.hand_landmarks[0]],
+                "ts": packet.timestamp_ms / 1000.0
+            }
+            try:
+                self.sock.sendto(json.dumps(data).encode(), self.address)
+            except OSError:
+                pass
+        return packet
+
+
+class RenderStage(Stage):
+    """
+    Rendu et affichage natif (OpenCV HighGUI). Seul ce thread touche aux fenêtres :
+    création, imshow, waitKey et fermeture demandée par la pause.
+
+    max_fps cadence l'affichage indépendamment de la capture : un packet arrivé moins de
+    1/max_fps après le dernier rendu est transmis sans être dessiné (décimation).
+    """
+
+    name = "render"
+
+    def __init__(
+        self,
+        render: Callable[[FramePacket], None],
+        window_name: Optional[str] = None,
+        on_key: Optional[Callable[[int], None]] = None,
+        max_fps: Optional[float] = None
+    ):
+        self.render = render
+        self.window_name = window_name  # None : pas d'affichage natif (headless)
+        self.on_key = on_key
+        self.max_fps = max_fps
+        self._min_interval = 1.0 / max_fps if max_fps else 0.0
+        self._last_render = 0.0
+        self.render_stats = StageStats()  # Rendus effectifs uniquement
+        self.decimated = 0
+        self._window_open = False
+        self._close_requested = False
+
+    def request_close(self):
+        """Demande la fermeture des fenêtres (exécutée par le thread de rendu)"""
+        self._close_requested = True
+
+    def process(self, packet: FramePacket) -> Optional[FramePacket]:
+        if self._close_requested:
+            self.idle()
+        if packet.frame is None:
+            return packet
+        now = time.perf_counter()
+        if now - self._last_render < self._min_interval:
+            self.decimated += 1
+            return packet
+        self._last_render = now
+        if self.window_name and not self._window_open:
+            # GUI_NORMAL : fenêtre sans barre d'outils
+            cv2.namedWindow(self.window_name, cv2.WINDOW_GUI_NORMAL)
+            self._window_open = True
+        self.render(packet)
+        if self.window_name:
+            self._poll_keys()
+        self.render_stats.record((time.perf_counter() - now) * 1000)
+        return packet
+
+    def get_stats(self) -> dict:
+        """Rendus effectués, cadence, frames décimées et temps de rendu ainsi évité (ms)"""
+        stats = self.render_stats.to_dict()
+        return {
+            "max_fps": self.max_fps,
+            "render_fps": stats["fps"],
+            "rendered": stats["count"],
+            "decimated": self.decimated,
+            "render_avg_ms": stats["avg_ms"],
+            "saved_ms": self.decimated * stats["avg_ms"],
+        }
+
+    def idle(self):
+        """Sans frame : applique une fermeture demandée et garde les fenêtres réactives"""
+        if not self.window_name:
+            return
+        if self._close_requested:
+            self._close_requested = False
+            if self._window_open:
+                cv2.destroyAllWindows()
+                self._window_open = False
+        if self._window_open:
+            self._poll_keys()
+
+    def _poll_keys(self):
+        key = cv2.waitKey(1) & 0xFF
+        if self.on_key is not None and key != 0xFF:
+            self.on_key(key)
+
+
+def build_hand_pipeline(
+    host,
+    get_camera: Callable[[], Optional[object]],
+    detect: Callable[[object, int], None],
+    render: Callable[[FramePacket], None],
+    headless: bool = False,
+    window_name: Optional[str] = None,
+    on_key: Optional[Callable[[int], None]] = None,
+    udp_socket=None,
+    hud_addr=None,
+    threaded_stages=DEFAULT_THREADED_STAGES,
+    display_fps: Optional[float] = None,
+    frame_sinks: Optional[FrameSinks] = None
+) -> Pipeline:
+    """
+    Assemble capture → prétraitement → inférence → interprétation → action → stream → rendu.
+
+    La capture est cadencée par la boucle de l'hôte (Pipeline.submit) ; les autres étages
+    listés dans threaded_stages tournent sur leur propre thread derrière une file d'une
+    place qui garde la frame la plus récente. display_fps limite la cadence du rendu ;
+    en headless, le rendu ne tourne que pendant qu'un consommateur est attaché à frame_sinks.
+    """
+    threaded = set(threaded_stages)
+    if CaptureStage.name in threaded:
+        raise ValueError("The capture stage is driven by the host loop and cannot be threaded")
+
+    stages = [
+        CaptureStage(get_camera),
+        PreprocessStage(
+            need_display=not headless,
+            mirror_landmarks=headless,  # Sans affichage : miroir appliqué aux landmarks
+            copy_outputs=InferStage.name in threaded,
+            sinks=frame_sinks
+        ),
+        InferStage(detect),
+        InterpretStage(host),
+        ActStage(host),
+    ]
+    if udp_socket is not None:
+        stages.append(StreamStage(udp_socket, hud_addr))
+    stages.append(RenderStage(render, None if headless else window_name, on_key, max_fps=display_fps))
+
+    pipeline = Pipeline(name="hand")
+    for stage in stages:
+        pipeline.add_stage(
+            stage,
+            threaded=stage.name in threaded,
+            drop_policy=DropPolicy.DROP_OLDEST,
+            mailbox=stage.name in MAILBOX_STAGES
+        )
+    return pipeline
@@ -20,6 +20,13 @@ class AppMode(Enum):
     KEYBOARD = "keyboard"
 
 
+class PauseMode(Enum):
+    """Politique de pause : ressources conservées entre stop() et start()"""
+    COLD = "cold"  # Libère caméra + landmarker (comportement historique)
+    WARM = "warm"  # Garde le landmarker, libère la caméra
+    HOT = "hot"    # Garde caméra + landmarker, saute simplement le traitement
+
+
 @dataclass
 class HandData:
     """Données d'une main détectée"""
@@ -164,6 +171,16 @@ class StateManager:
         with self._lock:
             self._state.keyboard_enabled = value
     
+    @property
+    def mouse_frozen(self) -> bool:
+        with self._lock:
+            return self._state.mouse_frozen
+    
+    @mouse_frozen.setter
+    def mouse_frozen(self, value: bool):
+        with self._lock:
+            self._state.mouse_frozen = value
+    
     # --- Listeners ---
     
     def add_listener(self, callback):
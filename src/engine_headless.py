@@ -13,44 +13,54 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 try:
     from src.engine import HandEngine
+    from src.models.config import AppConfig
 except ImportError:
     from engine import HandEngine
+    from models.config import AppConfig
 
-# Global frame buffer
+# Global frame buffer (filled only while at least one client is connected)
 output_frame = None
+frame_id = 0
 lock = threading.Lock()
+new_frame = threading.Condition(lock)
+engine = None
+viewers = 0
 
 class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
     daemon_threads = True
 
 class MJPEGHandler(BaseHTTPRequestHandler):
     def do_GET(self):
-        global output_frame, lock
         if self.path == '/stream':
             self.send_response(200)
             self.send_header('Content-type', 'multipart/x-mixed-replace; boundary=boundarydonotcross')
             self.send_header('Access-Control-Allow-Origin', '*')
             self.end_headers()
+            viewer_connected()
             try:
+                last_id = None
                 while True:
-                    with lock:
-                        if output_frame is None:
+                    with new_frame:
+                        # Wait for a frame newer than the last one sent (no busy loop)
+                        if not new_frame.wait_for(lambda: output_frame is not None and frame_id != last_id, 1.0):
                             continue
-                        # Encode frame as JPEG
-                        (flag, encodedImage) = cv2.imencode(".jpg", output_frame)
-                        if not flag:
-                            continue
-                        
+                        frame, last_id = output_frame, frame_id
+                    # Encode frame as JPEG (outside the lock)
+                    (flag, encodedImage) = cv2.imencode(".jpg", frame)
+                    if not flag:
+                        continue
+
                     self.wfile.write(b'--boundarydonotcross\r\n')
                     self.send_header('Content-type', 'image/jpeg')
                     self.send_header('Content-length', str(len(encodedImage)))
                     self.end_headers()
                     self.wfile.write(encodedImage)
                     self.wfile.write(b'\r\n')
-                    time.sleep(0.016) # ~60 FPS cap
             except Exception as e:
                 # Client disconnected
                 pass
+            finally:
+                viewer_disconnected()
         else:
             self.send_response(404)
             self.end_headers()
@@ -61,16 +71,42 @@ def start_server():
     server.serve_forever()
 
 def update_frame(img):
-    global output_frame, lock
+    global output_frame, frame_id
+    frame = img.copy()  # Render buffers are reused by the engine
+    with new_frame:
+        output_frame = frame
+        frame_id += 1
+        new_frame.notify_all()
+
+def viewer_connected():
+    """First client: the engine starts rendering frames for the stream"""
+    global viewers
+    with lock:
+        viewers += 1
+        if viewers == 1 and engine is not None:
+            engine.frame_sinks.attach("mjpeg", update_frame)
+
+def viewer_disconnected():
+    """Last client gone: back to zero-render headless"""
+    global viewers, output_frame
     with lock:
-        output_frame = img.copy()
+        viewers -= 1
+        if viewers == 0:
+            output_frame = None
+            if engine is not None:
+                engine.frame_sinks.detach("mjpeg")
 
 def main():
+    global engine
     print("🤖 Hand Mouse OS - Headless Engine Starting...")
     
-    # 1. Start Engine
-    engine = HandEngine(headless=True)
-    engine.frame_callback = update_frame
+    # 1. Start Engine (renders nothing until a stream client connects)
+    performance = AppConfig.load().performance  # Politique de pause et cadence de l'aperçu
+    engine = HandEngine(
+        headless=True,
+        pause_mode=performance.pause_mode,
+        display_fps=performance.display_fps
+    )
     engine.start()
 
     # 2. Start MJPEG Server (Daemon thread)
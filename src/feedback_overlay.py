@@ -45,6 +45,12 @@ class FeedbackOverlay:
         "asl": "ASL (SIGNES)",
     }
     
+    # Géométrie du panneau d'info
+    PANEL_SIZE = (220, 100)
+    PANEL_MARGIN = 10
+    PANEL_ALPHA = 0.85
+    PANEL_BORDER = 2
+    
     def __init__(self, position: str = "top_left"):
         """
         Args:
@@ -53,7 +59,100 @@ class FeedbackOverlay:
         self.position = position
         self._confidence = 0.0
         self._last_action = "Aucune"
+        self.debug_raw_gesture = ""
+        
+        # Caches du compositeur : seules les ROI concernées sont mélangées, en place
+        self._panel_cache = {}   # (mode, w, h) -> (roi, calque, trous, origine dans la ROI)
+        # ((haut de la zone média, marge des bords), {(mode, w, h) -> [(roi, aplat de couleur)]}),
+        # remplacé d'un bloc par set_zones
+        self._zone_state = ((0.20, 0.10), {})
+        self._text_key = None    # Textes rendus dans _text_layer
+        self._text_layer = None  # (rows, 255 * (1 - alpha), couleur * alpha) en uint8
+        
+    def _panel_origin(self, w: int, h: int) -> Tuple[int, int]:
+        """Coin haut-gauche du panneau selon la position configurée"""
+        overlay_w, overlay_h = self.PANEL_SIZE
+        margin = self.PANEL_MARGIN
+        if self.position == "top_left":
+            return margin, margin
+        if self.position == "top_right":
+            return w - overlay_w - margin, margin
+        if self.position == "bottom_left":
+            return margin, h - overlay_h - margin
+        return w - overlay_w - margin, h - overlay_h - margin  # bottom_right
+    
+    def _get_panel(self, mode: str, w: int, h: int):
+        """Calque pré-rendu (fond + bordure) et masque du panneau, par (mode, taille)"""
+        key = (mode, w, h)
+        cached = self._panel_cache.get(key)
+        if cached is None:
+            x, y = self._panel_origin(w, h)
+            overlay_w, overlay_h = self.PANEL_SIZE
+            pad = self.PANEL_BORDER
+            x0, y0 = max(x - pad, 0), max(y - pad, 0)
+            x1, y1 = min(x + overlay_w + pad + 1, w), min(y + overlay_h + pad + 1, h)
+            
+            mode_color = self.MODE_COLORS.get(mode, (200, 200, 200))
+            layer = np.zeros((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+            mask = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+            pt1, pt2 = (x - x0, y - y0), (x + overlay_w - x0, y + overlay_h - y0)
+            for target, fill, border in ((layer, (30, 30, 35), mode_color), (mask, 255, 255)):
+                cv2.rectangle(target, pt1, pt2, fill, -1)
+                cv2.rectangle(target, pt1, pt2, border, 2)
+            
+            # ROI resserrée sur les pixels dessinés ; les rares trous (coins de la bordure)
+            # sont sauvegardés puis restaurés au lieu d'un mélange masqué
+            ys, xs = np.nonzero(mask)
+            top, bottom, left, right = ys.min(), ys.max() + 1, xs.min(), xs.max() + 1
+            layer = np.ascontiguousarray(layer[top:bottom, left:right])
+            holes = np.nonzero(mask[top:bottom, left:right] == 0)
+            roi = (slice(y0 + top, y0 + bottom), slice(x0 + left, x0 + right))
+            cached = (roi, layer, holes if holes[0].size else None, (x - x0 - left, y - y0 - top))
+            self._panel_cache[key] = cached
+        return cached
+    
+    def _get_text_layer(self, mode: str, gesture: str, action: str, shape: Tuple[int, int],
+                        origin: Tuple[int, int]):
+        """
+        Rend les textes du panneau une seule fois par combinaison (mode, geste, action) :
+        couverture anti-aliasée (alpha) + couleur prémultipliée, composées ensuite par frame.
+        """
+        key = (mode, gesture, action, self.debug_raw_gesture, shape, origin)
+        if key == self._text_key:
+            return self._text_layer
         
+        roi_h, roi_w = shape
+        ox, oy = origin
+        mode_color = self.MODE_COLORS.get(mode, (200, 200, 200))
+        mode_name = self.MODE_NAMES.get(mode, mode.upper())
+        gesture_icon = self.GESTURE_ICONS.get(gesture.upper(), "[?]")
+        lines = [
+            (f"Mode: {mode_name}", 25, 0.5, mode_color),
+            (f"Geste: {gesture_icon} {gesture} ({self.debug_raw_gesture})", 50, 0.5, (255, 255, 255)),
+        ]
+        if action:
+            lines.append((f"Action: {action}", 75, 0.4, (180, 180, 180)))
+        
+        color = np.zeros((roi_h, roi_w, 3), dtype=np.float32)
+        alpha = np.zeros((roi_h, roi_w), dtype=np.float32)
+        for text, dy, scale, text_color in lines:
+            coverage = np.zeros((roi_h, roi_w), dtype=np.uint8)
+            cv2.putText(coverage, text, (ox + 10, oy + dy),
+                       cv2.FONT_HERSHEY_SIMPLEX, scale, 255, 1, cv2.LINE_AA)
+            a = coverage.astype(np.float32) / 255.0
+            # Texte suivant par-dessus le précédent (lignes disjointes en pratique)
+            color = color * (1 - a)[..., None] + a[..., None] * np.float32(text_color)
+            alpha = alpha + a * (1 - alpha)
+        
+        # Lignes couvertes par du texte uniquement : la composition par frame reste minimale
+        rows = np.flatnonzero(alpha.any(axis=1))
+        rows = slice(int(rows[0]), int(rows[-1]) + 1) if rows.size else slice(0, 0)
+        inv_alpha = np.repeat(((1 - alpha[rows]) * 255 + 0.5)[..., None], 3, axis=2).astype(np.uint8)
+        premultiplied = (color[rows] + 0.5).astype(np.uint8)
+        self._text_layer = (rows, inv_alpha, premultiplied)
+        self._text_key = key
+        return self._text_layer
+    
     def draw(
         self,
         frame: np.ndarray,
@@ -63,7 +162,7 @@ class FeedbackOverlay:
         confidence: float = 1.0
     ) -> np.ndarray:
         """
-        Dessine l'overlay sur la frame.
+        Dessine l'overlay sur la frame (en place).
         
         Args:
             frame: Image OpenCV (BGR)
@@ -76,50 +175,27 @@ class FeedbackOverlay:
             Frame avec overlay dessiné
         """
         h, w = frame.shape[:2]
+        mode = mode.lower()
+        (rows, cols), layer, holes, origin = self._get_panel(mode, w, h)
+        roi = frame[rows, cols]
         
-        # Dimensions de l'overlay
-        overlay_w = 220
-        overlay_h = 100
-        margin = 10
+        # Fond semi-transparent : mélange limité à la ROI du panneau
+        saved = roi[holes] if holes is not None else None
+        cv2.addWeighted(layer, self.PANEL_ALPHA, roi, 1 - self.PANEL_ALPHA, 0, dst=roi)
+        if saved is not None:
+            roi[holes] = saved
         
-        # Position selon configuration
-        if self.position == "top_left":
-            x, y = margin, margin
-        elif self.position == "top_right":
-            x, y = w - overlay_w - margin, margin
-        elif self.position == "bottom_left":
-            x, y = margin, h - overlay_h - margin
-        else:  # bottom_right
-            x, y = w - overlay_w - margin, h - overlay_h - margin
-        
-        # Couleur du mode
-        mode_color = self.MODE_COLORS.get(mode.lower(), (200, 200, 200))
-        
-        # Fond semi-transparent
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (x, y), (x + overlay_w, y + overlay_h), (30, 30, 35), -1)
-        cv2.rectangle(overlay, (x, y), (x + overlay_w, y + overlay_h), mode_color, 2)
-        
-        # Blend avec la frame originale
-        alpha = 0.85
-        frame = cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0)
-        
-        # Texte : Mode
-        mode_name = self.MODE_NAMES.get(mode.lower(), mode.upper())
-        cv2.putText(frame, f"Mode: {mode_name}", (x + 10, y + 25), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, mode_color, 1, cv2.LINE_AA)
-        
-        # Texte : Geste
-        gesture_icon = self.GESTURE_ICONS.get(gesture.upper(), "[?]")
-        cv2.putText(frame, f"Geste: {gesture_icon} {gesture} ({getattr(self, 'debug_raw_gesture', '')})", (x + 10, y + 50), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
-        
-        # Texte : Action (si fournie)
-        if action:
-            cv2.putText(frame, f"Action: {action}", (x + 10, y + 75), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (180, 180, 180), 1, cv2.LINE_AA)
+        # Textes pré-rendus (re-rendus seulement si mode / geste / action changent)
+        text_rows, inv_alpha, color = self._get_text_layer(mode, gesture, action, layer.shape[:2], origin)
+        band = roi[text_rows]
+        # band * (1 - alpha) + couleur * alpha, en deux passes uint8 saturées
+        cv2.multiply(band, inv_alpha, dst=band, scale=1 / 255)
+        cv2.add(band, color, dst=band)
         
         # Barre de confiance
+        x, y = self._panel_origin(w, h)
+        overlay_w, overlay_h = self.PANEL_SIZE
+        mode_color = self.MODE_COLORS.get(mode, (200, 200, 200))
         conf_bar_y = y + overlay_h - 15
         conf_bar_w = int((overlay_w - 20) * confidence)
         cv2.rectangle(frame, (x + 10, conf_bar_y), (x + 10 + overlay_w - 20, conf_bar_y + 8), (50, 50, 50), -1)
@@ -127,13 +203,41 @@ class FeedbackOverlay:
         
         return frame
     
+    def set_zones(self, media_zone_top: float, window_edge_margin: float):
+        """Géométrie des zones (ContextModeDetector) : les aplats seront recalculés"""
+        self._zone_state = ((media_zone_top, window_edge_margin), {})
+
+    def _get_zones(self, mode: str, w: int, h: int):
+        """Zones à teinter pour le mode : (ROI, aplat de couleur) pré-calculés par taille"""
+        key = (mode, w, h)
+        (media_top, edge_margin), cache = self._zone_state
+        zones = cache.get(key)
+        if zones is None:
+            media_h = int(h * media_top)
+            edge_w = int(w * edge_margin)
+            rects = []
+            if mode == "media":
+                rects = [((0, 0, w, media_h), (0, 255, 0))]
+            elif mode == "window":
+                rects = [((0, media_h, edge_w, h), (255, 0, 255)),
+                         ((w - edge_w, media_h, w, h), (255, 0, 255))]
+            zones = []
+            for (x0, y0, x1, y1), color in rects:
+                # cv2.rectangle inclut le point final : +1, borné à la frame
+                x1, y1 = min(x1 + 1, w), min(y1 + 1, h)
+                block = np.empty((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+                block[:] = color
+                zones.append(((slice(y0, y1), slice(x0, x1)), block))
+            cache[key] = zones
+        return zones
+    
     def draw_zone_indicators(
         self,
         frame: np.ndarray,
         current_mode: str
     ) -> np.ndarray:
         """
-        Dessine les indicateurs de zones d'écran.
+        Dessine les indicateurs de zones d'écran (en place, uniquement sur les zones teintées).
         
         Args:
             frame: Image OpenCV
@@ -143,27 +247,16 @@ class FeedbackOverlay:
             Frame avec indicateurs
         """
         h, w = frame.shape[:2]
+        mode = current_mode.lower()
         
-        # Zones (semi-transparentes)
-        overlay = frame.copy()
+        for (rows, cols), block in self._get_zones(mode, w, h):
+            roi = frame[rows, cols]
+            cv2.addWeighted(block, 0.1, roi, 0.9, 0, dst=roi)
         
-        # Zone Media (top 20%)
-        media_h = int(h * 0.20)
-        if current_mode.lower() == "media":
-            cv2.rectangle(overlay, (0, 0), (w, media_h), (0, 255, 0), -1)
-            cv2.addWeighted(overlay, 0.1, frame, 0.9, 0, frame)
+        if mode == "media":
             cv2.putText(frame, "MEDIA ZONE", (w//2 - 50, 25), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
         
-        # Zones fenêtres (bords 10%)
-        edge_w = int(w * 0.10)
-        if current_mode.lower() == "window":
-            # Bord gauche
-            cv2.rectangle(overlay, (0, media_h), (edge_w, h), (255, 0, 255), -1)
-            # Bord droit
-            cv2.rectangle(overlay, (w - edge_w, media_h), (w, h), (255, 0, 255), -1)
-            cv2.addWeighted(overlay, 0.1, frame, 0.9, 0, frame)
-        
         return frame
     
     def draw_hand_halo(
@@ -174,7 +267,7 @@ class FeedbackOverlay:
         radius: int = 40
     ) -> np.ndarray:
         """
-        Dessine un halo coloré autour de la main.
+        Dessine un halo coloré autour de la main (mélange limité à la boîte du cercle).
         
         Args:
             frame: Image OpenCV
@@ -186,13 +279,20 @@ class FeedbackOverlay:
             Frame avec halo
         """
         color = self.MODE_COLORS.get(mode.lower(), (200, 200, 200))
+        h, w = frame.shape[:2]
+        cx, cy = int(hand_pos[0]), int(hand_pos[1])
         
-        # Halo extérieur (semi-transparent)
-        overlay = frame.copy()
-        cv2.circle(overlay, hand_pos, radius, color, 3)
-        cv2.addWeighted(overlay, 0.5, frame, 0.5, 0, frame)
+        # Halo extérieur (semi-transparent), dessiné sur une copie de la seule ROI
+        reach = radius + 3
+        x0, y0 = max(cx - reach, 0), max(cy - reach, 0)
+        x1, y1 = min(cx + reach + 1, w), min(cy + reach + 1, h)
+        if x0 < x1 and y0 < y1:
+            roi = frame[y0:y1, x0:x1]
+            overlay = roi.copy()
+            cv2.circle(overlay, (cx - x0, cy - y0), radius, color, 3)
+            cv2.addWeighted(overlay, 0.5, roi, 0.5, 0, dst=roi)
         
         # Point central
-        cv2.circle(frame, hand_pos, 5, color, -1)
+        cv2.circle(frame, (cx, cy), 5, color, -1)
         
         return frame
@@ -2,6 +2,8 @@ import math
 from typing import List, Tuple, Dict
 from enum import Enum
 
+from src.processing.geometry.hand_frame import landmarks_to_array, normalize_hands
+
 class Gesture(Enum):
     """Les gestes universels du système simplifié."""
     POINTING = "POINTING"       # 👆 Index tendu seul
@@ -22,18 +24,25 @@ class StaticGestureClassifier:
     
     # Seuils de détection
     PINCH_THRESHOLD = 0.05  # Distance normalisée pouce-index pour PINCH
+    THUMB_VERTICAL = 0.05   # Écart vertical pouce-poignet pour THUMBS_UP / THUMBS_DOWN
+    
+    # Scores continus (scores()) : marge pour passer de 0.5 (seuil) à 0 ou 1
+    EXTENSION_MARGIN = 0.15  # Repère de la main (longueur de paume)
+    PINCH_MARGIN = 0.05
+    VERTICAL_MARGIN = 0.05
     
     def __init__(self):
         # Indices des landmarks
         self.finger_tips = [4, 8, 12, 16, 20]  # Pouce, Index, Majeur, Annulaire, Auriculaire
         self.finger_pips = [2, 6, 10, 14, 18]  # Articulations intermédiaires
         
-    def classify(self, landmarks: List) -> str:
+    def classify(self, landmarks: List, normalized=None) -> str:
         """
         Classifie la pose de la main.
         
         Args:
             landmarks: Liste des 21 points de la main (normalisés ou non)
+            normalized: (21, 3) dans le repère de la main si déjà calculé (lot de la frame)
             
         Returns:
             label (str): 'POINTING', 'PINCH', 'PALM', 'FIST', 'TWO_FINGERS', 'UNKNOWN'
@@ -45,7 +54,7 @@ class StaticGestureClassifier:
         if self._is_pinching(landmarks):
             return Gesture.PINCH.value
             
-        fingers_extended = self._get_extended_fingers(landmarks)
+        fingers_extended = self._get_extended_fingers(landmarks, normalized)
         # fingers_extended: [Pouce, Index, Majeur, Annulaire, Auriculaire]
         
         # 2. THUMBS UP / DOWN (Pouce seul tendu, autres repliés)
@@ -57,9 +66,9 @@ class StaticGestureClassifier:
             
             # THUMBS_UP: Pouce au-dessus du poignet (y plus petit)
             # THUMBS_DOWN: Pouce en-dessous du poignet (y plus grand)
-            if thumb_tip.y < wrist.y - 0.05:  # Seuil pour éviter faux positifs
+            if thumb_tip.y < wrist.y - self.THUMB_VERTICAL:  # Seuil pour éviter faux positifs
                 return Gesture.THUMBS_UP.value
-            elif thumb_tip.y > wrist.y + 0.05:
+            elif thumb_tip.y > wrist.y + self.THUMB_VERTICAL:
                 return Gesture.THUMBS_DOWN.value
         
         # 3. PALM (Tous les doigts étendus)
@@ -80,9 +89,47 @@ class StaticGestureClassifier:
             
         return Gesture.UNKNOWN.value
     
-    def _is_pinching(self, landmarks) -> bool:
-        """Détecte si le pouce et l'index sont joints (pincement)."""
-        # Note: Rust disabled temporarily - needs threshold calibration
+    def scores(self, landmarks: List, normalized=None) -> Dict[str, float]:
+        """
+        Score continu 0-1 de chaque geste (0.5 = seuil des règles de classify).
+        
+        Chaque condition des règles devient un score (marge au seuil, bornée), combinées
+        par min (ET) : un geste franc s'approche de 1, une pose à la limite reste vers 0.5.
+        Vide si la main est incomplète.
+        """
+        if not landmarks or len(landmarks) < 21:
+            return {}
+        if normalized is None:
+            normalized = normalize_hands(landmarks_to_array(landmarks))
+        
+        ext = [self._ramp(m, self.EXTENSION_MARGIN) for m in self._finger_margins(normalized)]
+        bent = [1.0 - e for e in ext]
+        pinch = self._ramp(self.PINCH_THRESHOLD - self._pinch_distance(landmarks), self.PINCH_MARGIN)
+        open_hand = 1.0 - pinch
+        
+        rise = landmarks[0].y - landmarks[4].y  # > 0 : pouce au-dessus du poignet
+        up = self._ramp(rise - self.THUMB_VERTICAL, self.VERTICAL_MARGIN)
+        down = self._ramp(-rise - self.THUMB_VERTICAL, self.VERTICAL_MARGIN)
+        others_bent = min(bent[1:])
+        thumb_alone = min(ext[0], others_bent)
+        
+        return {
+            Gesture.PINCH.value: pinch,
+            Gesture.THUMBS_UP.value: min(open_hand, thumb_alone, up),
+            Gesture.THUMBS_DOWN.value: min(open_hand, thumb_alone, down),
+            Gesture.PALM.value: min(open_hand, *ext),
+            # Poing : pouce libre, sauf pouce tendu vertical (THUMBS_UP / DOWN prioritaires)
+            Gesture.FIST.value: min(open_hand, others_bent, 1.0 - min(ext[0], max(up, down))),
+            Gesture.POINTING.value: min(open_hand, ext[1], bent[2], bent[3], bent[4]),
+            Gesture.TWO_FINGERS.value: min(open_hand, ext[1], ext[2], bent[3], bent[4]),
+        }
+    
+    @staticmethod
+    def _ramp(margin: float, width: float) -> float:
+        """Marge signée au seuil → score 0-1 (0.5 au seuil, saturé à ±width)"""
+        return min(1.0, max(0.0, 0.5 + 0.5 * margin / width))
+    
+    def _pinch_distance(self, landmarks) -> float:
         thumb_tip = landmarks[4]
         index_tip = landmarks[8]
         
@@ -90,42 +137,39 @@ class StaticGestureClassifier:
         dy = thumb_tip.y - index_tip.y
         dz = getattr(thumb_tip, 'z', 0) - getattr(index_tip, 'z', 0)
         
-        distance = math.sqrt(dx*dx + dy*dy + dz*dz)
-        
-        return distance < self.PINCH_THRESHOLD
+        return math.sqrt(dx*dx + dy*dy + dz*dz)
+    
+    def _is_pinching(self, landmarks) -> bool:
+        """Détecte si le pouce et l'index sont joints (pincement)."""
+        # Note: Rust disabled temporarily - needs threshold calibration
+        return self._pinch_distance(landmarks) < self.PINCH_THRESHOLD
 
-    def _get_extended_fingers(self, landmarks) -> List[bool]:
+    def _get_extended_fingers(self, landmarks, normalized=None) -> List[bool]:
         """Détermine si chaque doigt est tendu.
         
+        Les comparaisons se font dans le repère de la main (y : poignet → doigts), pas en
+        coordonnées écran : même résultat main inclinée, retournée ou caméra en miroir.
+        
         Returns:
             Liste de 5 booléens [Pouce, Index, Majeur, Annulaire, Auriculaire]
         """
-        extended = []
-        
+        if normalized is None:
+            normalized = normalize_hands(landmarks_to_array(landmarks))
+        return [margin > 0 for margin in self._finger_margins(normalized)]
+    
+    def _finger_margins(self, normalized) -> List[float]:
+        """Marge signée de chaque doigt au seuil "tendu" (> 0 : tendu), repère de la main."""
         # 1. POUCE (Cas particulier - mouvement latéral)
-        # Compare le tip au MCP sur l'axe X
-        thumb_tip = landmarks[4]
-        thumb_ipp = landmarks[3]
-        
-        # Le pouce est étendu si le tip est plus éloigné du centre de la paume
-        if abs(thumb_tip.x - landmarks[5].x) > abs(thumb_ipp.x - landmarks[5].x):
-            extended.append(True)
-        else:
-            extended.append(False)
+        # Le pouce est étendu si le tip est plus éloigné du MCP de l'index (axe x de la main)
+        index_x = normalized[5, 0]
+        margins = [float(abs(normalized[4, 0] - index_x) - abs(normalized[3, 0] - index_x))]
             
         # 2. AUTRES DOIGTS (Index à Auriculaire)
-        # Un doigt est tendu si son tip est plus haut que son PIP
+        # Un doigt est tendu si son tip est plus loin du poignet que son PIP le long de la main
         for i in range(1, 5):
-            tip = landmarks[self.finger_tips[i]]
-            pip = landmarks[self.finger_pips[i]]
-            
-            # En coordonnées écran, Y diminue vers le haut
-            if tip.y < pip.y:
-                extended.append(True)
-            else:
-                extended.append(False)
+            margins.append(float(normalized[self.finger_tips[i], 1] - normalized[self.finger_pips[i], 1]))
                 
-        return extended
+        return margins
     
     def get_gesture_emoji(self, gesture: str) -> str:
         """Retourne l'emoji correspondant au geste."""
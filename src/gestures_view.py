@@ -61,6 +61,11 @@ class GesturesView(ft.Column):
                     # Quick Reference Table
                     self._build_quick_reference(),
                     
+                    ft.Container(height=40),
+                    
+                    # Gestes dynamiques enregistrés par l'utilisateur
+                    self._build_custom_gestures(),
+                    
                 ], horizontal_alignment=ft.CrossAxisAlignment.START, spacing=0)
             )
         ]
@@ -186,6 +191,96 @@ class GesturesView(ft.Column):
             padding=20,
         )
 
+    def _build_custom_gestures(self):
+        """Section d'enregistrement des gestes personnalisés (trajectoire de la paume)."""
+        self.custom_name = ft.TextField(label="Nom du geste", width=220, dense=True)
+        self.custom_hand = ft.Dropdown(
+            width=140, dense=True, value="Right",
+            options=[ft.dropdown.Option("Right", "Main droite"), ft.dropdown.Option("Left", "Main gauche")],
+        )
+        self.btn_record = ft.ElevatedButton("Enregistrer", icon=ft.Icons.FIBER_MANUAL_RECORD,
+                                           on_click=self._toggle_recording)
+        self.custom_status = ft.Text("", size=12, color=ft.Colors.GREY_400)
+        self.custom_list = ft.Column(spacing=5)
+        self._refresh_custom_list()
+        
+        return ft.Container(
+            content=ft.Column([
+                ft.Text("✨ Gestes Personnalisés", size=20, weight=ft.FontWeight.BOLD, color=ft.Colors.WHITE),
+                ft.Text("Enregistrez un mouvement de la main (1 à 2 s). Plusieurs enregistrements "
+                        "du même nom améliorent la reconnaissance.", size=12, color=ft.Colors.GREY_500),
+                ft.Container(height=10),
+                ft.Row([self.custom_name, self.custom_hand, self.btn_record], spacing=10),
+                self.custom_status,
+                ft.Container(height=10),
+                self.custom_list,
+            ]),
+            bgcolor="#1f2125",
+            border_radius=16,
+            padding=20,
+        )
+
+    def _engine(self):
+        return getattr(self.main_app, "engine", None)
+
+    def _toggle_recording(self, e):
+        """Démarre / termine l'enregistrement d'un geste sur le moteur en marche."""
+        engine = self._engine()
+        if engine is None or not engine.is_processing:
+            self.custom_status.value = "⚠️ Démarrez le système avant d'enregistrer un geste!"
+            self.custom_status.update()
+            return
+        
+        recognizer = engine.temporal_gestures
+        if not recognizer.recording:
+            name = (self.custom_name.value or "").strip().upper().replace(" ", "_")
+            if not name:
+                self.custom_status.value = "⚠️ Donnez un nom au geste."
+                self.custom_status.update()
+                return
+            self.custom_name.value = name
+            recognizer.start_recording(self.custom_hand.value)
+            self.btn_record.text = "Terminer"
+            self.btn_record.icon = ft.Icons.STOP
+            self.custom_status.value = f"🔴 Enregistrement de {name}... effectuez le geste."
+        else:
+            trajectory = recognizer.stop_recording()
+            self.btn_record.text = "Enregistrer"
+            self.btn_record.icon = ft.Icons.FIBER_MANUAL_RECORD
+            if len(trajectory) < 5:
+                self.custom_status.value = "⚠️ Main non détectée : geste ignoré."
+            else:
+                engine.gesture_templates.add(self.custom_name.value, trajectory, self.custom_hand.value)
+                engine.gesture_templates.save()
+                self.custom_status.value = f"✅ {self.custom_name.value} enregistré ({len(trajectory)} frames)."
+                self._refresh_custom_list()
+        self.update()
+
+    def _delete_template(self, name):
+        engine = self._engine()
+        engine.gesture_templates.remove(name)
+        engine.gesture_templates.save()
+        self._refresh_custom_list()
+        self.update()
+
+    def _refresh_custom_list(self):
+        engine = self._engine()
+        templates = engine.gesture_templates.names() if engine is not None else {}
+        self.custom_list.controls = [
+            ft.Container(
+                content=ft.Row([
+                    ft.Text(name, size=12, color=ft.Colors.WHITE, expand=True),
+                    ft.Text(f"{count} enregistrement(s)", size=11, color=ft.Colors.GREY_400),
+                    ft.IconButton(ft.Icons.DELETE_OUTLINE, icon_size=18,
+                                  on_click=lambda e, n=name: self._delete_template(n)),
+                ], spacing=10),
+                padding=ft.padding.symmetric(4, 10),
+                bgcolor="#1a1c20",
+                border_radius=8,
+            )
+            for name, count in sorted(templates.items())
+        ] or [ft.Text("Aucun geste personnalisé.", size=12, color=ft.Colors.GREY_500, italic=True)]
+
     def _handle_hover(self, e, color):
         if e.data == "true":
             e.control.border = ft.border.all(2, color)
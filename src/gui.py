@@ -7,6 +7,7 @@ import os
 import http.server
 import socket
 from src.engine import HandEngine
+from src.models.config import AppConfig
 from src.gestures_view import GesturesView
 from src.settings_view import SettingsView
 
@@ -19,7 +20,12 @@ class AppGUI:
         self.page.bgcolor = "#1a1c21"
         
         # Initialize Engine (Native Window Enabled as requested)
-        self.engine = HandEngine(headless=False)
+        performance = AppConfig.load().performance
+        self.engine = HandEngine(
+            headless=False,
+            pause_mode=performance.pause_mode,
+            display_fps=performance.display_fps
+        )
         self.wv_3d = None # WebView for 3D HUD
         
         # Start Local HUD Server
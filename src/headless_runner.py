@@ -13,6 +13,7 @@ if str(root_dir) not in sys.path:
     sys.path.insert(0, str(root_dir))
 
 from src.engine import HandEngine
+from src.models.config import AppConfig
 from src.ipc_server import IPCServer
 
 
@@ -43,7 +44,12 @@ class HeadlessRunner:
         print(f"📹 Vidéo: {'Activée' if self.show_video else 'Désactivée'}")
         
         # Créer l'engine avec le flag headless approprié
-        self.engine = HandEngine(headless=not self.show_video)
+        performance = AppConfig.load().performance  # Politique de pause et cadence de l'aperçu
+        self.engine = HandEngine(
+            headless=not self.show_video,
+            pause_mode=performance.pause_mode,
+            display_fps=performance.display_fps
+        )
         
         # Démarrer le serveur IPC
         self.ipc_server = IPCServer(self.engine)
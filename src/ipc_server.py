@@ -80,10 +80,25 @@ class IPCServer:
                     "is_processing": self.engine.is_processing,
                     "asl_enabled": self.engine.asl_enabled,
                     "fps": getattr(self.engine, 'fps', 0),
-                    "camera_index": getattr(self.engine, 'camera_index', 0)
+                    "camera_index": getattr(self.engine, 'camera_index', 0),
+                    "pause_mode": self._pause_mode_value(),
+                    "last_resume_ms": getattr(self.engine, 'last_resume_ms', None)
                 }
             }
         
+        elif cmd_type == "set_pause_mode":
+            try:
+                mode = self.engine.set_pause_mode(command.get("value", "cold"))
+            except ValueError:
+                return {"status": "error", "message": f"Invalid pause mode: {command.get('value')}"}
+            return {"status": "ok", "pause_mode": mode}
+        
+        elif cmd_type == "get_resume_stats":
+            return {"status": "ok", "data": self.engine.get_resume_stats()}
+        
+        elif cmd_type == "get_pipeline_stats":
+            return {"status": "ok", "data": self.engine.get_pipeline_stats()}
+        
         elif cmd_type == "set_camera":
             value = int(command.get("value", 0))
             new_idx = self.engine.set_camera(value)
@@ -108,3 +123,8 @@ class IPCServer:
         
         else:
             return {"status": "error", "message": f"Unknown command: {cmd_type}"}
+    
+    def _pause_mode_value(self):
+        """Valeur sérialisable de la politique de pause de l'engine"""
+        mode = getattr(self.engine, 'pause_mode', None)
+        return getattr(mode, 'value', mode)
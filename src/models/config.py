@@ -34,6 +34,10 @@ class MouseConfig:
     smoothing: str = "hybrid"  # one_euro, kalman, hybrid
     min_cutoff: float = 1.0
     beta: float = 0.007
+    pointer: str = "absolute"  # absolute (main → point de l'écran), relative (trackpad, REL_X/REL_Y)
+    relative_gain: float = 1600.0  # Pixels par largeur d'image parcourue (mode relative)
+    relative_min_factor: float = 0.35  # Accélération : facteur à vitesse lente...
+    relative_max_factor: float = 2.5  # ...et à vitesse rapide
 
 
 @dataclass
@@ -41,7 +45,9 @@ class PerformanceConfig:
     """Configuration performance"""
     profiling_enabled: bool = False
     max_fps: int = 60
+    display_fps: int = 30  # Cadence de l'aperçu, indépendante de la capture (0 : sans limite)
     use_rust_acceleration: bool = True
+    pause_mode: str = "cold"  # cold, warm, hot
 
 
 @dataclass
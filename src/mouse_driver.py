@@ -3,12 +3,16 @@ import time
 import math
 import os
 from src.optimized_utils import AdaptiveOneEuroFilter, AdaptiveSensitivityMapper
+from src.control.input import devices as E
+from src.control.input.event_batch import EventBatch
+from src.control.input.relative_pointer import RelativePointer
+from src.models.config import MouseConfig
 
 # Try to import evdev (Linux only) for uinput support
 UINPUT_ERROR = None
 try:
     import evdev
-    from evdev import UInput, ecodes as E
+    from evdev import UInput
     UINPUT_AVAILABLE = True
 except Exception as err:
     UINPUT_AVAILABLE = False
@@ -21,7 +25,19 @@ except ImportError:
     PYNPUT_AVAILABLE = False
 
 class MouseDriver:
-    def __init__(self, smoothing_enabled=True):
+    CLICK_FREEZE = 0.2  # Seconds of frozen cursor after a click
+    SCROLL_STEP = 5  # REL_WHEEL units per scroll step (uinput)
+
+    def __init__(self, smoothing_enabled=True, device=None, config=None):
+        """
+        Args:
+            device: already opened uinput device (tests, benchmarks: FakeUInput)
+            config: MouseConfig; pointer="relative" selects the trackpad mode (REL_X/REL_Y)
+        """
+        config = config if config is not None else MouseConfig()
+        if config.pointer not in ("absolute", "relative"):
+            raise ValueError(f"Unknown pointer mode '{config.pointer}' (expected absolute or relative)")
+        self.pointer_mode = config.pointer
         self.os_name = platform.system()
         self._pyautogui = None
         self.sw, self.sh = 1920, 1080 # Default
@@ -38,22 +54,41 @@ class MouseDriver:
         self.filter = AdaptiveOneEuroFilter()
         self.mapper = AdaptiveSensitivityMapper(self.sw, self.sh, gamma=1.3)
         # -------------------------------
+        # Relative mode: hand motion → accelerated deltas, clutching, sub-pixel remainder
+        self.pointer = None
+        if self.pointer_mode == "relative":
+            self.pointer = RelativePointer(config.relative_gain, config.relative_min_factor,
+                                           config.relative_max_factor)
         
         self.mode = "pyautogui"
-        self.frozen_until = 0  # Stability: Freeze cursor during clicks
+        self.frozen_until = 0  # Stability: Freeze cursor during clicks (frame clock, seconds)
+        # uinput: events of a frame are batched and written with a single syscall.
+        # deferred=True leaves flush() to the caller (ActionExecutor idle hook)
+        self.batch = None
+        self.deferred = False
         
         # Check for Linux & UInput support
-        if self.os_name == "Linux" and UINPUT_AVAILABLE:
+        if device is not None:
+            self.device = device
+            self.mode = "uinput"
+        elif self.os_name == "Linux" and UINPUT_AVAILABLE:
             try:
                 # Configuration du device virtuel avec evdev
-                cap = {
-                    E.EV_KEY: [E.BTN_LEFT, E.BTN_RIGHT],
-                    E.EV_ABS: [
-                        (E.ABS_X, evdev.AbsInfo(value=0, min=0, max=self.sw, fuzz=0, flat=0, resolution=0)),
-                        (E.ABS_Y, evdev.AbsInfo(value=0, min=0, max=self.sh, fuzz=0, flat=0, resolution=0)),
-                    ],
-                    E.EV_REL: [E.REL_WHEEL]
-                }
+                if self.pointer is not None:
+                    # Plain relative mouse: no ABS axes, so the compositor applies REL_X/REL_Y as is
+                    cap = {
+                        E.EV_KEY: [E.BTN_LEFT, E.BTN_RIGHT],
+                        E.EV_REL: [E.REL_X, E.REL_Y, E.REL_WHEEL]
+                    }
+                else:
+                    cap = {
+                        E.EV_KEY: [E.BTN_LEFT, E.BTN_RIGHT],
+                        E.EV_ABS: [
+                            (E.ABS_X, evdev.AbsInfo(value=0, min=0, max=self.sw, fuzz=0, flat=0, resolution=0)),
+                            (E.ABS_Y, evdev.AbsInfo(value=0, min=0, max=self.sh, fuzz=0, flat=0, resolution=0)),
+                        ],
+                        E.EV_REL: [E.REL_WHEEL]
+                    }
                 self.device = UInput(cap, name="Hand Mouse Output")
                 self.mode = "uinput"
                 print("MouseDriver: Using EVDEV-UINPUT (Kernel Level) - Maximum Performance")
@@ -65,6 +100,9 @@ class MouseDriver:
             print(f"MouseDriver: UInput not available ({reason}).")
             self.mode = "fallback"
 
+        if self.mode == "uinput":
+            self.batch = EventBatch(self.device)
+
         if self.mode == "fallback":
             if PYNPUT_AVAILABLE:
                 try:
@@ -107,10 +145,20 @@ class MouseDriver:
         return self._pyautogui
 
     def move(self, x, y, frame_w, frame_h, timestamp=None):
+        # timestamp: capture time of the frame (monotonic seconds), so the filter and the
+        # click freeze follow the camera, not the processing rate
         if timestamp is None:
-            timestamp = time.time()
+            timestamp = time.monotonic()
+
+        if timestamp < self.frozen_until:
+            return
 
-        if time.time() < self.frozen_until:
+        if self.pointer is not None:
+            # Relative: both axes in frame widths so that the hand moves isotropically;
+            # the pointer does its own smoothing (reset on clutch)
+            dx, dy = self.pointer.update(x / frame_w, y / frame_w, timestamp)
+            if dx or dy:
+                self._move_relative(dx, dy)
             return
 
         # 1. Normalize Coordinates [0, 1]
@@ -128,10 +176,9 @@ class MouseDriver:
         screen_y = int(max(0, min(self.sh - 1, screen_y)))
         
         # 5. Apply Movement
-        if self.mode == "uinput" and hasattr(self, 'device'):
-            self.device.write(E.EV_ABS, E.ABS_X, screen_x)
-            self.device.write(E.EV_ABS, E.ABS_Y, screen_y)
-            self.device.syn()
+        if self.batch is not None:
+            self.batch.move(screen_x, screen_y)  # Unchanged position: nothing written
+            self._commit()
         elif self.mode == "pynput" and hasattr(self, 'pynput_mouse'):
             self.pynput_mouse.position = (screen_x, screen_y)
         elif self.mode == "pyautogui":
@@ -142,41 +189,83 @@ class MouseDriver:
                 except Exception:
                     pass
 
-    def click(self):
-        self.frozen_until = time.time() + 0.2
-        if self.mode == "uinput" and hasattr(self, 'device'):
-            self.device.write(E.EV_KEY, E.BTN_LEFT, 1)
-            self.device.syn()
-            self.device.write(E.EV_KEY, E.BTN_LEFT, 0)
-            self.device.syn()
+    def _move_relative(self, dx, dy):
+        if self.batch is not None:
+            self.batch.move_relative(dx, dy)
+            self._commit()
+        elif self.mode == "pynput" and hasattr(self, 'pynput_mouse'):
+            self.pynput_mouse.move(dx, dy)
+        elif self.mode == "pyautogui":
+            pg = self._get_pyautogui()
+            if pg:
+                try:
+                    pg.moveRel(dx, dy)
+                except Exception:
+                    pass
+
+    def click(self, timestamp=None):
+        self.frozen_until = (time.monotonic() if timestamp is None else timestamp) + self.CLICK_FREEZE
+        if self.batch is not None:
+            self.batch.button(E.BTN_LEFT, True)
+            self.batch.button(E.BTN_LEFT, False)
+            self._commit()
         elif self.mode == "pynput" and hasattr(self, 'pynput_mouse'):
             self.pynput_mouse.click(Button.left)
         elif self.mode == "pyautogui":
             pg = self._get_pyautogui()
             if pg: pg.click()
             
-    def right_click(self):
-        self.frozen_until = time.time() + 0.2
-        if self.mode == "uinput" and hasattr(self, 'device'):
-            self.device.write(E.EV_KEY, E.BTN_RIGHT, 1)
-            self.device.syn()
-            self.device.write(E.EV_KEY, E.BTN_RIGHT, 0)
-            self.device.syn()
+    def right_click(self, timestamp=None):
+        self.frozen_until = (time.monotonic() if timestamp is None else timestamp) + self.CLICK_FREEZE
+        if self.batch is not None:
+            self.batch.button(E.BTN_RIGHT, True)
+            self.batch.button(E.BTN_RIGHT, False)
+            self._commit()
         elif self.mode == "pynput" and hasattr(self, 'pynput_mouse'):
             self.pynput_mouse.click(Button.right)
         elif self.mode == "pyautogui":
             pg = self._get_pyautogui()
             if pg: pg.rightClick()
             
+    def drag_start(self):
+        """Bouton gauche maintenu (glisser) jusqu'à drag_end"""
+        if self.batch is not None:
+            self.batch.button(E.BTN_LEFT, True)
+            self._commit()
+        elif self.mode == "pynput" and hasattr(self, 'pynput_mouse'):
+            self.pynput_mouse.press(Button.left)
+        elif self.mode == "pyautogui":
+            pg = self._get_pyautogui()
+            if pg: pg.mouseDown()
+
+    def drag_end(self):
+        if self.batch is not None:
+            self.batch.button(E.BTN_LEFT, False)
+            self._commit()
+        elif self.mode == "pynput" and hasattr(self, 'pynput_mouse'):
+            self.pynput_mouse.release(Button.left)
+        elif self.mode == "pyautogui":
+            pg = self._get_pyautogui()
+            if pg: pg.mouseUp()
+
     def scroll(self, dx, dy):
-        if self.mode == "uinput" and hasattr(self, 'device'):
-            # evdev REL_WHEEL: +1 is UP, -1 is DOWN
-            self.device.write(E.EV_REL, E.REL_WHEEL, int(dy * 5))
-            self.device.syn()
+        if self.batch is not None:
+            # evdev REL_WHEEL: +1 is UP, -1 is DOWN; steps of a frame add up
+            self.batch.scroll(int(dy * self.SCROLL_STEP))
+            self._commit()
         elif self.mode == "pyautogui":
             pg = self._get_pyautogui()
             if pg: pg.scroll(int(dy * 50))
 
+    def flush(self):
+        """Writes the pending uinput events (one syscall)"""
+        if self.batch is not None:
+            self.batch.flush()
+
+    def _commit(self):
+        if not self.deferred:
+            self.batch.flush()
+
     def set_smoothing(self, value):
         normalized = max(0.001, (21 - value) * 0.001) 
         self.filter.MEDIUM_CUTOFF = normalized
@@ -193,25 +193,12 @@ class AdaptiveSensitivityMapper:
 class VisualFeedback:
     @staticmethod
     def draw_skeleton(frame: np.ndarray, landmarks: List[Tuple[int, int]]):
-        CONNECTIONS = frozenset([
-            (0, 1), (1, 2), (2, 3), (3, 4),
-            (0, 5), (5, 6), (6, 7), (7, 8),
-            (5, 9), (9, 10), (10, 11), (11, 12),
-            (9, 13), (13, 14), (14, 15), (15, 16),
-            (13, 17), (17, 18), (18, 19), (19, 20),
-            (0, 17)
-        ])
-        
-        # Dessiner les liens
-        for start_idx, end_idx in CONNECTIONS:
-            if start_idx < len(landmarks) and end_idx < len(landmarks):
-                pt1 = landmarks[start_idx]
-                pt2 = landmarks[end_idx]
-                cv2.line(frame, pt1, pt2, (0, 255, 0), 2)
-        
-        # Dessiner les points
-        for point in landmarks:
-            cv2.circle(frame, point, 4, (255, 0, 0), -1)
+        from src.ui.rendering.skeleton_renderer import draw_hand  # Import local : pas de dépendance vers la couche UI
+
+        # Liens en un appel polylines (une polyligne par doigt, seulement entre points
+        # présents si la liste est partielle), puis les points
+        points = np.asarray(landmarks, dtype=np.int32).reshape(-1, 2)
+        draw_hand(frame, points, (0, 255, 0), (255, 0, 0), thickness=2, joint_radius=4)
     
     @staticmethod
     def draw_fps(frame: np.ndarray, fps: float):
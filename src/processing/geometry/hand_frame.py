@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Hand Frame - Landmarks exprimés dans le repère de la main
+Responsabilité unique : Rendre les coordonnées indépendantes de la position, de la taille
+et de l'orientation de la main dans l'image (et du miroir de la caméra).
+
+Repère (par main) :
+    origine  poignet (0)
+    y        poignet → MCP du majeur (9), longueur = unité
+    x        MCP auriculaire (17) → MCP index (5), orthogonalisé par rapport à y
+    z        x × y (normale à la paume)
+
+"Doigt tendu" devient y(tip) > y(PIP) quelle que soit l'inclinaison de la main, et le
+pouce est toujours du côté x > 0 (main gauche ou droite, image miroir ou non).
+Ordre de priorité : Numba (noyau compilé, une boucle sur le lot) > numpy vectorisé.
+"""
+import numpy as np
+
+try:
+    from src.processing.geometry.numba_accelerated import normalize_hands_batch
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+WRIST, INDEX_MCP, MIDDLE_MCP, PINKY_MCP = 0, 5, 9, 17
+
+
+def landmarks_to_array(landmarks) -> np.ndarray:
+    """Liste de 21 landmarks (x, y, z) → tableau (21, 3) float32"""
+    return np.array([(p.x, p.y, getattr(p, "z", 0.0)) for p in landmarks], dtype=np.float32)
+
+
+def hands_to_array(hands) -> np.ndarray:
+    """Plusieurs mains (listes de landmarks) → tableau (N, 21, 3) float32, en une copie"""
+    return np.array([[(p.x, p.y, getattr(p, "z", 0.0)) for p in landmarks] for landmarks in hands],
+                    dtype=np.float32).reshape(-1, 21, 3)
+
+
+def normalize_hands(points: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    (N, 21, 3) coordonnées image → (N, 21, 3) dans le repère de chaque main.
+    Accepte aussi une seule main (21, 3). out : tableau de sortie réutilisé (lot uniquement).
+    """
+    points = np.ascontiguousarray(points, dtype=np.float32)
+    single = points.ndim == 2
+    if single:
+        points = points[None]
+    if NUMBA_AVAILABLE:
+        if out is None:
+            out = np.empty_like(points)
+        normalize_hands_batch(points, out)
+    else:
+        normalized = _normalize_numpy(points)
+        if out is None:
+            out = normalized
+        else:
+            out[...] = normalized
+    return out[0] if single else out
+
+
+def _normalize_numpy(points: np.ndarray) -> np.ndarray:
+    """Repli sans Numba : mêmes calculs, vectorisés sur le lot"""
+    offsets = points - points[:, WRIST:WRIST + 1]
+
+    axis_y = offsets[:, MIDDLE_MCP]
+    scale = np.linalg.norm(axis_y, axis=1)
+    scale = np.maximum(scale, 1e-6)
+    axis_y = axis_y / scale[:, None]
+    across = offsets[:, INDEX_MCP] - offsets[:, PINKY_MCP]
+    across -= (across * axis_y).sum(axis=1, keepdims=True) * axis_y
+    axis_x = across / np.maximum(np.linalg.norm(across, axis=1), 1e-6)[:, None]
+    axis_z = np.stack((axis_x[:, 1] * axis_y[:, 2] - axis_x[:, 2] * axis_y[:, 1],
+                       axis_x[:, 2] * axis_y[:, 0] - axis_x[:, 0] * axis_y[:, 2],
+                       axis_x[:, 0] * axis_y[:, 1] - axis_x[:, 1] * axis_y[:, 0]), axis=1)  # x × y
+
+    basis = np.stack((axis_x, axis_y, axis_z), axis=1)  # (N, 3, 3), une ligne par axe
+    return (offsets @ basis.transpose(0, 2, 1)) / scale[:, None, None]
@@ -108,6 +108,56 @@ def fingers_extended_from_coords(coords: np.ndarray) -> np.ndarray:
     return result
 
 
+@jit(nopython=True)
+def normalize_hands_batch(points: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Landmarks (N, 21, 3) → repère de chaque main (voir hand_frame), écrit dans out (N, 21, 3).
+    Origine poignet, y poignet → MCP majeur (unité), x auriculaire → index, z = x × y.
+    """
+    for h in range(points.shape[0]):
+        wx = points[h, 0, 0]
+        wy = points[h, 0, 1]
+        wz = points[h, 0, 2]
+
+        yx = points[h, 9, 0] - wx
+        yy = points[h, 9, 1] - wy
+        yz = points[h, 9, 2] - wz
+        scale = math.sqrt(yx * yx + yy * yy + yz * yz)
+        if scale < 1e-6:
+            scale = 1e-6
+        yx /= scale
+        yy /= scale
+        yz /= scale
+
+        ax = points[h, 5, 0] - points[h, 17, 0]
+        ay = points[h, 5, 1] - points[h, 17, 1]
+        az = points[h, 5, 2] - points[h, 17, 2]
+        d = ax * yx + ay * yy + az * yz
+        ax -= d * yx
+        ay -= d * yy
+        az -= d * yz
+        norm = math.sqrt(ax * ax + ay * ay + az * az)
+        if norm < 1e-6:
+            norm = 1e-6
+        ax /= norm
+        ay /= norm
+        az /= norm
+
+        zx = ay * yz - az * yy
+        zy = az * yx - ax * yz
+        zz = ax * yy - ay * yx
+
+        inv = 1.0 / scale
+        for k in range(21):
+            dx = points[h, k, 0] - wx
+            dy = points[h, k, 1] - wy
+            dz = points[h, k, 2] - wz
+            out[h, k, 0] = (dx * ax + dy * ay + dz * az) * inv
+            out[h, k, 1] = (dx * yx + dy * yy + dz * yz) * inv
+            out[h, k, 2] = (dx * zx + dy * zy + dz * zz) * inv
+    return out
+
+
 # Wrapper pour compatibilité avec l'ancien code
 class NumbaGeometry:
     """Wrapper pour les fonctions Numba avec API compatible"""
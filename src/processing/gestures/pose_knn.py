@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Pose k-NN - Classification des poses statiques par plus proches voisins
+Responsabilité unique : Reconnaître une pose de main à partir d'exemples étiquetés.
+
+Alternative aux règles tip/PIP de StaticGestureClassifier et SignLanguageInterpreter
+(mêmes interfaces classify / predict) :
+    1. landmarks → repère de la main (hand_frame) : invariance position, taille, rotation ;
+    2. vecteur de 60 float32 (20 points hors poignet) ;
+    3. k plus proches voisins dans une matrice float32 contiguë, indexée par un KD-tree.
+
+Le KD-tree est construit dans la base des composantes principales du jeu de données :
+une rotation conserve les distances (résultat exact), et les premières coupes portent
+sur les directions où les poses diffèrent vraiment. Chaque feuille est évaluée par un
+produit matrice-vecteur ; jusqu'à BRUTE_FORCE_MAX exemples, une feuille unique (balayage
+complet, dans l'espace d'origine : ni projection ni parcours) reste plus rapide que
+l'arbre en Python.
+"""
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.gesture_classifier import Gesture, StaticGestureClassifier
+from src.processing.geometry.hand_frame import landmarks_to_array, normalize_hands
+
+FEATURE_DIM = 60
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "config")
+DEFAULT_POSE_DATASET = os.path.join(CONFIG_DIR, "pose_dataset.npz")
+DEFAULT_ASL_DATASET = os.path.join(CONFIG_DIR, "asl_dataset.npz")
+BRUTE_FORCE_MAX = 4096  # Exemples : en deçà, l'index est une seule feuille
+
+# Même pose, orientation opposée : départagées par l'orientation dans l'image
+ORIENTED_LABELS = (Gesture.THUMBS_UP.value, Gesture.THUMBS_DOWN.value)
+
+
+def pose_features(points: np.ndarray) -> np.ndarray:
+    """(N, 21, 3) ou (21, 3) coordonnées image → (N, 60) ou (60,) float32"""
+    normalized = normalize_hands(points)
+    if normalized.ndim == 2:
+        return np.ascontiguousarray(normalized[1:].reshape(-1))
+    return np.ascontiguousarray(normalized[:, 1:].reshape(len(normalized), -1))
+
+
+class KDTree:
+    """KD-tree exact (distance euclidienne) sur une matrice (N, D) float32"""
+
+    def __init__(self, data: np.ndarray, leaf_size: int = 256):
+        data = np.asarray(data, dtype=np.float32)
+        if len(data) <= leaf_size:
+            # Une seule feuille : balayage complet dans l'espace d'origine, sans projection
+            self.rotation = None
+            self.index = np.arange(len(data))
+            self.split_dim, self.split_value = [-1], [0.0]
+            self.children, self.bounds = [(-1, -1)], [(0, len(data))]
+            self.points = np.ascontiguousarray(data)
+            self.sq_norms = np.einsum("ij,ij->i", self.points, self.points)
+            return
+        self.mean = data.mean(axis=0) if len(data) else np.zeros(data.shape[1], np.float32)
+        centered = data - self.mean
+        # Base orthonormée complète, variance décroissante
+        _, vectors = np.linalg.eigh(centered.T.astype(np.float64) @ centered)
+        self.rotation = np.ascontiguousarray(vectors[:, ::-1], dtype=np.float32)
+
+        points = centered @ self.rotation
+        self.index = np.arange(len(data))
+        # Nœuds en tableaux parallèles ; feuille : split_dim = -1, points [start, end)
+        self.split_dim: List[int] = []
+        self.split_value: List[float] = []
+        self.children: List[Tuple[int, int]] = []
+        self.bounds: List[Tuple[int, int]] = []
+        stack = [(0, len(data), None, 0)]
+        while stack:
+            start, end, parent, side = stack.pop()
+            node = len(self.split_dim)
+            if parent is not None:
+                left, right = self.children[parent]
+                self.children[parent] = (node, right) if side == 0 else (left, node)
+            self.bounds.append((start, end))
+            self.children.append((-1, -1))
+            subset = points[self.index[start:end]]
+            if end - start <= leaf_size:
+                self.split_dim.append(-1)
+                self.split_value.append(0.0)
+                continue
+            dim = int(np.argmax(subset.max(axis=0) - subset.min(axis=0)))
+            order = np.argsort(subset[:, dim], kind="stable")
+            self.index[start:end] = self.index[start:end][order]
+            mid = start + (end - start) // 2
+            self.split_dim.append(dim)
+            self.split_value.append(float(points[self.index[mid], dim]))
+            stack.append((mid, end, node, 1))
+            stack.append((start, mid, node, 0))
+        self.points = np.ascontiguousarray(points[self.index])  # Feuilles contiguës
+        self.sq_norms = np.einsum("ij,ij->i", self.points, self.points)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def query(self, x: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """(distances, indices dans data) des k plus proches voisins, du plus proche au plus loin"""
+        k = min(k, len(self.index))
+        if k == 0:
+            return np.zeros(0, np.float32), np.zeros(0, np.int64)
+        if self.rotation is None:
+            return self._scan(np.asarray(x, dtype=np.float32), k)
+        q = (np.asarray(x, dtype=np.float32) - self.mean) @ self.rotation
+        self._q, self._q_sq, self._k = q, float(q @ q), k
+        self._best_d = np.full(k, np.inf, dtype=np.float32)  # Distances au carré, triées
+        self._best_i = np.full(k, -1, dtype=np.int64)
+        self.leaves_visited = 0
+        self._visit(0, 0.0, np.zeros(len(q), dtype=np.float32))
+        best_d, best_i = self._best_d, self._best_i
+        return np.sqrt(np.maximum(best_d, 0.0)), self.index[best_i]
+
+    def _scan(self, q: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Balayage complet : un produit matrice-vecteur puis sélection partielle des k plus proches"""
+        self.leaves_visited = 1
+        dist = self.sq_norms - 2.0 * (self.points @ q) + float(q @ q)
+        best = np.argpartition(dist, k - 1)[:k] if k < len(dist) else np.arange(len(dist))
+        best = best[np.argsort(dist[best])]
+        return np.sqrt(np.maximum(dist[best], 0.0)), best
+
+    def _visit(self, node: int, reach: float, offsets: np.ndarray):
+        """
+        reach : distance au carré de la requête à la cellule du nœud (borne inférieure),
+        mise à jour incrémentalement par dimension coupée (offsets).
+        """
+        dim = self.split_dim[node]
+        if dim < 0:
+            start, end = self.bounds[node]
+            # |p - q|² = |p|² - 2 p·q + |q|² : un produit matrice-vecteur par feuille
+            dist = self.sq_norms[start:end] - 2.0 * (self.points[start:end] @ self._q) + self._q_sq
+            self.leaves_visited += 1
+            if dist.min() >= self._best_d[-1]:
+                return
+            merged_d = np.concatenate((self._best_d, dist))
+            merged_i = np.concatenate((self._best_i, np.arange(start, end)))
+            keep = np.argpartition(merged_d, self._k - 1)[:self._k]
+            keep = keep[np.argsort(merged_d[keep])]
+            self._best_d, self._best_i = merged_d[keep], merged_i[keep]
+            return
+        gap = float(self._q[dim]) - self.split_value[node]
+        near, far = self.children[node] if gap < 0 else self.children[node][::-1]
+        self._visit(near, reach, offsets)
+        # Cellule lointaine : seul l'écart sur dim change
+        old = float(offsets[dim])
+        far_reach = reach - old * old + gap * gap
+        if far_reach < self._best_d[-1]:
+            offsets[dim] = gap
+            self._visit(far, far_reach, offsets)
+            offsets[dim] = old
+
+
+class PoseDataset:
+    """Exemples étiquetés : matrice (N, 60) float32 contiguë + étiquettes, persistés en .npz"""
+
+    def __init__(self, path: str = DEFAULT_POSE_DATASET):
+        self.path = path
+        self.features = np.zeros((0, FEATURE_DIM), dtype=np.float32)
+        self.labels: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def add(self, label: str, landmarks):
+        """Un exemple (liste de landmarks ou tableau (21, 3))"""
+        points = landmarks if isinstance(landmarks, np.ndarray) else landmarks_to_array(landmarks)
+        self.add_batch(label, points[None])
+
+    def add_batch(self, label: str, points: np.ndarray):
+        """Plusieurs exemples de la même étiquette, (N, 21, 3) coordonnées image"""
+        features = pose_features(np.asarray(points, dtype=np.float32).reshape(-1, 21, 3))
+        self.features = np.ascontiguousarray(np.concatenate((self.features, features)))
+        self.labels.extend([label] * len(features))
+
+    def counts(self) -> dict:
+        counts = {}
+        for label in self.labels:
+            counts[label] = counts.get(label, 0) + 1
+        return counts
+
+    def save(self, path: Optional[str] = None):
+        path = path or self.path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:  # Fichier ouvert : np.savez n'ajoute pas ".npz"
+            np.savez(f, features=self.features, labels=np.array(self.labels, dtype=str))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_POSE_DATASET) -> "PoseDataset":
+        dataset = cls(path)
+        with np.load(path) as data:
+            dataset.features = np.ascontiguousarray(data["features"], dtype=np.float32)
+            dataset.labels = [str(label) for label in data["labels"]]
+        return dataset
+
+
+class KNNPoseClassifier:
+    """k-NN sur un PoseDataset ; remplace StaticGestureClassifier (classify) ou l'ASL (predict)"""
+
+    def __init__(self, dataset: PoseDataset, k: int = 5, max_distance: float = 1.0,
+                 unknown: str = Gesture.UNKNOWN.value):
+        """
+        Args:
+            dataset: exemples étiquetés
+            k: nombre de voisins votants
+            max_distance: au-delà (unités : longueur de paume), la pose est inconnue
+            unknown: étiquette des poses rejetées
+        """
+        self.k = k
+        self.max_distance = max_distance
+        self.unknown = unknown
+        self.names = sorted(set(dataset.labels))
+        self.label_ids = np.array([self.names.index(label) for label in dataset.labels], dtype=np.int64)
+        size = len(dataset.features)
+        self.tree = KDTree(dataset.features, leaf_size=max(size, 1) if size <= BRUTE_FORCE_MAX else 256)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_POSE_DATASET, **kwargs) -> "KNNPoseClassifier":
+        return cls(PoseDataset.load(path), **kwargs)
+
+    def classify(self, landmarks: List, normalized=None) -> str:
+        """Même contrat que StaticGestureClassifier.classify"""
+        return self.predict(None, landmarks, normalized)[0]
+
+    def predict(self, hand_crop_unused, landmarks, normalized=None) -> Tuple[str, float]:
+        """Même contrat que SignLanguageInterpreter.predict : (étiquette, confiance 0-1)"""
+        scores = self.scores(landmarks, normalized)
+        if not scores:
+            return self.unknown, 0.0
+        label = max(scores, key=scores.get)
+        return label, scores[label]
+
+    def scores(self, landmarks, normalized=None) -> Dict[str, float]:
+        """Part des votes (pondérés par l'inverse de la distance) de chaque étiquette, vide si rejetée"""
+        if not landmarks or len(landmarks) < 21 or len(self.tree) == 0:
+            return {}
+        if normalized is None:
+            normalized = normalize_hands(landmarks_to_array(landmarks))
+        distances, ids = self.tree.query(normalized[1:].reshape(-1), self.k)
+        if distances[0] > self.max_distance:
+            return {}
+
+        weights = 1.0 / (distances + 1e-3)
+        votes = np.bincount(self.label_ids[ids], weights=weights, minlength=len(self.names)) / weights.sum()
+        scores = {self.names[i]: float(votes[i]) for i in np.flatnonzero(votes)}
+        oriented = sum(scores.pop(label, 0.0) for label in ORIENTED_LABELS)
+        if oriented:
+            # Le repère de la main efface l'orientation : pouce au-dessus du poignet dans l'image ?
+            label = ORIENTED_LABELS[0] if landmarks[4].y < landmarks[0].y else ORIENTED_LABELS[1]
+            scores[label] = oriented
+        return scores
+
+
+def create_gesture_classifier(backend: str = "rules", dataset_path: str = DEFAULT_POSE_DATASET):
+    """Classificateur de gestes statiques : "rules" (géométrie) ou "knn" (exemples appris)"""
+    if backend == "knn":
+        if os.path.exists(dataset_path):
+            return KNNPoseClassifier.load(dataset_path)
+        print(f"⚠️ Pose dataset not found ({dataset_path}), using rule-based classifier")
+    return StaticGestureClassifier()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Gesture Stability - Gestes statiques débruités par main
+Responsabilité unique : Transformer les scores bruités de chaque frame en un geste stable.
+
+Machine à états par main, à partir des scores continus du classificateur (scores()) :
+    - entrée : un geste devient candidat si son score atteint ENTER_SCORE ;
+    - sortie : le geste courant est conservé tant que son score reste ≥ EXIT_SCORE
+      (hystérésis : une pose à la limite du seuil ne clignote pas) ;
+    - durée minimale : un candidat doit rester en tête MIN_DWELL frames consécutives avant
+      de remplacer le geste courant (une frame mal classée ne déclenche rien).
+Chaque changement validé est un événement (StableGesture.changed) ; la confiance est le
+score lissé du geste courant.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable
+
+UNKNOWN = "UNKNOWN"
+
+
+@dataclass
+class StableGesture:
+    """Geste stable d'une main à une frame"""
+    label: str
+    confidence: float
+    changed: bool = False      # Nouveau geste validé à cette frame
+    previous: str = UNKNOWN
+
+
+class _HandState:
+    __slots__ = ("label", "confidence", "candidate", "count")
+
+    def __init__(self):
+        self.label = UNKNOWN
+        self.confidence = 0.0
+        self.candidate = UNKNOWN
+        self.count = 0
+
+
+class GestureStabilizer:
+    """Un état par main (clés libres : "Right", "Left"...)"""
+
+    ENTER_SCORE = 0.65
+    EXIT_SCORE = 0.35
+    MIN_DWELL = 3           # Frames
+    SMOOTHING = 0.5         # Lissage exponentiel de la confiance affichée
+
+    def __init__(self, enter_score: float = ENTER_SCORE, exit_score: float = EXIT_SCORE,
+                 min_dwell: int = MIN_DWELL):
+        self.enter_score = enter_score
+        self.exit_score = exit_score
+        self.min_dwell = min_dwell
+        self._hands: Dict[str, _HandState] = {}
+        # Compteurs : changements validés, candidats abandonnés avant MIN_DWELL
+        self.events = 0
+        self.suppressed = 0
+
+    def update(self, hand: str, scores: Dict[str, float]) -> StableGesture:
+        """Scores de la frame (geste → 0-1, vide si main incomplète) → geste stable"""
+        state = self._hands.get(hand)
+        if state is None:
+            state = self._hands[hand] = _HandState()
+
+        top = max(scores, key=scores.get) if scores else UNKNOWN
+        top_score = scores.get(top, 0.0)
+        proposal = top if top_score >= self.enter_score else UNKNOWN
+        holding = state.label != UNKNOWN and scores.get(state.label, 0.0) >= self.exit_score
+
+        if proposal == state.label or (proposal == UNKNOWN and holding):
+            # Rien à changer : le geste courant tient (ou aucun geste n'est assez sûr)
+            if state.count:
+                self.suppressed += 1
+            state.candidate, state.count = UNKNOWN, 0
+        elif proposal == state.candidate:
+            state.count += 1
+        else:
+            if state.count:
+                self.suppressed += 1
+            state.candidate, state.count = proposal, 1
+
+        changed = False
+        previous = state.label
+        if state.count >= self.min_dwell:
+            state.label = state.candidate
+            state.candidate, state.count = UNKNOWN, 0
+            state.confidence = scores.get(state.label, 0.0) if state.label != UNKNOWN else 0.0
+            changed = True
+            self.events += 1
+        elif state.label != UNKNOWN:
+            score = scores.get(state.label, 0.0)
+            state.confidence += self.SMOOTHING * (score - state.confidence)
+        return StableGesture(state.label, state.confidence, changed, previous)
+
+    def label(self, hand: str) -> str:
+        state = self._hands.get(hand)
+        return state.label if state else UNKNOWN
+
+    def keep_only(self, hands: Iterable[str]):
+        """Oublie les mains absentes de la frame"""
+        for hand in set(self._hands) - set(hands):
+            del self._hands[hand]
+
+    def reset(self):
+        self._hands.clear()
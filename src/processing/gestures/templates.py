@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+Gesture Templates - Gestes dynamiques personnalisés enregistrés par l'utilisateur
+Responsabilité unique : Stocker des trajectoires modèles et reconnaître la trajectoire
+en cours par DTW (Dynamic Time Warping) contre des centaines de modèles par main.
+
+Trajectoire = centre de la paume (x, y) sur la fenêtre glissante, rééchantillonnée en
+n points équidistants puis centrée et mise à l'échelle (invariance position / taille).
+Pour tenir dans le budget d'une frame :
+    1. LB_Keogh (borne inférieure du DTW, enveloppes précalculées) pour tous les modèles
+       d'un coup (numpy), dans les deux sens ;
+    2. DTW à bande Sakoe-Chiba des candidats par borne croissante, arrêt dès que la borne
+       dépasse la meilleure distance (les suivants ne peuvent pas faire mieux) ;
+    3. abandon anticipé d'un DTW dès qu'une ligne entière dépasse la meilleure distance.
+Le résultat est identique à un 1-NN DTW exhaustif.
+"""
+import json
+import math
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_LIBRARY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "config", "gesture_templates.json"
+)
+
+
+def normalize_trajectory(points, n: int = 32) -> np.ndarray:
+    """(m, 2) → (n, 2) : rééchantillonné à pas constant, centré, rayon quadratique moyen 1"""
+    points = np.asarray(points, dtype=np.float64)[:, :2]
+    if len(points) > 1:
+        seg = np.hypot(*np.diff(points, axis=0).T)
+        dist = np.concatenate(([0.0], np.cumsum(seg)))
+    else:
+        dist = np.zeros(1)
+    if dist[-1] > 0:
+        targets = np.linspace(0.0, dist[-1], n)
+        points = np.stack((np.interp(targets, dist, points[:, 0]),
+                           np.interp(targets, dist, points[:, 1])), axis=1)
+    else:
+        points = np.repeat(points[:1], n, axis=0)
+    points = points - points.mean(axis=0)
+    radius = math.sqrt((points ** 2).sum(axis=1).mean())
+    if radius > 0:
+        points /= radius
+    return points.astype(np.float32)
+
+
+def envelope(series: np.ndarray, radius: int):
+    """Enveloppes basse / haute (min / max glissants sur ±radius) d'une série (..., n, d)"""
+    n = series.shape[-2]
+    lower = series.copy()
+    upper = series.copy()
+    for shift in range(1, radius + 1):
+        lower[..., :n - shift, :] = np.minimum(lower[..., :n - shift, :], series[..., shift:, :])
+        lower[..., shift:, :] = np.minimum(lower[..., shift:, :], series[..., :n - shift, :])
+        upper[..., :n - shift, :] = np.maximum(upper[..., :n - shift, :], series[..., shift:, :])
+        upper[..., shift:, :] = np.maximum(upper[..., shift:, :], series[..., :n - shift, :])
+    return lower, upper
+
+
+def lb_keogh(query: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """Borne inférieure du DTW (coût quadratique) de query (n, d) contre K enveloppes (K, n, d)"""
+    above = np.maximum(query - upper, 0.0)
+    below = np.maximum(lower - query, 0.0)
+    return (above * above + below * below).sum(axis=(1, 2))
+
+
+def dtw_distance(a, b, radius: int, best: float = math.inf) -> float:
+    """
+    DTW à bande Sakoe-Chiba entre deux trajectoires 2D de même longueur (listes de (x, y)),
+    coût quadratique. Retourne inf dès qu'une ligne dépasse best (abandon anticipé).
+    """
+    inf = math.inf
+    m = len(b)
+    prev = [0.0] + [inf] * m
+    for i in range(1, len(a) + 1):
+        ax, ay = a[i - 1]
+        cur = [inf] * (m + 1)
+        row_min = inf
+        for j in range(max(1, i - radius), min(m, i + radius) + 1):
+            bx, by = b[j - 1]
+            c = prev[j - 1]
+            if prev[j] < c:
+                c = prev[j]
+            if cur[j - 1] < c:
+                c = cur[j - 1]
+            v = (ax - bx) * (ax - bx) + (ay - by) * (ay - by) + c
+            cur[j] = v
+            if v < row_min:
+                row_min = v
+        if row_min >= best:
+            return inf
+        prev = cur
+    return prev[m]
+
+
+@dataclass(frozen=True)
+class TemplateMatch:
+    """Geste personnalisé reconnu (value : nom, comme MotionGesture.value)"""
+    name: str
+    distance: float
+
+    @property
+    def value(self) -> str:
+        return self.name
+
+
+class _HandTemplates:
+    """Modèles d'une main en tableaux contigus (K, n, 2) + enveloppes"""
+
+    def __init__(self, names: List[str], series: np.ndarray, radius: int):
+        self.names = names
+        self.series = series
+        self.rows = [[(float(x), float(y)) for x, y in s] for s in series]  # Pour dtw_distance
+        self.lower, self.upper = envelope(series, radius)
+
+
+class TemplateLibrary:
+    """Modèles nommés par main (plusieurs enregistrements possibles par nom), persistés en JSON"""
+
+    def __init__(self, path: str = DEFAULT_LIBRARY_PATH, n_samples: int = 32, band: float = 0.1):
+        self.path = path
+        self.n_samples = n_samples
+        self.radius = max(1, int(round(band * n_samples)))  # Bande Sakoe-Chiba (points)
+        self._templates: Dict[str, List[tuple]] = {}  # main → [(nom, série normalisée)]
+        self._compiled: Dict[str, _HandTemplates] = {}
+        self.version = 0  # Incrémentée à chaque modification (recompilation paresseuse)
+
+    def add(self, name: str, trajectory, hand: str = "Right") -> np.ndarray:
+        """Ajoute un enregistrement brut (m, 2) ; retourne la série normalisée"""
+        series = normalize_trajectory(trajectory, self.n_samples)
+        self._insert(name, series, hand)
+        return series
+
+    def _insert(self, name: str, series: np.ndarray, hand: str):
+        self._templates.setdefault(hand, []).append((name, series))
+        self._changed(hand)
+
+    def remove(self, name: str, hand: Optional[str] = None) -> int:
+        """Supprime tous les enregistrements d'un nom (d'une main ou de toutes)"""
+        removed = 0
+        for h in [hand] if hand else list(self._templates):
+            kept = [t for t in self._templates.get(h, []) if t[0] != name]
+            removed += len(self._templates.get(h, [])) - len(kept)
+            self._templates[h] = kept
+            self._changed(h)
+        return removed
+
+    def names(self, hand: Optional[str] = None) -> Dict[str, int]:
+        """Nom → nombre d'enregistrements"""
+        counts: Dict[str, int] = {}
+        for h, templates in self._templates.items():
+            if hand is None or h == hand:
+                for name, _ in templates:
+                    counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def count(self, hand: str) -> int:
+        return len(self._templates.get(hand, []))
+
+    def compiled(self, hand: str) -> Optional[_HandTemplates]:
+        compiled = self._compiled.get(hand)
+        if compiled is None and self._templates.get(hand):
+            names = [name for name, _ in self._templates[hand]]
+            series = np.stack([s for _, s in self._templates[hand]])
+            compiled = self._compiled[hand] = _HandTemplates(names, series, self.radius)
+        return compiled
+
+    def _changed(self, hand: str):
+        self._compiled.pop(hand, None)
+        self.version += 1
+
+    def save(self, path: Optional[str] = None):
+        path = path or self.path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        data = {
+            "n_samples": self.n_samples,
+            "templates": [
+                {"name": name, "hand": hand, "points": np.round(series, 5).tolist()}
+                for hand, templates in self._templates.items() for name, series in templates
+            ],
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_LIBRARY_PATH) -> "TemplateLibrary":
+        """Charge la bibliothèque si le fichier existe, sinon bibliothèque vide"""
+        library = cls(path)
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                library.n_samples = data.get("n_samples", library.n_samples)
+                library.radius = max(1, int(round(0.1 * library.n_samples)))
+                for entry in data.get("templates", []):
+                    series = np.asarray(entry["points"], dtype=np.float32)
+                    if series.shape == (library.n_samples, 2):
+                        # Déjà normalisée : la rééchantillonner déplacerait les coins
+                        library._insert(entry["name"], series, entry.get("hand", "Right"))
+                    else:
+                        library.add(entry["name"], series, entry.get("hand", "Right"))
+            except Exception as e:
+                print(f"⚠️ Gesture templates load failed: {e}")
+        return library
+
+
+class DTWMatcher:
+    """Plus proche modèle (DTW) d'une trajectoire, avec élagage LB_Keogh et abandon anticipé"""
+
+    def __init__(self, library: TemplateLibrary, threshold: float = 0.15):
+        """
+        Args:
+            library: modèles par main
+            threshold: distance DTW maximale par point (trajectoires normalisées) pour accepter
+        """
+        self.library = library
+        self.threshold = threshold
+        # Compteurs : DTW complets, abandonnés, modèles écartés par la borne
+        self.dtw_computed = 0
+        self.dtw_abandoned = 0
+        self.pruned = 0
+
+    def match(self, hand: str, trajectory) -> Optional[TemplateMatch]:
+        """Meilleur modèle de la main sous le seuil, None sinon"""
+        templates = self.library.compiled(hand)
+        if templates is None:
+            return None
+        n = self.library.n_samples
+        query = normalize_trajectory(trajectory, n)
+        best = self.threshold * n  # Distance maximale acceptée = point de départ de l'élagage
+        name, distance = self._nearest(templates, query, best)
+        if name is None:
+            return None
+        return TemplateMatch(name, distance / n)
+
+    def _nearest(self, templates: _HandTemplates, query: np.ndarray, best: float):
+        radius = self.library.radius
+        # Borne des deux côtés : enveloppe des modèles / enveloppe de la requête
+        q_lower, q_upper = envelope(query, radius)
+        bounds = np.maximum(lb_keogh(query, templates.lower, templates.upper),
+                            lb_keogh(templates.series, q_lower[None], q_upper[None]))
+        order = np.argsort(bounds)
+        rows = [(float(x), float(y)) for x, y in query]
+        best_name = None
+        for rank, k in enumerate(order):
+            if bounds[k] >= best:
+                self.pruned += len(order) - rank
+                break
+            dist = dtw_distance(rows, templates.rows[k], radius, best)
+            if dist == math.inf:
+                self.dtw_abandoned += 1
+                continue
+            self.dtw_computed += 1
+            if dist < best:
+                best, best_name = dist, templates.names[k]
+        return best_name, best
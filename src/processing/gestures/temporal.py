@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+Temporal Gestures - Reconnaissance des gestes en mouvement (swipe, cercle, poussée, double pincement)
+Responsabilité unique : Suivre une fenêtre glissante de landmarks par main et détecter les
+gestes dynamiques que le classificateur statique (une frame) ne peut pas voir.
+
+Chaque main a un tampon circulaire de taille fixe (landmarks, temps, centre de la paume,
+taille apparente). Les caractéristiques de la fenêtre sont mises à jour incrémentalement :
+à chaque frame, on ajoute la contribution du nouveau point (segment, virage) et on retire
+celle des points évincés. Le coût par frame est O(1), indépendant de la taille de la fenêtre.
+"""
+import math
+from collections import deque
+from enum import Enum
+from typing import Dict, Optional
+
+import numpy as np
+
+# Paume : poignet + bases des doigts (centre stable quand les doigts bougent)
+PALM_LANDMARKS = (0, 5, 9, 13, 17)
+
+
+class MotionGesture(Enum):
+    """Gestes dynamiques (coordonnées image : y vers le bas, landmarks déjà en miroir)"""
+    SWIPE_LEFT = "SWIPE_LEFT"
+    SWIPE_RIGHT = "SWIPE_RIGHT"
+    SWIPE_UP = "SWIPE_UP"
+    SWIPE_DOWN = "SWIPE_DOWN"
+    CIRCLE_CW = "CIRCLE_CW"      # Sens horaire à l'écran
+    CIRCLE_CCW = "CIRCLE_CCW"
+    PUSH = "PUSH"                # Main avancée vers la caméra
+    DOUBLE_PINCH = "DOUBLE_PINCH"
+
+
+class Span:
+    """Portion récente d'une fenêtre (durée max) et ses sommes cumulées"""
+
+    __slots__ = ("max_age", "start", "count", "path", "winding")
+
+    def __init__(self, max_age: float):
+        self.max_age = max_age
+        self.reset()
+
+    def reset(self):
+        self.start = 0   # Slot de la plus ancienne frame
+        self.count = 0
+        self.path = 0.0     # Longueur du trajet du centre de la paume
+        self.winding = 0.0  # Somme des virages signés (rad)
+
+
+class LandmarkWindow:
+    """
+    Tampon circulaire des dernières frames d'une main. Deux portions sont suivies : la
+    fenêtre complète (max_age, gestes lents comme le cercle) et une portion courte
+    (short_age, gestes vifs : swipe, poussée), chacune avec ses sommes cumulées.
+    """
+
+    def __init__(self, capacity: int = 32, max_age: float = 1.0, short_age: float = 0.4,
+                 smoothing: float = 0.5, min_segment: float = 0.004):
+        """
+        Args:
+            capacity: nombre de frames gardées au plus
+            max_age: durée (s) couverte au plus par la fenêtre
+            short_age: durée (s) de la portion courte
+            smoothing: lissage exponentiel du centre de la paume (0 : aucun)
+            min_segment: déplacement (normalisé) en dessous duquel un virage est ignoré (bruit)
+        """
+        self.capacity = capacity
+        self.smoothing = smoothing
+        self.min_segment = min_segment
+        self.frames = np.zeros((capacity, 21, 3), dtype=np.float32)
+        # Scalaires par slot (listes Python : plus rapides que numpy élément par élément)
+        self.times = [0.0] * capacity
+        self.cx = [0.0] * capacity
+        self.cy = [0.0] * capacity
+        self.scale = [0.0] * capacity
+        self.seg = [0.0] * capacity   # Longueur du segment arrivant au slot
+        self.turn = [0.0] * capacity  # Virage signé (rad) au point précédant le slot
+        self.full = Span(max_age)
+        self.short = Span(min(short_age, max_age))
+
+    @property
+    def count(self) -> int:
+        return self.full.count
+
+    def reset(self):
+        self.full.reset()
+        self.short.reset()
+
+    def _evict(self, span: Span):
+        """Retire la frame la plus ancienne d'une portion et les contributions qui l'utilisaient"""
+        cap = self.capacity
+        if span.count > 1:
+            span.path -= self.seg[(span.start + 1) % cap]
+        if span.count > 2:
+            span.winding -= self.turn[(span.start + 2) % cap]
+        span.start = (span.start + 1) % cap
+        span.count -= 1
+
+    def push(self, landmarks, timestamp: float):
+        """Ajoute une frame (21 landmarks MediaPipe) : O(1) amorti"""
+        cap = self.capacity
+        full = self.full
+        count = full.count
+        slot = (full.start + count) % cap
+        self.frames[slot] = [(lm.x, lm.y, lm.z) for lm in landmarks]
+        x = sum(landmarks[i].x for i in PALM_LANDMARKS) / len(PALM_LANDMARKS)
+        y = sum(landmarks[i].y for i in PALM_LANDMARKS) / len(PALM_LANDMARKS)
+        wrist, middle = landmarks[0], landmarks[9]
+        self.scale[slot] = math.hypot(middle.x - wrist.x, middle.y - wrist.y)
+        self.times[slot] = timestamp
+
+        seg = turn = 0.0
+        if count:
+            prev = (slot - 1) % cap
+            x = self.smoothing * self.cx[prev] + (1 - self.smoothing) * x
+            y = self.smoothing * self.cy[prev] + (1 - self.smoothing) * y
+            dx, dy = x - self.cx[prev], y - self.cy[prev]
+            seg = math.hypot(dx, dy)
+            if count > 1 and seg >= self.min_segment:
+                before = (slot - 2) % cap
+                px, py = self.cx[prev] - self.cx[before], self.cy[prev] - self.cy[before]
+                if px * px + py * py >= self.min_segment * self.min_segment:
+                    turn = math.atan2(px * dy - py * dx, px * dx + py * dy)
+        self.cx[slot], self.cy[slot] = x, y
+        self.seg[slot] = seg
+        self.turn[slot] = turn
+
+        for span in (full, self.short):
+            if span.count:
+                span.path += seg
+                if span.count > 1:
+                    span.winding += turn
+            else:
+                span.start = slot
+            span.count += 1
+            while span.count > 1 and timestamp - self.times[span.start] > span.max_age:
+                self._evict(span)
+        # Tampon plein : la frame la plus ancienne sera écrasée au prochain push
+        if full.count == cap:
+            self._evict(full)
+            if self.short.count > full.count:
+                self._evict(self.short)
+
+    # Caractéristiques d'une portion (O(1)), fenêtre complète par défaut
+    def duration(self, span: Optional[Span] = None) -> float:
+        span = span or self.full
+        if not span.count:
+            return 0.0
+        return self.times[(span.start + span.count - 1) % self.capacity] - self.times[span.start]
+
+    def displacement(self, span: Optional[Span] = None):
+        """(dx, dy) du centre de la paume entre la plus ancienne et la dernière frame"""
+        span = span or self.full
+        if not span.count:
+            return 0.0, 0.0
+        last = (span.start + span.count - 1) % self.capacity
+        return self.cx[last] - self.cx[span.start], self.cy[last] - self.cy[span.start]
+
+    def scale_ratio(self, span: Optional[Span] = None) -> float:
+        """Taille apparente de la main : dernière / plus ancienne (> 1 : main qui avance)"""
+        span = span or self.full
+        if not span.count or self.scale[span.start] <= 0:
+            return 1.0
+        return self.scale[(span.start + span.count - 1) % self.capacity] / self.scale[span.start]
+
+    def trajectory(self) -> np.ndarray:
+        """(count, 2) centres de la paume (lissés) de la plus ancienne à la plus récente"""
+        idx = [(self.full.start + i) % self.capacity for i in range(self.full.count)]
+        return np.array([(self.cx[i], self.cy[i]) for i in idx], dtype=np.float32)
+
+    def ordered_frames(self) -> np.ndarray:
+        """Copie (count, 21, 3) des frames de la plus ancienne à la plus récente"""
+        idx = [(self.full.start + i) % self.capacity for i in range(self.full.count)]
+        return self.frames[idx]
+
+
+class TemporalGestureRecognizer:
+    """
+    Une LandmarkWindow par main ; un geste reconnu vide la fenêtre (pas de répétition).
+    Avec un matcher (DTWMatcher), la trajectoire de la fenêtre est aussi comparée aux gestes
+    personnalisés quand aucun geste intégré n'est reconnu (retour : TemplateMatch).
+    """
+
+    # Seuils (coordonnées normalisées 0-1, secondes)
+    SWIPE_MIN_DIST = 0.22
+    SWIPE_MIN_SPEED = 0.5         # Distance / durée (par s) : écarte les déplacements lents du curseur
+    SWIPE_MIN_STRAIGHTNESS = 0.8  # Déplacement / trajet
+    SWIPE_AXIS_RATIO = 1.5        # Axe dominant
+    CIRCLE_MIN_WINDING = 1.6 * math.pi
+    CIRCLE_MIN_PATH = 0.25
+    PUSH_MIN_RATIO = 1.3
+    PUSH_MAX_DRIFT = 0.08
+    DOUBLE_PINCH_INTERVAL = 0.5
+    MIN_DURATION = 0.08
+    TEMPLATE_MIN_PATH = 0.15     # Trajet minimal avant comparaison aux gestes personnalisés
+
+    def __init__(self, capacity: int = 32, max_age: float = 1.0, matcher=None):
+        self.capacity = capacity
+        self.max_age = max_age
+        self.matcher = matcher
+        self.windows: Dict[str, LandmarkWindow] = {}
+        self._pinching: Dict[str, bool] = {}
+        self._pinch_onsets: Dict[str, deque] = {}
+        self.recognized = 0
+        # Enregistrement d'un geste personnalisé (centres de la paume d'une main)
+        self._recording: Optional[list] = None
+        self._recording_hand = "Right"
+
+    def start_recording(self, hand: str = "Right"):
+        self._recording = []
+        self._recording_hand = hand
+
+    def stop_recording(self) -> np.ndarray:
+        """Fin de l'enregistrement : trajectoire (m, 2), vide si rien n'a été vu"""
+        points, self._recording = self._recording or [], None
+        return np.array(points, dtype=np.float32).reshape(-1, 2)
+
+    @property
+    def recording(self) -> bool:
+        return self._recording is not None
+
+    def update(self, hand: str, landmarks, timestamp: float, static_gesture: str = "UNKNOWN"):
+        """
+        Ajoute la frame d'une main et retourne le geste dynamique terminé à cette frame.
+
+        Args:
+            hand: identifiant stable de la main ("Right" / "Left")
+            landmarks: 21 landmarks (normalisés, miroir déjà appliqué)
+            timestamp: instant de la frame (s)
+            static_gesture: geste statique de la frame (pincement pour DOUBLE_PINCH)
+
+        Returns:
+            MotionGesture, TemplateMatch (geste personnalisé) ou None
+        """
+        window = self.windows.get(hand)
+        if window is None:
+            window = self.windows[hand] = LandmarkWindow(self.capacity, self.max_age)
+        window.push(landmarks, timestamp)
+        if self._recording is not None:
+            if hand == self._recording_hand:
+                last = (window.full.start + window.count - 1) % window.capacity
+                self._recording.append((window.cx[last], window.cy[last]))
+            return None
+
+        gesture = self._double_pinch(hand, static_gesture == "PINCH", timestamp) or self._motion(window)
+        if gesture is None and self.matcher is not None and window.full.path >= self.TEMPLATE_MIN_PATH:
+            gesture = self.matcher.match(hand, window.trajectory())
+        if gesture is not None:
+            window.reset()
+            self.recognized += 1
+        return gesture
+
+    def lost(self, hand: str):
+        """Main disparue : sa fenêtre repart de zéro"""
+        window = self.windows.get(hand)
+        if window is not None:
+            window.reset()
+        self._pinching[hand] = False
+
+    def keep_only(self, hands):
+        """Remet à zéro les mains absentes de la frame"""
+        for hand in self.windows:
+            if hand not in hands and self.windows[hand].count:
+                self.lost(hand)
+
+    def lost_all(self):
+        for hand in self.windows:
+            if self.windows[hand].count:
+                self.lost(hand)
+
+    def _double_pinch(self, hand: str, pinching: bool, timestamp: float) -> Optional[MotionGesture]:
+        was_pinching = self._pinching.get(hand, False)
+        self._pinching[hand] = pinching
+        if not pinching or was_pinching:
+            return None
+        onsets = self._pinch_onsets.setdefault(hand, deque(maxlen=2))
+        onsets.append(timestamp)
+        if len(onsets) == 2 and onsets[1] - onsets[0] <= self.DOUBLE_PINCH_INTERVAL:
+            onsets.clear()
+            return MotionGesture.DOUBLE_PINCH
+        return None
+
+    def _motion(self, window: LandmarkWindow) -> Optional[MotionGesture]:
+        full, short = window.full, window.short
+
+        # Cercle : angle parcouru sur toute la fenêtre
+        if abs(full.winding) >= self.CIRCLE_MIN_WINDING and full.path >= self.CIRCLE_MIN_PATH:
+            return MotionGesture.CIRCLE_CW if full.winding > 0 else MotionGesture.CIRCLE_CCW
+
+        # Swipe et poussée : portion courte (mouvement vif)
+        duration = window.duration(short)
+        if duration < self.MIN_DURATION:
+            return None
+        dx, dy = window.displacement(short)
+        dist = math.hypot(dx, dy)
+        if (dist >= self.SWIPE_MIN_DIST and dist / duration >= self.SWIPE_MIN_SPEED
+                and dist >= self.SWIPE_MIN_STRAIGHTNESS * short.path):
+            if abs(dx) >= self.SWIPE_AXIS_RATIO * abs(dy):
+                return MotionGesture.SWIPE_RIGHT if dx > 0 else MotionGesture.SWIPE_LEFT
+            if abs(dy) >= self.SWIPE_AXIS_RATIO * abs(dx):
+                return MotionGesture.SWIPE_DOWN if dy > 0 else MotionGesture.SWIPE_UP
+
+        if window.scale_ratio(short) >= self.PUSH_MIN_RATIO and dist <= self.PUSH_MAX_DRIFT:
+            return MotionGesture.PUSH
+        return None
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+SwipeDecoder - Décodage de la frappe par glissement (swipe) sur le clavier virtuel
+Responsabilité unique : Transformer la trajectoire du doigt en mots candidats.
+
+Chaque mot du lexique a un gabarit : le tracé idéal reliant les centres de ses touches,
+rééchantillonné en n points équidistants. Les gabarits sont groupés par (première touche,
+dernière touche) : au décodage, seuls les groupes dont les touches sont proches du début
+et de la fin du tracé sont comparés, en un calcul vectorisé (distance moyenne point à point),
+puis pondérés par la fréquence du mot.
+"""
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def key_centers(buttons) -> Dict[str, Tuple[float, float]]:
+    """Centres des touches lettres (une lettre) d'une page du clavier, en minuscules"""
+    centers = {}
+    for btn in buttons:
+        if len(btn.text) == 1 and btn.text.isalpha():
+            x, y = btn.pos
+            w, h = btn.size
+            centers[btn.text.lower()] = (x + w / 2, y + h / 2)
+    return centers
+
+
+def base_letters(word: str) -> str:
+    """Lettres tapées pour un mot : accents retirés (é → e), le reste inchangé"""
+    decomposed = unicodedata.normalize("NFD", word.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def resample(points: np.ndarray, n: int) -> np.ndarray:
+    """n points équidistants le long d'une polyligne (m, 2)"""
+    points = np.asarray(points, dtype=np.float32)
+    if len(points) == 1:
+        return np.repeat(points, n, axis=0)
+    seg = np.hypot(*np.diff(points, axis=0).T)
+    dist = np.concatenate(([0.0], np.cumsum(seg)))
+    if dist[-1] == 0:
+        return np.repeat(points[:1], n, axis=0)
+    targets = np.linspace(0.0, dist[-1], n)
+    return np.stack((np.interp(targets, dist, points[:, 0]),
+                     np.interp(targets, dist, points[:, 1])), axis=1).astype(np.float32)
+
+
+def path_length(points) -> float:
+    points = np.asarray(points, dtype=np.float32)
+    if len(points) < 2:
+        return 0.0
+    return float(np.hypot(*np.diff(points, axis=0).T).sum())
+
+
+class SwipeDecoder:
+    """Gabarits précalculés d'un lexique pour une disposition de touches"""
+
+    def __init__(self, centers: Dict[str, Tuple[float, float]], words: Iterable[Tuple[str, int]],
+                 n_samples: int = 32, key_size: float = 85.0, freq_weight: float = 0.04):
+        """
+        Args:
+            centers: lettre → centre de la touche (px), voir key_centers()
+            words: (mot, fréquence) ; les mots contenant une lettre absente sont ignorés
+            n_samples: points par gabarit / tracé
+            key_size: largeur d'une touche (px), unité des distances et rayon d'élagage
+            freq_weight: poids de -log(fréquence relative) face à la distance en touches
+        """
+        self.centers = centers
+        self.n_samples = n_samples
+        self.key_size = key_size
+        self.freq_weight = freq_weight
+
+        self._letters = sorted(centers)
+        self._letter_xy = np.array([centers[c] for c in self._letters], dtype=np.float32)
+
+        kept, templates, freqs, groups = [], [], [], {}
+        for word, freq in words:
+            letters = base_letters(word)
+            if not letters or any(c not in centers for c in letters):
+                continue
+            # Lettres doublées : une seule position sur le tracé
+            keys = [letters[0]] + [c for prev, c in zip(letters, letters[1:]) if c != prev]
+            groups.setdefault((keys[0], keys[-1]), []).append(len(kept))
+            templates.append(resample([centers[c] for c in keys], n_samples))
+            kept.append(word)
+            freqs.append(max(1, freq))
+
+        self.words = kept
+        self.templates = np.stack(templates) if templates else np.zeros((0, n_samples, 2), np.float32)
+        freqs = np.asarray(freqs, dtype=np.float64)
+        self._prior = (-np.log(freqs / freqs.max()) * freq_weight).astype(np.float32) if kept else freqs
+        self._groups = {key: np.asarray(ids, dtype=np.int64) for key, ids in groups.items()}
+
+    @classmethod
+    def from_trie(cls, trie, centers, max_words: Optional[int] = None, **kwargs) -> "SwipeDecoder":
+        """Lexique lu dans un WordTrie (mots déjà triés par fréquence décroissante)"""
+        count = len(trie) if max_words is None else min(len(trie), max_words)
+        words = ((trie.word(i), trie.frequency(i)) for i in range(count))
+        return cls(centers, words, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def _near_keys(self, point, radius: float) -> List[str]:
+        """Touches dont le centre est à moins de radius (au moins la plus proche)"""
+        dist = np.hypot(*(self._letter_xy - point).T)
+        near = np.flatnonzero(dist <= radius)
+        if len(near) == 0:
+            near = [int(dist.argmin())]
+        return [self._letters[i] for i in near]
+
+    def candidates(self, start, end) -> np.ndarray:
+        """Mots dont les touches de début et de fin sont proches des extrémités du tracé"""
+        radius = self.key_size * 0.9
+        ids = [self._groups[(first, last)]
+               for first in self._near_keys(start, radius)
+               for last in self._near_keys(end, radius)
+               if (first, last) in self._groups]
+        if not ids:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(ids)
+
+    def decode(self, points: Sequence[Tuple[float, float]], k: int = 3) -> List[str]:
+        """Mots les plus probables pour un tracé (pixels du canvas clavier), meilleur d'abord"""
+        if len(points) == 0 or len(self.words) == 0:
+            return []
+        path = resample(points, self.n_samples)
+        ids = self.candidates(path[0], path[-1])
+        if len(ids) == 0:
+            return []
+
+        # Distance moyenne point à point, en largeurs de touche, + a priori de fréquence
+        diff = self.templates[ids] - path
+        cost = np.sqrt((diff * diff).sum(axis=2)).mean(axis=1) / self.key_size + self._prior[ids]
+        k = min(k, len(ids))
+        best = np.argpartition(cost, k - 1)[:k]
+        best = best[np.argsort(cost[best])]
+        return [self.words[ids[i]] for i in best]
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+WordTrie - Trie compact en mémoire mappée pour la complétion de mots
+Responsabilité unique : Prédire les mots les plus fréquents commençant par un préfixe.
+
+Format (little-endian, sections alignées sur 4 octets) :
+    en-tête   magic, n_nodes, n_words, k, taille du blob
+    labels    n_nodes octets : octet UTF-8 menant à chaque nœud (racine : 0)
+    children  n_nodes + 1 uint32 : enfants de i = [children[i], children[i+1]) (ordre BFS)
+    top       n_nodes * k uint32 : k meilleurs mots du sous-arbre (NO_WORD : vide)
+    offsets   n_words + 1 uint32 : mots dans le blob, triés par fréquence décroissante
+    freqs     n_words uint32
+    blob      mots UTF-8 concaténés
+
+Les mots étant numérotés par fréquence décroissante, le top-k d'un nœud est le k plus
+petits identifiants de son sous-arbre : il est calculé à la construction. Une frappe coûte
+une recherche d'octet parmi les enfants (mmap.find) et les suggestions une lecture de k
+entrées : quelques microsecondes quelle que soit la taille du dictionnaire.
+"""
+import mmap
+import os
+import struct
+from typing import Iterable, List, Optional, Tuple
+
+MAGIC = b"HMTRIE1\0"
+HEADER = struct.Struct("<8sIIII")
+NO_WORD = 0xFFFFFFFF
+
+
+def _align(n: int) -> int:
+    return (n + 3) & ~3
+
+
+def read_frequency_list(path: str) -> List[Tuple[str, int]]:
+    """Liste "mot fréquence" par ligne (fréquence absente : rang dans le fichier)"""
+    words = []
+    with open(path, encoding="utf-8") as f:
+        for rank, line in enumerate(f):
+            parts = line.split()
+            if not parts:
+                continue
+            freq = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+            words.append((parts[0], freq or max(1, 1_000_000 - rank)))
+    return words
+
+
+def build_trie(words: Iterable[Tuple[str, int]], path: str, k: int = 5) -> str:
+    """
+    Compile une liste (mot, fréquence) en fichier trie. Les doublons (casse comprise)
+    sont fusionnés en gardant la plus grande fréquence.
+    """
+    best = {}
+    for word, freq in words:
+        word = word.strip().lower()
+        if word and freq > best.get(word, -1):
+            best[word] = freq
+    ranked = sorted(best.items(), key=lambda item: (-item[1], item[0]))
+    encoded = [word.encode("utf-8") for word, _ in ranked]
+
+    # Trie en dictionnaires (octet → nœud), mot terminal = identifiant de rang
+    children = [{}]
+    terminal = [NO_WORD]
+    for word_id, data in enumerate(encoded):
+        node = 0
+        for byte in data:
+            nxt = children[node].get(byte)
+            if nxt is None:
+                nxt = len(children)
+                children[node][byte] = nxt
+                children.append({})
+                terminal.append(NO_WORD)
+            node = nxt
+        terminal[node] = min(terminal[node], word_id)
+
+    # Renumérotation BFS : enfants contigus et triés par octet
+    order = [0]
+    labels = bytearray([0])
+    starts = []
+    for node in order:
+        starts.append(len(order))
+        for byte in sorted(children[node]):
+            order.append(children[node][byte])
+            labels.append(byte)
+    starts.append(len(order))
+    n_nodes = len(order)
+
+    # Top-k des sous-arbres, des feuilles vers la racine (BFS inversé)
+    top = [None] * n_nodes
+    for bfs in range(n_nodes - 1, -1, -1):
+        ids = [] if terminal[order[bfs]] == NO_WORD else [terminal[order[bfs]]]
+        for child in range(starts[bfs], starts[bfs + 1]):
+            ids.extend(top[child])
+        ids.sort()
+        top[bfs] = ids[:k]
+
+    top_flat = []
+    for ids in top:
+        top_flat.extend(ids)
+        top_flat.extend([NO_WORD] * (k - len(ids)))
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    blob = b"".join(encoded)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, n_nodes, len(encoded), k, len(blob)))
+        f.write(bytes(labels).ljust(_align(n_nodes), b"\0"))
+        f.write(struct.pack(f"<{n_nodes + 1}I", *starts))
+        f.write(struct.pack(f"<{n_nodes * k}I", *top_flat))
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.write(struct.pack(f"<{len(encoded)}I", *(freq for _, freq in ranked)))
+        f.write(blob)
+    os.replace(tmp_path, path)  # Jamais de fichier à moitié écrit pour un lecteur mappé
+    return path
+
+
+class WordTrie:
+    """Lecteur du fichier compilé : mmap en lecture seule, aucune copie des tableaux"""
+
+    root = 0  # Nœud du préfixe vide
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.n_nodes, self.n_words, self.k, blob_len = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a word trie file: {path}")
+
+        self._view = view = memoryview(self._mm)
+        pos = HEADER.size
+        self._labels_pos = pos  # Recherche d'octet directement dans le mmap
+        pos += _align(self.n_nodes)
+        self._children = view[pos:pos + 4 * (self.n_nodes + 1)].cast("I")
+        pos += 4 * (self.n_nodes + 1)
+        self._top = view[pos:pos + 4 * self.n_nodes * self.k].cast("I")
+        pos += 4 * self.n_nodes * self.k
+        self._offsets = view[pos:pos + 4 * (self.n_words + 1)].cast("I")
+        pos += 4 * (self.n_words + 1)
+        self._freqs = view[pos:pos + 4 * self.n_words].cast("I")
+        pos += 4 * self.n_words
+        self._blob_pos = pos
+
+    @classmethod
+    def load(cls, path: str) -> "WordTrie":
+        """
+        Ouvre un trie compilé, ou compile d'abord une liste de fréquences texte
+        (path + ".trie", recompilé si la liste est plus récente).
+        """
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) == MAGIC:
+                return cls(path)
+        compiled = path + ".trie"
+        if not os.path.exists(compiled) or os.path.getmtime(compiled) < os.path.getmtime(path):
+            build_trie(read_frequency_list(path), compiled)
+        return cls(compiled)
+
+    def close(self):
+        for view in (self._children, self._top, self._offsets, self._freqs, self._view):
+            view.release()
+        self._mm.close()
+
+    def step(self, node: int, byte: int) -> int:
+        """Enfant de node étiqueté par l'octet, -1 si absent"""
+        start, end = self._children[node], self._children[node + 1]
+        found = self._mm.find(bytes((byte,)), self._labels_pos + start, self._labels_pos + end)
+        return -1 if found < 0 else found - self._labels_pos
+
+    def find(self, prefix: str, node: int = 0) -> int:
+        """Nœud atteint par le préfixe (depuis node), -1 si aucun mot ne commence ainsi"""
+        for byte in prefix.lower().encode("utf-8"):
+            node = self.step(node, byte)
+            if node < 0:
+                return -1
+        return node
+
+    def word(self, word_id: int) -> str:
+        start = self._blob_pos + self._offsets[word_id]
+        end = self._blob_pos + self._offsets[word_id + 1]
+        return self._mm[start:end].decode("utf-8")
+
+    def frequency(self, word_id: int) -> int:
+        return self._freqs[word_id]
+
+    def top(self, node: int, k: Optional[int] = None) -> List[str]:
+        """Mots les plus fréquents sous node (au plus self.k)"""
+        if node < 0:
+            return []
+        base = node * self.k
+        words = []
+        for i in range(base, base + min(k or self.k, self.k)):
+            word_id = self._top[i]
+            if word_id == NO_WORD:
+                break
+            words.append(self.word(word_id))
+        return words
+
+    def complete(self, prefix: str, k: Optional[int] = None) -> List[str]:
+        return self.top(self.find(prefix), k)
+
+    def __len__(self) -> int:
+        return self.n_words
+
+
+class PredictiveText:
+    """
+    Mot en cours de frappe, suivi incrémentalement : une frappe avance d'un nœud, un
+    retour arrière dépile, un séparateur termine le mot.
+    """
+
+    def __init__(self, trie: WordTrie, max_suggestions: int = 3):
+        self.trie = trie
+        self.max_suggestions = max_suggestions
+        self.prefix = ""
+        self._nodes = [WordTrie.root]  # Nœud après chaque caractère du préfixe
+        self.suggestions: List[str] = []
+
+    def feed(self, char: str) -> List[str]:
+        """Caractère tapé : lettre → préfixe prolongé, autre → mot terminé"""
+        if not char.isalpha() and char not in "'-":
+            return self.reset()
+        node = self._nodes[-1]
+        if node >= 0:
+            node = self.trie.find(char, node)
+        self.prefix += char.lower()
+        self._nodes.append(node)
+        return self._update()
+
+    def backspace(self) -> List[str]:
+        if self.prefix:
+            self.prefix = self.prefix[:-1]
+            self._nodes.pop()
+        return self._update()
+
+    def reset(self) -> List[str]:
+        self.prefix = ""
+        self._nodes = [WordTrie.root]
+        self.suggestions = []
+        return self.suggestions
+
+    def completion(self, word: str) -> str:
+        """Caractères restant à taper pour obtenir word (+ espace)"""
+        if word.startswith(self.prefix):
+            return word[len(self.prefix):] + " "
+        return "\b" * len(self.prefix) + word + " "
+
+    def _update(self) -> List[str]:
+        node = self._nodes[-1]
+        if not self.prefix or node < 0:
+            self.suggestions = []
+        else:
+            self.suggestions = self.trie.top(node, self.max_suggestions)
+        return self.suggestions
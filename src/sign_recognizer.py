@@ -1,5 +1,7 @@
 import math
 
+from src.processing.geometry.hand_frame import landmarks_to_array, normalize_hands
+
 class SignLanguageInterpreter:
     """
     Interpréteur de langue des signes (ASL) basé sur la géométrie des landmarks MediaPipe.
@@ -9,13 +11,14 @@ class SignLanguageInterpreter:
         self.finger_tips = [4, 8, 12, 16, 20]
         self.finger_pips = [2, 6, 10, 14, 18]
 
-    def predict(self, hand_crop_unused, landmarks):
+    def predict(self, hand_crop_unused, landmarks, normalized=None):
         """
         Prediit la lettre ASL basée sur les landmarks normalisés.
         
         Args:
             hand_crop_unused: Ignoré (legacy CNN signature)
             landmarks: Liste des objets landmarks (x, y, z) de MediaPipe
+            normalized: (21, 3) dans le repère de la main si déjà calculé
             
         Returns:
             label (str), confidence (float)
@@ -23,19 +26,22 @@ class SignLanguageInterpreter:
         if not landmarks:
             return "Unknown", 0.0
 
+        # Repère de la main : x vers le pouce (main gauche ou droite), y vers les doigts
+        if normalized is None:
+            normalized = normalize_hands(landmarks_to_array(landmarks))
+
         # Analyse des doigts (Ouvert/Fermé)
         fingers = []
         
-        # Pouce (Axe X pour la main droite, inverser si main gauche - supposons main droite pour l'instant)
-        # Pouce ouvert si tip à droite de IP
-        if landmarks[4].x > landmarks[3].x:
+        # Pouce ouvert si tip plus loin que IP côté pouce (axe x)
+        if normalized[4, 0] > normalized[3, 0]:
             fingers.append(1)
         else:
             fingers.append(0)
 
-        # 4 autres doigts (Axe Y)
+        # 4 autres doigts (axe y de la main)
         for i in range(1, 5):
-            if landmarks[self.finger_tips[i]].y < landmarks[self.finger_pips[i]].y:
+            if normalized[self.finger_tips[i], 1] > normalized[self.finger_pips[i], 1]:
                 fingers.append(1)
             else:
                 fingers.append(0)
@@ -80,10 +86,7 @@ class SignLanguageInterpreter:
             # Raffinement E vs A
             # E: Tips proches du bas de la paume
             # A: Pouce vertical contre la main
-            thumb_tip = landmarks[4]
-            index_mcp = landmarks[5]
-            
-            if thumb_tip.y < index_mcp.y: # Pouce un peu haut
+            if normalized[4, 1] > normalized[5, 1]: # Pouce un peu haut
                 gesture = "A"
             else:
                 gesture = "E"
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+PreviewComposer - Composition de la fenêtre d'aperçu unifiée (vidéo + squelette)
+Responsabilité unique : Assembler l'aperçu dans un buffer préalloué, sans hstack, et
+ne reconstruire le panneau squelette que lorsqu'un nouveau résultat est arrivé
+"""
+import time
+from typing import Callable, Hashable, Tuple
+
+import cv2
+import numpy as np
+
+from src.core.pipeline import StageStats
+
+
+class PreviewComposer:
+    """[Vidéo 533x400] + [Squelette 600x400] = 1133x400, composés en place"""
+
+    def __init__(self, video_size: Tuple[int, int] = (533, 400), panel_size: Tuple[int, int] = (600, 400)):
+        video_w, height = video_size
+        panel_w, panel_h = panel_size
+        if panel_h != height:
+            raise ValueError("Video and skeleton panel must have the same height")
+        self.video_size = video_size
+        self.buffer = np.zeros((height, video_w + panel_w, 3), dtype=np.uint8)
+        # Vues sur le buffer : resize et copie du panneau écrivent directement dedans
+        self._video = self.buffer[:, :video_w]
+        self._panel = self.buffer[:, video_w:]
+        self._panel_key = None
+        self.panel_stats = StageStats()
+        self.panel_reused = 0
+
+    def compose(self, frame: np.ndarray, panel_key: Hashable, render_panel: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Compose l'aperçu. render_panel() n'est appelé que si panel_key (numéro de séquence
+        du résultat de landmarks) a changé depuis le dernier appel.
+
+        Le buffer retourné est réutilisé à l'appel suivant.
+        """
+        cv2.resize(frame, self.video_size, dst=self._video)
+        if panel_key != self._panel_key or panel_key is None:
+            start = time.perf_counter()
+            np.copyto(self._panel, render_panel())
+            self.panel_stats.record((time.perf_counter() - start) * 1000)
+            self._panel_key = panel_key
+        else:
+            self.panel_reused += 1
+        return self.buffer
+
+    def invalidate(self):
+        """Force la reconstruction du panneau au prochain compose()"""
+        self._panel_key = None
+
+    def get_stats(self) -> dict:
+        panel = self.panel_stats.to_dict()
+        return {
+            "panel_rendered": panel["count"],
+            "panel_reused": self.panel_reused,
+            "panel_avg_ms": panel["avg_ms"],
+            # Temps évité : panneaux réutilisés × coût moyen d'une reconstruction
+            "panel_saved_ms": self.panel_reused * panel["avg_ms"],
+        }
@@ -2,10 +2,14 @@
 """
 SkeletonRenderer - Rendu visuel des squelettes de mains
 Responsabilité unique : Génération d'images de visualisation
+
+Rendu vectorisé : toutes les vues d'une main sont projetées par un seul produit matriciel
+sur le tableau (21, 3), les os sont tracés en un appel cv2.polylines (une polyligne par
+doigt) et le fond statique (grille, libellés) est pré-rendu puis recopié.
 """
 import numpy as np
 import cv2
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Sequence
 
 
 # Connexions MediaPipe
@@ -18,14 +22,91 @@ HAND_CONNECTIONS = [
     (0, 17)                                # Paume
 ]
 
+# Mêmes connexions regroupées en chaînes continues (une polyligne chacune)
+FINGER_CHAINS = [
+    np.array([0, 1, 2, 3, 4]),       # Pouce
+    np.array([0, 5, 6, 7, 8]),       # Index
+    np.array([5, 9, 10, 11, 12]),    # Majeur
+    np.array([9, 13, 14, 15, 16]),   # Annulaire
+    np.array([13, 17, 18, 19, 20]),  # Auriculaire
+    np.array([0, 17]),               # Paume
+]
+
+# Projections des landmarks monde (x, y, z) vers le plan de chaque vue (colonnes u, v)
+VIEW_AXES = {
+    "top": ((1, 0), (0, 0), (0, -1)),    # Plan XZ
+    "left": ((0, 0), (0, 1), (-1, 0)),   # Plan ZY
+    "right": ((0, 0), (0, 1), (1, 0)),   # Plan ZY inversé
+}
+
+
+def landmarks_to_array(landmarks) -> np.ndarray:
+    """Landmarks MediaPipe → tableau (N, 3) float64"""
+    return np.array([(lm.x, lm.y, lm.z) for lm in landmarks], dtype=np.float64)
+
+
+def draw_hand(
+    canvas: np.ndarray,
+    points: np.ndarray,
+    bone_color: Tuple[int, int, int],
+    joint_color: Tuple[int, int, int],
+    thickness: int = 2,
+    joint_radius: int = 3,
+    joints_first: bool = False
+):
+    """
+    Dessine une main depuis un tableau (21, 2) int32 de points pixel : os en un appel
+    cv2.polylines, puis articulations (ou l'inverse avec joints_first). Avec moins de 21
+    points, seuls les os dont les deux extrémités existent sont tracés.
+    """
+    if joints_first:
+        _draw_joints(canvas, points, joint_color, joint_radius)
+    n = len(points)
+    if n >= 21:
+        chains = [points[chain] for chain in FINGER_CHAINS]
+    else:
+        # Chaînes croissantes : les os valides en forment le début
+        chains = [points[chain[chain < n]] for chain in FINGER_CHAINS if chain[1] < n]
+    if chains:
+        cv2.polylines(canvas, chains, False, bone_color, thickness)
+    if not joints_first:
+        _draw_joints(canvas, points, joint_color, joint_radius)
+
+
+def _draw_joints(canvas, points, color, radius):
+    for x, y in points.tolist():
+        cv2.circle(canvas, (x, y), radius, color, -1)
+
+
+class SkeletonView:
+    """
+    Vue d'un quadrant : pixel = (landmark - center) @ matrix + offset, tronqué vers zéro
+    (comme int()). source = "screen" (landmarks normalisés) ou "world" (mètres).
+    """
+
+    def __init__(self, source: str, matrix, offset: Tuple[float, float], center=(0.0, 0.0, 0.0)):
+        self.source = source
+        self.matrix = np.asarray(matrix, dtype=np.float64)
+        self.offset = np.asarray(offset, dtype=np.float64)
+        self.center = np.asarray(center, dtype=np.float64)
+
+    @classmethod
+    def world(cls, view_type: str, offset: Tuple[float, float], scale: float) -> "SkeletonView":
+        return cls("world", np.asarray(VIEW_AXES[view_type], dtype=np.float64) * scale, offset)
+
 
 class SkeletonRenderer:
     """Génère les visualisations de squelettes de mains"""
-    
+
     def __init__(
         self,
         canvas_size: Tuple[int, int] = (600, 400),
-        colors: dict = None
+        colors: dict = None,
+        views: Optional[List[SkeletonView]] = None,
+        labels: Sequence[Tuple[str, Tuple[int, int]]] = (),
+        waiting_pos: Optional[Tuple[int, int]] = None,
+        bone_color: Optional[Tuple[int, int, int]] = None,
+        joint_colors: Optional[Sequence[Tuple[int, int, int]]] = None
     ):
         self.width, self.height = canvas_size
         self.colors = colors or {
@@ -35,101 +116,109 @@ class SkeletonRenderer:
             'joint': (255, 255, 255),
             'grid': (50, 50, 50)
         }
-    
+        mid_x, mid_y = self.width // 2, self.height // 2
+
+        # Disposition par défaut : 2D (haut-gauche) + vues de dessus, gauche, droite
+        self.views = views or [
+            SkeletonView("screen", [[150, 0], [0, 150], [0, 0]],
+                         (mid_x // 2, mid_y // 2), center=(0.5, 0.5, 0.0)),
+            SkeletonView.world("top", (mid_x + mid_x // 2, mid_y // 2), 500),
+            SkeletonView.world("left", (mid_x // 2, mid_y + mid_y // 2), 500),
+            SkeletonView.world("right", (mid_x + mid_x // 2, mid_y + mid_y // 2), 500),
+        ]
+        self.labels = labels
+        self.waiting_pos = waiting_pos or (mid_x - 60, mid_y)
+        self.bone_color = bone_color or self.colors['right']
+        self.joint_colors = joint_colors or [self.colors['joint']]
+
+        # Une seule multiplication par source : matrices des vues concaténées (3, 2 * n)
+        self._projections = {}
+        for source in ("screen", "world"):
+            indices = [i for i, view in enumerate(self.views) if view.source == source]
+            if indices:
+                self._projections[source] = (
+                    indices,
+                    np.hstack([self.views[i].matrix for i in indices]),
+                    np.concatenate([self.views[i].offset for i in indices]),
+                    self.views[indices[0]].center,
+                )
+
+        self._background = self._render_background()
+        self._canvas = np.empty_like(self._background)
+
+    @classmethod
+    def engine_4view(cls) -> "SkeletonRenderer":
+        """Disposition de la fenêtre unifiée de HandEngine (toutes les mains, libellés)"""
+        return cls(
+            canvas_size=(600, 400),
+            colors={'grid': (50, 50, 50)},
+            views=[
+                SkeletonView("screen", [[300, 0], [0, 200], [0, 0]], (0, 0)),
+                SkeletonView.world("top", (450, 100), 600),
+                SkeletonView.world("left", (150, 300), 600),
+                SkeletonView.world("right", (450, 300), 600),
+            ],
+            labels=[('Main View', (10, 20)), ('Top View', (310, 20)),
+                    ('Left View', (10, 220)), ('Right View', (310, 220))],
+            waiting_pos=(240, 200),
+            bone_color=(180, 180, 180),
+            joint_colors=[(0, 255, 255), (255, 0, 255)]  # Jaune / Violet
+        )
+
+    def _render_background(self) -> np.ndarray:
+        """Fond statique (lignes de quadrant + libellés), rendu une seule fois"""
+        canvas = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        mid_x, mid_y = self.width // 2, self.height // 2
+        cv2.line(canvas, (mid_x, 0), (mid_x, self.height), self.colors['grid'], 2)
+        cv2.line(canvas, (0, mid_y), (self.width, mid_y), self.colors['grid'], 2)
+        for text, pos in self.labels:
+            cv2.putText(canvas, text, pos, cv2.FONT_HERSHEY_SIMPLEX, 0.5, (100, 100, 255), 1)
+        return canvas
+
     def render_4view(
         self,
         landmarks,
         world_landmarks = None
     ) -> np.ndarray:
-        """Génère une vue 4 quadrants (2D + 3 vues 3D)"""
-        canvas = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        
-        # Lignes de quadrant
-        mid_x, mid_y = self.width // 2, self.height // 2
-        cv2.line(canvas, (mid_x, 0), (mid_x, self.height), self.colors['grid'], 2)
-        cv2.line(canvas, (0, mid_y), (self.width, mid_y), self.colors['grid'], 2)
-        
-        if landmarks is None:
-            cv2.putText(canvas, "WAITING...", (mid_x - 60, mid_y), 
+        """Génère une vue 4 quadrants (2D + 3 vues 3D) pour une main"""
+        hands = [(landmarks, world_landmarks)] if landmarks is not None else []
+        return self.render_hands(hands)
+
+    def render_hands(self, hands) -> np.ndarray:
+        """
+        Génère les 4 quadrants pour plusieurs mains [(landmarks, world_landmarks | None)].
+
+        Le canvas retourné est réutilisé à l'appel suivant (copier pour le conserver).
+        """
+        canvas = self._canvas
+        np.copyto(canvas, self._background)
+
+        if not hands:
+            cv2.putText(canvas, "WAITING...", self.waiting_pos,
                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
             return canvas
-        
-        # Quadrant 1: Vue 2D (haut-gauche)
-        self._draw_2d_view(canvas, landmarks, 
-                          offset=(mid_x // 2, mid_y // 2),
-                          scale=150)
-        
-        if world_landmarks:
-            # Quadrant 2: Vue de dessus XZ (haut-droite)
-            self._draw_3d_view(canvas, world_landmarks, "top",
-                              offset=(mid_x + mid_x // 2, mid_y // 2))
-            
-            # Quadrant 3: Vue côté gauche ZY (bas-gauche)
-            self._draw_3d_view(canvas, world_landmarks, "left",
-                              offset=(mid_x // 2, mid_y + mid_y // 2))
-            
-            # Quadrant 4: Vue côté droit (bas-droite)
-            self._draw_3d_view(canvas, world_landmarks, "right",
-                              offset=(mid_x + mid_x // 2, mid_y + mid_y // 2))
-        
+
+        for i, (landmarks, world_landmarks) in enumerate(hands):
+            joint_color = self.joint_colors[min(i, len(self.joint_colors) - 1)]
+            for points in self.project(landmarks, world_landmarks):
+                if points is not None:
+                    draw_hand(canvas, points, self.bone_color, joint_color)
         return canvas
-    
-    def _draw_2d_view(
-        self,
-        canvas: np.ndarray,
-        landmarks,
-        offset: Tuple[int, int],
-        scale: float = 150
-    ):
-        """Dessine la vue 2D screen-space"""
-        ox, oy = offset
-        points = []
-        
-        for lm in landmarks:
-            x = int(ox + (lm.x - 0.5) * scale)
-            y = int(oy + (lm.y - 0.5) * scale)
-            points.append((x, y))
-        
-        self._draw_skeleton(canvas, points, self.colors['right'])
-    
-    def _draw_3d_view(
-        self,
-        canvas: np.ndarray,
-        world_landmarks,
-        view_type: str,
-        offset: Tuple[int, int],
-        scale: float = 500
-    ):
-        """Dessine une projection 3D"""
-        ox, oy = offset
-        points = []
-        
-        for lm in world_landmarks:
-            if view_type == "top":      # XZ plane
-                x = int(ox + lm.x * scale)
-                y = int(oy - lm.z * scale)
-            elif view_type == "left":   # ZY plane
-                x = int(ox - lm.z * scale)
-                y = int(oy + lm.y * scale)
-            else:                       # ZY inverted
-                x = int(ox + lm.z * scale)
-                y = int(oy + lm.y * scale)
-            points.append((x, y))
-        
-        self._draw_skeleton(canvas, points, self.colors['right'])
-    
-    def _draw_skeleton(
-        self,
-        canvas: np.ndarray,
-        points: List[Tuple[int, int]],
-        color: Tuple[int, int, int]
-    ):
-        """Dessine le squelette (os + articulations)"""
-        # Connexions
-        for start_idx, end_idx in HAND_CONNECTIONS:
-            if start_idx < len(points) and end_idx < len(points):
-                cv2.line(canvas, points[start_idx], points[end_idx], color, 2)
-        
-        # Articulations
-        for pt in points:
-            cv2.circle(canvas, pt, 3, self.colors['joint'], -1)
+
+    def project(self, landmarks, world_landmarks=None) -> List[Optional[np.ndarray]]:
+        """Points pixel (21, 2) int32 de chaque vue (None si sa source est absente)"""
+        sources = {
+            "screen": landmarks,
+            "world": world_landmarks,
+        }
+        projected: List[Optional[np.ndarray]] = [None] * len(self.views)
+        for source, (indices, matrix, offset, center) in self._projections.items():
+            data = sources[source]
+            if data is None or len(data) == 0:
+                continue
+            coords = landmarks_to_array(data) if not isinstance(data, np.ndarray) else data
+            # (21, 3) @ (3, 2n) : toutes les vues de la source en une multiplication
+            pixels = ((coords - center) @ matrix + offset).astype(np.int32).reshape(len(coords), -1, 2)
+            for k, view_index in enumerate(indices):
+                projected[view_index] = pixels[:, k]
+        return projected
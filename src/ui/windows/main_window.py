@@ -7,6 +7,7 @@ import threading
 import time
 
 from src.engine import HandEngine
+from src.models.config import AppConfig
 from src.gestures_view import GesturesView
 from src.settings_view import SettingsView
 
@@ -19,7 +20,12 @@ class MainWindow:
         self._configure_page()
         
         # Moteur
-        self.engine = HandEngine(headless=False)
+        performance = AppConfig.load().performance  # Politique de pause et cadence de l'aperçu
+        self.engine = HandEngine(
+            headless=False,
+            pause_mode=performance.pause_mode,
+            display_fps=performance.display_fps
+        )
         
         # Composants UI
         self._init_navigation()
@@ -119,7 +125,7 @@ class MainWindow:
         if idx == 0:
             self._build_dashboard()
         elif idx == 1:
-            self.content_area.controls.append(GesturesView(self.page))
+            self.content_area.controls.append(GesturesView(self))
         elif idx == 2:
             self.content_area.controls.append(SettingsView(self.page, self.engine))
         
@@ -6,17 +6,25 @@ Adapté pour Hand Mouse OS avec MediaPipe landmarks
 
 import cv2
 import numpy as np
+import os
 from pynput.keyboard import Controller
+import threading
 import time
 
+from src.core.pipeline import StageStats
+from src.processing.text.swipe_decoder import SwipeDecoder, key_centers, path_length
+from src.processing.text.word_trie import PredictiveText, WordTrie
+
 class Button:
     def __init__(self, pos, text, size=(85, 85)):
         self.pos = pos
         self.text = text
         self.size = size
         self.hovered = False
-        self.dwell_time = 0
-        self.dwell_threshold = 30  # Frames (~1.0s à 30fps) - AUGMENTÉ
+        self.dwell_time = 0.0      # Secondes de survol (horloge de frame)
+        self.dwell_start = None    # Début du survol (None : repart à la prochaine frame)
+        self.dwell_threshold = 1.0  # Secondes - AUGMENTÉ
+        self._text_pos = None  # Position du texte centré (getTextSize calculé une fois)
         
     def contains(self, point):
         """Vérifie si le point est dans le bouton"""
@@ -25,139 +33,529 @@ class Button:
         w, h = self.size
         return px <= x <= px + w and py <= y <= py + h
     
+    def reset_dwell(self):
+        self.dwell_time = 0.0
+        self.dwell_start = None
+
+    def progress_width(self):
+        """Largeur (px) de la barre de progression dwell, None si non survolé"""
+        if not self.hovered:
+            return None
+        return int(self.size[0] * min(1.0, self.dwell_time / self.dwell_threshold))
+
     def draw(self, frame):
         """Dessine le bouton sur l'image"""
+        self.draw_state(frame, self.progress_width())
+
+    def draw_state(self, frame, progress_w):
+        """Dessine le bouton dans un état donné (progress_w None : au repos)"""
         x, y = self.pos
         w, h = self.size
         
         # Couleur selon état
-        if self.hovered:
+        if progress_w is not None:
             color = (0, 255, 0)  # Vert si survolé
             thickness = 3
             # Barre de progression dwell
-            progress = min(1.0, self.dwell_time / self.dwell_threshold)
-            progress_w = int(w * progress)
             cv2.rectangle(frame, (x, y + h - 5), (x + progress_w, y + h), (0, 200, 0), -1)
         else:
             color = (200, 200, 200)  # Gris clair par défaut
             thickness = 2
-            self.dwell_time = 0
             
         # Cadre du bouton
         cv2.rectangle(frame, (x, y), (x + w, y + h), color, thickness)
         
         # Texte centré
         font = cv2.FONT_HERSHEY_SIMPLEX
-        text_size = cv2.getTextSize(self.text, font, 0.8, 2)[0]
-        text_x = x + (w - text_size[0]) // 2
-        text_y = y + (h + text_size[1]) // 2
-        cv2.putText(frame, self.text, (text_x, text_y), font, 0.8, (0, 0, 0), 2)
+        if self._text_pos is None:
+            text_size = cv2.getTextSize(self.text, font, 0.8, 2)[0]
+            self._text_pos = (x + (w - text_size[0]) // 2, y + (h + text_size[1]) // 2)
+        cv2.putText(frame, self.text, self._text_pos, font, 0.8, (0, 0, 0), 2)
+
+    def set_text(self, text):
+        """Change le libellé (touches de suggestion)"""
+        if text != self.text:
+            self.text = text
+            self._text_pos = None
+
+
+# Pages du clavier : lignes de touches carrées, puis une ligne de touches larges
+# (texte, décalage x depuis le bord gauche du clavier, largeur)
+LETTER_ROWS = {
+    "azerty": [
+        ["A", "Z", "E", "R", "T", "Y", "U", "I", "O", "P"],
+        ["Q", "S", "D", "F", "G", "H", "J", "K", "L", "M"],
+        ["W", "X", "C", "V", "B", "N", ",", ".", "?", "!"]
+    ],
+    "qwerty": [
+        ["Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P"],
+        ["A", "S", "D", "F", "G", "H", "J", "K", "L", ";"],
+        ["Z", "X", "C", "V", "B", "N", "M", ",", ".", "?"]
+    ],
+}
+NUMERIC_ROWS = [
+    ["1", "2", "3", "4", "5", "6", "7", "8", "9", "0"],
+    ["-", "/", ":", ";", "(", ")", "$", "&", "@", "\""],
+    [".", ",", "?", "!", "'", "+", "=", "*", "%", "_"]
+]
+SYMBOL_ROWS = [
+    ["[", "]", "{", "}", "#", "%", "^", "*", "+", "="],
+    ["_", "\\", "|", "~", "<", ">", "$", "&", "@", "\""],
+    [".", ",", "?", "!", "'", "`", ":", ";", "(", ")"]
+]
+LETTER_WIDE_KEYS = [("123", 0, 180), ("SPACE", 190, 400), ("SHIFT", 600, 150), ("⌫", 760, 150)]
+NUMERIC_WIDE_KEYS = [("ABC", 0, 180), ("SPACE", 190, 400), ("#+=", 600, 150), ("⌫", 760, 150)]
+SYMBOL_WIDE_KEYS = [("ABC", 0, 180), ("SPACE", 190, 400), ("123", 600, 150), ("⌫", 760, 150)]
+
+# Touches de changement de page ("ABC" : page lettres de la disposition choisie)
+PAGE_KEYS = {"123": "numeric", "#+=": "symbols", "ABC": None}
+
+# Liste "mot fréquence" (ou trie compilé) pour la prédiction ; absente : pas de suggestions
+DEFAULT_DICTIONARY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "dictionary", "words.txt"
+)
+# Barre de suggestions au-dessus du clavier : x de la première case, y, taille, pas
+SUGGESTION_SLOTS = 3
+SUGGESTION_ORIGIN = (280, 12)
+SUGGESTION_SIZE = (215, 48)
+SUGGESTION_STEP = 225
+# Swipe : mots les plus fréquents du dictionnaire gardés comme gabarits ; tracé plus court
+# qu'un tap (px) = frappe de la touche de départ
+SWIPE_MAX_WORDS = 50000
+SWIPE_TAP_PX = 40
+
+
+class KeyGrid:
+    """
+    Index spatial d'une page : la zone couverte est découpée en cellules de cell px,
+    chaque cellule listant les touches qui la recouvrent (au plus quelques-unes).
+    Le test d'un point ne regarde que sa cellule : O(1) quel que soit le nombre de touches.
+    """
+
+    DEFAULT_CELL = 32
+
+    def __init__(self, buttons, cell=DEFAULT_CELL):
+        self.cell = cell
+        max_x = max((b.pos[0] + b.size[0] for b in buttons), default=0)
+        max_y = max((b.pos[1] + b.size[1] for b in buttons), default=0)
+        self.cols = max_x // cell + 1
+        self.rows = max_y // cell + 1
+        cells = [[[] for _ in range(self.cols)] for _ in range(self.rows)]
+        for btn in buttons:
+            x, y = btn.pos
+            w, h = btn.size
+            # Bords inclus, comme Button.contains
+            for row in range(max(0, y // cell), (y + h) // cell + 1):
+                for col in range(max(0, x // cell), (x + w) // cell + 1):
+                    cells[row][col].append(btn)
+        self._cells = [[tuple(c) for c in row] for row in cells]
+
+    def hit(self, point):
+        """Touche contenant le point (pixels du canvas), None sinon"""
+        x, y = int(point[0]), int(point[1])
+        if x < 0 or y < 0:
+            return None
+        row, col = y // self.cell, x // self.cell
+        if row >= self.rows or col >= self.cols:
+            return None
+        for btn in self._cells[row][col]:
+            if btn.contains((x, y)):
+                return btn
+        return None
+
+
+class KeyboardLayout:
+    """Page de touches avec son index spatial et son rendu en cache, construits une fois"""
+
+    def __init__(self, name, buttons, cell=KeyGrid.DEFAULT_CELL, canvas_size=None):
+        self.name = name
+        self.buttons = buttons
+        self.grid = KeyGrid(buttons, cell)
+        self.canvas_size = canvas_size  # None : VirtualKeyboard.CANVAS_SIZE
+        # Rendu en cache (VirtualKeyboard.render) : fond seul, fond + touches au repos,
+        # canvas réutilisé et état dessiné de chaque touche
+        self.background = None
+        self.base = None
+        self.base_mode = None
+        self.canvas = None
+        self.drawn = {}  # Button → largeur de progression dessinée (None : au repos)
+
+    @classmethod
+    def from_rows(cls, name, rows, wide_keys=(), origin=(50, 100), key_size=(85, 85), gap=10):
+        """Lignes de touches carrées + une ligne de touches larges en dessous"""
+        start_x, start_y = origin
+        button_w, button_h = key_size
+        buttons = []
+        for row_idx, row in enumerate(rows):
+            for col_idx, key in enumerate(row):
+                x = start_x + col_idx * (button_w + gap)
+                y = start_y + row_idx * (button_h + gap)
+                buttons.append(Button((x, y), key, (button_w, button_h)))
+        wide_y = start_y + len(rows) * (button_h + gap)
+        for text, offset_x, width in wide_keys:
+            buttons.append(Button((start_x + offset_x, wide_y), text, (width, button_h)))
+        return cls(name, buttons)
+
+    @classmethod
+    def merge(cls, name, layouts, margin=10):
+        """Plusieurs claviers affichés ensemble (ex. lettres + pavé numérique), canvas ajusté"""
+        layout = cls(name, [btn for layout in layouts for btn in layout.buttons])
+        width, height = layout.size
+        layout.canvas_size = (width + margin, height + margin)
+        return layout
+
+    @property
+    def size(self):
+        """(largeur, hauteur) couverte par les touches"""
+        return (max(b.pos[0] + b.size[0] for b in self.buttons),
+                max(b.pos[1] + b.size[1] for b in self.buttons))
 
 
 class VirtualKeyboard:
-    def __init__(self, layout="azerty", mode="dwell"):
+    # Canvas de la fenêtre "Virtual Keyboard" (largeur, hauteur)
+    CANVAS_SIZE = (960, 480)
+    # Marge autour d'une touche couverte par son cadre le plus épais
+    KEY_MARGIN = 3
+    # Libellé de l'indicateur de mode (polices Hershey : ASCII seulement)
+    MODE_LABELS = {"dwell": "SURVOL", "pinch": "PINCH", "swipe": "TRACE"}
+
+    def __init__(self, layout="azerty", mode="dwell", dictionary=DEFAULT_DICTIONARY):
         """
         Args:
-            layout: "azerty" ou "qwerty"
-            mode: "dwell" (survol) ou "pinch" (Pouce+Index)
+            layout: "azerty" ou "qwerty" (page lettres ; pages "numeric" et "symbols" en plus)
+            mode: "dwell" (survol), "pinch" (Pouce+Index) ou "swipe" (tracé pincé, mot au relâché)
+            dictionary: liste de fréquences ou trie compilé pour les suggestions (None : aucune)
         """
         self.layout = layout
         self.mode = mode
         self.keyboard_controller = Controller()
-        self.buttons = []
-        self.last_typed = 0
-        
-        self._create_layout()
+        self.executor = None  # ActionExecutor : frappes envoyées hors du thread appelant
+        self.last_typed = float("-inf")
+        self.now = 0.0  # Horloge de frame de la dernière entrée (s) : anti-spam et dwell
+        self.shift = False  # Majuscule pour la prochaine lettre (touche SHIFT)
         
-    def _create_layout(self):
-        """Génère les touches du clavier"""
-        keys_azerty = [
-            ["A", "Z", "E", "R", "T", "Y", "U", "I", "O", "P"],
-            ["Q", "S", "D", "F", "G", "H", "J", "K", "L", "M"],
-            ["W", "X", "C", "V", "B", "N", ",", ".", "?", "!"]
-        ]
+        # Pages construites une fois (touches + index + rendu), puis simplement activées
+        self.layouts = {}
+        self.active = self._get_layout(layout)
+        self._hovered = None
         
-        keys_qwerty = [
-            ["Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P"],
-            ["A", "S", "D", "F", "G", "H", "J", "K", "L", ";"],
-            ["Z", "X", "C", "V", "B", "N", "M", ",", ".", "?"]
+        # Prédiction : suggestions affichées comme touches sélectionnables
+        self.suggestion_keys = [
+            Button((SUGGESTION_ORIGIN[0] + i * SUGGESTION_STEP, SUGGESTION_ORIGIN[1]), "", SUGGESTION_SIZE)
+            for i in range(SUGGESTION_SLOTS)
         ]
+        self._suggestion_grid = KeyGrid(self.suggestion_keys)
+        self.predictor = None
+        if dictionary and os.path.exists(dictionary):
+            self.predictor = PredictiveText(WordTrie.load(dictionary), SUGGESTION_SLOTS)
+            print(f"📖 Keyboard predictions: {len(self.predictor.trie)} words")
         
-        keys = keys_azerty if self.layout == "azerty" else keys_qwerty
-        
-        start_x = 50
-        start_y = 100
-        gap = 10
-        button_w, button_h = 85, 85
+        # Swipe : tracé en cours, décodeurs par page (None : en construction), dernier mot glissé
+        self._trace = None
+        self._decoders = {}
+        self._swiped_text = ""
+        if self.mode == "swipe":
+            self._swipe_decoder()  # Gabarits préparés en arrière-plan dès le démarrage
         
-        for row_idx, row in enumerate(keys):
-            for col_idx, key in enumerate(row):
-                x = start_x + col_idx * (button_w + gap)
-                y = start_y + row_idx * (button_h + gap)
-                btn = Button((x, y), key, (button_w, button_h))
-                self.buttons.append(btn)
-                
-        # Bouton ESPACE (large, en bas)
-        space_btn = Button((start_x + 2 * (button_w + gap), start_y + 3 * (button_h + gap)), "SPACE", (400, button_h))
-        self.buttons.append(space_btn)
-        
-        # Bouton BACKSPACE
-        back_btn = Button((start_x + 8 * (button_w + gap), start_y + 3 * (button_h + gap)), "⌫", (150, button_h))
-        self.buttons.append(back_btn)
+        self.draw_stats = StageStats()
+        self.keys_redrawn = 0
+    
+    @property
+    def buttons(self):
+        """Touches de la page active"""
+        return self.active.buttons
+    
+    def _get_layout(self, name):
+        layout = self.layouts.get(name)
+        if layout is None:
+            layout = self._create_layout(name)
+            self.layouts[name] = layout
+        return layout
+    
+    def _create_layout(self, name):
+        """Génère les touches d'une page"""
+        if name == "numeric":
+            return KeyboardLayout.from_rows(name, NUMERIC_ROWS, NUMERIC_WIDE_KEYS)
+        if name == "symbols":
+            return KeyboardLayout.from_rows(name, SYMBOL_ROWS, SYMBOL_WIDE_KEYS)
+        rows = LETTER_ROWS["azerty"] if name == "azerty" else LETTER_ROWS["qwerty"]
+        return KeyboardLayout.from_rows(name, rows, LETTER_WIDE_KEYS)
+    
+    def add_layout(self, layout):
+        """Enregistre une page personnalisée (ex. KeyboardLayout.merge de plusieurs claviers)"""
+        self.layouts[layout.name] = layout
+    
+    def set_layout(self, name):
+        """Active une page (construite au premier usage seulement)"""
+        layout = self._get_layout(name)
+        if self._hovered is not None:
+            self._hovered.hovered = False
+            self._hovered.reset_dwell()
+            self._hovered = None
+        self.active = layout
+        return layout.name
         
     def draw(self, frame):
         """Dessine le clavier complet sur l'image"""
-        # Fond semi-transparent (optionnel)
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (20, 70), (950, 450), (50, 50, 50), -1)
-        frame = cv2.addWeighted(overlay, 0.3, frame, 0.7, 0)
+        frame = self._draw_background(frame)
         
         # Dessiner toutes les touches
         for btn in self.buttons:
             btn.draw(frame)
-            
+        
+        return frame
+    
+    def _draw_background(self, frame):
+        """Fond semi-transparent + indicateur de mode"""
+        overlay = frame.copy()
+        h, w = frame.shape[:2]
+        cv2.rectangle(overlay, (20, 70), (w - 10, h - 30), (50, 50, 50), -1)
+        frame = cv2.addWeighted(overlay, 0.3, frame, 0.7, 0)
+        
         # Indicateur de mode
-        mode_text = f"Mode: {'SURVOL' if self.mode == 'dwell' else 'PINCH'}"
+        mode_text = f"Mode: {self.MODE_LABELS.get(self.mode, self.mode.upper())}"
         cv2.putText(frame, mode_text, (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        
         return frame
     
-    def check_input(self, index_pos, is_pinching=False):
+    def render(self):
+        """
+        Canvas du clavier (CANVAS_SIZE) pour la fenêtre dédiée, mis à jour de façon
+        incrémentale : seules les touches dont l'état (survol, progression dwell) a changé
+        depuis le dernier appel sont redessinées. Le canvas est réutilisé d'un appel à l'autre.
+        """
+        start = time.perf_counter()
+        layout = self.active  # Instantané : la page peut changer sur le thread d'interprétation
+        if layout.base is None or layout.base_mode != self.mode:
+            self._build_base(layout)
+        
+        canvas = layout.canvas
+        for btn in layout.buttons:
+            progress_w = btn.progress_width()
+            if layout.drawn.get(btn) == progress_w:
+                continue
+            roi = self._key_roi(btn)
+            if progress_w is None:
+                canvas[roi] = layout.base[roi]  # Touche au repos : déjà rendue dans la base
+            else:
+                canvas[roi] = layout.background[roi]
+                btn.draw_state(canvas, progress_w)
+            layout.drawn[btn] = progress_w
+            self.keys_redrawn += 1
+        
+        # Suggestions : libellé variable, jamais dans la base ; case vide = fond seul
+        if self.predictor is not None:
+            for btn in self.suggestion_keys:
+                state = (btn.progress_width(), btn.text)
+                if layout.drawn.get(btn) == state:
+                    continue
+                roi = self._key_roi(btn)
+                canvas[roi] = layout.background[roi]
+                if btn.text:
+                    btn.draw_state(canvas, state[0])
+                layout.drawn[btn] = state
+                self.keys_redrawn += 1
+        
+        self.draw_stats.record((time.perf_counter() - start) * 1000)
+        return canvas
+    
+    def _key_roi(self, btn):
+        """Zone du canvas couverte par une touche, cadre épais compris"""
+        x, y = btn.pos
+        w, h = btn.size
+        margin = self.KEY_MARGIN
+        return (slice(max(0, y - margin), y + h + margin + 1), slice(max(0, x - margin), x + w + margin + 1))
+    
+    def _build_base(self, layout):
+        """Pré-rend le fond et toutes les touches au repos d'une page (ou mode modifié)"""
+        w, h = layout.canvas_size or self.CANVAS_SIZE
+        layout.background = self._draw_background(np.zeros((h, w, 3), dtype=np.uint8))
+        layout.base = layout.background.copy()
+        for btn in layout.buttons:
+            btn.draw_state(layout.base, None)
+        layout.canvas = layout.base.copy()
+        layout.base_mode = self.mode
+        layout.drawn = {btn: None for btn in layout.buttons}
+    
+    def get_draw_stats(self) -> dict:
+        """Temps de rendu du canvas par frame (ms) et nombre de touches redessinées"""
+        stats = self.draw_stats.to_dict()
+        stats["keys_redrawn"] = self.keys_redrawn
+        return stats
+    
+    def check_input(self, index_pos, is_pinching=False, timestamp=None):
         """
         Vérifie l'interaction avec le clavier.
         
         Args:
             index_pos: (x, y) position de l'index (ou bout du doigt)
             is_pinching: True si geste PINCH détecté
+            timestamp: instant de capture de la frame (s, monotone) ; à défaut, l'horloge
+                monotone du système
         """
         if index_pos is None:
             return
+        self.now = timestamp if timestamp is not None else time.monotonic()
             
         # Empêcher spam (0.3s minimum entre frappes)
-        if time.time() - self.last_typed < 0.3:
+        if self.now - self.last_typed < 0.3:
             return
             
-        for btn in self.buttons:
-            if btn.contains(index_pos):
+        # Touche sous le doigt via l'index spatial (O(1)) ; seule l'ancienne touche survolée
+        # est remise au repos
+        btn = self._hit(index_pos)
+        previous = self._hovered
+        if previous is not None and previous is not btn:
+            previous.hovered = False
+            previous.reset_dwell()
+        self._hovered = btn
+        if self.mode == "swipe":
+            if btn is not None:
                 btn.hovered = True
+            self._swipe(index_pos, is_pinching)
+            return
+        if btn is None:
+            return
+        btn.hovered = True
+        
+        # Mode DWELL: Attendre survol prolongé
+        if self.mode == "dwell":
+            if btn.dwell_start is None:
+                btn.dwell_start = self.now
+            btn.dwell_time = self.now - btn.dwell_start
+            if btn.dwell_time >= btn.dwell_threshold:
+                btn.reset_dwell()
+                self._press(btn)
                 
-                # Mode DWELL: Attendre survol prolongé
-                if self.mode == "dwell":
-                    btn.dwell_time += 1
-                    if btn.dwell_time >= btn.dwell_threshold:
-                        self._type_key(btn.text)
-                        btn.dwell_time = 0
-                        
-                # Mode PINCH: Clic immédiat
-                elif self.mode == "pinch" and is_pinching:
-                    self._type_key(btn.text)
-            else:
-                btn.hovered = False
+        # Mode PINCH: Clic immédiat
+        elif self.mode == "pinch" and is_pinching:
+            self._press(btn)
+    
+    def _hit(self, pos):
+        """Touche de la page active ou suggestion (non vide) sous le point"""
+        btn = self.active.grid.hit(pos)
+        if btn is None and self.predictor is not None:
+            btn = self._suggestion_grid.hit(pos)
+            if btn is not None and not btn.text:
+                btn = None  # Case de suggestion vide
+        return btn
+    
+    def _swipe(self, pos, is_pinching):
+        """Pincé : le tracé s'allonge ; relâché : tap (tracé court) ou décodage du mot"""
+        if is_pinching:
+            if self._trace is None:
+                self._trace = []
+            self._trace.append(pos)
+            return
+        trace, self._trace = self._trace, None
+        if not trace:
+            return
+        if path_length(trace) < SWIPE_TAP_PX:
+            btn = self._hit(trace[0])
+            if btn is not None:
+                self._press(btn)
+            return
+        decoder = self._swipe_decoder()
+        words = decoder.decode(trace, SUGGESTION_SLOTS + 1) if decoder is not None else []
+        if words:
+            self._type_swiped(words)
+    
+    def _swipe_decoder(self):
+        """Décodeur de la page active ; construit en arrière-plan au premier appel (None d'ici là)"""
+        layout = self.active
+        if self.predictor is None:
+            return None
+        if layout.name not in self._decoders:
+            self._decoders[layout.name] = None
+            threading.Thread(target=self._build_decoder, args=(layout,),
+                             name="swipe-templates", daemon=True).start()
+        return self._decoders[layout.name]
+    
+    def _build_decoder(self, layout):
+        centers = key_centers(layout.buttons)
+        if not centers:
+            return  # Page sans lettres : pas de swipe
+        decoder = SwipeDecoder.from_trie(self.predictor.trie, centers, SWIPE_MAX_WORDS)
+        self._decoders[layout.name] = decoder
+        print(f"〰️ Swipe templates ready ({layout.name}): {len(decoder)} words")
+    
+    def _type_swiped(self, words):
+        """Tape le meilleur mot glissé ; les suivants deviennent suggestions (remplacement)"""
+        self.last_typed = self.now
+        text = words[0] + " "
+        if self.shift:
+            text = text[0].upper() + text[1:]
+            self.shift = False
+        
+        if self.executor is not None:
+            self.executor.submit("key", self._send_text, text)
+        else:
+            self._send_text(text)
+        
+        self.predictor.reset()
+        self._swiped_text = text
+        self._show_suggestions(words[1:])
+    
+    def _press(self, btn):
+        """Touche validée : suggestion, changement de page, modificateur ou frappe"""
+        key = btn.text
+        if btn in self.suggestion_keys:
+            self._accept_suggestion(key)
+        elif key in PAGE_KEYS:
+            self.last_typed = self.now
+            self.set_layout(PAGE_KEYS[key] or self.layout)
+        elif key == "SHIFT":
+            self.last_typed = self.now
+            self.shift = not self.shift
+        else:
+            self._type_key(key)
                 
     def _type_key(self, key):
         """Simule la frappe d'une touche"""
-        self.last_typed = time.time()
+        self.last_typed = self.now
+        shift, self.shift = self.shift, False
+        self._swiped_text = ""
+        
+        if self.executor is not None:
+            self.executor.submit("key", self._send_key, key, shift)
+        else:
+            self._send_key(key, shift)
         
+        if self.predictor is not None:
+            if key == "⌫":
+                self.predictor.backspace()
+            elif key == "SPACE":
+                self.predictor.reset()
+            else:
+                self.predictor.feed(key)
+            self._show_suggestions()
+    
+    def _accept_suggestion(self, word):
+        """Complète le mot en cours avec la suggestion choisie, suivie d'un espace"""
+        self.last_typed = self.now
+        self.shift = False
+        if self._swiped_text:
+            # Alternative au mot glissé : il est effacé puis remplacé
+            text = "\b" * len(self._swiped_text) + word + " "
+            self._swiped_text = ""
+        else:
+            text = self.predictor.completion(word)
+        
+        if self.executor is not None:
+            self.executor.submit("key", self._send_text, text)
+        else:
+            self._send_text(text)
+        
+        self.predictor.reset()
+        self._show_suggestions()
+    
+    def _show_suggestions(self, words=None):
+        if words is None:
+            words = self.predictor.suggestions
+        for i, btn in enumerate(self.suggestion_keys):
+            btn.set_text(words[i] if i < len(words) else "")
+    
+    def _send_key(self, key, shift=False):
+        """Appel OS (pynput) de la frappe"""
         if key == "SPACE":
             self.keyboard_controller.press(' ')
             self.keyboard_controller.release(' ')
@@ -165,12 +563,21 @@ class VirtualKeyboard:
             self.keyboard_controller.press('\b')
             self.keyboard_controller.release('\b')
         else:
-            self.keyboard_controller.press(key.lower())
-            self.keyboard_controller.release(key.lower())
+            char = key.upper() if shift else key.lower()
+            self.keyboard_controller.press(char)
+            self.keyboard_controller.release(char)
             
         print(f"⌨️ Typed: {key}")
+    
+    def _send_text(self, text):
+        """Appel OS (pynput) d'une suite de caractères ('\\b' : retour arrière)"""
+        for char in text:
+            self.keyboard_controller.press(char)
+            self.keyboard_controller.release(char)
+        
+        print(f"⌨️ Typed: {text!r}")
 
-    def process(self, landmarks, gesture_name, frame_shape):
+    def process(self, landmarks, gesture_name, frame_shape, timestamp=None):
         """
         Main processing loop for the keyboard.
         Calculates index position and delegates to check_input.
@@ -187,5 +594,5 @@ class VirtualKeyboard:
         # PINCH detection
         is_pinching = (gesture_name == "PINCH")
         
-        self.check_input(index_pos_px, is_pinching)
+        self.check_input(index_pos_px, is_pinching, timestamp)
         return True
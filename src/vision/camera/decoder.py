@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+FrameDecoder - Décodage des buffers bruts caméra (MJPG / YUYV)
+Responsabilité unique : Produire l'image d'affichage (BGR) et l'image d'inférence (RGB réduite)
+directement depuis le buffer brut, sans la chaîne flip → resize → cvtColor en pleine résolution
+"""
+from typing import Optional, Tuple
+import cv2
+import numpy as np
+
+from src.vision.preprocessing.frame_preprocessor import FramePreprocessor
+
+
+# Facteurs de réduction supportés par libjpeg au décodage (échelle DCT)
+_JPEG_REDUCED_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+
+class FrameDecoder:
+    """Décode un buffer brut vers (frame BGR d'affichage, image RGB d'inférence)"""
+
+    def __init__(
+        self,
+        pixel_format: str,
+        frame_size: Tuple[int, int] = (640, 480),
+        inference_size: Tuple[int, int] = (320, 240),
+        display_buffers: int = 1
+    ):
+        self.pixel_format = pixel_format
+        self.frame_size = frame_size
+        self.inference_size = inference_size
+        self.preprocessor = FramePreprocessor(inference_size, display_buffers)
+        self._yuyv_rgb = None  # Buffer de conversion YUYV → RGB réutilisé
+
+    def decode(
+        self,
+        raw: np.ndarray,
+        need_display: bool = True,
+        flip: bool = True,
+        mirror_landmarks: bool = False
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Décode un buffer caméra.
+
+        Args:
+            raw: Buffer brut (JPEG 1-D, YUYV packé) ou frame BGR déjà décodée
+            need_display: Si False, l'image pleine résolution n'est pas produite
+            flip: Effet miroir horizontal (vue selfie)
+            mirror_landmarks: L'image d'inférence reste non miroir ; l'appelant applique
+                le miroir aux landmarks (mirror_result) au lieu de retourner les pixels
+
+        Returns:
+            (display_bgr ou None, inference_rgb) - (None, None) si le buffer est invalide
+        """
+        if raw is None or raw.size == 0:
+            return None, None
+        flip_inference = flip and not mirror_landmarks
+
+        # Backend qui ignore CAP_PROP_CONVERT_RGB : frame BGR déjà décodée
+        if raw.ndim == 3 and raw.shape[2] == 3:
+            return self._from_bgr(raw, need_display, flip, flip_inference)
+
+        if self.pixel_format == "MJPG":
+            return self._decode_mjpg(raw, need_display, flip, flip_inference)
+        if self.pixel_format == "YUYV":
+            return self._decode_yuyv(raw, need_display, flip, flip_inference)
+        return None, None
+
+    def _from_bgr(self, bgr: np.ndarray, need_display: bool, flip: bool, flip_inference: bool):
+        """Frame BGR pleine résolution : affichage miroir + inférence depuis la source"""
+        display = None
+        if need_display:
+            display = self.preprocessor.mirror_display(bgr) if flip else bgr
+        return display, self.preprocessor.to_inference(bgr, flip_inference)
+
+    def _reduced_flag(self) -> Tuple[int, int]:
+        """Plus grand facteur de réduction JPEG qui reste >= résolution d'inférence"""
+        fw, fh = self.frame_size
+        iw, ih = self.inference_size
+        for factor, flag in _JPEG_REDUCED_FLAGS:
+            if fw // factor >= iw and fh // factor >= ih:
+                return factor, flag
+        return 1, cv2.IMREAD_COLOR
+
+    def _decode_mjpg(self, raw: np.ndarray, need_display: bool, flip: bool, flip_inference: bool):
+        """MJPG : décodage réduit par libjpeg quand l'affichage n'est pas requis"""
+        if need_display:
+            bgr = cv2.imdecode(raw, cv2.IMREAD_COLOR)
+            if bgr is None:
+                return None, None
+            return self._from_bgr(bgr, True, flip, flip_inference)
+
+        _, flag = self._reduced_flag()
+        small = cv2.imdecode(raw, flag)
+        if small is None:
+            return None, None
+        return None, self.preprocessor.to_inference(small, flip_inference)
+
+    def _decode_yuyv(self, raw: np.ndarray, need_display: bool, flip: bool, flip_inference: bool):
+        """YUYV : conversion directe vers RGB, une ligne sur deux, sans passer par BGR"""
+        w, h = self.frame_size
+        if raw.size != w * h * 2:
+            return None, None
+        packed = raw.reshape(h, w, 2)
+
+        if need_display:
+            bgr = cv2.cvtColor(packed, cv2.COLOR_YUV2BGR_YUYV)
+            return self._from_bgr(bgr, True, flip, flip_inference)
+
+        # Réduction verticale gratuite : on ne convertit qu'une ligne sur deux
+        # (vue numpy à pas de ligne, aucune copie), directement en RGB
+        if h >= 2 * self.inference_size[1]:
+            packed = packed[::2]
+        if self._yuyv_rgb is None or self._yuyv_rgb.shape[:2] != packed.shape[:2]:
+            self._yuyv_rgb = np.empty(packed.shape[:2] + (3,), dtype=np.uint8)
+        rgb = cv2.cvtColor(packed, cv2.COLOR_YUV2RGB_YUYV, dst=self._yuyv_rgb)
+        return None, self.preprocessor.to_inference(rgb, flip_inference, is_rgb=True)
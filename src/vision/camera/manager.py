@@ -3,25 +3,41 @@
 CameraManager - Gestion du cycle de vie de la caméra
 Responsabilité unique : Ouverture, lecture, configuration et fermeture de la caméra
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import cv2
 import numpy as np
 
+from src.vision.camera.decoder import FrameDecoder
+
 
 class CameraManager:
     """Gère le cycle de vie de la caméra avec auto-détection"""
     
+    # Au-delà de ce débit (pixels/s), le YUYV non compressé sature l'USB 2.0 sur la
+    # plupart des webcams, qui baissent alors silencieusement leur fréquence : on passe en MJPG
+    YUYV_MAX_PIXEL_RATE = 640 * 480 * 15
+    
     def __init__(
         self, 
         indices: List[int] = None,
         backend: int = cv2.CAP_V4L2,
         target_fps: int = 30,
-        resolution: tuple = (640, 480)
+        resolution: tuple = (640, 480),
+        pixel_format: str = "auto",
+        inference_size: Tuple[int, int] = (320, 240),
+        fast_decode: bool = True,
+        display_buffers: int = 1
     ):
         self.indices = indices or [0, 1]
         self.backend = backend
         self.target_fps = target_fps
         self.resolution = resolution
+        self.requested_format = pixel_format.upper()  # AUTO, MJPG, YUYV
+        self.pixel_format = None  # Format effectivement négocié
+        self.inference_size = inference_size
+        self.fast_decode = fast_decode
+        self.display_buffers = display_buffers  # Frames d'affichage pouvant rester en vol
+        self.decoder: Optional[FrameDecoder] = None
         self.cap: Optional[cv2.VideoCapture] = None
         self._is_opened = False
         self._current_index = -1
@@ -58,21 +74,91 @@ class CameraManager:
         """Configure les paramètres optimaux de la caméra"""
         if self.cap is None:
             return
+        # Le FOURCC doit être posé avant la taille/fps (V4L2 renégocie le mode)
+        self._negotiate_format()
         self.cap.set(cv2.CAP_PROP_FPS, self.target_fps)
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
         self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Réduit la latence
+        
+        # Résolution réellement obtenue (le pilote peut arrondir)
+        width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or self.resolution[0]
+        height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or self.resolution[1]
+        
+        # Buffers bruts (JPEG / YUYV) : le décodage est fait par FrameDecoder
+        if self.fast_decode and self.pixel_format in ("MJPG", "YUYV"):
+            if not self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 0):
+                print("⚠️ Raw capture not supported by backend, using BGR frames")
+        self.decoder = FrameDecoder(
+            self.pixel_format, (width, height), self.inference_size, self.display_buffers
+        )
+        print(f"🎞️ Pixel format: {self.pixel_format} @ {width}x{height} {self.target_fps}fps")
+    
+    def _preferred_format(self) -> str:
+        """Choisit MJPG ou YUYV selon la résolution et la fréquence demandées"""
+        if self.requested_format in ("MJPG", "YUYV"):
+            return self.requested_format
+        width, height = self.resolution
+        pixel_rate = width * height * self.target_fps
+        return "MJPG" if pixel_rate > self.YUYV_MAX_PIXEL_RATE else "YUYV"
+    
+    def _negotiate_format(self):
+        """Tente le format préféré puis l'autre ; garde celui que le pilote accepte"""
+        preferred = self._preferred_format()
+        fallback = "YUYV" if preferred == "MJPG" else "MJPG"
+        for fourcc in (preferred, fallback):
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+            if self._current_fourcc() == fourcc:
+                self.pixel_format = fourcc
+                return
+        self.pixel_format = self._current_fourcc()
+        print(f"⚠️ FOURCC negotiation failed, camera stays in {self.pixel_format}")
+    
+    def _current_fourcc(self) -> str:
+        """FOURCC actif du périphérique sous forme de chaîne"""
+        code = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+        return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
     
     def read(self, flip: bool = True) -> Optional[np.ndarray]:
         """Lit une frame, optionnellement flippée horizontalement"""
-        if not self._is_opened or self.cap is None:
-            return None
+        display, _ = self.read_frames(need_display=True, flip=flip)
+        return display
+    
+    def read_frames(
+        self,
+        need_display: bool = True,
+        flip: bool = True,
+        mirror_landmarks: bool = False
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Lit une frame et produit directement l'image d'inférence RGB réduite.
         
-        ret, frame = self.cap.read()
-        if not ret:
-            return None
+        Avec mirror_landmarks=True, l'image d'inférence n'est pas retournée : le miroir
+        est appliqué aux résultats (voir mirror_result).
+        
+        Returns:
+            (frame BGR d'affichage ou None si need_display=False, image RGB d'inférence)
+        """
+        raw = self.read_raw()
+        if raw is None:
+            return None, None
         
-        return cv2.flip(frame, 1) if flip else frame
+        return self.decoder.decode(
+            raw, need_display=need_display, flip=flip, mirror_landmarks=mirror_landmarks
+        )
+    
+    def read_raw(self) -> Optional[np.ndarray]:
+        """Lit le buffer brut (décodé ensuite par self.decoder), None en cas d'échec"""
+        if not self._is_opened or self.cap is None:
+            return None
+        ret, raw = self.cap.read()
+        return raw if ret else None
+    
+    def grab(self) -> bool:
+        """Récupère une frame sans la décoder (vidage du buffer)"""
+        if not self._is_opened or self.cap is None:
+            return False
+        return self.cap.grab()
     
     def release(self):
         """Libère les ressources de la caméra"""
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+FramePreprocessor - Préparation de l'image d'inférence en un minimum de passes
+Responsabilité unique : Miroir + redimensionnement + conversion RGB dans des buffers préalloués
+"""
+from typing import Tuple
+import cv2
+import numpy as np
+
+
+class FramePreprocessor:
+    """
+    Produit l'image RGB d'inférence (miroir, réduite) sans allocation par frame.
+    
+    - Réduction en cv2.resize vers un buffer de destination (seule passe sur la frame source)
+    - Miroir + BGR → RGB fusionnés en une passe : inverser l'ordre des octets d'une ligne
+      BGR inverse à la fois l'ordre des pixels et celui des canaux (cv2.flip sur une vue 2D)
+    
+    Les tableaux retournés sont réutilisés à la frame suivante : l'appelant doit les
+    consommer (mp.Image copie les données) avant le prochain appel. Les frames d'affichage
+    tournent sur display_buffers buffers, pour celles qui restent en vol dans le pipeline.
+    """
+    
+    def __init__(self, inference_size: Tuple[int, int] = (320, 240), display_buffers: int = 1):
+        self.inference_size = inference_size
+        iw, ih = inference_size
+        self._scaled = np.empty((ih, iw, 3), dtype=np.uint8)
+        self._rgb = np.empty((ih, iw, 3), dtype=np.uint8)
+        self._display = [None] * max(1, display_buffers)
+        self._display_index = 0
+    
+    def to_inference(self, src: np.ndarray, flip: bool = True, is_rgb: bool = False) -> np.ndarray:
+        """
+        Image d'inférence RGB depuis une frame (BGR par défaut) de taille quelconque.
+        
+        Args:
+            src: Frame source, non miroir
+            flip: Applique l'effet miroir horizontal
+            is_rgb: La source est déjà en RGB (pas de conversion couleur)
+        """
+        h, w = src.shape[:2]
+        if (w, h) == self.inference_size:
+            scaled = src
+        else:
+            scaled = cv2.resize(src, self.inference_size, dst=self._scaled)
+        
+        iw, ih = self.inference_size
+        if is_rgb:
+            return cv2.flip(scaled, 1, dst=self._rgb) if flip else scaled
+        if flip:
+            # Vue (h, w*3) : le flip horizontal inverse pixels ET canaux (BGR → RGB)
+            rows = np.ascontiguousarray(scaled).reshape(ih, iw * 3)
+            cv2.flip(rows, 1, dst=self._rgb.reshape(ih, iw * 3))
+            return self._rgb
+        return cv2.cvtColor(scaled, cv2.COLOR_BGR2RGB, dst=self._rgb)
+    
+    def mirror_display(self, frame: np.ndarray) -> np.ndarray:
+        """Frame d'affichage miroir, écrite dans le prochain buffer de l'anneau"""
+        i = self._display_index
+        self._display_index = (i + 1) % len(self._display)
+        if self._display[i] is None or self._display[i].shape != frame.shape:
+            self._display[i] = np.empty_like(frame)
+        return cv2.flip(frame, 1, dst=self._display[i])
+
+
+def mirror_result(result):
+    """
+    Miroir mathématique d'un HandLandmarkerResult (en place) : remplace le flip des pixels
+    quand l'inférence est faite sur l'image non miroir.
+    
+    x normalisé → 1 - x, x monde → -x, latéralité Left ↔ Right.
+    """
+    if result is None:
+        return result
+    for hand in result.hand_landmarks or []:
+        for lm in hand:
+            lm.x = 1.0 - lm.x
+    for hand in result.hand_world_landmarks or []:
+        for lm in hand:
+            lm.x = -lm.x
+    for categories in result.handedness or []:
+        for category in categories:
+            if category.category_name == "Left":
+                category.category_name = "Right"
+            elif category.category_name == "Right":
+                category.category_name = "Left"
+            if getattr(category, 'display_name', None) in ("Left", "Right"):
+                category.display_name = category.category_name
+    return result
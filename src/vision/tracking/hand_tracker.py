@@ -4,6 +4,7 @@ HandTracker - Wrapper MediaPipe avec gestion GPU/CPU automatique
 Responsabilité unique : Détection des mains via MediaPipe
 """
 from typing import Optional, Callable
+import cv2
 import mediapipe as mp
 from mediapipe.tasks import python
 from mediapipe.tasks.python import vision
@@ -32,6 +33,7 @@ class HandTracker:
         self.landmarker: Optional[vision.HandLandmarker] = None
         self.using_gpu = False
         self._options = None
+        self._rgb_buffer: Optional[np.ndarray] = None  # Conversion BGR → RGB réutilisée
     
     def initialize(self) -> bool:
         """Initialise MediaPipe avec fallback CPU si GPU échoue"""
@@ -79,14 +81,19 @@ class HandTracker:
             print(f"❌ CPU init failed: {e}")
             return False
     
-    def detect(self, frame: np.ndarray, timestamp_ms: int):
+    def detect(self, frame: np.ndarray, timestamp_ms: int, is_rgb: bool = False):
         """Détecte les mains de manière asynchrone"""
         if self.landmarker is None:
             return
         
-        # Convertit BGR → RGB si nécessaire
-        if len(frame.shape) == 3 and frame.shape[2] == 3:
-            frame_rgb = frame[:, :, ::-1]  # BGR to RGB (view, no copy)
+        if is_rgb:
+            # Image déjà produite en RGB contigu par le décodeur caméra
+            frame_rgb = frame
+        elif len(frame.shape) == 3 and frame.shape[2] == 3:
+            # Convertit BGR → RGB dans un buffer réutilisé (mp.Image copie les données)
+            if self._rgb_buffer is None or self._rgb_buffer.shape != frame.shape:
+                self._rgb_buffer = np.empty_like(frame)
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
         else:
             frame_rgb = frame
             
@@ -1,6 +1,9 @@
 import sys
 from unittest.mock import MagicMock
 
+import numpy as np
+import pytest
+
 # Mock des dépendances GUI/Hardware pour le CI (Headless)
 mock_pyautogui = MagicMock()
 mock_pyautogui.size.return_value = (1920, 1080)
@@ -20,3 +23,92 @@ sys.modules["uinput"] = mock_uinput
 
 # Mock cv2 pour éviter les dépendances système GTK/QT dans le CI
 sys.modules["cv2"] = MagicMock()
+
+
+class NumpyCV2:
+    """
+    Sous-ensemble de cv2 en numpy (cv2 est un MagicMock dans les tests) : flip, resize au
+    plus proche, conversions BGR ↔ RGB et YUYV à chrominance neutre, codec JPEG factice.
+    """
+
+    IMREAD_COLOR = 1
+    IMREAD_REDUCED_COLOR_2 = 17
+    IMREAD_REDUCED_COLOR_4 = 33
+    IMREAD_REDUCED_COLOR_8 = 65
+    COLOR_BGR2RGB = 4
+    COLOR_YUV2RGB_YUYV = 115
+    COLOR_YUV2BGR_YUYV = 116
+    CAP_V4L2 = 200
+    CAP_GSTREAMER = 1800
+    CAP_PROP_FRAME_WIDTH = 3
+    CAP_PROP_FRAME_HEIGHT = 4
+    CAP_PROP_FPS = 5
+    CAP_PROP_FOURCC = 6
+    CAP_PROP_CONVERT_RGB = 16
+    CAP_PROP_BUFFERSIZE = 38
+
+    _REDUCTION = {IMREAD_COLOR: 1, IMREAD_REDUCED_COLOR_2: 2, IMREAD_REDUCED_COLOR_4: 4, IMREAD_REDUCED_COLOR_8: 8}
+
+    def __init__(self):
+        self.jpegs = {}  # Octets « JPEG » → image BGR encodée
+        self.decode_flags = []
+        self.color_codes = []
+        self.VideoCapture = None  # (index, backend) → capture factice, posé par le test
+
+    @staticmethod
+    def _out(result, dst):
+        if dst is None:
+            return np.ascontiguousarray(result)
+        dst[...] = result
+        return dst
+
+    def flip(self, src, code, dst=None):
+        assert code == 1  # Seul le miroir horizontal est utilisé
+        return self._out(src[:, ::-1], dst)
+
+    def resize(self, src, size, dst=None):
+        w, h = size
+        ys = np.arange(h) * src.shape[0] // h
+        xs = np.arange(w) * src.shape[1] // w
+        return self._out(src[ys][:, xs], dst)
+
+    def cvtColor(self, src, code, dst=None):
+        self.color_codes.append(code)
+        if code == self.COLOR_BGR2RGB:
+            return self._out(src[..., ::-1], dst)
+        assert (src[..., 1] == 128).all()  # U et V neutres : le pixel vaut sa luminance
+        return self._out(np.repeat(src[..., :1], 3, axis=2), dst)
+
+    def VideoWriter_fourcc(self, *chars):
+        return sum(ord(c) << (8 * i) for i, c in enumerate(chars))
+
+    def encode_jpeg(self, bgr):
+        """Buffer MJPG synthétique (1-D uint8) que imdecode sait relire"""
+        data = b"JPEG%d" % len(self.jpegs)
+        self.jpegs[data] = bgr.copy()
+        return np.frombuffer(data, dtype=np.uint8)
+
+    def imdecode(self, buf, flag):
+        self.decode_flags.append(flag)
+        image = self.jpegs.get(bytes(buf))
+        if image is None:
+            return None  # Buffer corrompu
+        factor = self._REDUCTION[flag]  # Décodage réduit (échelle DCT)
+        return image[::factor, ::factor].copy()
+
+
+@pytest.fixture
+def numpy_cv2(monkeypatch):
+    """Remplace cv2 par NumpyCV2 dans la chaîne caméra → prétraitement"""
+    from src.vision.camera import decoder, manager
+    from src.vision.preprocessing import frame_preprocessor
+
+    fake = NumpyCV2()
+    for module in (decoder, manager, frame_preprocessor):
+        monkeypatch.setattr(module, "cv2", fake)
+    monkeypatch.setattr(decoder, "_JPEG_REDUCED_FLAGS", (
+        (8, fake.IMREAD_REDUCED_COLOR_8),
+        (4, fake.IMREAD_REDUCED_COLOR_4),
+        (2, fake.IMREAD_REDUCED_COLOR_2),
+    ))
+    return fake
@@ -0,0 +1,70 @@
+import pytest
+
+from src.action_dispatcher import ActionDispatcher, ActionType, GestureTiming
+
+
+def test_compiled_table_matches_bindings():
+    """Chaque liaison par défaut est retrouvée par la table compilée ; le reste donne NONE."""
+    dispatcher = ActionDispatcher()
+    slots = {timing.value: i for i, timing in enumerate(GestureTiming)}
+    for (mode, gesture, timing), action in dispatcher._build_action_table().items():
+        assert dispatcher.table.lookup(mode, gesture, slots[timing]) == action
+        assert dispatcher.table.lookup(mode.upper(), gesture.lower(), slots[timing]) == action
+    assert dispatcher.table.lookup("cursor", "THUMBS_UP", 0) == ActionType.NONE
+    assert dispatcher.table.lookup("keyboard", "PINCH", 0) == ActionType.NONE
+    assert dispatcher.get_motion_action("media", "SWIPE_RIGHT") == ActionType.NEXT_TRACK
+    assert dispatcher.get_action_info(ActionType.COPY) is dispatcher.get_action_info(ActionType.COPY)
+
+
+def test_set_bindings_swaps_whole_table():
+    """Liaisons invalides : ValueError, table active intacte ; valides : remplacement complet."""
+    dispatcher = ActionDispatcher()
+    before = dispatcher.table
+    with pytest.raises(ValueError):
+        dispatcher.set_bindings({("cursor", "PINCH", "quick"): "launch_rockets"})
+    with pytest.raises(ValueError):
+        dispatcher.set_bindings({("desktop", "PINCH", "quick"): "copy"})
+    assert dispatcher.table is before
+
+    dispatcher.set_bindings({("Cursor", "pinch", "QUICK"): "copy"})
+    assert dispatcher.get_action("cursor", "PINCH", timestamp=0.0) == ActionType.COPY
+    assert dispatcher.get_action("cursor", "POINTING", timestamp=0.1) == ActionType.NONE
+    assert dispatcher.table.bindings == {("cursor", "PINCH", "quick"): ActionType.COPY}
+
+
+def test_bindings_file_hot_reload(tmp_path):
+    """Fichier modifié → table et zones remplacées ; fichier invalide → ancienne config conservée."""
+    import os
+
+    from src.context_mode import ContextMode, ContextModeDetector
+    from src.control.actions.bindings import BindingsWatcher
+
+    dispatcher, detector = ActionDispatcher(), ContextModeDetector()
+    path = tmp_path / "bindings.yaml"
+    watcher = BindingsWatcher(dispatcher, detector, path=str(path))
+    assert not watcher.check()  # Pas de fichier : liaisons du code
+
+    path.write_text("bindings:\n  cursor:\n    FIST: copy\n    PINCH: {quick: none}\n"
+                    "zones:\n  media_zone_top: 0.4\n", encoding="utf-8")
+    assert watcher.check() and not watcher.check()  # Rechargé une seule fois
+    assert dispatcher.get_action("cursor", "FIST", timestamp=0.0) == ActionType.COPY
+    assert dispatcher.table.lookup("cursor", "PINCH", 0) == ActionType.NONE
+    assert dispatcher.table.lookup("cursor", "POINTING", 0) == ActionType.MOVE_CURSOR  # Hérité
+    assert detector.detect_mode((0.5, 0.3), timestamp=0.0) == ContextMode.MEDIA
+
+    table = dispatcher.table
+    path.write_text("bindings:\n  cursor:\n    FIST: explode\n  desk: {}\nzones:\n  media_zone_top: 2\n",
+                    encoding="utf-8")
+    os.utime(path, ns=(1, 1))  # Date différente même si l'écriture tombe dans la même tick
+    assert not watcher.check()
+    assert dispatcher.table is table and watcher.failures == 1
+    assert all(word in watcher.last_error for word in ("explode", "desk", "media_zone_top"))
+
+    json_path = tmp_path / "bindings.json"
+    json_path.write_text('{"inherit_defaults": false, "bindings": {"media": {"PUSH": {"motion": "mute"}}}}',
+                         encoding="utf-8")
+    watcher.path = str(json_path)
+    assert watcher.check() and len(dispatcher.table) == 1
+    assert dispatcher.get_motion_action("media", "PUSH") == ActionType.MUTE
+    assert detector.zones.media_zone_top == ContextModeDetector.MEDIA_ZONE_TOP
+    assert watcher.get_stats()["reloads"] == 2
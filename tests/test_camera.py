@@ -0,0 +1,129 @@
+import numpy as np
+
+from src.vision.camera.decoder import FrameDecoder
+from src.vision.camera.manager import CameraManager
+
+
+class FakeCapture:
+    """cv2.VideoCapture factice : n'accepte que certains FOURCC, read() livre des buffers bruts"""
+
+    def __init__(self, cv2, accepted, current, frames=()):
+        self.cv2 = cv2
+        self.accepted = {cv2.VideoWriter_fourcc(*fourcc) for fourcc in accepted}
+        self.props = {cv2.CAP_PROP_FOURCC: cv2.VideoWriter_fourcc(*current)}
+        self.frames = list(frames)
+        self.reads = 0
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        frame = self.frames[self.reads % len(self.frames)]
+        self.reads += 1
+        return True, frame
+
+    def set(self, prop, value):
+        if prop == self.cv2.CAP_PROP_FOURCC and value not in self.accepted:
+            return False  # Le pilote garde son format
+        self.props[prop] = value
+        return True
+
+    def get(self, prop):
+        return self.props.get(prop, 0)
+
+    def release(self):
+        pass
+
+
+def _bgr(h, w, seed=0):
+    return np.random.default_rng(seed).integers(0, 256, (h, w, 3), dtype=np.uint8)
+
+
+def test_bgr_frame_mirrored_and_reduced(numpy_cv2):
+    """Backend sans buffer brut : affichage miroir, inférence réduite miroir en RGB."""
+    img = _bgr(4, 8)
+    decoder = FrameDecoder("MJPG", (8, 4), (4, 2))
+
+    display, rgb = decoder.decode(img)
+    assert np.array_equal(display, img[:, ::-1])
+    assert np.array_equal(rgb, img[::2, ::2][:, ::-1, ::-1])
+
+    # Miroir appliqué aux landmarks : l'inférence garde l'orientation caméra
+    _, rgb = decoder.decode(img, need_display=False, mirror_landmarks=True)
+    assert np.array_equal(rgb, img[::2, ::2][..., ::-1])
+
+
+def test_mjpg_reduced_dct_decode_without_display(numpy_cv2):
+    """Sans affichage, libjpeg décode directement à la plus petite échelle >= inférence."""
+    img = _bgr(480, 640)
+    raw = numpy_cv2.encode_jpeg(img)
+
+    display, rgb = FrameDecoder("MJPG", (640, 480), (160, 120)).decode(raw, need_display=False)
+    assert display is None and numpy_cv2.decode_flags[-1] == numpy_cv2.IMREAD_REDUCED_COLOR_4
+    assert np.array_equal(rgb, img[::4, ::4][:, ::-1, ::-1])
+
+    decoder = FrameDecoder("MJPG", (640, 480), (320, 240))
+    display, rgb = decoder.decode(raw, need_display=False)
+    assert numpy_cv2.decode_flags[-1] == numpy_cv2.IMREAD_REDUCED_COLOR_2
+    assert np.array_equal(rgb, img[::2, ::2][:, ::-1, ::-1])
+
+    # Avec affichage : décodage pleine résolution
+    display, rgb = decoder.decode(raw)
+    assert numpy_cv2.decode_flags[-1] == numpy_cv2.IMREAD_COLOR
+    assert np.array_equal(display, img[:, ::-1])
+    assert np.array_equal(rgb, img[::2, ::2][:, ::-1, ::-1])
+
+    assert decoder.decode(np.frombuffer(b"corrupt", dtype=np.uint8)) == (None, None)
+
+
+def test_yuyv_checks_buffer_size_and_converts_every_other_row(numpy_cv2):
+    """YUYV : taille du buffer vérifiée, une ligne sur deux convertie directement en RGB."""
+    luma = np.arange(32, dtype=np.uint8).reshape(4, 8)
+    raw = np.dstack([luma, np.full_like(luma, 128)]).reshape(-1)  # Chrominance neutre
+    decoder = FrameDecoder("YUYV", (8, 4), (4, 2))
+
+    assert decoder.decode(raw[:-2]) == (None, None)
+
+    display, rgb = decoder.decode(raw, need_display=False)
+    assert display is None and numpy_cv2.color_codes == [numpy_cv2.COLOR_YUV2RGB_YUYV]
+    expected = luma[::2, ::2][:, ::-1]
+    assert np.array_equal(rgb, np.repeat(expected[..., None], 3, axis=2))
+
+    display, _ = decoder.decode(raw)
+    assert numpy_cv2.color_codes[-1] == numpy_cv2.COLOR_YUV2BGR_YUYV
+    assert np.array_equal(display[..., 0], luma[:, ::-1])
+
+
+def test_fourcc_falls_back_when_camera_refuses_preferred_format(numpy_cv2):
+    """MJPG préféré en 720p ; refusé par le pilote → YUYV ; tout refusé → format courant."""
+    assert CameraManager(resolution=(1280, 720))._preferred_format() == "MJPG"
+    assert CameraManager(resolution=(320, 240))._preferred_format() == "YUYV"
+    assert CameraManager(resolution=(1280, 720), pixel_format="yuyv")._preferred_format() == "YUYV"
+
+    camera = CameraManager(resolution=(1280, 720))
+    camera.cap = FakeCapture(numpy_cv2, accepted={"YUYV"}, current="YUYV")
+    camera._configure()
+    assert camera.pixel_format == "YUYV"
+    assert camera.decoder.pixel_format == "YUYV" and camera.decoder.frame_size == (1280, 720)
+
+    camera.cap = FakeCapture(numpy_cv2, accepted=set(), current="BGR3")
+    camera._configure()
+    assert camera.pixel_format == "BGR3"
+    assert numpy_cv2.CAP_PROP_CONVERT_RGB not in camera.cap.props  # Pas de capture brute demandée
+
+
+def test_open_negotiates_mjpg_and_reads_raw_buffers(numpy_cv2):
+    """Ouverture : MJPG accepté, conversion RGB du backend coupée, buffers JPEG décodés réduits."""
+    img = _bgr(480, 640, seed=1)
+    capture = FakeCapture(numpy_cv2, accepted={"MJPG", "YUYV"}, current="YUYV",
+                          frames=[numpy_cv2.encode_jpeg(img)])
+    numpy_cv2.VideoCapture = lambda index, backend: capture
+
+    camera = CameraManager(indices=[0], inference_size=(320, 240))
+    assert camera.open()
+    assert camera.pixel_format == "MJPG"
+    assert capture.get(numpy_cv2.CAP_PROP_CONVERT_RGB) == 0
+
+    display, rgb = camera.read_frames(need_display=False)
+    assert display is None and numpy_cv2.decode_flags[-1] == numpy_cv2.IMREAD_REDUCED_COLOR_2
+    assert np.array_equal(rgb, img[::2, ::2][:, ::-1, ::-1])
@@ -5,15 +5,15 @@ from src.engine import HandEngine
 @pytest.fixture
 def mock_engine():
     # Mock des dépendances lourdes pour éviter l'init matérielle
-    with patch('src.engine.MouseDriver'), \
-         patch('src.engine.HybridMouseFilter'), \
-         patch('src.engine.StaticGestureClassifier'), \
-         patch('src.engine.ContextModeDetector'), \
-         patch('src.engine.ActionDispatcher'), \
-         patch('src.engine.FeedbackOverlay'), \
-         patch('src.engine.VirtualKeyboard'), \
-         patch('src.engine.ASLManager'), \
-         patch('src.engine.PerformanceProfiler'), \
+    with patch('src.core.hand_host.MouseDriver'), \
+         patch('src.core.hand_host.HybridMouseFilter'), \
+         patch('src.core.hand_host.create_gesture_classifier'), \
+         patch('src.core.hand_host.ContextModeDetector'), \
+         patch('src.core.hand_host.ActionDispatcher'), \
+         patch('src.core.hand_host.FeedbackOverlay'), \
+         patch('src.core.hand_host.VirtualKeyboard'), \
+         patch('src.core.hand_host.ASLManager'), \
+         patch('src.core.hand_host.PerformanceProfiler'), \
          patch('cv2.VideoCapture'):
         
         engine = HandEngine(headless=True)
@@ -43,3 +43,20 @@ def test_engine_set_camera(mock_engine):
     mock_engine.set_camera(1)
     assert mock_engine.camera_index == 1
     assert mock_engine.cap is None # Doit être libéré pour ré-init
+
+def test_engine_pause_mode(mock_engine):
+    """Vérifie la politique de pause et le type de reprise mesuré."""
+    assert mock_engine.set_pause_mode("hot") == "hot"
+    with pytest.raises(ValueError):
+        mock_engine.set_pause_mode("lukewarm")
+    
+    # Landmarker conservé, caméra libérée -> reprise warm
+    mock_engine.landmarker = MagicMock()
+    mock_engine.cap = None
+    mock_engine.start()
+    assert mock_engine._resume_kind.value == "warm"
+    
+    mock_engine._record_resume()
+    stats = mock_engine.get_resume_stats()
+    assert stats["warm"]["count"] == 1
+    assert stats["cold"]["count"] == 0
@@ -56,3 +56,25 @@ def test_mapper_gamma():
     mx, _ = mapper.map(0.75, 0.5)
     linear_val = int(0.75 * 1920)
     assert mx != linear_val
+
+
+def test_finger_rules_survive_rotation_and_mirror():
+    """Index tendu, main inclinée ou en miroir : même geste (règles dans le repère de la main)."""
+    import math
+    from types import SimpleNamespace
+    from src.gesture_classifier import StaticGestureClassifier
+    from src.sign_recognizer import SignLanguageInterpreter
+
+    # Repère main : x vers l'index, y vers les doigts ; index tendu, autres doigts repliés
+    points = [(0, 0)] * 21
+    points[1:5] = [(0.3, 0.3), (0.35, 0.55), (0.2, 0.7), (0.1, 0.75)]     # Pouce replié sur la paume
+    points[5:9] = [(0.25, 1.0), (0.25, 1.45), (0.25, 1.7), (0.25, 1.9)]   # Index tendu
+    for base, x in ((9, 0.0), (13, -0.2), (17, -0.38)):
+        points[base:base + 4] = [(x, 1.0), (x, 1.35), (x, 1.1), (x, 0.9)]  # Tip revenu sous le PIP
+
+    for angle, mirror in ((0.0, 1), (1.4, 1), (-2.5, 1), (0.7, -1)):
+        c, s = math.cos(angle), math.sin(angle)
+        landmarks = [SimpleNamespace(x=0.5 + 0.1 * mirror * (c * x - s * y),
+                                     y=0.6 - 0.1 * (s * x + c * y), z=0.0) for x, y in points]
+        assert StaticGestureClassifier().classify(landmarks) == "POINTING"
+        assert SignLanguageInterpreter().predict(None, landmarks)[0] == "D"
@@ -0,0 +1,56 @@
+import math
+from types import SimpleNamespace
+
+from src.gesture_classifier import StaticGestureClassifier
+from src.processing.gestures.stability import GestureStabilizer
+
+
+def _feed(stabilizer, frames, hand="Right"):
+    return [stabilizer.update(hand, scores) for scores in frames]
+
+
+def test_glitch_frames_do_not_switch_gesture():
+    """Une ou deux frames mal classées sont absorbées ; le changement exige MIN_DWELL frames."""
+    palm, fist = {"PALM": 0.9, "FIST": 0.1}, {"PALM": 0.1, "FIST": 0.9}
+    stabilizer = GestureStabilizer(min_dwell=3)
+    out = _feed(stabilizer, [palm] * 3 + [fist] + [palm] * 2 + [fist, fist] + [palm])
+    assert [o.label for o in out] == ["UNKNOWN", "UNKNOWN"] + ["PALM"] * 7
+    assert sum(o.changed for o in out) == 1 and stabilizer.suppressed == 2
+
+    out = _feed(stabilizer, [fist] * 3)
+    assert [o.label for o in out] == ["PALM", "PALM", "FIST"]
+    assert out[-1].changed and out[-1].previous == "PALM" and out[-1].confidence == 0.9
+
+
+def test_hysteresis_holds_borderline_pose():
+    """Score entre EXIT et ENTER : le geste courant tient, un nouveau geste n'entre pas."""
+    stabilizer = GestureStabilizer(enter_score=0.65, exit_score=0.35, min_dwell=1)
+    assert _feed(stabilizer, [{"PINCH": 0.8}])[0].label == "PINCH"
+    out = _feed(stabilizer, [{"PINCH": 0.4, "PALM": 0.6}] * 5)
+    assert {o.label for o in out} == {"PINCH"} and not any(o.changed for o in out)
+    # Sous le seuil de sortie, sans autre geste sûr : retour à UNKNOWN
+    assert _feed(stabilizer, [{"PINCH": 0.2, "PALM": 0.5}])[0].label == "UNKNOWN"
+
+    # Mains indépendantes ; une main disparue repart de zéro
+    stabilizer.update("Left", {"FIST": 0.9})
+    stabilizer.keep_only(["Left"])
+    assert stabilizer.label("Left") == "FIST" and stabilizer.label("Right") == "UNKNOWN"
+
+
+def test_scores_agree_with_rules():
+    """Pose franche : le meilleur score est le geste de classify, au-dessus du seuil d'entrée."""
+    points = [(0, 0)] * 21
+    points[1:5] = [(0.3, 0.3), (0.35, 0.55), (0.2, 0.7), (0.1, 0.75)]     # Pouce replié
+    points[5:9] = [(0.25, 1.0), (0.25, 1.45), (0.25, 1.7), (0.25, 1.9)]   # Index tendu
+    for base, x in ((9, 0.0), (13, -0.2), (17, -0.38)):
+        points[base:base + 4] = [(x, 1.0), (x, 1.35), (x, 1.1), (x, 0.9)]
+    classifier = StaticGestureClassifier()
+    for angle in (0.0, 0.8, -1.2):
+        c, s = math.cos(angle), math.sin(angle)
+        landmarks = [SimpleNamespace(x=0.5 + 0.1 * (c * x - s * y), y=0.6 - 0.1 * (s * x + c * y), z=0.0)
+                     for x, y in points]
+        scores = classifier.scores(landmarks)
+        best = max(scores, key=scores.get)
+        assert best == classifier.classify(landmarks) == "POINTING"
+        assert scores[best] >= GestureStabilizer.ENTER_SCORE
+    assert classifier.scores(landmarks[:10]) == {}
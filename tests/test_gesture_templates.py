@@ -0,0 +1,77 @@
+import math
+
+import numpy as np
+
+from src.processing.gestures.templates import (
+    DTWMatcher, TemplateLibrary, TemplateMatch, dtw_distance, envelope, lb_keogh, normalize_trajectory,
+)
+from src.processing.gestures.temporal import TemporalGestureRecognizer
+from tests.test_temporal_gestures import _run
+
+
+def _random_walk(rng, n=30):
+    return np.cumsum(rng.normal(0, 0.01, (n, 2)), axis=0) + 0.5
+
+
+def test_pruned_matcher_equals_exhaustive_dtw():
+    """Borne ≤ DTW, et le 1-NN élagué = le 1-NN exhaustif."""
+    rng = np.random.default_rng(1)
+    library = TemplateLibrary(path="/dev/null")
+    for i in range(60):
+        library.add(f"g{i % 12}", _random_walk(rng))
+    compiled = library.compiled("Right")
+    matcher = DTWMatcher(library, threshold=math.inf)
+
+    for _ in range(20):
+        trajectory = _random_walk(rng)
+        query = normalize_trajectory(trajectory, library.n_samples)
+        rows = [(float(x), float(y)) for x, y in query]
+        exact = [dtw_distance(rows, t, library.radius) for t in compiled.rows]
+        bounds = lb_keogh(query, compiled.lower, compiled.upper)
+        q_lower, q_upper = envelope(query, library.radius)
+        reverse = lb_keogh(compiled.series, q_lower[None], q_upper[None])
+        assert np.all(bounds <= np.array(exact) + 1e-4)
+        assert np.all(reverse <= np.array(exact) + 1e-4)
+
+        match = matcher.match("Right", trajectory)
+        assert match.name == compiled.names[int(np.argmin(exact))]
+        assert abs(match.distance - min(exact) / library.n_samples) < 1e-6
+    assert matcher.pruned + matcher.dtw_abandoned > 0
+
+
+def test_library_round_trip(tmp_path):
+    path = str(tmp_path / "templates.json")
+    library = TemplateLibrary(path=path)
+    library.add("Z", [(0, 0), (1, 0), (0, 1), (1, 1)])
+    library.add("V", [(0, 0), (0.5, 1), (1, 0)], hand="Left")
+    library.save()
+
+    loaded = TemplateLibrary.load(path)
+    assert loaded.names() == {"Z": 1, "V": 1}
+    assert loaded.count("Left") == 1
+    assert np.allclose(loaded.compiled("Right").series, library.compiled("Right").series, atol=1e-4)
+    assert loaded.remove("Z") == 1 and loaded.compiled("Right") is None
+
+
+def test_recorded_gesture_is_recognized():
+    """Un Z enregistré est reconnu plus petit et ailleurs ; les gestes intégrés restent prioritaires."""
+    def z_path(x0, y0, size, frames=10):
+        corners = [(0, 0), (1, 0), (0, 1), (1, 1)]
+        points = []
+        for (ax, ay), (bx, by) in zip(corners, corners[1:]):
+            points += [(x0 + size * (ax + (bx - ax) * i / frames),
+                        y0 + size * (ay + (by - ay) * i / frames), 1.0) for i in range(frames)]
+        return points
+
+    library = TemplateLibrary(path="/dev/null")
+    recognizer = TemporalGestureRecognizer(max_age=2.0, matcher=DTWMatcher(library))
+    recognizer.start_recording("Right")
+    assert _run(recognizer, z_path(0.3, 0.3, 0.2)) == []
+    library.add("Z", recognizer.stop_recording())
+    assert not recognizer.recording
+
+    found = _run(recognizer, [(0.5, 0.4, 1.0)] * 5 + z_path(0.5, 0.4, 0.18), t0=10.0)
+    assert len(found) == 1 and isinstance(found[0], TemplateMatch) and found[0].value == "Z"
+
+    swipe = [(0.3, 0.5, 1.0)] * 10 + [(0.3 + 0.4 * i / 9, 0.5, 1.0) for i in range(10)]
+    assert [g.value for g in _run(recognizer, swipe, t0=20.0)] == ["SWIPE_RIGHT"]
@@ -41,3 +41,21 @@ def test_ipc_invalid_command(mock_engine):
     resp = server._execute_command({"command": "invalid_cmd"})
     assert resp["status"] == "error"
     assert "Unknown command" in resp["message"]
+
+def test_ipc_pause_mode(mock_engine):
+    """Vérifie le réglage de la politique de pause et l'exposition des temps de reprise."""
+    server = IPCServer(mock_engine)
+    mock_engine.set_pause_mode.return_value = "warm"
+    
+    resp = server._execute_command({"command": "set_pause_mode", "value": "warm"})
+    assert resp["status"] == "ok"
+    assert resp["pause_mode"] == "warm"
+    mock_engine.set_pause_mode.assert_called_once_with("warm")
+    
+    mock_engine.set_pause_mode.side_effect = ValueError("bad")
+    resp = server._execute_command({"command": "set_pause_mode", "value": "lukewarm"})
+    assert resp["status"] == "error"
+    
+    mock_engine.get_resume_stats.return_value = {"warm": {"last_ms": 12.0, "avg_ms": 12.0, "count": 1}}
+    resp = server._execute_command({"command": "get_resume_stats"})
+    assert resp["data"]["warm"]["last_ms"] == 12.0
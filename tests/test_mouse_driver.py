@@ -0,0 +1,106 @@
+import time
+
+from src.control.actions.executor import ActionExecutor
+from src.control.input import devices as E
+from src.control.input.devices import FakeUInput
+from src.mouse_driver import MouseDriver
+
+
+def _driver():
+    device = FakeUInput()
+    mouse = MouseDriver(device=device)
+    mouse.deferred = True
+    mouse.move = lambda x, y: mouse.batch.move(x, y)  # Sans filtre ni mapping : pixels écran
+    return mouse, device
+
+
+def test_frame_events_written_in_one_syscall():
+    """Une frame → un write ; position inchangée ignorée ; molette cumulée ; clic après le déplacement."""
+    mouse, device = _driver()
+    mouse.move(100, 200)
+    mouse.move(110, 200)  # Remplace la précédente
+    mouse.scroll(0, 1)
+    mouse.scroll(0, 2)
+    mouse.click(timestamp=0.0)
+    mouse.flush()
+    assert mouse.batch.writes == 1 and device.writes == 0
+    assert device.reports() == [
+        [(E.EV_ABS, E.ABS_X, 110), (E.EV_ABS, E.ABS_Y, 200), (E.EV_REL, E.REL_WHEEL, 15)],
+        [(E.EV_KEY, E.BTN_LEFT, 1)],
+        [(E.EV_KEY, E.BTN_LEFT, 0)],
+    ]
+
+    mouse.move(110, 200)  # Déjà émise : rien à écrire
+    mouse.flush()
+    mouse.move(110, 205)  # Seul l'axe modifié part
+    mouse.scroll(0, 1)
+    mouse.scroll(0, -1)   # S'annulent
+    mouse.flush()
+    assert mouse.batch.writes == 2
+    assert device.reports()[-1] == [(E.EV_ABS, E.ABS_Y, 205)]
+    stats = mouse.batch.get_stats()
+    assert stats["dropped_moves"] == 2 and stats["coalesced_scrolls"] == 2
+    device.close()
+
+
+def test_executor_flushes_when_queue_drains():
+    """Rafale d'actions sur l'executor : écrite d'un bloc quand la file se vide."""
+    mouse, device = _driver()
+    executor = ActionExecutor()
+    executor.on_idle(mouse.flush)
+    for x in range(5):
+        executor.submit("move", mouse.move, x, 0)
+    executor.submit("click", mouse.click, timestamp=0.0)
+    executor.start()
+    try:
+        deadline = time.time() + 1.0
+        while len(device.events) < 6 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        executor.stop()
+    assert mouse.batch.writes == 1
+    assert device.reports()[0] == [(E.EV_ABS, E.ABS_X, 4), (E.EV_ABS, E.ABS_Y, 0)]
+    device.close()
+
+
+def test_relative_pointer_accumulates_accelerates_and_clutches():
+    """Mode trackpad : fractions de pixel conservées, gain croissant avec la vitesse, embrayage."""
+    from src.models.config import MouseConfig
+
+    device = FakeUInput()
+    mouse = MouseDriver(device=device, config=MouseConfig(pointer="relative"))
+    pointer = mouse.pointer
+
+    def replay(xs, start=0.0, fps=30):
+        for i, x in enumerate(xs):
+            mouse.move(x, 240, 640, 480, timestamp=start + i / fps)
+        return sum(v for t, c, v in device.events if (t, c) == (E.EV_REL, E.REL_X))
+
+    # Lent : 0.1 px caméra par frame, bien moins d'un pixel écran par frame
+    slow = replay([320 + 0.1 * i for i in range(301)])
+    expected = 30 / 640 * pointer.gain * pointer.min_factor
+    assert abs(slow - expected) <= 2 and not device.capabilities
+
+    # Rapide : 120 px caméra en 4 frames → plus de pixels écran par pixel caméra
+    device.events.clear()
+    fast = replay([350 + 30 * i for i in range(5)] + [470] * 20, start=11.0)
+    assert fast / 120 > 3 * slow / 30
+
+    # Main levée puis reposée ailleurs : aucun saut
+    device.events.clear()
+    moved = replay([100.0, 100.0], start=20.0)
+    assert moved == 0 and pointer.engagements == 3
+    assert all(t != E.EV_ABS for t, c, v in device.events)
+    device.close()
+
+
+def test_clutch_gestures_only_move_in_cursor_mode():
+    """Embrayage du mode relatif : aucun clic ni glisser lié par défaut au geste d'embrayage."""
+    from src.action_dispatcher import ActionDispatcher, ActionType
+    from src.control.input.relative_pointer import CLUTCH_GESTURES
+
+    dispatcher = ActionDispatcher()
+    for (mode, gesture, timing), action in dispatcher._build_action_table().items():
+        if mode == "cursor" and gesture in CLUTCH_GESTURES:
+            assert action == ActionType.MOVE_CURSOR, (gesture, timing)
+    assert dispatcher.get_action("cursor", "FIST", timestamp=0.0) == ActionType.CLICK_RIGHT
@@ -0,0 +1,216 @@
+import threading
+import time
+
+import pytest
+
+from src.control.actions.executor import ActionExecutor
+from src.core.hand_host import HandHost
+from src.core.pipeline import DropPolicy, FramePacket, Mailbox, Pipeline, Stage, StageQueue
+
+
+class RecordStage(Stage):
+    """Étage de test : note le thread d'exécution et l'ordre de passage."""
+
+    def __init__(self, name, log, stop=False):
+        self.name = name
+        self.log = log
+        self.stop = stop
+
+    def process(self, packet):
+        self.log.append((self.name, threading.current_thread().name))
+        return None if self.stop else packet
+
+
+def test_stage_queue_drop_policies():
+    """Une file pleine garde la frame la plus récente ou rejette l'entrante selon la politique."""
+    oldest = StageQueue(maxsize=1, policy=DropPolicy.DROP_OLDEST)
+    assert oldest.put("a") and oldest.put("b")
+    assert oldest.get(timeout=0) == "b"
+    assert oldest.dropped == 1
+
+    newest = StageQueue(maxsize=1, policy=DropPolicy.DROP_NEWEST)
+    assert newest.put("a")
+    assert newest.put("b") is False
+    assert newest.get(timeout=0) == "a"
+    assert newest.get(timeout=0) is None
+
+    blocking = StageQueue(maxsize=1, policy=DropPolicy.BLOCK)
+    blocking.put("a")
+    assert blocking.put("b", timeout=0.01) is False
+
+
+def test_mailbox_keeps_latest():
+    """La mailbox ne garde que le dernier résultat déposé."""
+    mailbox = Mailbox()
+    assert mailbox.get(timeout=0) is None
+    mailbox.put("r1")
+    mailbox.put("r2")
+    assert mailbox.get(timeout=0) == "r2"
+    assert mailbox.dropped == 1
+    assert len(mailbox) == 0
+
+
+def test_stage_queue_keeps_non_droppable_items():
+    """Éléments non abandonnables : ni évincés ni rejetés, quitte à dépasser la borne."""
+    for policy in DropPolicy:
+        queue = StageQueue(maxsize=2, policy=policy)
+        queue.put("a")
+        queue.put("release", droppable=False)
+        assert queue.put("late-release", timeout=0, droppable=False)
+        assert len(queue) == (2 if policy == DropPolicy.DROP_OLDEST else 3)
+        items = [queue.get(timeout=0) for _ in range(len(queue))]
+        assert items[-2:] == ["release", "late-release"]
+
+    queue = StageQueue(maxsize=1, policy=DropPolicy.DROP_OLDEST)
+    queue.put("release", droppable=False)
+    assert queue.put("move") is False and queue.dropped == 1
+    assert queue.get(timeout=0) == "release"
+
+
+def test_incomplete_stage_and_host_fail_at_creation():
+    """Hook manquant : erreur à l'instanciation, pas au premier packet sur un thread d'étage."""
+    class NoProcess(Stage):
+        name = "broken"
+
+    class NoDetect(HandHost):
+        def _camera_opened(self): return False
+        def _grab_frame(self): pass
+        def _release_camera(self): pass
+        def _landmarker_ready(self): return False
+        def _close_landmarker(self): pass
+
+    with pytest.raises(TypeError):
+        NoProcess()
+    with pytest.raises(TypeError, match="_detect"):
+        NoDetect()
+
+
+def test_action_executor_runs_off_thread():
+    """Les actions s'exécutent dans l'ordre sur le thread de l'executor, avec métriques."""
+    calls = []
+    executor = ActionExecutor()
+    executor.start()
+    try:
+        executor.submit("click", lambda: calls.append(("click", threading.current_thread().name)))
+        executor.submit("move", lambda x: calls.append(("move", x)), 42)
+        deadline = time.time() + 1.0
+        while len(calls) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        executor.stop()
+
+    assert calls == [("click", "action-executor"), ("move", 42)]
+    stats = executor.get_stats()
+    assert stats["click"]["count"] == 1
+    assert "wait_avg_ms" in stats["move"]
+
+
+def test_pipeline_inline_and_threaded_stages():
+    """Les étages inline tournent dans l'appelant, les étages threadés sur leur thread."""
+    log = []
+    pipeline = Pipeline(name="test")
+    pipeline.add_stage(RecordStage("capture", log))
+    pipeline.add_stage(RecordStage("render", log), threaded=True)
+    pipeline.start()
+    try:
+        assert pipeline.submit(FramePacket())
+        deadline = time.time() + 1.0
+        while len(log) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        pipeline.stop()
+
+    assert [name for name, _ in log] == ["capture", "render"]
+    assert log[0][1] == threading.current_thread().name
+    assert log[1][1] == "test-render"
+
+    stats = pipeline.get_stats()
+    assert stats["capture"]["count"] == 1
+    assert stats["render"]["threaded"] is True
+    assert stats["end_to_end"]["count"] == 1
+
+
+def test_pipeline_resume_at_named_stage():
+    """Un packet arrêté (inférence asynchrone) reprend à l'étage nommé."""
+    log = []
+    pipeline = Pipeline()
+    pipeline.add_stage(RecordStage("infer", log, stop=True))
+    pipeline.add_stage(RecordStage("interpret", log))
+
+    packet = FramePacket()
+    assert pipeline.submit(packet) is False
+    assert pipeline.submit(packet, stage="interpret") is True
+    assert [name for name, _ in log] == ["infer", "interpret"]
+    assert set(packet.timings) == {"infer", "interpret"}
+
+
+def test_render_stage_decimation():
+    """Au-delà de max_fps, les packets sont transmis sans être rendus."""
+    from src.core.stages import RenderStage
+
+    rendered = []
+    stage = RenderStage(rendered.append, max_fps=10)
+    packets = [FramePacket(frame=object()) for _ in range(5)]
+    for packet in packets:
+        assert stage.process(packet) is packet
+
+    assert rendered == packets[:1]
+    stats = stage.get_stats()
+    assert stats["rendered"] == 1 and stats["decimated"] == 4
+
+
+def test_stage_stats_fps():
+    """La cadence est calculée sur les instants d'enregistrement de la fenêtre."""
+    from src.core.pipeline import StageStats
+
+    stats = StageStats()
+    assert stats.fps == 0.0
+    for _ in range(3):
+        stats.record(1.0)
+        time.sleep(0.01)
+    assert 0 < stats.to_dict()["fps"] <= 100
+
+
+def test_headless_decodes_display_only_with_consumer():
+    """Sans consommateur attaché, aucune frame d'affichage n'est produite."""
+    from src.core.frame_sinks import FrameSinks
+    from src.core.stages import PreprocessStage
+
+    class FakeDecoder:
+        def decode(self, raw, need_display, mirror_landmarks):
+            return ("display" if need_display else None), "rgb"
+
+    sinks = FrameSinks()
+    stage = PreprocessStage(need_display=False, mirror_landmarks=True, sinks=sinks)
+    assert stage.process(FramePacket(raw="raw", decoder=FakeDecoder())).frame is None
+
+    received = []
+    sinks.attach("viewer", received.append)
+    assert stage.process(FramePacket(raw="raw", decoder=FakeDecoder())).frame == "display"
+    sinks.publish("frame")
+    sinks.detach("viewer")
+    sinks.publish("ignored")
+    assert received == ["frame"] and not sinks.active
+
+
+def test_timing_follows_frame_clock():
+    """Durées mesurées sur l'instant de capture : même résultat quelle que soit la vitesse de traitement."""
+    from src.action_dispatcher import ActionDispatcher, ActionType
+    from src.context_mode import ContextMode, ContextModeDetector
+    from src.core.stages import InferStage
+
+    sent = []
+    infer = InferStage(lambda image, ts: sent.append(ts))
+    for captured_at in (100.0, 100.033, 100.5):
+        infer.process(FramePacket(inference_rgb=object(), captured_at=captured_at))
+    assert sent == [1, 33, 500]  # Premier timestamp > 0 ; écarts = écarts de capture
+
+    dispatcher, detector = ActionDispatcher(), ContextModeDetector()
+    actions, modes = [], []
+    for i in range(40):  # 40 frames à 30 fps (1.3 s), traitées instantanément
+        t = i / 30
+        actions.append(dispatcher.get_action("cursor", "PINCH", timestamp=t))
+        modes.append(detector.detect_mode((0.5, 0.5), "FIST", (0.2, 0.5), timestamp=t))
+    assert actions[0] == ActionType.CLICK_LEFT and actions[-1] == ActionType.DRAG_START
+    assert actions.index(ActionType.DRAG_START) == 9  # 0.3 s
+    assert modes.index(ContextMode.SHORTCUT) == 24  # 0.8 s de poing gauche immobile
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from src.processing.geometry.hand_frame import _normalize_numpy, normalize_hands
+from src.processing.gestures.pose_knn import KDTree, KNNPoseClassifier, PoseDataset
+from tests.test_temporal_gestures import _hand
+
+
+def _rotate(points, angle, scale=1.0, offset=(0.0, 0.0)):
+    """Rotation dans le plan image autour du poignet, puis mise à l'échelle et translation"""
+    c, s = np.cos(angle), np.sin(angle)
+    out = points.copy()
+    rel = points[:, :2] - points[0, :2]
+    out[:, 0] = points[0, 0] + offset[0] + scale * (c * rel[:, 0] - s * rel[:, 1])
+    out[:, 1] = points[0, 1] + offset[1] + scale * (s * rel[:, 0] + c * rel[:, 1])
+    out[:, 2] = points[:, 2] * scale
+    return out
+
+
+def test_hand_frame_is_rotation_and_scale_invariant():
+    rng = np.random.default_rng(0)
+    hands = rng.uniform(0.2, 0.8, (5, 21, 3)).astype(np.float32)
+    moved = np.stack([_rotate(h, a, 1.7, (0.1, -0.2)) for h, a in zip(hands, rng.uniform(-3, 3, 5))])
+    assert np.allclose(normalize_hands(hands), normalize_hands(moved), atol=1e-4)
+    frame = normalize_hands(hands[0])
+    assert np.allclose(frame[0], 0) and np.allclose(frame[9], [0, 1, 0], atol=1e-5)
+
+
+def test_numba_hand_frame_matches_numpy():
+    """Noyau Numba (compilé et Python pur) = repli numpy : mains droites, gauches, miroir, dégénérée."""
+    pytest.importorskip("numba")
+    from src.processing.geometry.numba_accelerated import normalize_hands_batch
+
+    rng = np.random.default_rng(2)
+    right = rng.uniform(0.2, 0.8, (32, 21, 3)).astype(np.float32)
+    left = right.copy()
+    left[..., 0] = 1.0 - left[..., 0]  # Main gauche : symétrique d'une droite
+    mirrored = right[:, :, [1, 0, 2]]  # Image retournée (axes x et y échangés)
+    rotated = np.stack([_rotate(h, a, 0.6) for h, a in zip(right, rng.uniform(-3, 3, 32))])
+    degenerate = np.full((1, 21, 3), 0.5, dtype=np.float32)  # Tous les points confondus
+    hands = np.ascontiguousarray(np.concatenate([right, left, mirrored, rotated, degenerate]))
+
+    expected = _normalize_numpy(hands)
+    for kernel in (normalize_hands_batch, normalize_hands_batch.py_func):
+        out = kernel(hands, np.empty_like(hands))
+        assert np.allclose(out, expected, atol=1e-4)
+    assert np.isfinite(expected).all()
+
+
+def test_kdtree_matches_full_scan():
+    rng = np.random.default_rng(1)
+    data = rng.normal(size=(3000, 8)).astype(np.float32) * np.linspace(3, 0.1, 8, dtype=np.float32)
+    tree = KDTree(data, leaf_size=16)
+    for q in rng.normal(size=(30, 8)).astype(np.float32):
+        distances, ids = tree.query(q, 5)
+        exact = np.sqrt(((data - q) ** 2).sum(axis=1))
+        assert np.allclose(distances, np.sort(exact)[:5], atol=1e-3)
+        assert np.allclose(exact[ids], distances, atol=1e-3)
+
+
+def test_knn_classifier_handles_rotated_hands(tmp_path):
+    """Exemples droits → poses tournées reconnues ; pose éloignée rejetée ; sauvegarde / chargement."""
+    rng = np.random.default_rng(2)
+    base = {label: rng.uniform(0.3, 0.7, (21, 3)).astype(np.float32) for label in ("A", "B", "C")}
+    dataset = PoseDataset(path=str(tmp_path / "poses.npz"))
+    for label, points in base.items():
+        dataset.add_batch(label, points + rng.normal(0, 0.005, (20, 21, 3)).astype(np.float32))
+    dataset.save()
+
+    classifier = KNNPoseClassifier.load(dataset.path, max_distance=0.5)
+    assert classifier.names == ["A", "B", "C"]
+    for label, points in base.items():
+        rotated = _rotate(points, 1.2, 0.6)
+        landmarks = _hand(0.5, 0.5)
+        for p, (x, y, z) in zip(landmarks, rotated):
+            p.x, p.y, p.z = float(x), float(y), float(z)
+        predicted, confidence = classifier.predict(None, landmarks)
+        assert predicted == label and confidence > 0.9
+        assert classifier.classify(landmarks) == label
+    assert classifier.classify(_hand(0.5, 0.5)) == "UNKNOWN"
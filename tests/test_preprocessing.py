@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.vision.preprocessing.frame_preprocessor import FramePreprocessor, mirror_result
+
+
+def _landmark(x):
+    return SimpleNamespace(x=x, y=0.5, z=0.0)
+
+
+def test_mirror_result_flips_landmarks_and_handedness():
+    """Le miroir des landmarks doit équivaloir au flip horizontal de l'image."""
+    result = SimpleNamespace(
+        hand_landmarks=[[_landmark(0.2), _landmark(0.75)]],
+        hand_world_landmarks=[[_landmark(0.03)]],
+        handedness=[[SimpleNamespace(category_name="Left", display_name="Left")]],
+    )
+
+    mirror_result(result)
+
+    assert [lm.x for lm in result.hand_landmarks[0]] == [0.8, 0.25]
+    assert result.hand_world_landmarks[0][0].x == -0.03
+    assert result.handedness[0][0].category_name == "Right"
+    assert result.handedness[0][0].display_name == "Right"
+
+
+def test_mirror_result_empty():
+    """Un résultat sans main reste inchangé."""
+    result = SimpleNamespace(hand_landmarks=[], hand_world_landmarks=[], handedness=[])
+    assert mirror_result(result) is result
+    assert mirror_result(None) is None
+
+
+def test_fused_mirror_and_bgr_to_rgb(numpy_cv2):
+    """Le flip d'une ligne d'octets BGR équivaut à cvtColor(flip(frame), BGR2RGB)."""
+    bgr = np.arange(2 * 3 * 3, dtype=np.uint8).reshape(2, 3, 3)  # Pixels et canaux tous distincts
+    preprocessor = FramePreprocessor(inference_size=(3, 2))
+
+    rgb = preprocessor.to_inference(bgr, flip=True)
+
+    assert np.array_equal(rgb, bgr[:, ::-1, ::-1])
+    # Pixel de gauche = pixel de droite de la source, canaux B, G, R → R, G, B
+    assert rgb[0, 0].tolist() == [bgr[0, 2, 2], bgr[0, 2, 1], bgr[0, 2, 0]]
+    assert rgb[1, 2].tolist() == [bgr[1, 0, 2], bgr[1, 0, 1], bgr[1, 0, 0]]
+    assert numpy_cv2.color_codes == []  # Aucune passe cvtColor séparée
+
+    # Sans miroir : simple conversion de canaux
+    assert np.array_equal(preprocessor.to_inference(bgr, flip=False), bgr[..., ::-1])
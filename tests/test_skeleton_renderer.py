@@ -0,0 +1,76 @@
+import random
+from types import SimpleNamespace
+
+from src.ui.rendering.skeleton_renderer import SkeletonRenderer
+
+
+def _hand(rng, spread):
+    return [SimpleNamespace(x=rng.uniform(-spread, spread), y=rng.uniform(-spread, spread),
+                            z=rng.uniform(-spread, spread)) for _ in range(21)]
+
+
+def test_project_matches_per_landmark_formulas():
+    """La projection matricielle reproduit les anciens calculs int() point par point."""
+    rng = random.Random(0)
+    renderer = SkeletonRenderer()
+    landmarks, world = _hand(rng, 1.0), _hand(rng, 0.1)
+
+    screen, top, left, right = [p.tolist() for p in renderer.project(landmarks, world)]
+
+    assert screen == [[int(150 + (lm.x - 0.5) * 150), int(100 + (lm.y - 0.5) * 150)] for lm in landmarks]
+    assert top == [[int(450 + lm.x * 500), int(100 - lm.z * 500)] for lm in world]
+    assert left == [[int(150 - lm.z * 500), int(300 + lm.y * 500)] for lm in world]
+    assert right == [[int(450 + lm.z * 500), int(300 + lm.y * 500)] for lm in world]
+
+
+def test_project_without_world_landmarks():
+    """Sans landmarks monde, seules les vues écran sont projetées."""
+    renderer = SkeletonRenderer.engine_4view()
+    landmarks = _hand(random.Random(1), 1.0)
+
+    screen, top, left, right = renderer.project(landmarks, None)
+
+    assert screen.tolist() == [[int(lm.x * 300), int(lm.y * 200)] for lm in landmarks]
+    assert top is None and left is None and right is None
+
+
+def test_preview_composer_reuses_panel_for_same_result():
+    """Le panneau squelette n'est reconstruit que si la séquence du résultat change."""
+    import numpy as np
+    from src.ui.rendering.preview_composer import PreviewComposer
+
+    composer = PreviewComposer()
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    calls = []
+
+    def panel():
+        calls.append(1)
+        return np.full((400, 600, 3), len(calls), dtype=np.uint8)
+
+    for seq in (1, 1, 1, 2):
+        out = composer.compose(frame, seq, panel)
+
+    assert len(calls) == 2
+    assert out.shape == (400, 1133, 3) and out[0, -1, 0] == 2
+    assert composer.get_stats()["panel_reused"] == 2
+
+
+def test_draw_skeleton_partial_landmarks(monkeypatch):
+    """Liste partielle : seuls les liens entre points présents sont tracés, sans IndexError."""
+    from unittest.mock import MagicMock
+    from src.optimized_utils import VisualFeedback
+    from src.ui.rendering import skeleton_renderer
+
+    cv2 = MagicMock()
+    monkeypatch.setattr(skeleton_renderer, "cv2", cv2)
+    landmarks = [(i, 2 * i) for i in range(7)]  # Pouce complet, index jusqu'au point 6
+
+    VisualFeedback.draw_skeleton(None, landmarks)
+
+    chains = [chain.tolist() for chain in cv2.polylines.call_args[0][1]]
+    assert chains == [[[i, 2 * i] for i in (0, 1, 2, 3, 4)], [[i, 2 * i] for i in (0, 5, 6)]]
+    assert cv2.circle.call_count == 7
+
+    cv2.reset_mock()
+    VisualFeedback.draw_skeleton(None, [])
+    assert not cv2.polylines.called and not cv2.circle.called
@@ -0,0 +1,35 @@
+import random
+
+from src.processing.text.swipe_decoder import SwipeDecoder, base_letters
+
+ROWS = ["azertyuiop", "qsdfghjklm", "wxcvbn"]
+CENTERS = {c: (92.5 + col * 95, 142.5 + row * 95) for row, keys in enumerate(ROWS) for col, c in enumerate(keys)}
+LEXICON = [("bonjour", 900), ("bonsoir", 400), ("merci", 800), ("maison", 500), ("mais", 700),
+           ("été", 300), ("tard", 200), ("terre", 150), ("train", 100), ("main", 600)]
+
+
+def _path(word, rng, noise=12.0):
+    """Tracé synthétique : centres des touches bruités, 8 points intermédiaires par segment"""
+    keys = [CENTERS[c] for c in base_letters(word)]
+    anchors = [(x + rng.gauss(0, noise), y + rng.gauss(0, noise)) for x, y in keys]
+    points = [anchors[0]]
+    for (x0, y0), (x1, y1) in zip(anchors, anchors[1:]):
+        points.extend((x0 + (x1 - x0) * t / 8, y0 + (y1 - y0) * t / 8) for t in range(1, 9))
+    return points
+
+
+def test_decode_synthetic_paths():
+    """Chaque mot du lexique est retrouvé en tête à partir d'un tracé bruité."""
+    decoder = SwipeDecoder(CENTERS, LEXICON)
+    rng = random.Random(0)
+    for word, _ in LEXICON:
+        for _ in range(5):
+            assert decoder.decode(_path(word, rng))[0] == word
+
+
+def test_candidates_pruned_by_start_and_end_keys():
+    """Seuls les mots commençant et finissant près des extrémités du tracé sont comparés."""
+    decoder = SwipeDecoder(CENTERS, LEXICON + [("l'eau", 5)])
+    ids = decoder.candidates(CENTERS["m"], CENTERS["n"])
+    assert sorted(decoder.words[i] for i in ids) == ["main", "maison"]
+    assert len(decoder) == 10  # "l'eau" : apostrophe absente de la disposition
@@ -0,0 +1,169 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.action_dispatcher import ActionDispatcher, ActionType
+from src.control.actions.executor import ActionExecutor
+from src.control.actions.system import SystemActions, UInputKeys, XdotoolKeys
+from src.control.input import devices as E
+from src.control.input.devices import FakeUInput
+from src.core.pipeline import FramePacket
+from src.core.stages import ActStage
+
+
+def test_actions_reach_fake_uinput_device():
+    """Raccourcis, multimédia et fenêtres : touches pressées puis relâchées, une SYN par étape."""
+    device = FakeUInput()
+    mouse = MagicMock()
+    dispatcher = ActionDispatcher()
+    dispatcher.system_actions = SystemActions(mouse, UInputKeys(device))
+
+    assert dispatcher.execute_action(ActionType.COPY)
+    assert device.reports() == [[(E.EV_KEY, E.KEY_LEFTCTRL, 1), (E.EV_KEY, E.KEY_C, 1)],
+                                [(E.EV_KEY, E.KEY_C, 0), (E.EV_KEY, E.KEY_LEFTCTRL, 0)]]
+    device.events.clear()
+    assert dispatcher.execute_action(ActionType.VOLUME_UP, count=3)
+    assert device.reports() == [[(E.EV_KEY, E.KEY_VOLUMEUP, 1)], [(E.EV_KEY, E.KEY_VOLUMEUP, 0)]] * 3
+
+    # Souris : MouseDriver ; glisser idempotent ; déplacement continu non géré ici
+    assert dispatcher.execute_action(ActionType.SCROLL_DOWN, count=2)
+    mouse.scroll.assert_called_once_with(0, -2)
+    dispatcher.execute_action(ActionType.DRAG_START)
+    dispatcher.execute_action(ActionType.DRAG_START)
+    dispatcher.system_actions.release_held()
+    assert mouse.drag_start.call_count == 1 and mouse.drag_end.call_count == 1
+    assert not dispatcher.execute_action(ActionType.MOVE_CURSOR)
+
+    assert XdotoolKeys().command(("super", "left"), 2) == ["xdotool", "key", "--repeat", "2", "super+Left"]
+    assert not SystemActions(mouse, None).perform(ActionType.MUTE)
+
+
+def test_executor_coalesces_identical_pending_actions():
+    """Actions identiques consécutives en file : une exécution avec count ; l'ordre reste intact."""
+    calls, gate = [], threading.Event()
+
+    def volume(step, count, tag):
+        calls.append((step, count, tag))
+
+    executor = ActionExecutor()
+    executor.submit("block", gate.wait)
+    for i in range(4):
+        executor.submit_coalesced("volume", volume, "up", tag=i)  # kwargs : ceux de la dernière
+    executor.submit_coalesced("volume", volume, "down", tag=0)
+    executor.submit_coalesced("volume", volume, "up", tag=5)
+    assert executor.pending == 4 and executor.coalesced == 3
+
+    executor.start()
+    gate.set()
+    try:
+        deadline = time.time() + 1.0
+        while len(calls) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        executor.stop()
+    assert calls == [("up", 4, 3), ("down", 1, 0), ("up", 1, 5)]
+    assert executor.get_stats()["volume"]["count"] == 3
+
+
+def test_executor_never_drops_release_actions():
+    """File pleine : les mouvements les plus anciens sautent, le drag_end s'exécute toujours."""
+    mouse = MagicMock()
+    dispatcher = ActionDispatcher()
+    dispatcher.system_actions = SystemActions(mouse, UInputKeys(FakeUInput()))
+    assert dispatcher.execute_action(ActionType.DRAG_START)
+    started, gate = threading.Event(), threading.Event()
+
+    executor = ActionExecutor(max_pending=4)
+    executor.start()
+    try:
+        executor.submit("block", lambda: (started.set(), gate.wait()))  # Action OS lente
+        assert started.wait(1.0)
+        executor.submit_coalesced("drag_end", dispatcher.execute_action, ActionType.DRAG_END)
+        for i in range(10):
+            executor.submit("move", mouse.move, i, i)
+        assert executor.pending == 4 and executor.get_stats()["dropped"] == 7
+        gate.set()
+        deadline = time.time() + 1.0
+        while executor.pending and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        executor.stop()
+    mouse.drag_end.assert_called_once()
+    assert not dispatcher.system_actions.dragging
+    assert [c.args for c in mouse.move.call_args_list] == [(7, 7), (8, 8), (9, 9)]
+
+
+def test_shutdown_during_drag_writes_button_release():
+    """Quitter en plein glisser : le BTN_LEFT relâché part au périphérique malgré le mode différé."""
+    from src.core.app_coordinator import AppCoordinator
+    from src.mouse_driver import MouseDriver
+
+    device = FakeUInput()
+    app = AppCoordinator.__new__(AppCoordinator)
+    app.state, app.pipeline, app.bindings_watcher = MagicMock(), MagicMock(), MagicMock()
+    app.camera, app.tracker, app._thread = MagicMock(), MagicMock(), None
+    app.mouse = MouseDriver(device=device)
+    app.mouse.deferred = True
+    app.system_actions = SystemActions(app.mouse, UInputKeys(FakeUInput()))
+    app.action_executor = ActionExecutor()
+    app.action_executor.on_idle(app.mouse.flush)
+    app.action_executor.start()
+    app.action_executor.submit("drag_start", app.system_actions.perform, ActionType.DRAG_START)
+    deadline = time.time() + 1.0
+    while (E.EV_KEY, E.BTN_LEFT, 1) not in device.events and time.time() < deadline:
+        time.sleep(0.01)
+    assert app.system_actions.dragging
+
+    app.shutdown()
+    assert device.events[-2:] == [(E.EV_KEY, E.BTN_LEFT, 0), (E.EV_SYN, E.SYN_REPORT, 0)]
+    assert not app.system_actions.dragging
+
+
+def test_act_stage_fires_discrete_actions_once():
+    """Action tenue plusieurs frames : un seul envoi ; scroll répété ; glisser relâché en fin."""
+    submitted = []
+    host = SimpleNamespace(
+        action_executor=SimpleNamespace(
+            submit=lambda name, *a, **k: submitted.append(name),
+            submit_coalesced=lambda name, *a, **k: submitted.append(name)),
+        action_dispatcher=ActionDispatcher(), mouse=MagicMock(), filter=MagicMock(),
+        virtual_keyboard=MagicMock(), asl_manager=MagicMock(),
+        keyboard_enabled=False, mouse_frozen=True, active_hand_pos=(0, 0))
+    stage = ActStage(host)
+    landmarks = [SimpleNamespace(x=0.5, y=0.5, z=0.0)] * 21
+    sequence = [ActionType.SNAP_LEFT] * 3 + [ActionType.SCROLL_UP] * 2 + [ActionType.DRAG_START] * 2
+    for t, action in enumerate(sequence + [ActionType.NONE]):
+        stage.process(FramePacket(primary_landmarks=landmarks, action=action, captured_at=t / 30))
+    assert submitted == ["snap_left", "scroll_up", "scroll_up", "drag_start", "drag_end"]
+
+
+def test_act_stage_clutches_on_brief_open_hand():
+    """Mode relatif : main ouverte plus brève que CLUTCH_GAP, puis reprise ailleurs : aucun saut."""
+    from src.context_mode import ContextMode
+    from src.models.config import MouseConfig
+    from src.mouse_driver import MouseDriver
+
+    device = FakeUInput()
+    run = lambda name, fn, *a, **k: fn(*a, **k)  # Executor synchrone
+    host = SimpleNamespace(
+        action_executor=SimpleNamespace(submit=run, submit_coalesced=lambda *a, **k: None),
+        action_dispatcher=ActionDispatcher(), filter=MagicMock(),
+        mouse=MouseDriver(device=device, config=MouseConfig(pointer="relative")),
+        virtual_keyboard=MagicMock(), asl_manager=MagicMock(),
+        keyboard_enabled=False, mouse_frozen=False, active_hand_pos=(0, 0))
+    stage = ActStage(host)
+
+    def frame(x, gesture, action, t):
+        landmarks = [SimpleNamespace(x=x, y=0.5, z=0.0)] * 21
+        device.events.clear()
+        stage.process(FramePacket(primary_landmarks=landmarks, primary_gesture=gesture,
+                                  action=action, mode=ContextMode.CURSOR, captured_at=t))
+        return [e for e in device.events if e[0] == E.EV_REL]
+
+    for i in range(4):
+        frame(0.2 + 0.01 * i, "POINTING", ActionType.MOVE_CURSOR, i / 30)
+    assert frame(0.24, "POINTING", ActionType.MOVE_CURSOR, 4 / 30)
+    frame(0.5, "PALM", ActionType.NONE, 5 / 30)  # 33 ms < CLUTCH_GAP
+    assert frame(0.8, "POINTING", ActionType.MOVE_CURSOR, 6 / 30) == []
+    assert host.mouse.pointer.engagements == 2
@@ -0,0 +1,61 @@
+import math
+import random
+from types import SimpleNamespace
+
+from src.processing.gestures.temporal import LandmarkWindow, MotionGesture, TemporalGestureRecognizer
+
+
+def _hand(cx, cy, scale=1.0):
+    """Main schématique : tous les points autour du centre, poignet → majeur = 0.1 * scale"""
+    points = [SimpleNamespace(x=cx, y=cy, z=0.0) for _ in range(21)]
+    points[0] = SimpleNamespace(x=cx, y=cy + 0.05 * scale, z=0.0)
+    points[9] = SimpleNamespace(x=cx, y=cy - 0.05 * scale, z=0.0)
+    return points
+
+
+def _run(recognizer, positions, t0=0.0, fps=30, gestures=None):
+    found = []
+    for i, (x, y, scale) in enumerate(positions):
+        gesture = recognizer.update("Right", _hand(x, y, scale), t0 + i / fps,
+                                    gestures[i] if gestures else "UNKNOWN")
+        if gesture is not None:
+            found.append(gesture)
+    return found
+
+
+def test_recognizes_swipe_circle_and_push():
+    """Chaque geste synthétique est reconnu une seule fois (la fenêtre est vidée ensuite)."""
+    still = [(0.3, 0.5, 1.0)] * 10
+    swipe = [(0.3 + 0.4 * i / 9, 0.5, 1.0) for i in range(10)]
+    assert _run(TemporalGestureRecognizer(), still + swipe) == [MotionGesture.SWIPE_RIGHT]
+
+    circle = [(0.5 + 0.12 * math.cos(a), 0.5 - 0.12 * math.sin(a), 1.0)
+              for a in [2.2 * math.pi * i / 27 for i in range(28)]]
+    assert _run(TemporalGestureRecognizer(), circle) == [MotionGesture.CIRCLE_CCW]
+
+    push = [(0.5, 0.5, 1.0 + 0.5 * i / 11) for i in range(12)]
+    assert _run(TemporalGestureRecognizer(), [(0.5, 0.5, 1.0)] * 5 + push) == [MotionGesture.PUSH]
+
+
+def test_double_pinch_needs_two_close_onsets():
+    positions = [(0.5, 0.5, 1.0)] * 40
+    quick = ["UNKNOWN", "PINCH", "PINCH", "UNKNOWN", "UNKNOWN", "PINCH"] + ["UNKNOWN"] * 34
+    assert _run(TemporalGestureRecognizer(), positions, gestures=quick) == [MotionGesture.DOUBLE_PINCH]
+    slow = ["PINCH"] * 3 + ["UNKNOWN"] * 30 + ["PINCH"] * 7
+    assert _run(TemporalGestureRecognizer(), positions, gestures=slow) == []
+
+
+def test_incremental_sums_match_full_window():
+    """Trajet et virages cumulés = somme recalculée sur les frames encore dans la fenêtre."""
+    rng = random.Random(0)
+    window = LandmarkWindow(capacity=16, max_age=0.31, short_age=0.11, smoothing=0.0)
+    x, y = 0.5, 0.5
+    for i in range(200):
+        x += rng.uniform(-0.03, 0.03)
+        y += rng.uniform(-0.03, 0.03)
+        window.push(_hand(x, y), i / 30)
+        for span in (window.full, window.short):
+            slots = [(span.start + k) % window.capacity for k in range(span.count)]
+            assert math.isclose(span.path, sum(window.seg[s] for s in slots[1:]), abs_tol=1e-9)
+            assert math.isclose(span.winding, sum(window.turn[s] for s in slots[2:]), abs_tol=1e-9)
+    assert window.count == 10 and window.short.count == 4
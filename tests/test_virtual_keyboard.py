@@ -0,0 +1,127 @@
+from src.virtual_keyboard import VirtualKeyboard
+
+
+def _center(btn):
+    x, y = btn.pos
+    return (x + btn.size[0] // 2, y + btn.size[1] // 2)
+
+
+def test_render_redraws_only_changed_keys():
+    """Après le rendu initial, seule la touche survolée est redessinée."""
+    keyboard = VirtualKeyboard(layout="azerty", mode="dwell")
+    keyboard.render()
+    assert keyboard.keys_redrawn == 0
+
+    target = keyboard.buttons[3]
+    keyboard.check_input(_center(target))
+    keyboard.render()
+    keyboard.render()  # Rien n'a changé entre les deux appels
+    assert keyboard.keys_redrawn == 1
+
+    keyboard.check_input(_center(keyboard.buttons[4]))
+    keyboard.render()
+    assert keyboard.keys_redrawn == 3  # Ancienne touche remise au repos + nouvelle
+
+
+def test_dwell_resets_when_leaving_key():
+    """Le dwell repart de zéro hors de la touche, même sans rendu (headless)."""
+    keyboard = VirtualKeyboard(layout="azerty", mode="dwell")
+    target = keyboard.buttons[0]
+    for i in range(5):
+        keyboard.check_input(_center(target), timestamp=i / 30)
+    assert abs(target.dwell_time - 4 / 30) < 1e-9
+
+    keyboard.check_input(_center(keyboard.buttons[1]), timestamp=5 / 30)
+    assert target.dwell_time == 0 and not target.hovered
+
+
+def test_dwell_follows_frame_clock():
+    """Même session rejouée à 15 ou 60 fps : la touche est validée au même instant de capture."""
+    for fps in (15, 60):
+        keyboard = VirtualKeyboard(layout="azerty", mode="dwell")
+        pressed = []
+        keyboard._press = lambda btn: pressed.append(keyboard.now)
+        target = keyboard.buttons[2]
+        for i in range(int(1.5 * fps)):
+            keyboard.check_input(_center(target), timestamp=10.0 + i / fps)
+        assert len(pressed) == 1 and abs(pressed[0] - 11.0) < 1.0 / fps + 1e-9
+
+
+def test_grid_hit_matches_linear_scan():
+    """L'index spatial renvoie la même touche que le parcours contains(), bords compris."""
+    from src.virtual_keyboard import NUMERIC_ROWS, KeyboardLayout
+
+    keyboard = VirtualKeyboard(layout="qwerty")
+    layout = KeyboardLayout.merge("both", [
+        keyboard.active, KeyboardLayout.from_rows("numeric", NUMERIC_ROWS, origin=(1010, 100))])
+    width, height = layout.size
+    for x in range(0, width + 40, 7):
+        for y in range(0, height + 40, 7):
+            expected = next((b for b in layout.buttons if b.contains((x, y))), None)
+            assert layout.grid.hit((x, y)) is expected
+    corner = layout.buttons[0]
+    assert layout.grid.hit((corner.pos[0] + corner.size[0], corner.pos[1])) is corner
+
+
+def test_page_keys_switch_layout_without_rebuilding():
+    """Les touches 123 / ABC changent de page ; chaque page n'est construite qu'une fois."""
+    keyboard = VirtualKeyboard(layout="azerty", mode="pinch")
+    letters = keyboard.active
+    to_numeric = next(b for b in keyboard.buttons if b.text == "123")
+    keyboard.check_input(_center(to_numeric), is_pinching=True)
+    assert keyboard.active.name == "numeric" and keyboard.buttons[0].text == "1"
+    assert not to_numeric.hovered
+
+    numeric = keyboard.active
+    keyboard.last_typed = 0
+    keyboard.check_input(_center(next(b for b in keyboard.buttons if b.text == "ABC")), is_pinching=True)
+    assert keyboard.active is letters
+    keyboard.set_layout("numeric")
+    assert keyboard.active is numeric
+
+
+def test_suggestion_key_completes_word(tmp_path):
+    """Une suggestion choisie tape la fin du mot puis un espace."""
+    words = tmp_path / "words.txt"
+    words.write_text("bonjour 50\nbon 80\nbateau 10\n", encoding="utf-8")
+    keyboard = VirtualKeyboard(layout="azerty", mode="pinch", dictionary=str(words))
+    keyboard._type_key("B")
+    assert [btn.text for btn in keyboard.suggestion_keys] == ["bon", "bonjour", "bateau"]
+
+    keyboard.keyboard_controller.reset_mock()
+    keyboard.last_typed = 0
+    keyboard.check_input(_center(keyboard.suggestion_keys[1]), is_pinching=True)
+    typed = "".join(call.args[0] for call in keyboard.keyboard_controller.press.call_args_list)
+    assert typed == "onjour "
+    assert all(btn.text == "" for btn in keyboard.suggestion_keys)
+
+
+def test_swipe_types_decoded_word(tmp_path):
+    """Tracé pincé puis relâché : le mot décodé est tapé, les alternatives sont proposées."""
+    words = tmp_path / "words.txt"
+    words.write_text("main 50\nmaison 40\nmerci 30\n", encoding="utf-8")
+    keyboard = VirtualKeyboard(layout="azerty", mode="swipe", dictionary=str(words))
+    keyboard._build_decoder(keyboard.active)  # Synchrone pour le test
+    keys = {btn.text: _center(btn) for btn in keyboard.buttons}
+
+    keyboard.keyboard_controller.reset_mock()
+    for key in "MAIN":
+        keyboard.check_input(keys[key], is_pinching=True)
+    keyboard.check_input(keys["N"], is_pinching=False)
+
+    typed = "".join(call.args[0] for call in keyboard.keyboard_controller.press.call_args_list)
+    assert typed == "main "
+    assert [btn.text for btn in keyboard.suggestion_keys] == ["maison", "", ""]
+
+
+def test_mode_indicator_names_each_mode(monkeypatch):
+    """L'indicateur de mode distingue survol, pincement et tracé."""
+    from unittest.mock import MagicMock
+    import src.virtual_keyboard as virtual_keyboard
+
+    cv2 = MagicMock()
+    monkeypatch.setattr(virtual_keyboard, "cv2", cv2)
+    frame = MagicMock(shape=(480, 960, 3))
+    for mode, label in (("dwell", "SURVOL"), ("pinch", "PINCH"), ("swipe", "TRACE")):
+        VirtualKeyboard(layout="azerty", mode=mode)._draw_background(frame)
+        assert cv2.putText.call_args[0][1] == f"Mode: {label}"
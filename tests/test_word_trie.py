@@ -0,0 +1,31 @@
+from src.processing.text.word_trie import PredictiveText, WordTrie, build_trie
+
+WORDS = [("bonjour", 50), ("bon", 80), ("bonne", 70), ("bateau", 10), ("été", 40), ("étage", 5)]
+
+
+def test_complete_returns_most_frequent_words(tmp_path):
+    """Top-k par fréquence décroissante, préfixes accentués compris."""
+    trie = WordTrie(build_trie(WORDS, str(tmp_path / "words.trie"), k=3))
+    try:
+        assert trie.complete("b") == ["bon", "bonne", "bonjour"]
+        assert trie.complete("bonj") == ["bonjour"]
+        assert trie.complete("É") == ["été", "étage"]
+        assert trie.complete("x") == []
+        assert len(trie) == 6
+    finally:
+        trie.close()
+
+
+def test_predictive_text_tracks_prefix_incrementally(tmp_path):
+    """Frappe, retour arrière et séparateur mettent à jour les suggestions sans relire le préfixe."""
+    words = tmp_path / "words.txt"
+    words.write_text("".join(f"{w} {f}\n" for w, f in WORDS), encoding="utf-8")
+    predictor = PredictiveText(WordTrie.load(str(words)), max_suggestions=2)
+
+    assert predictor.feed("B") == ["bon", "bonne"]
+    assert predictor.feed("x") == []
+    assert predictor.backspace() == ["bon", "bonne"]
+    predictor.feed("o")
+    predictor.feed("n")
+    assert predictor.completion("bonjour") == "jour "
+    assert predictor.feed(",") == [] and predictor.prefix == ""